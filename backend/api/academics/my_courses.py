@@ -3,7 +3,9 @@
 APIs relative to a specific user."""
 
 import json
+from typing import Iterable, Iterator
 from fastapi import APIRouter, Depends
+from pydantic import BaseModel
 import io
 import csv
 
@@ -29,6 +31,7 @@ from ...models.office_hours.course_site import (
     UpdatedCourseSite,
 )
 from ...models.office_hours.course_site_details import CourseSiteDetails
+from ...models.office_hours.ticket import OfficeHoursTicketCsvRow
 from ...models.pagination import PaginationParams, Paginated, TicketPaginationParams
 
 __authors__ = ["Kris Jordan", "Ajay Gandecha"]
@@ -300,11 +303,11 @@ def get_ticket_statistics_csv(
     range_end: str = "",
     subject: User = Depends(registered_user),
     oh_statistics_svc: OfficeHoursStatisticsService = Depends(),
-) -> OfficeHoursTicketStatistics:
+) -> StreamingResponse:
     """
-    Gets the ticket statistics for a given class.
+    Gets the ticket history for a given class as a CSV file.
     Returns:
-        OfficeHoursTicketStatistics
+        StreamingResponse
     """
 
     # Generate pagination params
@@ -315,28 +318,37 @@ def get_ticket_statistics_csv(
         range_end=range_end,
     )
 
-    # Load CSV data
-    csv_data = oh_statistics_svc.get_ticket_csv(
+    # Load CSV rows lazily, so that they are encoded as they are fetched
+    csv_rows = oh_statistics_svc.get_ticket_csv(
         subject, course_site_id, ticket_statistics_params
     )
 
-    # Create IO Stream
-    stream = io.StringIO()
-    # Create dictionary writer to convert objects to CSV rows
-    # Note: __dict__ converts the Pydantic model into a dictionary of key-value
-    # pairs, enabling access of the object's keys.
-    wr = csv.DictWriter(
-        stream, delimiter=",", fieldnames=list(csv_data[0].__dict__.keys())
-    )
-    wr.writeheader()
-    wr.writerows([d.__dict__ for d in csv_data])
     # Create HTTP response of type `text/csv`
-    response = StreamingResponse(iter([stream.getvalue()]), media_type="text/csv")
+    response = StreamingResponse(
+        _encode_csv(csv_rows, OfficeHoursTicketCsvRow), media_type="text/csv"
+    )
     response.headers["Content-Disposition"] = "attachment; filename=export.csv"
     # Return the response
     return response
 
 
+def _encode_csv(
+    rows: Iterable[BaseModel], model: type[BaseModel], rows_per_chunk: int = 500
+) -> Iterator[str]:
+    """Encodes rows as CSV text in chunks, so that the full export is never held in memory."""
+    stream = io.StringIO()
+    # Create dictionary writer to convert objects to CSV rows
+    wr = csv.DictWriter(stream, delimiter=",", fieldnames=list(model.model_fields))
+    wr.writeheader()
+    for index, row in enumerate(rows, start=1):
+        wr.writerow(row.model_dump())
+        if index % rows_per_chunk == 0:
+            yield stream.getvalue()
+            stream.seek(0)
+            stream.truncate()
+    yield stream.getvalue()
+
+
 @api.get("/{course_site_id}/roster/csv", tags=["My Courses"])
 def get_course_site_roster_csv(
     course_site_id: int,
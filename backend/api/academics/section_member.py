@@ -104,10 +104,15 @@ def add_instructor(
 def import_roster_from_csv(
     section_id: int,
     csv: CSVModel,
+    dry_run: bool = False,
     subject: User = Depends(registered_user),
     section_member_svc: SectionMemberService = Depends(),
 ) -> UploadResponse:
     """
     Creates user roles from a Canvas section roster CSV file.
+
+    With `dry_run`, returns the changes the import would make without making them.
     """
-    return section_member_svc.import_users_from_csv(subject, section_id, csv.csv_data)
+    return section_member_svc.import_users_from_csv(
+        subject, section_id, csv.csv_data, dry_run
+    )
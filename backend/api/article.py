@@ -2,9 +2,9 @@
 
 from fastapi import APIRouter, Depends
 
-from ..api.authentication import registered_user
+from ..api.authentication import registered_user, async_registered_user
 
-from ..services.article import ArticleService
+from ..services.article import ArticleService, AsyncArticleService
 
 from ..models import User
 from ..models.articles import WelcomeOverview, ArticleOverview, ArticleDraft
@@ -22,19 +22,20 @@ openapi_tags = {
 
 
 @api.get("/welcome", tags=["Articles"])
-def get_welcome_status(
-    subject: User = Depends(registered_user), article_svc: ArticleService = Depends()
+async def get_welcome_status(
+    subject: User = Depends(async_registered_user),
+    article_svc: AsyncArticleService = Depends(),
 ) -> WelcomeOverview:
     """Retrieves the welcome status."""
-    return article_svc.get_welcome_overview(subject)
+    return await article_svc.get_welcome_overview(subject)
 
 
 @api.get("/welcome/unauthenticated", tags=["Articles"])
-def get_welcome_status_unauthenticated(
-    article_svc: ArticleService = Depends(),
+async def get_welcome_status_unauthenticated(
+    article_svc: AsyncArticleService = Depends(),
 ) -> WelcomeOverview:
     """Retrieves the welcome status for an unauthenticated user."""
-    return article_svc.get_welcome_overview(None)
+    return await article_svc.get_welcome_overview(None)
 
 
 @api.get("/list", tags=["Articles"])
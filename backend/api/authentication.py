@@ -56,6 +56,13 @@ In development, the proxy is not present. Instead, there are two options for aut
 Finally, the `authenticated_pid` function ensures a user is authenticated with PID and Onyen,
 but does not require that the user be registered in the database. This is only really useful
 for routes used in the process of registering a user.
+
+Resolving a token to its user requires the database, so `registered_user` caches the user each
+token resolves to (see `backend/services/principal.py`). Hot, read-only routes may instead depend
+on `snapshot_user`, which also accepts short-lived principal snapshot tokens, issued by
+`principal_snapshot_token`, that embed the user they authenticate and require no database access.
+`async def` routes depend on `async_registered_user` and `async_snapshot_user` instead, which load
+users with an `AsyncSession` rather than blocking the event loop.
 """
 
 import jwt
@@ -66,8 +73,10 @@ from fastapi.exceptions import HTTPException
 from fastapi.security import HTTPBearer
 from fastapi.security.http import HTTPAuthorizationCredentials
 from fastapi.responses import RedirectResponse
+from pydantic import ValidationError
 from ..env import getenv
-from ..services import UserService, GitHubService
+from ..services import UserService, AsyncUserService, GitHubService
+from ..services.principal import get_principal, cache_principal
 from ..models import User
 
 
@@ -81,26 +90,131 @@ HOST = getenv("HOST")
 AUTH_SERVER_HOST = "csxl.unc.edu"
 _JWT_SECRET = getenv("JWT_SECRET")
 _JST_ALGORITHM = "HS256"
+_PRINCIPAL_CLAIM = "principal"
+_PRINCIPAL_SNAPSHOT_LIFETIME = timedelta(
+    seconds=int(getenv("PRINCIPAL_SNAPSHOT_LIFETIME", "300"))
+)
 
 
 def registered_user(
     user_service: UserService = Depends(),
     token: HTTPAuthorizationCredentials | None = Depends(HTTPBearer()),
 ) -> User:
-    """Returns the authenticated user or raises a 401 HTTPException if the user is not authenticated."""
+    """Returns the authenticated user or raises a 401 HTTPException if the user is not authenticated.
+
+    Users are cached by the token that authenticated them, so repeated requests bearing the same
+    token are authenticated without decoding it again or querying the database."""
     if token:
         try:
+            user = get_principal(token.credentials)
+            if user:
+                return user
             auth_info = jwt.decode(
                 token.credentials, _JWT_SECRET, algorithms=[_JST_ALGORITHM]
             )
             user = user_service.get(auth_info["pid"])
             if user:
+                cache_principal(token.credentials, auth_info["exp"], user)
                 return user
         except:
             ...
     raise HTTPException(status_code=401, detail="Unauthorized")
 
 
+async def async_registered_user(
+    user_service: AsyncUserService = Depends(),
+    token: HTTPAuthorizationCredentials | None = Depends(HTTPBearer()),
+) -> User:
+    """Returns the authenticated user or raises a 401 HTTPException if the user is not authenticated.
+
+    This is the variant of `registered_user` for `async def` routes. Principals are shared with
+    `registered_user`, and users not yet cached are loaded without blocking the event loop."""
+    if token:
+        user = get_principal(token.credentials)
+        if user:
+            return user
+        try:
+            auth_info = jwt.decode(
+                token.credentials, _JWT_SECRET, algorithms=[_JST_ALGORITHM]
+            )
+            pid, expires_at = int(auth_info["pid"]), auth_info["exp"]
+        except (jwt.PyJWTError, KeyError, TypeError, ValueError):
+            raise HTTPException(status_code=401, detail="Unauthorized")
+        user = await user_service.get(pid)
+        if user:
+            cache_principal(token.credentials, expires_at, user)
+            return user
+    raise HTTPException(status_code=401, detail="Unauthorized")
+
+
+def snapshot_user(
+    user_service: UserService = Depends(),
+    token: HTTPAuthorizationCredentials | None = Depends(HTTPBearer()),
+) -> User:
+    """Returns the authenticated user or raises a 401 HTTPException if the user is not authenticated.
+
+    Unlike `registered_user`, the user embedded in a principal snapshot token is trusted as is,
+    so the database is not accessed. A snapshot may be out of date by up to its lifetime, so only
+    read-only routes whose results do not hinge on recent changes to the user should depend on
+    this function. Other tokens are authenticated as by `registered_user`."""
+    user = _snapshot_principal(token)
+    if user is not None:
+        return user
+    return registered_user(user_service, token)
+
+
+async def async_snapshot_user(
+    user_service: AsyncUserService = Depends(),
+    token: HTTPAuthorizationCredentials | None = Depends(HTTPBearer()),
+) -> User:
+    """Returns the authenticated user or raises a 401 HTTPException if the user is not authenticated.
+
+    This is the variant of `snapshot_user` for `async def` routes. Tokens other than principal
+    snapshots are authenticated as by `async_registered_user`."""
+    user = _snapshot_principal(token)
+    if user is not None:
+        return user
+    return await async_registered_user(user_service, token)
+
+
+def _snapshot_principal(token: HTTPAuthorizationCredentials | None) -> User | None:
+    """Returns the user embedded in a principal snapshot token, or None if the token is not one.
+
+    Raises:
+        HTTPException: If the token is expired, is not signed with the secret, or embeds an invalid user.
+    """
+    if token:
+        try:
+            auth_info = jwt.decode(
+                token.credentials, _JWT_SECRET, algorithms=[_JST_ALGORITHM]
+            )
+            if _PRINCIPAL_CLAIM in auth_info:
+                return User.model_validate(auth_info[_PRINCIPAL_CLAIM])
+        except (jwt.PyJWTError, ValidationError):
+            raise HTTPException(status_code=401, detail="Unauthorized")
+    return None
+
+
+def principal_snapshot_token(user: User) -> str:
+    """Issues a short-lived principal snapshot token that embeds a user.
+
+    Args:
+        user (User): The authenticated user to embed.
+
+    Returns:
+        str: The encoded token, which `snapshot_user` resolves without accessing the database."""
+    return jwt.encode(
+        {
+            "uid": user.onyen,
+            "pid": user.pid,
+            _PRINCIPAL_CLAIM: user.model_dump(mode="json", include=User.model_fields),
+            "exp": datetime.now() + _PRINCIPAL_SNAPSHOT_LIFETIME,
+        },
+        _JWT_SECRET,
+        algorithm=_JST_ALGORITHM,
+    )
+
+
 def authenticated_pid(
     token: HTTPAuthorizationCredentials | None = Depends(HTTPBearer()),
 ) -> tuple[int, str]:
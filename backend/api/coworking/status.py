@@ -3,8 +3,8 @@
 This API is used to retrieve and update a user's profile."""
 
 from fastapi import APIRouter, Depends
-from ..authentication import registered_user
-from ...services.coworking import StatusService
+from ..authentication import async_snapshot_user
+from ...services.coworking import AsyncStatusService
 from ...models import User
 from ...models.coworking import Status
 
@@ -21,8 +21,9 @@ openapi_tags = {
 
 
 @api.get("", response_model=Status, tags=["Coworking"])
-def get_coworking_status(
-    subject: User = Depends(registered_user), status_svc: StatusService = Depends()
+async def get_coworking_status(
+    subject: User = Depends(async_snapshot_user),
+    status_svc: AsyncStatusService = Depends(),
 ):
     """Status endpoint supports the primary screen of the coworking features.
 
@@ -30,4 +31,4 @@ def get_coworking_status(
     It also fetches the current seat availability of the XL during operating hours.
     Finally, it provides a list of upcoming hours.
     """
-    return status_svc.get_coworking_status(subject)
+    return await status_svc.get_coworking_status(subject)
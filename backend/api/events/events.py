@@ -10,12 +10,12 @@ from backend.models.pagination import EventPaginationParams, Paginated, Paginati
 
 from backend.services.organization import OrganizationService
 
-from ...services.event import EventService
+from ...services.event import EventService, AsyncEventService
 from ...services.user import UserService
 from ...services.exceptions import ResourceNotFoundException, UserPermissionException
 from ...models.event import EventDraft, EventOverview, EventStatusOverview
 from ...models.coworking.time_range import TimeRange
-from ...api.authentication import registered_user
+from ...api.authentication import registered_user, async_registered_user
 from ...models.user import User
 
 __authors__ = [
@@ -36,15 +36,21 @@ openapi_tags = {
 
 
 @api.get("/unauthenticated/paginate", tags=["Events"])
-def list_events(
-    event_service: EventService = Depends(),
+async def list_events(
+    event_service: AsyncEventService = Depends(),
     order_by: str = "time",
     ascending: str = "true",
     filter: str = "",
     range_start: str = "",
     range_end: str = "",
+    page_size: int = 10,
+    cursor: str | None = None,
+    count: bool = True,
 ) -> Paginated[EventOverview]:
-    """List events in time range via standard backend pagination query parameters."""
+    """List events in time range via standard backend pagination query parameters.
+
+    Passing a `cursor`, initially the empty string and thereafter the `next_cursor` of the previous
+    page, pages through events by start time instead."""
 
     pagination_params = EventPaginationParams(
         order_by=order_by,
@@ -52,21 +58,33 @@ def list_events(
         filter=filter,
         range_start=range_start,
         range_end=range_end,
+        page_size=page_size,
+        cursor=cursor,
+        count=count,
     )
-    return event_service.get_paginated_events(pagination_params, None)
+    try:
+        return await event_service.get_paginated_events(pagination_params, None)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @api.get("/paginate", tags=["Events"])
-def list_events(
-    subject: User = Depends(registered_user),
-    event_service: EventService = Depends(),
+async def list_events(
+    subject: User = Depends(async_registered_user),
+    event_service: AsyncEventService = Depends(),
     order_by: str = "time",
     ascending: str = "true",
     filter: str = "",
     range_start: str = "",
     range_end: str = "",
+    page_size: int = 10,
+    cursor: str | None = None,
+    count: bool = True,
 ) -> Paginated[EventOverview]:
-    """List events in time range via standard backend pagination query parameters."""
+    """List events in time range via standard backend pagination query parameters.
+
+    Passing a `cursor`, initially the empty string and thereafter the `next_cursor` of the previous
+    page, pages through events by start time instead."""
 
     pagination_params = EventPaginationParams(
         order_by=order_by,
@@ -74,8 +92,14 @@ def list_events(
         filter=filter,
         range_start=range_start,
         range_end=range_end,
+        page_size=page_size,
+        cursor=cursor,
+        count=count,
     )
-    return event_service.get_paginated_events(pagination_params, subject)
+    try:
+        return await event_service.get_paginated_events(pagination_params, subject)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @api.get("/unauthenticated/status", tags=["Events"])
@@ -5,6 +5,9 @@ Production systems monitor these end points upon deployment, and at regular inte
 
 from fastapi import APIRouter, Depends
 from ..services.health import HealthService
+from ..models import User
+from ..models.health import DatabasePoolsStatus
+from .authentication import registered_user
 
 
 __authors__ = ["Kris Jordan"]
@@ -22,3 +25,12 @@ api = APIRouter(prefix="/api/health")
 @api.get("", tags=["System Health"])
 def health_check(health_svc: HealthService = Depends()) -> str:
     return health_svc.check()
+
+
+@api.get("/pools", tags=["System Health"])
+def get_pool_status(
+    subject: User = Depends(registered_user),
+    health_svc: HealthService = Depends(),
+) -> DatabasePoolsStatus:
+    """Report the database connection pools of the worker that serves the request."""
+    return health_svc.get_pool_status(subject)
@@ -13,7 +13,7 @@ from ...models.office_hours.office_hours_recurrence_pattern import (
 from ...services.office_hours.office_hours_recurrence import (
     OfficeHoursRecurrenceService,
 )
-from ..authentication import registered_user
+from ..authentication import registered_user, snapshot_user
 from ...services.office_hours.office_hours import OfficeHoursService
 from ...models.user import User
 from ...models.office_hours.office_hours import OfficeHours, NewOfficeHours
@@ -33,7 +33,7 @@ api = APIRouter(prefix="/api/office-hours")
 @api.get("/{id}/queue", tags=["Office Hours"])
 def get_office_hours_queue(
     id: int,
-    subject: User = Depends(registered_user),
+    subject: User = Depends(snapshot_user),
     oh_event_svc: OfficeHoursService = Depends(),
 ) -> OfficeHourQueueOverview:
     """
@@ -63,7 +63,7 @@ def get_office_hours_role(
 @api.get("/{id}/get-help", tags=["Office Hours"])
 def get_office_hours_help(
     id: int,
-    subject: User = Depends(registered_user),
+    subject: User = Depends(snapshot_user),
     oh_event_svc: OfficeHoursService = Depends(),
 ) -> OfficeHourGetHelpOverview:
     """
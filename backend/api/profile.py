@@ -3,7 +3,11 @@
 This API is used to retrieve and update a user's profile."""
 
 from fastapi import APIRouter, Depends
-from .authentication import authenticated_pid
+from .authentication import (
+    authenticated_pid,
+    registered_user,
+    principal_snapshot_token,
+)
 from ..services import UserService
 from ..models import UserDetails, User, UnregisteredUser, ProfileForm
 
@@ -88,3 +92,14 @@ def update_profile(
         return user_details
     else:
         raise Exception("Unexpected internal server error.")
+
+
+@api.get("/snapshot", response_model=str, tags=["Profile"])
+def read_principal_snapshot(subject: User = Depends(registered_user)) -> str:
+    """Issue a short-lived token embedding the subject's profile.
+
+    Hot, read-only routes such as polling endpoints accept this token in place of the usual
+    bearer token without querying the database to authenticate the subject. Once it expires,
+    a new snapshot must be requested.
+    """
+    return principal_snapshot_token(subject)
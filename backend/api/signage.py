@@ -1,7 +1,7 @@
 """Signage API"""
 
-from fastapi import APIRouter, Depends
-from ..services import SignageService
+from fastapi import APIRouter, Depends, Response
+from ..services import AsyncSignageService
 from ..models import SignageOverviewFast, SignageOverviewSlow
 
 __authors__ = ["Will Zahrt", "Andrew Lockard", "Audrey Toney"]
@@ -15,8 +15,8 @@ openapi_tags = {
 }
 
 
-@api.get("/slow", tags=["Signage"])
-def get_slow_signage(signage_svc: SignageService = Depends()) -> SignageOverviewSlow:
+@api.get("/slow", tags=["Signage"], response_model=SignageOverviewSlow)
+async def get_slow_signage(signage_svc: AsyncSignageService = Depends()) -> Response:
     """Gets signage data that does not need to be updated frequently.
 
     Parameters:
@@ -25,11 +25,13 @@ def get_slow_signage(signage_svc: SignageService = Depends()) -> SignageOverview
     Returns:
         SignageOverviewSlow - contains news, top users, events, and announcements
     """
-    return signage_svc.get_slow_data()
+    return Response(
+        await signage_svc.get_slow_data_json(), media_type="application/json"
+    )
 
 
-@api.get("/fast", tags=["Signage"])
-def get_fast_signage(signage_svc: SignageService = Depends()) -> SignageOverviewFast:
+@api.get("/fast", tags=["Signage"], response_model=SignageOverviewFast)
+async def get_fast_signage(signage_svc: AsyncSignageService = Depends()) -> Response:
     """Gets signage data that needs to be updated in real time.
 
     Parameters:
@@ -38,4 +40,6 @@ def get_fast_signage(signage_svc: SignageService = Depends()) -> SignageOverview
     Returns:
         SignageOverviewFast - contains office hours information for queue time, room and seat availability
     """
-    return signage_svc.get_fast_data()
+    return Response(
+        await signage_svc.get_fast_data_json(), media_type="application/json"
+    )
@@ -1,8 +1,25 @@
-from fastapi import APIRouter
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.security.http import HTTPAuthorizationCredentials
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
 from starlette.types import Scope, Receive, Send
 from fastapi.websockets import WebSocket, WebSocketDisconnect
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from .authentication import registered_user
+from ..database import engine
+from ..models.roster_role import RosterRole
+from ..services import UserService, PermissionService
+from ..services.exceptions import CoursePermissionException, ResourceNotFoundException
+from ..services.office_hours import OfficeHoursService
+from ..services.office_hours.queue_hub import (
+    OfficeHoursQueueHub,
+    OfficeHoursQueueSubscription,
+    office_hours_queue_hub,
+)
+
 
 class WebSocketMiddleware(BaseHTTPMiddleware):
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:  # type: ignore
@@ -26,3 +43,75 @@ async def echo(websocket: WebSocket):
             await websocket.send_json({"type": "echo", "data": message})
     except WebSocketDisconnect:
         ...
+
+
+@api.websocket("/office-hours/{id}/queue")
+async def office_hours_queue(
+    websocket: WebSocket,
+    id: int,
+    token: str,
+    queue_hub: OfficeHoursQueueHub = Depends(office_hours_queue_hub),
+):
+    """
+    Pushes changes to an office hours queue as they happen, instead of clients polling for them.
+
+    Browsers cannot set headers on WebSockets, so the JWT bearer token is passed as the `token`
+    query parameter. The first message is a snapshot: the queue overview for staff, or the get help
+    overview for students. Each following message is an `OfficeHoursQueueUpdate` for one ticket;
+    students receive them without ticket details.
+    """
+    await websocket.accept()
+
+    # Subscribe before loading the snapshot so that no update between the two is missed.
+    async with queue_hub.subscribe(id) as subscription:
+        try:
+            is_staff, snapshot = await run_in_threadpool(
+                _load_office_hours_queue_snapshot, token, id
+            )
+        except (HTTPException, CoursePermissionException, ResourceNotFoundException):
+            await websocket.close(code=1008)
+            return
+
+        await websocket.send_text(snapshot.model_dump_json())
+        forward = asyncio.create_task(
+            _forward_queue_updates(websocket, subscription, is_staff)
+        )
+        try:
+            while (await websocket.receive())["type"] != "websocket.disconnect":
+                ...
+        finally:
+            forward.cancel()
+
+
+def _load_office_hours_queue_snapshot(
+    token: str, office_hours_id: int
+) -> tuple[bool, BaseModel]:
+    """Authenticates a queue subscriber and loads the queue as they are permitted to see it.
+
+    Raises:
+        HTTPException: If the token does not belong to a registered user.
+        CoursePermissionException: If the user is not a member of the office hours' course site.
+        ResourceNotFoundException: If the office hours event does not exist.
+    """
+    with Session(engine) as session:
+        subject = registered_user(
+            UserService(session, PermissionService(session)),
+            HTTPAuthorizationCredentials(scheme="Bearer", credentials=token),
+        )
+        oh_event_svc = OfficeHoursService(session)
+        role = oh_event_svc.get_oh_event_role(subject, office_hours_id).role
+        if role == RosterRole.STUDENT.value:
+            return False, oh_event_svc.get_office_hour_get_help_overview(
+                subject, office_hours_id
+            )
+        return True, oh_event_svc.get_office_hour_queue(subject, office_hours_id)
+
+
+async def _forward_queue_updates(
+    websocket: WebSocket, subscription: OfficeHoursQueueSubscription, is_staff: bool
+):
+    while True:
+        update = await subscription.get()
+        if not is_staff:
+            update = update.redacted()
+        await websocket.send_text(update.model_dump_json())
@@ -1,7 +1,12 @@
 """SQLAlchemy DB Engine and Session niceties for FastAPI dependency injection."""
 
+import threading
+import time
 import sqlalchemy
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from .env import getenv
 
 __authors__ = ["Kris Jordan"]
@@ -9,9 +14,10 @@ __copyright__ = "Copyright 2023"
 __license__ = "MIT"
 
 
-def _engine_str(database: str = getenv("POSTGRES_DATABASE")) -> str:
+def _engine_str(
+    database: str = getenv("POSTGRES_DATABASE"), dialect: str = "postgresql+psycopg2"
+) -> str:
     """Helper function for reading settings from environment variables to produce connection string."""
-    dialect = "postgresql+psycopg2"
     user = getenv("POSTGRES_USER")
     password = getenv("POSTGRES_PASSWORD")
     host = getenv("POSTGRES_HOST")
@@ -24,14 +30,153 @@ def _in_production() -> bool:
     return getenv("MODE") == "production"
 
 
-engine = sqlalchemy.create_engine(_engine_str(), echo=not _in_production())
+def _pool_options() -> dict:
+    """Helper function for reading connection pool settings from environment variables.
+
+    Every worker process holds its own pool per engine, so PostgreSQL must accept up to
+    `workers * 2 * (POSTGRES_POOL_SIZE + POSTGRES_POOL_MAX_OVERFLOW)` connections."""
+    return {
+        "pool_size": int(getenv("POSTGRES_POOL_SIZE", "5")),
+        "max_overflow": int(getenv("POSTGRES_POOL_MAX_OVERFLOW", "10")),
+        "pool_timeout": float(getenv("POSTGRES_POOL_TIMEOUT", "30")),
+        "pool_recycle": int(getenv("POSTGRES_POOL_RECYCLE", "-1")),
+        "pool_pre_ping": getenv("POSTGRES_POOL_PRE_PING", "false").lower() == "true",
+    }
+
+
+class PoolMetrics:
+    """Counters of the activity of an engine's connection pool since it was created.
+
+    Checkout wait is the time spent acquiring a connection from the pool, whether waiting for one to
+    be returned or opening a new one. It grows as the pool runs out of connections, so it is the first
+    sign that a pool is too small. Waits are only recorded by pools of the `MeteredQueuePool` classes.
+
+    The other counters are kept by listeners of the pool's `connect`, `checkout` and `checkin` events.
+    Checkout time is the time connections are held between checkout and checkin, so pools whose
+    connections are held longer run out of connections sooner."""
+
+    connections_opened: int
+    checkouts: int
+    checkins: int
+    checkout_wait_seconds_total: float
+    checkout_wait_seconds_max: float
+    checkout_seconds_total: float
+    checkout_seconds_max: float
+    _lock: threading.Lock
+
+    def __init__(self, engine: sqlalchemy.Engine):
+        self.connections_opened = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.checkout_wait_seconds_total = 0.0
+        self.checkout_wait_seconds_max = 0.0
+        self.checkout_seconds_total = 0.0
+        self.checkout_seconds_max = 0.0
+        self._lock = threading.Lock()
+        if isinstance(engine.pool, _MeteredPool):
+            engine.pool.metrics = self
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "checkin", self._on_checkin)
+
+    def record_wait(self, seconds: float) -> None:
+        """Records the time a checkout spent acquiring a connection."""
+        with self._lock:
+            self.checkout_wait_seconds_total += seconds
+            self.checkout_wait_seconds_max = max(
+                self.checkout_wait_seconds_max, seconds
+            )
+
+    def _on_connect(self, _dbapi_connection, _connection_record) -> None:
+        with self._lock:
+            self.connections_opened += 1
+
+    def _on_checkout(self, _dbapi_connection, connection_record, _connection_proxy):
+        connection_record.info["checked_out_at"] = time.perf_counter()
+        with self._lock:
+            self.checkouts += 1
+
+    def _on_checkin(self, _dbapi_connection, connection_record) -> None:
+        checked_out_at = connection_record.info.pop("checked_out_at", None)
+        if checked_out_at is None:
+            return
+        seconds = time.perf_counter() - checked_out_at
+        with self._lock:
+            self.checkins += 1
+            self.checkout_seconds_total += seconds
+            self.checkout_seconds_max = max(self.checkout_seconds_max, seconds)
+
+
+class _MeteredPool:
+    """Times every connection acquired from a pool, recording the wait in the pool's `PoolMetrics`.
+
+    Sessions acquire their connection when they first execute a statement, so the wait is timed in
+    the pool rather than when a session is created, and requests answered from caches never wait."""
+
+    metrics: PoolMetrics | None = None
+
+    def connect(self):
+        started_at = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            if self.metrics is not None:
+                self.metrics.record_wait(time.perf_counter() - started_at)
+
+    def recreate(self):
+        # Disposing of an engine replaces its pool, which must keep reporting to the same metrics
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+class MeteredQueuePool(_MeteredPool, QueuePool):
+    """A `QueuePool` whose checkout waits are recorded by `PoolMetrics`."""
+
+
+class MeteredAsyncAdaptedQueuePool(_MeteredPool, AsyncAdaptedQueuePool):
+    """An `AsyncAdaptedQueuePool` whose checkout waits are recorded by `PoolMetrics`."""
+
+
+engine = sqlalchemy.create_engine(
+    _engine_str(),
+    echo=not _in_production(),
+    poolclass=MeteredQueuePool,
+    **_pool_options(),
+)
 """Application-level SQLAlchemy database engine."""
 
+pool_metrics = PoolMetrics(engine)
+"""Activity of the application-level engine's connection pool."""
+
+async_engine = create_async_engine(
+    _engine_str(dialect="postgresql+asyncpg"),
+    echo=not _in_production(),
+    poolclass=MeteredAsyncAdaptedQueuePool,
+    **_pool_options(),
+)
+"""Application-level SQLAlchemy database engine for `async def` routes, driven by asyncpg."""
+
+async_pool_metrics = PoolMetrics(async_engine.sync_engine)
+"""Activity of the async engine's connection pool."""
+
 
 def db_session():
-    """Generator function offering dependency injection of SQLAlchemy Sessions."""
+    """Generator function offering dependency injection of SQLAlchemy Sessions.
+
+    FastAPI caches dependencies for the duration of a request, so every service a route depends on,
+    directly or through other services, shares this one session and its pooled connection."""
     session = Session(engine)
     try:
         yield session
     finally:
         session.close()
+
+
+async def async_db_session():
+    """Generator function offering dependency injection of SQLAlchemy AsyncSessions.
+
+    Routes declared with `async def` run on the event loop rather than in the threadpool, so they are
+    not bounded by the threadpool's size while awaiting the database."""
+    async with AsyncSession(async_engine) as session:
+        yield session
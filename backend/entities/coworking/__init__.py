@@ -1,3 +1,4 @@
+from .checkin_monthly_total_entity import CheckinMonthlyTotalEntity
 from .operating_hours_entity import OperatingHoursEntity
 from .reservation_entity import ReservationEntity
 from .reservation_seat_table import reservation_seat_table
@@ -0,0 +1,35 @@
+"""Definition of SQLAlchemy table-backed object mapping entity for monthly check-in totals."""
+
+from datetime import date
+from sqlalchemy import Date, Float, ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..entity_base import EntityBase
+
+__authors__ = ["Will Zahrt", "Andrew Lockard"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+
+class CheckinMonthlyTotalEntity(EntityBase):
+    """Serves as the database model schema defining the shape of the `CheckinMonthlyTotal` table
+
+    Each row accumulates the time one user spent in checked out reservations ending in one month,
+    so that the signage leaderboard reads the top rows of a month rather than summing reservations.
+    Rows are maintained by `CheckinLeaderboardService` as reservations are checked out."""
+
+    # Name for the totals table in the PostgreSQL database
+    __tablename__ = "coworking__checkin_monthly_total"
+    __table_args__ = (
+        Index("coworking__checkin_monthly_total_idx", "month", "seconds", unique=False),
+    )
+
+    # User who was checked in
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("user.id", ondelete="CASCADE"), primary_key=True
+    )
+    # First day of the month the reservations ended in
+    month: Mapped[date] = mapped_column(Date, primary_key=True)
+
+    # Sum of the lengths of the reservations in seconds
+    seconds: Mapped[float] = mapped_column(Float, nullable=False, default=0)
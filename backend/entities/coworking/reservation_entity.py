@@ -1,7 +1,18 @@
 """Entity for Reservations."""
 
 from datetime import datetime
-from sqlalchemy import Integer, String, Boolean, ForeignKey, DateTime, Index
+from sqlalchemy import (
+    Integer,
+    String,
+    Boolean,
+    ForeignKey,
+    DateTime,
+    Index,
+    and_,
+    column,
+    func,
+)
+from sqlalchemy.dialects.postgresql import ExcludeConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship, Session
 from ..entity_base import EntityBase
 from ...models.coworking import Reservation, ReservationState, ReservationOverview
@@ -20,6 +31,23 @@ class ReservationEntity(EntityBase):
     __tablename__ = "coworking__reservation"
     __table_args__ = (
         Index("coworking__reservation_time_idx", "start", "end", "state", unique=False),
+        # Active reservations of a room may not overlap. Seats are constrained likewise on
+        # the `coworking__reservation_seat` table.
+        ExcludeConstraint(
+            (column("room_id"), "="),
+            (func.tsrange(column("start"), column("end")), "&&"),
+            name="coworking__reservation_room_no_overlap",
+            using="gist",
+            where=and_(
+                column("room_id").is_not(None),
+                column("state").not_in(
+                    [
+                        ReservationState.CANCELLED.value,
+                        ReservationState.CHECKED_OUT.value,
+                    ]
+                ),
+            ),
+        ),
     )
 
     # Reservation Model Fields
@@ -1,7 +1,19 @@
 """Join table between Reservation and Seat entities."""
 
-from sqlalchemy import Table, Column, ForeignKey
+from sqlalchemy import (
+    DDL,
+    Column,
+    DateTime,
+    ForeignKey,
+    String,
+    Table,
+    column,
+    event,
+    func,
+)
+from sqlalchemy.dialects.postgresql import ExcludeConstraint
 from ..entity_base import EntityBase
+from ...models.coworking import ReservationState
 
 __authors__ = ["Kris Jordan"]
 __copyright__ = "Copyright 2023"
@@ -12,4 +24,56 @@ reservation_seat_table = Table(
     EntityBase.metadata,
     Column("reservation_id", ForeignKey("coworking__reservation.id"), primary_key=True),
     Column("seat_id", ForeignKey("coworking__seat.id"), primary_key=True),
+    # Copies of the reservation's time and state, maintained by the triggers below, so that
+    # overlapping reservations of a seat can be excluded by a constraint on this table.
+    Column("start", DateTime, nullable=False),
+    Column("end", DateTime, nullable=False),
+    Column("state", String, nullable=False),
+    # Active reservations of a seat may not overlap
+    ExcludeConstraint(
+        (column("seat_id"), "="),
+        (func.tsrange(column("start"), column("end")), "&&"),
+        name="coworking__reservation_seat_no_overlap",
+        using="gist",
+        where=column("state").not_in(
+            [ReservationState.CANCELLED.value, ReservationState.CHECKED_OUT.value]
+        ),
+    ),
+)
+
+# Seats are added to a reservation by inserting join rows with only their keys, so the
+# reservation's time and state are copied into each row as it is inserted.
+event.listen(
+    reservation_seat_table,
+    "after_create",
+    DDL(
+        """
+        CREATE OR REPLACE FUNCTION coworking__reservation_seat_copy_reservation()
+        RETURNS trigger AS $$
+        BEGIN
+            SELECT start, "end", state INTO NEW.start, NEW."end", NEW.state
+            FROM coworking__reservation WHERE id = NEW.reservation_id;
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql;
+
+        CREATE TRIGGER coworking__reservation_seat_copy_reservation
+        BEFORE INSERT OR UPDATE OF reservation_id ON coworking__reservation_seat
+        FOR EACH ROW EXECUTE FUNCTION coworking__reservation_seat_copy_reservation();
+
+        CREATE OR REPLACE FUNCTION coworking__reservation_sync_seats()
+        RETURNS trigger AS $$
+        BEGIN
+            UPDATE coworking__reservation_seat
+            SET start = NEW.start, "end" = NEW."end", state = NEW.state
+            WHERE reservation_id = NEW.id;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql;
+
+        CREATE TRIGGER coworking__reservation_sync_seats
+        AFTER UPDATE OF start, "end", state ON coworking__reservation
+        FOR EACH ROW EXECUTE FUNCTION coworking__reservation_sync_seats();
+        """
+    ),
 )
@@ -4,6 +4,7 @@ There is no reason to instantiate this class directly. Instead, look toward the
 Additionally, import from the top-level entities file which indexes all entity implementations.
 """
 
+from sqlalchemy import DDL, event
 from sqlalchemy.orm import DeclarativeBase
 
 
@@ -14,3 +15,18 @@ __license__ = "MIT"
 
 class EntityBase(DeclarativeBase):
     pass
+
+
+# Exclusion constraints of coworking reservations compare IDs for equality within GiST indexes
+event.listen(
+    EntityBase.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS btree_gist"),
+)
+
+# Searches of text columns match substrings with trigram indexes
+event.listen(
+    EntityBase.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"),
+)
@@ -1,6 +1,6 @@
 """Definition of SQLAlchemy table-backed object mapping entity for Events."""
 
-from sqlalchemy import Integer, String, Boolean, DateTime, ForeignKey
+from sqlalchemy import Integer, String, Boolean, DateTime, ForeignKey, Computed, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from ..models.event import EventOverview
 from .entity_base import EntityBase
@@ -21,6 +21,17 @@ class EventEntity(EntityBase):
 
     # Name for the events table in the PostgreSQL database
     __tablename__ = "event"
+    __table_args__ = (
+        # Orders events, and pages through them by cursor, by start time
+        Index("ix_event_start_id", "start", "id"),
+        # Trigram index serving substring matches of event search
+        Index(
+            "ix_event_search_text",
+            "search_text",
+            postgresql_using="gin",
+            postgresql_ops={"search_text": "gin_trgm_ops"},
+        ),
+    )
 
     # Event properties (columns in the database table)
 
@@ -44,6 +55,14 @@ class EventEntity(EntityBase):
     image_url: Mapped[str] = mapped_column(String, nullable=True)
     # This field provides a registration URL if external registration is used.
     override_registration_url: Mapped[str] = mapped_column(String, nullable=True)
+    # Lowercase name and description matched by event search, maintained by the database
+    search_text: Mapped[str] = mapped_column(
+        String,
+        Computed(
+            "lower(coalesce(name, '') || ' ' || coalesce(description, ''))",
+            persisted=True,
+        ),
+    )
 
     # Organization hosting the event
     # NOTE: This defines a one-to-many relationship between the organization and events tables.
@@ -0,0 +1,45 @@
+"""Definition of SQLAlchemy table-backed object mapping entity for daily office hours ticket rollups."""
+
+from datetime import date
+from sqlalchemy import Date, Float, ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..entity_base import EntityBase
+
+__authors__ = ["Ajay Gandecha", "Jade Keegan"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+
+class OfficeHoursTicketDailyRollupEntity(EntityBase):
+    """Serves as the database model schema defining the shape of the `OfficeHoursTicketDailyRollup` table
+
+    Each row aggregates the closed tickets of a course site created on one day and called by one
+    staff member, so that office hours statistics are summed over days rather than tickets. Rows are
+    maintained by `OfficeHoursTicketRollupService` as tickets are closed and deleted."""
+
+    # Name for the rollup table in the PostgreSQL database
+    __tablename__ = "office_hours__ticket_daily_rollup"
+
+    # Course site the tickets belong to
+    course_site_id: Mapped[int] = mapped_column(
+        ForeignKey("course_site.id", ondelete="CASCADE"), primary_key=True
+    )
+    # Day the tickets were created on
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    # Section member who called the tickets
+    caller_id: Mapped[int] = mapped_column(
+        ForeignKey("academics__user_section.id", ondelete="CASCADE"), primary_key=True
+    )
+
+    # Number of closed tickets, in total and by ticket type
+    ticket_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    conceptual_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    assignment_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # Sums of wait (created to called) and duration (called to closed) in seconds, with the
+    # number of tickets each sum is over, so that averages can be combined across rows
+    wait_seconds: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+    wait_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    duration_seconds: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+    duration_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
@@ -1,7 +1,7 @@
 """Definition of SQLAlchemy table-backed object mapping entity for Office Hour tickets."""
 
 from datetime import datetime
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ...models.office_hours.ticket_state import TicketState
@@ -36,6 +36,17 @@ class OfficeHoursTicketEntity(EntityBase):
 
     # Name for the events table in the PostgreSQL database
     __tablename__ = "office_hours__ticket"
+    __table_args__ = (
+        # Counts the queued tickets ahead of a ticket, which is a student's queue position
+        Index(
+            "office_hours__ticket_queue_idx",
+            "office_hours_id",
+            "state",
+            "created_at",
+            unique=False,
+            postgresql_where=text("state = 'QUEUED'"),
+        ),
+    )
 
     # Unique id for OfficeHoursTicket
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -1,6 +1,6 @@
 """Definition of SQLAlchemy table-backed object mapping entity for Organizations."""
 
-from sqlalchemy import Integer, String, Boolean
+from sqlalchemy import Integer, String, Boolean, Computed, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from .entity_base import EntityBase
 from typing import Self
@@ -17,6 +17,15 @@ class OrganizationEntity(EntityBase):
 
     # Name for the organizations table in the PostgreSQL database
     __tablename__ = "organization"
+    __table_args__ = (
+        # Trigram index serving substring matches of event search by organization
+        Index(
+            "ix_organization_search_text",
+            "search_text",
+            postgresql_using="gin",
+            postgresql_ops={"search_text": "gin_trgm_ops"},
+        ),
+    )
 
     # Organization properties (columns in the database table)
 
@@ -28,6 +37,10 @@ class OrganizationEntity(EntityBase):
     shorthand: Mapped[str] = mapped_column(String, nullable=False)
     # Slug of the organization
     slug: Mapped[str] = mapped_column(String, nullable=False, unique=True)
+    # Lowercase name and slug matched by event search, maintained by the database
+    search_text: Mapped[str] = mapped_column(
+        String, Computed("lower(name || ' ' || slug)", persisted=True)
+    )
     # Logo of the organization
     logo: Mapped[str] = mapped_column(String)
     # Short description of the organization
@@ -1,6 +1,6 @@
 """Definition of SQLAlchemy table-backed object mapping entity for Users."""
 
-from sqlalchemy import Boolean, Integer, String
+from sqlalchemy import Boolean, Computed, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import Self
 
@@ -21,6 +21,15 @@ class UserEntity(EntityBase):
 
     # Name for the user table in the PostgreSQL database
     __tablename__ = "user"
+    __table_args__ = (
+        # Trigram index serving substring matches of user search
+        Index(
+            "ix_user_search_text",
+            "search_text",
+            postgresql_using="gin",
+            postgresql_ops={"search_text": "gin_trgm_ops"},
+        ),
+    )
 
     # Unique ID for the user entry
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
@@ -54,6 +63,15 @@ class UserEntity(EntityBase):
     linkedin: Mapped[str | None] = mapped_column(String(), nullable=True)
     # Website of the user
     website: Mapped[str | None] = mapped_column(String(), nullable=True)
+    # Lowercase name, ONYEN, email, and PID matched by user search, maintained by the database
+    search_text: Mapped[str] = mapped_column(
+        String(),
+        Computed(
+            "lower(first_name || ' ' || last_name || ' ' || onyen || ' ' || email"
+            " || ' ' || pid::text)",
+            persisted=True,
+        ),
+    )
 
     # All of the roles for the given user.
     # NOTE: This field establishes a many-to-many relationship between the users and roles table.
@@ -1,11 +1,15 @@
 """Entrypoint of backend API exposing the FastAPI `app` to be served by an application server such as uvicorn."""
 
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import timedelta
 from pathlib import Path
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from fastapi.middleware.gzip import GZipMiddleware
 
 from backend.services.coworking.reservation import ReservationException
+from backend.services.coworking.reservation_lifecycle import sweep_periodically
 
 from .api.events import events
 
@@ -32,6 +36,7 @@ from .api.admin import users as admin_users
 from .api.admin import roles as admin_roles
 from .api.admin import facts as admin_facts
 
+from .env import getenv
 from .services.exceptions import (
     RecurringOfficeHourEventException,
     UserPermissionException,
@@ -48,6 +53,25 @@ description = """
 Welcome to the UNC Computer Science **Experience Labs** RESTful Application Programming Interface.
 """
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Runs the reservation lifecycle sweeper in the background while the app is served.
+
+    Set RESERVATION_SWEEP_INTERVAL to the seconds between sweeps, or to 0 to disable it. The
+    reservation exclusion constraints rely on the sweeper to expire reservations, so it should
+    only be disabled where another process sweeps them."""
+    interval = float(getenv("RESERVATION_SWEEP_INTERVAL", "60"))
+    sweeper = (
+        asyncio.create_task(sweep_periodically(timedelta(seconds=interval)))
+        if interval > 0
+        else None
+    )
+    yield
+    if sweeper is not None:
+        sweeper.cancel()
+
+
 # Metadata to improve the usefulness of OpenAPI Docs /docs API Explorer
 app = FastAPI(
     title="UNC CS Experience Labs API",
@@ -72,6 +96,7 @@ app = FastAPI(
         article.openapi_tags,
         signage.openapi_tags,
     ],
+    lifespan=lifespan,
 )
 
 # Use GZip middleware for compressing HTML responses over the network
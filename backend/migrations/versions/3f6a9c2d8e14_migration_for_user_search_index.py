@@ -0,0 +1,50 @@
+"""Migration for user search index
+
+Revision ID: 3f6a9c2d8e14
+Revises: 8d2b6c41f0a7
+Create Date: 2025-05-28 10:41:52.104387
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "3f6a9c2d8e14"
+down_revision = "8d2b6c41f0a7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.add_column(
+        "user",
+        sa.Column(
+            "search_text",
+            sa.String(),
+            sa.Computed(
+                "lower(first_name || ' ' || last_name || ' ' || onyen || ' ' || email"
+                " || ' ' || pid::text)",
+                persisted=True,
+            ),
+        ),
+    )
+    op.create_index(
+        "ix_user_search_text",
+        "user",
+        ["search_text"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"search_text": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_user_search_text",
+        table_name="user",
+        postgresql_using="gin",
+        postgresql_ops={"search_text": "gin_trgm_ops"},
+    )
+    op.drop_column("user", "search_text")
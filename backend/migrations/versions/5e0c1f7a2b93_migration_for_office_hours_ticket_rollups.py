@@ -0,0 +1,65 @@
+"""Migration for daily office hours ticket rollups
+
+Revision ID: 5e0c1f7a2b93
+Revises: a9f09b49d862
+Create Date: 2025-05-20 10:12:41.502214
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "5e0c1f7a2b93"
+down_revision = "a9f09b49d862"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "office_hours__ticket_daily_rollup",
+        sa.Column("course_site_id", sa.Integer(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("caller_id", sa.Integer(), nullable=False),
+        sa.Column("ticket_count", sa.Integer(), nullable=False),
+        sa.Column("conceptual_count", sa.Integer(), nullable=False),
+        sa.Column("assignment_count", sa.Integer(), nullable=False),
+        sa.Column("wait_seconds", sa.Float(), nullable=False),
+        sa.Column("wait_count", sa.Integer(), nullable=False),
+        sa.Column("duration_seconds", sa.Float(), nullable=False),
+        sa.Column("duration_count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["course_site_id"], ["course_site.id"], ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(
+            ["caller_id"], ["academics__user_section.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("course_site_id", "day", "caller_id"),
+    )
+
+    # Backfill the rollups from the tickets closed so far
+    op.execute(
+        """
+        INSERT INTO office_hours__ticket_daily_rollup
+        SELECT
+            office_hours.course_site_id,
+            DATE(ticket.created_at),
+            ticket.caller_id,
+            COUNT(*),
+            COUNT(*) FILTER (WHERE ticket.type = 'CONCEPTUAL_HELP'),
+            COUNT(*) FILTER (WHERE ticket.type = 'ASSIGNMENT_HELP'),
+            COALESCE(SUM(EXTRACT(EPOCH FROM ticket.called_at - ticket.created_at)), 0),
+            COUNT(ticket.called_at),
+            COALESCE(SUM(EXTRACT(EPOCH FROM ticket.closed_at - ticket.called_at)), 0),
+            COUNT(EXTRACT(EPOCH FROM ticket.closed_at - ticket.called_at))
+        FROM office_hours__ticket AS ticket
+        JOIN office_hours ON office_hours.id = ticket.office_hours_id
+        WHERE ticket.state = 'CLOSED' AND ticket.caller_id IS NOT NULL
+        GROUP BY office_hours.course_site_id, DATE(ticket.created_at), ticket.caller_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("office_hours__ticket_daily_rollup")
@@ -0,0 +1,130 @@
+"""Migration for reservation exclusion constraints
+
+Active reservations of a seat or a room may no longer overlap. Reservations due a time-based
+transition are expired first, as the reservation sweeper would, so that stale drafts and
+confirmations do not violate the constraints. Overlapping reservations that have yet to end must be resolved by hand
+before upgrading.
+
+Revision ID: 8d2b6c41f0a7
+Revises: 5e0c1f7a2b93
+Create Date: 2025-05-27 14:03:18.220931
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "8d2b6c41f0a7"
+down_revision = "5e0c1f7a2b93"
+branch_labels = None
+depends_on = None
+
+ACTIVE = "state NOT IN ('CANCELLED', 'CHECKED_OUT')"
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+
+    # Apply the transitions of ReservationLifecycleService#transitions, with the draft and
+    # check-in timeouts of PolicyService at the time of this migration
+    for state, next_state, expired in (
+        ("DRAFT", "CANCELLED", "created_at < now() - interval '5 minutes'"),
+        ("CONFIRMED", "CANCELLED", "start < now() - interval '10 minutes'"),
+        ("CHECKED_IN", "CHECKED_OUT", '"end" <= now()'),
+    ):
+        op.execute(
+            f"""
+            UPDATE coworking__reservation
+            SET state = '{next_state}'
+            WHERE state = '{state}' AND {expired}
+            """
+        )
+
+    # Copy each reservation's time and state onto its seats
+    for name, type_ in (
+        ("start", sa.DateTime()),
+        ("end", sa.DateTime()),
+        ("state", sa.String()),
+    ):
+        op.add_column(
+            "coworking__reservation_seat", sa.Column(name, type_, nullable=True)
+        )
+    op.execute(
+        """
+        UPDATE coworking__reservation_seat AS seat
+        SET start = reservation.start, "end" = reservation."end", state = reservation.state
+        FROM coworking__reservation AS reservation
+        WHERE reservation.id = seat.reservation_id
+        """
+    )
+    for name in ("start", "end", "state"):
+        op.alter_column("coworking__reservation_seat", name, nullable=False)
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION coworking__reservation_seat_copy_reservation()
+        RETURNS trigger AS $$
+        BEGIN
+            SELECT start, "end", state INTO NEW.start, NEW."end", NEW.state
+            FROM coworking__reservation WHERE id = NEW.reservation_id;
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql;
+
+        CREATE TRIGGER coworking__reservation_seat_copy_reservation
+        BEFORE INSERT OR UPDATE OF reservation_id ON coworking__reservation_seat
+        FOR EACH ROW EXECUTE FUNCTION coworking__reservation_seat_copy_reservation();
+
+        CREATE OR REPLACE FUNCTION coworking__reservation_sync_seats()
+        RETURNS trigger AS $$
+        BEGIN
+            UPDATE coworking__reservation_seat
+            SET start = NEW.start, "end" = NEW."end", state = NEW.state
+            WHERE reservation_id = NEW.id;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql;
+
+        CREATE TRIGGER coworking__reservation_sync_seats
+        AFTER UPDATE OF start, "end", state ON coworking__reservation
+        FOR EACH ROW EXECUTE FUNCTION coworking__reservation_sync_seats();
+        """
+    )
+
+    op.execute(
+        f"""
+        ALTER TABLE coworking__reservation_seat
+        ADD CONSTRAINT coworking__reservation_seat_no_overlap
+        EXCLUDE USING gist (seat_id WITH =, tsrange(start, "end") WITH &&)
+        WHERE ({ACTIVE})
+        """
+    )
+    op.execute(
+        f"""
+        ALTER TABLE coworking__reservation
+        ADD CONSTRAINT coworking__reservation_room_no_overlap
+        EXCLUDE USING gist (room_id WITH =, tsrange(start, "end") WITH &&)
+        WHERE (room_id IS NOT NULL AND {ACTIVE})
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        "coworking__reservation_room_no_overlap", "coworking__reservation"
+    )
+    op.drop_constraint(
+        "coworking__reservation_seat_no_overlap", "coworking__reservation_seat"
+    )
+    op.execute(
+        """
+        DROP TRIGGER coworking__reservation_sync_seats ON coworking__reservation;
+        DROP FUNCTION coworking__reservation_sync_seats();
+        DROP TRIGGER coworking__reservation_seat_copy_reservation
+            ON coworking__reservation_seat;
+        DROP FUNCTION coworking__reservation_seat_copy_reservation();
+        """
+    )
+    for name in ("state", "end", "start"):
+        op.drop_column("coworking__reservation_seat", name)
@@ -0,0 +1,64 @@
+"""Migration for event search and cursor index
+
+Revision ID: a7d3e5b19c60
+Revises: 3f6a9c2d8e14
+Create Date: 2025-05-29 09:17:36.582014
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "a7d3e5b19c60"
+down_revision = "3f6a9c2d8e14"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.add_column(
+        "event",
+        sa.Column(
+            "search_text",
+            sa.String(),
+            sa.Computed(
+                "lower(coalesce(name, '') || ' ' || coalesce(description, ''))",
+                persisted=True,
+            ),
+        ),
+    )
+    op.add_column(
+        "organization",
+        sa.Column(
+            "search_text",
+            sa.String(),
+            sa.Computed("lower(name || ' ' || slug)", persisted=True),
+        ),
+    )
+    op.create_index("ix_event_start_id", "event", ["start", "id"], unique=False)
+    op.create_index(
+        "ix_event_search_text",
+        "event",
+        ["search_text"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"search_text": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_organization_search_text",
+        "organization",
+        ["search_text"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"search_text": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_organization_search_text", table_name="organization")
+    op.drop_index("ix_event_search_text", table_name="event")
+    op.drop_index("ix_event_start_id", table_name="event")
+    op.drop_column("organization", "search_text")
+    op.drop_column("event", "search_text")
@@ -0,0 +1,34 @@
+"""Migration for office hours ticket queue index
+
+Revision ID: c41e8b2d7f05
+Revises: a7d3e5b19c60
+Create Date: 2025-06-03 14:42:11.208537
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "c41e8b2d7f05"
+down_revision = "a7d3e5b19c60"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "office_hours__ticket_queue_idx",
+        "office_hours__ticket",
+        ["office_hours_id", "state", "created_at"],
+        unique=False,
+        postgresql_where=sa.text("state = 'QUEUED'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "office_hours__ticket_queue_idx",
+        table_name="office_hours__ticket",
+        postgresql_where=sa.text("state = 'QUEUED'"),
+    )
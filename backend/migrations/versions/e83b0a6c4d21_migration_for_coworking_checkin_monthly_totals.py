@@ -0,0 +1,57 @@
+"""Migration for coworking check-in monthly totals
+
+Revision ID: e83b0a6c4d21
+Revises: c41e8b2d7f05
+Create Date: 2025-06-10 09:27:53.614802
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "e83b0a6c4d21"
+down_revision = "c41e8b2d7f05"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "coworking__checkin_monthly_total",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("month", sa.Date(), nullable=False),
+        sa.Column("seconds", sa.Float(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["user.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "month"),
+    )
+    op.create_index(
+        "coworking__checkin_monthly_total_idx",
+        "coworking__checkin_monthly_total",
+        ["month", "seconds"],
+        unique=False,
+    )
+
+    # Backfill the totals from the reservations checked out so far
+    op.execute(
+        """
+        INSERT INTO coworking__checkin_monthly_total
+        SELECT
+            reservation_user.user_id,
+            CAST(DATE_TRUNC('month', reservation.end) AS DATE),
+            SUM(EXTRACT(EPOCH FROM reservation.end - reservation.start))
+        FROM coworking__reservation AS reservation
+        JOIN coworking__reservation_user AS reservation_user
+            ON reservation_user.reservation_id = reservation.id
+        WHERE reservation.state = 'CHECKED_OUT'
+        GROUP BY reservation_user.user_id, CAST(DATE_TRUNC('month', reservation.end) AS DATE)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "coworking__checkin_monthly_total_idx",
+        table_name="coworking__checkin_monthly_total",
+    )
+    op.drop_table("coworking__checkin_monthly_total")
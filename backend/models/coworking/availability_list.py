@@ -84,6 +84,10 @@ class AvailabilityList(BaseModel):
         ):
             front += 1
 
+        # The block falls entirely within a gap between availability ranges.
+        if front == len(self.availability):
+            return
+
         end = front + 1
         while end < len(self.availability) and block.overlaps(self.availability[end]):
             end += 1
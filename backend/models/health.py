@@ -0,0 +1,39 @@
+"""Models reporting the health of the running service."""
+
+from pydantic import BaseModel
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+
+class DatabasePoolStatus(BaseModel):
+    """
+    Pydantic model representing the state of a worker's database connection pool.
+
+    `overflow` counts connections open beyond the pool's size. Connection counts and times are
+    totals since the worker started. Checkout wait time is the time spent acquiring connections from
+    the pool, which grows as it runs out of them, while checkout time is the time connections were
+    held before being returned to the pool.
+    """
+
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    checkout_wait_seconds_total: float
+    checkout_wait_seconds_max: float
+    connections_opened: int
+    checkouts: int
+    checkins: int
+    checkout_seconds_total: float
+    checkout_seconds_max: float
+
+
+class DatabasePoolsStatus(BaseModel):
+    """
+    Pydantic model representing the connection pools of the worker that served it.
+    """
+
+    database_pool: DatabasePoolStatus
+    async_database_pool: DatabasePoolStatus
@@ -0,0 +1,43 @@
+"""Model for incremental updates pushed to subscribers of an office hours queue."""
+
+from datetime import datetime
+from pydantic import BaseModel
+
+from ..academics.my_courses import OfficeHourTicketOverview
+
+__authors__ = ["Ajay Gandecha"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+
+class OfficeHoursQueueUpdate(BaseModel):
+    """
+    Pydantic model describing a change to one ticket of an office hours queue.
+
+    `ticket_id`, `state`, and `created_at` are enough for a client to maintain queue positions.
+    `ticket` holds the ticket's full overview for staff clients. It is omitted when the update
+    is sent to students, or when it is too large for the message broker. Clients should refetch
+    the queue if they need an omitted overview.
+    """
+
+    office_hours_id: int
+    ticket_id: int
+    state: str
+    created_at: datetime
+    ticket: OfficeHourTicketOverview | None = None
+
+    @classmethod
+    def from_ticket(
+        cls, office_hours_id: int, ticket: OfficeHourTicketOverview
+    ) -> "OfficeHoursQueueUpdate":
+        return cls(
+            office_hours_id=office_hours_id,
+            ticket_id=ticket.id,
+            state=ticket.state,
+            created_at=ticket.created_at,
+            ticket=ticket,
+        )
+
+    def redacted(self) -> "OfficeHoursQueueUpdate":
+        """Returns this update without the ticket overview."""
+        return self.model_copy(update={"ticket": None})
@@ -29,13 +29,22 @@ class TicketPaginationParams(PaginationParams):
 
 
 class EventPaginationParams(PaginationParams):
-    """Parameters passed from the client to paginate event results."""
+    """Parameters passed from the client to paginate event results.
+
+    When `cursor` is not None, events are paged through by start time from the position the cursor
+    encodes rather than by page number, and the empty string requests the first page. Cursors are
+    opaque to the client, which passes back the `next_cursor` of the previous page.
+
+    When `count` is False, the `length` of the result is the database's estimate rather than an
+    exact count, which spares a second query over every matching event."""
 
     order_by: str = ""
     ascending: str = "true"
     filter: str = ""
     range_start: str = ""
     range_end: str = ""
+    cursor: str | None = None
+    count: bool = True
 
 
 class Paginated(BaseModel, Generic[T]):
@@ -44,3 +53,4 @@ class Paginated(BaseModel, Generic[T]):
     items: list[T]
     length: int
     params: PaginationParams | EventPaginationParams | TicketPaginationParams
+    next_cursor: str | None = None
@@ -0,0 +1,48 @@
+"""
+This script recomputes the monthly check-in totals behind the signage leaderboard.
+
+The totals are maintained as reservations are checked out, and are backfilled for the months before
+they were introduced by their migration. Run this script to recompute historical months after
+reservations are corrected or imported directly in the database. Without a month, every month is
+recomputed.
+
+Usage: python3 -m backend.script.backfill_checkin_leaderboard [--since YYYY-MM]
+"""
+
+import argparse
+from datetime import datetime
+
+from sqlalchemy.orm import Session
+
+from ..database import engine
+from ..services.coworking.checkin_leaderboard import CheckinLeaderboardService
+
+__authors__ = ["Will Zahrt", "Andrew Lockard"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Recompute the monthly check-in totals of the signage leaderboard."
+    )
+    parser.add_argument(
+        "--since",
+        help="First month to recompute, as YYYY-MM. Defaults to every month.",
+        type=lambda month: datetime.strptime(month, "%Y-%m").date(),
+        default=None,
+    )
+    args = parser.parse_args()
+
+    with Session(engine) as session:
+        CheckinLeaderboardService(session).rebuild(args.since)
+        session.commit()
+
+    print(
+        "Recomputed check-in totals"
+        + (f" since {args.since:%Y-%m}" if args.since else "")
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+"""
+This script load-tests the reads served by both a sync and an async service: the event listing,
+the coworking status, the signage data, and the welcome overview.
+
+Each read is invoked the way its routes would be: through the sync service on a 40 thread pool, as
+Starlette runs sync `def` routes, and through the async service on a single event loop, as `async
+def` routes run. Throughput is reported at increasing numbers of concurrent clients.
+
+The signage data is read uncached, since its serialized snapshots would otherwise serve nearly every
+request without touching the database. Seats and operating hours are read from their snapshots, as
+they are by the routes.
+
+The script reads the development database, so populate it first with `reset_demo`.
+
+Usage: python3 -m backend.script.benchmark_async_routes
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import Session
+
+from ..database import _engine_str
+from ..entities import UserEntity
+from ..models import EventPaginationParams, User
+from ..services import (
+    ArticleService,
+    AsyncArticleService,
+    AsyncSignageService,
+    EventService,
+    PermissionService,
+    RoomService,
+    SignageService,
+    UserService,
+)
+from ..services.coworking import (
+    AsyncOperatingHoursService,
+    AsyncReservationService,
+    AsyncSeatService,
+    AsyncStatusService,
+    OperatingHoursService,
+    PolicyService,
+    ReservationService,
+    SeatService,
+    StatusService,
+)
+from ..services.event import AsyncEventService
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+REQUESTS = 400
+THREADPOOL_SIZE = 40  # Starlette's default number of threads for sync routes
+
+engine = create_engine(_engine_str())
+async_engine = create_async_engine(_engine_str(dialect="postgresql+asyncpg"))
+
+PAGE = EventPaginationParams(order_by="start", filter="")
+CURSOR = EventPaginationParams(filter="", cursor="", count=False)
+
+
+def _reservation_svc(session: Session) -> ReservationService:
+    permission_svc = PermissionService(session)
+    return ReservationService(
+        session,
+        permission_svc,
+        PolicyService(),
+        OperatingHoursService(session, permission_svc),
+        SeatService(session),
+    )
+
+
+def _async_reservation_svc(session: AsyncSession) -> AsyncReservationService:
+    return AsyncReservationService(
+        session, PolicyService(), AsyncOperatingHoursService(session)
+    )
+
+
+def _event_svc(session: Session) -> EventService:
+    permission_svc = PermissionService(session)
+    return EventService(session, permission_svc, UserService(session, permission_svc))
+
+
+def _status_svc(session: Session) -> StatusService:
+    permission_svc = PermissionService(session)
+    return StatusService(
+        PolicyService(),
+        OperatingHoursService(session, permission_svc),
+        SeatService(session),
+        _reservation_svc(session),
+    )
+
+
+def _async_status_svc(session: AsyncSession) -> AsyncStatusService:
+    return AsyncStatusService(
+        PolicyService(),
+        AsyncOperatingHoursService(session),
+        AsyncSeatService(session),
+        _async_reservation_svc(session),
+    )
+
+
+def _signage_svc(session: Session) -> SignageService:
+    return SignageService(
+        session, _reservation_svc(session), SeatService(session), RoomService(session)
+    )
+
+
+def _async_signage_svc(session: AsyncSession) -> AsyncSignageService:
+    return AsyncSignageService(
+        session, _async_reservation_svc(session), AsyncSeatService(session)
+    )
+
+
+def _article_svc(session: Session) -> ArticleService:
+    permission_svc = PermissionService(session)
+    return ArticleService(
+        session,
+        permission_svc,
+        PolicyService(),
+        OperatingHoursService(session, permission_svc),
+    )
+
+
+def _async_article_svc(session: AsyncSession) -> AsyncArticleService:
+    return AsyncArticleService(
+        session, PolicyService(), AsyncOperatingHoursService(session)
+    )
+
+
+READS: dict[
+    str,
+    tuple[
+        Callable[[Session, User], object],
+        Callable[[AsyncSession, User], Awaitable[object]],
+    ],
+] = {
+    "page": (
+        lambda session, subject: _event_svc(session).get_paginated_events(
+            PAGE, subject
+        ),
+        lambda session, subject: AsyncEventService(session).get_paginated_events(
+            PAGE, subject
+        ),
+    ),
+    "cursor": (
+        lambda session, subject: _event_svc(session).get_paginated_events(
+            CURSOR, subject
+        ),
+        lambda session, subject: AsyncEventService(session).get_paginated_events(
+            CURSOR, subject
+        ),
+    ),
+    "status": (
+        lambda session, subject: _status_svc(session).get_coworking_status(subject),
+        lambda session, subject: _async_status_svc(session).get_coworking_status(
+            subject
+        ),
+    ),
+    "fast": (
+        lambda session, _: _signage_svc(session).get_fast_data(),
+        lambda session, _: _async_signage_svc(session).get_fast_data(),
+    ),
+    "slow": (
+        lambda session, _: _signage_svc(session).get_slow_data(),
+        lambda session, _: _async_signage_svc(session).get_slow_data(),
+    ),
+    "welcome": (
+        lambda session, subject: _article_svc(session).get_welcome_overview(subject),
+        lambda session, subject: _async_article_svc(session).get_welcome_overview(
+            subject
+        ),
+    ),
+}
+
+
+def sync_throughput(
+    read: Callable[[Session, User], object], subject: User, concurrency: int
+) -> float:
+    def request():
+        with Session(engine) as session:
+            read(session, subject)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=min(concurrency, THREADPOOL_SIZE)) as pool:
+        for future in [pool.submit(request) for _ in range(REQUESTS)]:
+            future.result()
+    return REQUESTS / (time.perf_counter() - start)
+
+
+async def async_throughput(
+    read: Callable[[AsyncSession, User], Awaitable[object]],
+    subject: User,
+    concurrency: int,
+) -> float:
+    clients = asyncio.Semaphore(concurrency)
+
+    async def request():
+        async with clients, AsyncSession(async_engine) as session:
+            await read(session, subject)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(request() for _ in range(REQUESTS)))
+    return REQUESTS / (time.perf_counter() - start)
+
+
+async def main():
+    with Session(engine) as session:
+        subject = session.scalars(select(UserEntity).order_by(UserEntity.id)).first()
+        if subject is None:
+            raise SystemExit("No users found. Populate the database with `reset_demo`.")
+        subject = subject.to_model()
+
+    print(f"{'read':>8} {'clients':>8} {'sync req/s':>11} {'async req/s':>12}")
+    for name, (sync_read, async_read) in READS.items():
+        for concurrency in (10, 100, 400):
+            sync_rate = sync_throughput(sync_read, subject, concurrency)
+            async_rate = await async_throughput(async_read, subject, concurrency)
+            print(f"{name:>8} {concurrency:>8} {sync_rate:>11.1f} {async_rate:>12.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
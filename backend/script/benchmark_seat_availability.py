@@ -0,0 +1,91 @@
+"""
+This script micro-benchmarks subtracting seat reservations from operating hours.
+
+It compares subtracting each reservation from a per-seat AvailabilityList, as seat availability was
+previously computed, against sweeping the SeatAvailabilityIndex. Synthetic seats and reservations
+are generated in memory, so no database is required.
+
+Usage: python3 -m backend.script.benchmark_seat_availability
+"""
+
+import random
+import timeit
+from datetime import datetime, timedelta
+
+from ..models.coworking import AvailabilityList, TimeRange
+from ..services.coworking.seat_availability_index import SeatAvailabilityIndex
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+OPEN = datetime(2024, 1, 1, 10)
+CLOSE = datetime(2024, 1, 1, 20)
+SLOTS = int((CLOSE - OPEN) / timedelta(minutes=30))
+
+
+def synthetic_reservations(
+    seats: int, reservations_per_seat: int
+) -> list[tuple[int, datetime, datetime]]:
+    """Random half-hour aligned reservations within operating hours."""
+    rng = random.Random(seats * 1000 + reservations_per_seat)
+    reservations = []
+    for seat_id in range(seats):
+        for _ in range(reservations_per_seat):
+            start = rng.randrange(SLOTS - 1)
+            length = rng.randint(1, 4)
+            reservations.append(
+                (
+                    seat_id,
+                    OPEN + start * timedelta(minutes=30),
+                    OPEN + min(start + length, SLOTS) * timedelta(minutes=30),
+                )
+            )
+    return reservations
+
+
+def availability_list(seats: int, reservations: list[tuple[int, datetime, datetime]]):
+    by_seat = {
+        seat_id: AvailabilityList(availability=[TimeRange(start=OPEN, end=CLOSE)])
+        for seat_id in range(seats)
+    }
+    for seat_id, start, end in reservations:
+        by_seat[seat_id].subtract(TimeRange(start=start, end=end))
+    return {seat_id: seats.availability for seat_id, seats in by_seat.items()}
+
+
+def availability_index(seats: int, reservations: list[tuple[int, datetime, datetime]]):
+    index = SeatAvailabilityIndex(reservations)
+    return {
+        seat_id: index.available(seat_id, [(OPEN, CLOSE)]) for seat_id in range(seats)
+    }
+
+
+def main():
+    print(
+        f"{'seats':>6} {'res/seat':>9} {'list ms':>10} {'index ms':>10} {'speedup':>8}"
+    )
+    for seats in (25, 100, 400):
+        for reservations_per_seat in (2, 8, 32):
+            reservations = synthetic_reservations(seats, reservations_per_seat)
+            runs = 5
+            list_time = (
+                timeit.timeit(
+                    lambda: availability_list(seats, reservations), number=runs
+                )
+                / runs
+            )
+            index_time = (
+                timeit.timeit(
+                    lambda: availability_index(seats, reservations), number=runs
+                )
+                / runs
+            )
+            print(
+                f"{seats:>6} {reservations_per_seat:>9} {list_time * 1000:>10.2f} "
+                f"{index_time * 1000:>10.2f} {list_time / index_time:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+This script benchmarks user search against a synthetic table of 100,000 users.
+
+It compares the previous search, a prefix ILIKE pass followed by a substring ILIKE pass when the
+first finds nothing, against the ranked search over the trigram-indexed `search_text` column, with
+and without the in-process prefix index that answers searches shorter than a trigram.
+
+The users are inserted into a scratch database, which is created and then dropped by this script.
+
+Usage: python3 -m backend.script.benchmark_user_search
+"""
+
+import random
+import sys
+import time
+
+import sqlalchemy
+from sqlalchemy import String, cast, func, insert, or_, select, text
+from sqlalchemy.orm import Session
+
+from ..database import _engine_str
+from ..entities import EntityBase, UserEntity
+from ..env import getenv
+from ..models import User
+from ..services import PermissionService, UserService
+from ..services import user as user_module
+from ..services.cache import clear_caches
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+USERS = 100_000
+RUNS = 20
+QUERIES = ["j", "ma", "mar", "mart", "martinez", "rtin", "ez ki", "@unc", "7001", "qqq"]
+
+FIRST_NAMES = "James Mary Robert Patricia John Jennifer Michael Linda David Elizabeth Maria Kim Jose Wei Aisha Omar Priya Chen Luis Grace".split()
+LAST_NAMES = "Smith Johnson Williams Brown Jones Garcia Miller Davis Rodriguez Martinez Hernandez Lopez Gonzalez Wilson Anderson Thomas Taylor Moore Nguyen Patel Kim Lee".split()
+
+if getenv("MODE") != "development":
+    print("This script can only be run in development mode.", file=sys.stderr)
+    print("Add MODE=development to your .env file in workspace's `backend/` directory")
+    exit(1)
+
+database = f"{getenv('POSTGRES_DATABASE')}_user_search_benchmark"
+server = sqlalchemy.create_engine(_engine_str(""), isolation_level="AUTOCOMMIT")
+
+
+def synthetic_users(count: int) -> list[dict]:
+    """Users with names drawn from common first and last names, so prefixes are ambiguous."""
+    rng = random.Random(count)
+    users = []
+    for i in range(count):
+        first_name = rng.choice(FIRST_NAMES)
+        last_name = rng.choice(LAST_NAMES)
+        onyen = f"{first_name[0]}{last_name[:6]}{i}".lower()
+        users.append(
+            {
+                "id": i + 1,
+                "pid": 700_000_000 + i,
+                "onyen": onyen,
+                "email": f"{onyen}@unc.edu",
+                "first_name": first_name,
+                "last_name": last_name,
+            }
+        )
+    return users
+
+
+def legacy_search(session: Session, query: str) -> list[User]:
+    """User search as it was implemented before the trigram index."""
+    statement = (
+        select(UserEntity)
+        .where(
+            or_(
+                func.concat(UserEntity.first_name, " ", UserEntity.last_name).ilike(
+                    f"{query}%"
+                ),
+                UserEntity.last_name.ilike(f"{query}%"),
+                UserEntity.onyen.ilike(f"{query}%"),
+                cast(UserEntity.pid, String).ilike(f"{query}%"),
+            )
+        )
+        .order_by(UserEntity.first_name, UserEntity.last_name)
+        .limit(50)
+    )
+    entities = session.execute(statement).scalars().all()
+    if len(entities) == 0:
+        statement = (
+            select(UserEntity)
+            .where(
+                or_(
+                    func.concat(UserEntity.first_name, " ", UserEntity.last_name).ilike(
+                        f"%{query}%"
+                    ),
+                    UserEntity.last_name.ilike(f"%{query}%"),
+                    UserEntity.onyen.ilike(f"%{query}%"),
+                    UserEntity.email.ilike(f"%{query}%"),
+                    cast(UserEntity.pid, String).ilike(f"%{query}%"),
+                )
+            )
+            .order_by(UserEntity.first_name, UserEntity.last_name)
+            .limit(50)
+        )
+        entities = session.execute(statement).scalars().all()
+    return [entity.to_model() for entity in entities]
+
+
+def milliseconds(search, query: str) -> float:
+    search(query)  # Warm up caches, including the prefix index
+    start = time.perf_counter()
+    for _ in range(RUNS):
+        search(query)
+    return (time.perf_counter() - start) / RUNS * 1000
+
+
+def main():
+    with server.connect() as connection:
+        connection.execute(text(f"DROP DATABASE IF EXISTS {database}"))
+        connection.execute(text(f"CREATE DATABASE {database}"))
+    engine = sqlalchemy.create_engine(_engine_str(database))
+    try:
+        EntityBase.metadata.create_all(engine)
+        with Session(engine) as session:
+            session.execute(insert(UserEntity), synthetic_users(USERS))
+            session.commit()
+        with engine.connect().execution_options(
+            isolation_level="AUTOCOMMIT"
+        ) as connection:
+            connection.execute(text('VACUUM ANALYZE "user"'))
+
+        with Session(engine) as session:
+            user_svc = UserService(session, PermissionService(session))
+            subject = user_svc.get_by_id(1)
+
+            def ranked(query: str) -> list[User]:
+                return user_svc.search(subject, query)
+
+            def ranked_without_index(query: str) -> list[User]:
+                user_module._PREFIX_INDEX_ENABLED = False
+                try:
+                    return user_svc.search(subject, query)
+                finally:
+                    user_module._PREFIX_INDEX_ENABLED = True
+
+            start = time.perf_counter()
+            clear_caches()
+            ranked("a")
+            print(
+                f"Prefix index built in {(time.perf_counter() - start) * 1000:.0f} ms\n"
+            )
+
+            print(
+                f"{'query':>10} {'legacy ms':>10} {'ranked ms':>10} {'+index ms':>10} {'speedup':>8}"
+            )
+            for query in QUERIES:
+                legacy_time = milliseconds(
+                    lambda query: legacy_search(session, query), query
+                )
+                ranked_time = milliseconds(ranked_without_index, query)
+                indexed_time = milliseconds(ranked, query)
+                print(
+                    f"{query:>10} {legacy_time:>10.2f} {ranked_time:>10.2f} "
+                    f"{indexed_time:>10.2f} {legacy_time / indexed_time:>7.1f}x"
+                )
+    finally:
+        engine.dispose()
+        with server.connect() as connection:
+            connection.execute(text(f"DROP DATABASE IF EXISTS {database}"))
+
+
+if __name__ == "__main__":
+    main()
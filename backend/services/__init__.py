@@ -1,11 +1,11 @@
-from .user import UserService
-from .permission import PermissionService
+from .user import UserService, AsyncUserService
+from .permission import PermissionService, AsyncPermissionService
 from .role import RoleService
 from .github import GitHubService
 from .organization import OrganizationService
-from .event import EventService
+from .event import EventService, AsyncEventService
 from .exceptions import ResourceNotFoundException, UserPermissionException
 from .room import RoomService
-from .article import ArticleService
+from .article import ArticleService, AsyncArticleService
 from .application import ApplicationService
-from .signage import SignageService
+from .signage import SignageService, AsyncSignageService
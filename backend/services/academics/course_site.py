@@ -4,6 +4,7 @@ APIs for working with course sites.
 
 from datetime import datetime
 from itertools import groupby
+from typing import Iterable
 from fastapi import Depends
 from sqlalchemy import select, or_, func, case
 from sqlalchemy.orm import Session, joinedload
@@ -33,11 +34,35 @@ from ...entities.office_hours import OfficeHoursEntity, CourseSiteEntity
 from ...entities.user_entity import UserEntity
 from ...entities.academics.section_member_entity import SectionMemberEntity
 from ..exceptions import CoursePermissionException, ResourceNotFoundException
+from ..cache import TTLCache
+from ..office_hours.site_access import invalidate_site_access
 
 __authors__ = ["Ajay Gandecha", "Kris Jordan"]
 __copyright__ = "Copyright 2024"
 __license__ = "MIT"
 
+_user_course_sites: TTLCache[int, list[TermOverview]] = TTLCache(
+    maxsize=4096, ttl=10 * 60
+)
+"""The My Courses overview of each user, by user id.
+
+Entries are invalidated by roster and course site changes made in this process. The TTL bounds how
+long other worker processes may observe a user's courses that have since changed."""
+
+
+def invalidate_user_course_sites(user_ids: Iterable[int] | None = None) -> None:
+    """Discard cached My Courses overviews after a change to rosters or course sites.
+
+    Args:
+        user_ids (Iterable[int] | None): The users whose courses changed, or None if any number of
+            users' courses may have changed.
+    """
+    if user_ids is None:
+        _user_course_sites.clear()
+    else:
+        for user_id in user_ids:
+            _user_course_sites.invalidate(user_id)
+
 
 class CourseSiteService:
     """
@@ -54,12 +79,47 @@ class CourseSiteService:
         """
         Get the course sites for the current user.
 
+        The overview is cached per user until the user's rosters or course sites change. The
+        returned list is shared with the cache and must not be modified.
+
         Returns:
             list[TermOverview]
         """
+        terms = _user_course_sites.get(user.id)
+        if terms is None:
+            terms = self._load_user_course_sites([user.id])[user.id]
+            _user_course_sites.set(user.id, terms)
+        return terms
+
+    def warm_user_course_sites(self, user_ids: Iterable[int]) -> None:
+        """
+        Cache the course sites of many users at once, such as every member of a section after
+        its roster is imported, so that their next navigation is served from the cache.
+
+        Args:
+            user_ids (Iterable[int]): The users whose course sites to cache.
+        """
+        for user_id, terms in self._load_user_course_sites(user_ids).items():
+            _user_course_sites.set(user_id, terms)
+
+    def _load_user_course_sites(
+        self, user_ids: Iterable[int]
+    ) -> dict[int, list[TermOverview]]:
+        """
+        Load the course sites of users with a single query.
+
+        Args:
+            user_ids (Iterable[int]): The users whose course sites to load.
+
+        Returns:
+            dict[int, list[TermOverview]]: The course sites of each user, grouped by term.
+        """
+        memberships: dict[int, list[SectionMemberEntity]] = {
+            user_id: [] for user_id in user_ids
+        }
         query = (
             select(SectionMemberEntity)
-            .where(SectionMemberEntity.user_id == user.id)
+            .where(SectionMemberEntity.user_id.in_(memberships.keys()))
             .join(SectionEntity)
             .options(
                 joinedload(SectionMemberEntity.section).joinedload(
@@ -71,8 +131,12 @@ class CourseSiteService:
                 ),
             )
         )
-        section_member_entities = self._session.scalars(query).all()
-        return self._group_by_term(section_member_entities)
+        for section_member_entity in self._session.scalars(query):
+            memberships[section_member_entity.user_id].append(section_member_entity)
+        return {
+            user_id: self._group_by_term(entities)
+            for user_id, entities in memberships.items()
+        }
 
     def _group_by_term(self, entities: list[SectionMemberEntity]) -> list[TermOverview]:
         """
@@ -228,29 +292,20 @@ class CourseSiteService:
             .options(joinedload(SectionMemberEntity.user))
         )
 
-        # Add order by sort from pagination parameters
-        if pagination_params.order_by != "":
-            member_query = member_query.order_by(
-                getattr(UserEntity, pagination_params.order_by)
-            )
-        # If no order by is provided, sort based on role in the order of:
-        # Instructors -> GTAs -> UTAs -> Students
-        # Then within each role, sort by section number
-        else:
-            member_query = member_query.order_by(
-                case(
-                    (SectionMemberEntity.member_role == RosterRole.INSTRUCTOR, 1),
-                    (SectionMemberEntity.member_role == RosterRole.GTA, 2),
-                    (SectionMemberEntity.member_role == RosterRole.UTA, 3),
-                    (SectionMemberEntity.member_role == RosterRole.STUDENT, 4),
-                    else_=5,
-                ),
-                SectionEntity.number,
-            )
+        # Sort based on role in the order of: Instructors -> GTAs -> UTAs -> Students
+        role_priority = case(
+            (SectionMemberEntity.member_role == RosterRole.INSTRUCTOR, 1),
+            (SectionMemberEntity.member_role == RosterRole.GTA, 2),
+            (SectionMemberEntity.member_role == RosterRole.UTA, 3),
+            (SectionMemberEntity.member_role == RosterRole.STUDENT, 4),
+            else_=5,
+        )
 
         # Create query off of the member query for just the members matching
         # with the current user (used to determine permissions)
-        user_member_query = member_query.where(SectionMemberEntity.user_id == user.id)
+        user_member_query = member_query.where(
+            SectionMemberEntity.user_id == user.id
+        ).order_by(role_priority, SectionEntity.number)
         user_members = self._session.scalars(user_member_query).all()
 
         # If the user is not a member of the looked up course, throw an error
@@ -267,65 +322,87 @@ class CourseSiteService:
         # In the cases where sections are taught by different instructors, ensure that
         # the roster data only includes sections that the user has permissions for.
         section_ids = [member.section_id for member in user_members]
-        member_query = member_query.where(SectionEntity.id.in_(section_ids))
+        criteria = [
+            SectionEntity.course_site_id == site_id,
+            SectionEntity.id.in_(section_ids),
+        ]
 
         # Add filtering by inputted pagination parameters
         if pagination_params.filter != "":
             query = pagination_params.filter
-            criteria = or_(
-                UserEntity.first_name.ilike(f"%{query}%"),
-                UserEntity.last_name.ilike(f"%{query}%"),
-                UserEntity.onyen.ilike(f"%{query}%"),
+            criteria.append(
+                or_(
+                    UserEntity.first_name.ilike(f"%{query}%"),
+                    UserEntity.last_name.ilike(f"%{query}%"),
+                    UserEntity.onyen.ilike(f"%{query}%"),
+                )
             )
-            member_query = member_query.where(criteria)
-
-        # Load all entities first to handle deduplication properly
-        all_member_entities = self._session.scalars(member_query).all()
-
-        # Deduplicate staff members (Instructors, GTAs, UTAs) while keeping students per section
-        seen_staff = set()
-        deduplicated_entities = []
-
-        for member in all_member_entities:
-            if member.member_role == RosterRole.STUDENT:
-                # Keep all students (they're already per section)
-                deduplicated_entities.append(member)
-            else:
-                # For staff, only keep the first occurrence
-                staff_key = (member.user_id, member.member_role)
-                if staff_key not in seen_staff:
-                    seen_staff.add(staff_key)
-                    deduplicated_entities.append(member)
 
-        if pagination_params.order_by != "":
-            deduplicated_entities.sort(
-                key=lambda x: getattr(x.user, pagination_params.order_by)
+        # Deduplicate staff members (Instructors, GTAs, UTAs), who appear once per section they
+        # are members of, while keeping students per section. Each distinct member keeps the
+        # membership of their lowest numbered section.
+        student_section = case(
+            (
+                SectionMemberEntity.member_role == RosterRole.STUDENT,
+                SectionMemberEntity.section_id,
+            ),
+            else_=None,
+        )
+        distinct_members = (
+            select(SectionMemberEntity.id)
+            .join(SectionEntity)
+            .join(UserEntity)
+            .where(*criteria)
+            .distinct(
+                SectionMemberEntity.user_id,
+                SectionMemberEntity.member_role,
+                student_section,
             )
-        else:
-            # Apply the role-based ordering to deduplicated entities
-            deduplicated_entities.sort(
-                key=lambda x: (
-                    # Primary sort: role priority
-                    {
-                        RosterRole.INSTRUCTOR: 1,
-                        RosterRole.GTA: 2,
-                        RosterRole.UTA: 3,
-                        RosterRole.STUDENT: 4,
-                    }.get(x.member_role, 5),
-                    # Secondary sort: section number (only for students)
-                    x.section.number if x.member_role == RosterRole.STUDENT else "",
-                    # Third sort: last name (A->Z)
-                    x.user.last_name,
-                )
+            .order_by(
+                SectionMemberEntity.user_id,
+                SectionMemberEntity.member_role,
+                student_section,
+                SectionEntity.number,
             )
+            .subquery()
+        )
 
         # Calculate the correct total length after deduplication
-        total_length = len(deduplicated_entities)
+        total_length = self._session.scalar(
+            select(func.count()).select_from(distinct_members)
+        )
 
-        # Apply pagination to the deduplicated and sorted list
+        # Add order by sort from pagination parameters
+        if pagination_params.order_by != "":
+            ordering = (getattr(UserEntity, pagination_params.order_by),)
+        # If no order by is provided, sort by role, then students by section number,
+        # then by last name (A->Z)
+        else:
+            ordering = (
+                role_priority,
+                case(
+                    (
+                        SectionMemberEntity.member_role == RosterRole.STUDENT,
+                        SectionEntity.number,
+                    ),
+                    else_="",
+                ),
+                UserEntity.last_name,
+            )
+
+        # Load only the requested page of deduplicated members. Members are finally ordered by
+        # id so that pages neither overlap nor skip members with equal sort keys.
         offset = pagination_params.page * pagination_params.page_size
         limit = pagination_params.page_size
-        paginated_entities = deduplicated_entities[offset : offset + limit]
+        page_query = (
+            member_query.where(
+                SectionMemberEntity.id.in_(select(distinct_members.c.id))
+            )
+            .order_by(*ordering, SectionMemberEntity.id)
+            .offset(offset)
+            .limit(limit)
+        )
+        paginated_entities = self._session.scalars(page_query).all()
 
         # Create paginated representation of data and return
         return Paginated(
@@ -593,6 +670,11 @@ class CourseSiteService:
         # Save changes
         self._session.commit()
 
+        # The members of the sections now see the course site in their courses
+        section_member_ids = self._section_member_ids(new_site.section_ids)
+        invalidate_user_course_sites(section_member_ids)
+        invalidate_site_access(section_member_ids)
+
         # Return the model
         return course_site_entity.to_model()
 
@@ -664,6 +746,12 @@ class CourseSiteService:
                     "You cannot add sections to a course site that you are not an instructor for."
                 )
 
+        # Members of the old and new sections, including staff removed below, whose courses change
+        affected_section_ids = [
+            section.id for section in old_section_entities
+        ] + updated_site.section_ids
+        affected_user_ids = self._section_member_ids(affected_section_ids)
+
         # Complete the updates
         course_site_entity.title = updated_site.title
         course_site_entity.max_tickets_per_day = (
@@ -768,9 +856,21 @@ class CourseSiteService:
         # Save all changes in one commit
         self._session.commit()
 
+        # Staff added above are also members whose courses change
+        affected_user_ids |= self._section_member_ids(affected_section_ids)
+        invalidate_user_course_sites(affected_user_ids)
+        invalidate_site_access(affected_user_ids)
+
         # Return updated site
         return course_site_entity.to_model()
 
+    def _section_member_ids(self, section_ids: Iterable[int]) -> set[int]:
+        """Find the ids of the users who are members of any of the given sections."""
+        query = select(SectionMemberEntity.user_id).where(
+            SectionMemberEntity.section_id.in_(section_ids)
+        )
+        return set(self._session.scalars(query).all())
+
     def get(self, user: User, site_id: int) -> UpdatedCourseSite:
         """
         Returns a course site overview.
@@ -0,0 +1,296 @@
+"""
+Sources and parsing of the enrollment totals of COMP sections published by UNC's class search.
+
+The class search at reports.unc.edu renders each section as a card whose title is the course code
+and section number and whose available seats read "REMAINING/TOTAL". `SectionService` syncs these
+totals into the database; this module fetches and parses the pages it syncs from.
+"""
+
+import codecs
+import json
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from html.parser import HTMLParser
+from typing import Iterable, Iterator
+
+import requests
+from pydantic import BaseModel
+
+from ...env import getenv
+
+__authors__ = ["Ajay Gandecha", "Kris Jordan"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+ENROLLMENT_TERMS = {"2025+Fall": "25F", "2026+Spring": "26S"}
+"""Terms of the class search with enrollment data, and the IDs of their terms in the database.
+
+This is hard-coded based on the availability and representation of course enrollment data from
+UNC's course database."""
+
+
+class SectionEnrollmentData(BaseModel):
+    enrolled: int
+    total_seats: int
+
+
+class TermEnrollmentSync(BaseModel):
+    """Outcome of syncing the enrollment totals of one term."""
+
+    term: str
+    term_id: str
+    sections: int = 0
+    updated: int = 0
+    not_modified: bool = False
+    error: str | None = None
+
+
+class EnrollmentSyncReport(BaseModel):
+    """Outcome of syncing the enrollment totals of every term, which may partially succeed."""
+
+    terms: list[TermEnrollmentSync]
+
+
+class EnrollmentPage:
+    """The class search page of a term, as chunks of HTML that may be streamed as they are read."""
+
+    chunks: Iterable[bytes]
+    not_modified: bool
+
+    def __init__(self, chunks: Iterable[bytes], not_modified: bool = False):
+        """
+        Args:
+            chunks (Iterable[bytes]): The page, as chunks of UTF-8 encoded HTML.
+            not_modified (bool): Whether the page is unchanged since it was last fetched.
+        """
+        self.chunks = chunks
+        self.not_modified = not_modified
+
+
+class EnrollmentSource(ABC):
+    """Source of the class search page of COMP sections for a term."""
+
+    @abstractmethod
+    def fetch(self, term: str) -> EnrollmentPage:
+        """Fetch the class search page of a term.
+
+        Args:
+            term (str): The term, as named by the class search (e.g. "2025+Fall").
+
+        Returns:
+            EnrollmentPage: The page.
+        """
+
+
+class ReportsEnrollmentSource(EnrollmentSource):
+    """The class search of reports.unc.edu.
+
+    Each page is cached on disk with its `ETag` and `Last-Modified` headers, which are sent with
+    the next request for the page. When the page has not changed, the server answers with
+    `304 Not Modified` and the page is read from the cache instead of being downloaded again."""
+
+    _URL = "https://reports.unc.edu/class-search/tiled/?subject=COMP&term={term}"
+
+    _cache_dir: str
+    _timeout: float
+
+    def __init__(self, cache_dir: str, timeout: float = 30):
+        """Initialize the source.
+
+        Args:
+            cache_dir (str): Directory pages and their validators are cached in.
+            timeout (float): Seconds to wait for the server before failing a request.
+        """
+        self._cache_dir = cache_dir
+        self._timeout = timeout
+
+    def fetch(self, term: str) -> EnrollmentPage:
+        page_path = os.path.join(self._cache_dir, f"{term}.html")
+        validators_path = os.path.join(self._cache_dir, f"{term}.json")
+
+        headers: dict[str, str] = {}
+        if os.path.exists(page_path) and os.path.exists(validators_path):
+            with open(validators_path) as file:
+                validators = json.load(file)
+            if validators.get("etag"):
+                headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                headers["If-Modified-Since"] = validators["last_modified"]
+
+        response = requests.get(
+            self._URL.format(term=term),
+            headers=headers,
+            timeout=self._timeout,
+            stream=True,
+        )
+        if response.status_code == 304:
+            response.close()
+            return EnrollmentPage(chunks=_read_chunks(page_path), not_modified=True)
+        response.raise_for_status()
+        return EnrollmentPage(
+            chunks=self._cache_chunks(response, page_path, validators_path)
+        )
+
+    def _cache_chunks(
+        self, response: requests.Response, page_path: str, validators_path: str
+    ) -> Iterator[bytes]:
+        """Stream the chunks of a response while caching them, replacing the cached page only
+        once the whole response has been read."""
+        os.makedirs(self._cache_dir, exist_ok=True)
+        partial_path = f"{page_path}.partial"
+        with response, open(partial_path, "wb") as file:
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                file.write(chunk)
+                yield chunk
+        os.replace(partial_path, page_path)
+        with open(validators_path, "w") as file:
+            json.dump(
+                {
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                },
+                file,
+            )
+
+
+class DirectoryEnrollmentSource(EnrollmentSource):
+    """Class search pages saved as `<term>.html` files in a local directory, such as fixtures."""
+
+    _directory: str
+
+    def __init__(self, directory: str):
+        self._directory = directory
+
+    def fetch(self, term: str) -> EnrollmentPage:
+        return EnrollmentPage(
+            chunks=_read_chunks(os.path.join(self._directory, f"{term}.html"))
+        )
+
+
+def enrollment_source() -> EnrollmentSource:
+    """The enrollment source of this environment, injected into `SectionService`.
+
+    Pages are read from the `ENROLLMENT_SOURCE_DIR` directory when it is set, and otherwise from
+    reports.unc.edu with a cache in `ENROLLMENT_CACHE_DIR`."""
+    directory = getenv("ENROLLMENT_SOURCE_DIR", "")
+    if directory != "":
+        return DirectoryEnrollmentSource(directory)
+    return ReportsEnrollmentSource(
+        getenv(
+            "ENROLLMENT_CACHE_DIR",
+            os.path.join(tempfile.gettempdir(), "csxl-enrollment"),
+        )
+    )
+
+
+def _read_chunks(path: str, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    """Read a file in chunks."""
+    with open(path, "rb") as file:
+        while chunk := file.read(chunk_size):
+            yield chunk
+
+
+def parse_enrollment(
+    chunks: Iterable[bytes],
+) -> dict[tuple[str, str], SectionEnrollmentData]:
+    """Parse the enrollment totals of the sections on a class search page.
+
+    The page is parsed incrementally as its chunks arrive, keeping only the text of the card
+    being read rather than building a document tree.
+
+    Args:
+        chunks (Iterable[bytes]): The page, as chunks of UTF-8 encoded HTML.
+
+    Returns:
+        dict[tuple[str, str], SectionEnrollmentData]: Enrollment totals by course ID (e.g.
+            "comp110") and section number.
+
+    Raises:
+        ValueError: If a section card is malformed.
+    """
+    parser = _EnrollmentCardParser()
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    for chunk in chunks:
+        parser.feed(decoder.decode(chunk))
+    parser.feed(decoder.decode(b"", final=True))
+    parser.close()
+    return parser.sections
+
+
+class _EnrollmentCardParser(HTMLParser):
+    """Collects the title and available seats of every section card of a class search page."""
+
+    sections: dict[tuple[str, str], SectionEnrollmentData]
+
+    # Depth of nested <div> elements within the current card, or 0 outside of a card.
+    _card_depth: int
+    # The text being collected, and the element it is collected for ("h2" or "seats").
+    _field: str | None
+    _text: list[str]
+    _title: str | None
+    _seats: str | None
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.sections = {}
+        self._card_depth = 0
+        self._field = None
+        self._text = []
+        self._title = None
+        self._seats = None
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        classes = (dict(attrs).get("class") or "").split()
+        if tag == "div":
+            if self._card_depth > 0:
+                self._card_depth += 1
+            elif "card" in classes:
+                self._card_depth = 1
+                self._title = None
+                self._seats = None
+        elif self._card_depth > 0 and self._field is None:
+            if tag == "h2" and self._title is None:
+                self._field = "h2"
+                self._text = []
+            elif (
+                tag == "p" and "card-available-seats" in classes and self._seats is None
+            ):
+                self._field = "seats"
+                self._text = []
+
+    def handle_endtag(self, tag: str) -> None:
+        if self._field == "h2" and tag == "h2":
+            self._title = "".join(self._text)
+            self._field = None
+        elif self._field == "seats" and tag == "p":
+            self._seats = "".join(self._text)
+            self._field = None
+        elif tag == "div" and self._card_depth > 0:
+            self._card_depth -= 1
+            if self._card_depth == 0:
+                self._add_card()
+
+    def handle_data(self, data: str) -> None:
+        if self._field is not None:
+            self._text.append(data)
+
+    def _add_card(self) -> None:
+        if self._title is None or self._seats is None:
+            raise ValueError("Section card is missing its title or available seats.")
+
+        # Find the course code and section number from the title (e.g. "COMP - 110 001")
+        title_components = self._title.split(" ")
+        subject_code = title_components[0]
+        course_number = title_components[2]
+        section_number = title_components[3]
+
+        # Find the available seats (e.g. "25/300 seats available")
+        remaining_seats, total_seats = self._seats.strip().split(" ")[0].split("/")
+
+        self.sections[(subject_code.lower() + course_number, section_number)] = (
+            SectionEnrollmentData(
+                enrolled=int(total_seats) - int(remaining_seats),
+                total_seats=int(total_seats),
+            )
+        )
@@ -3,7 +3,7 @@ Service for hiring.
 """
 
 from itertools import groupby
-from operator import attrgetter
+from operator import attrgetter, itemgetter
 from fastapi import Depends
 from sqlalchemy import String, func, or_, select, update
 from sqlalchemy.orm import Session, joinedload, with_polymorphic, selectinload
@@ -17,7 +17,7 @@ from ...models.academics.section_member import RosterRole
 from ...entities import UserEntity
 from ...models.application import ApplicationUnderReview, ApplicationOverview
 from ...models.academics.hiring.conflict_check import ApplicationPriority, ConflictCheck
-from ...entities.academics import SectionEntity, TermEntity
+from ...entities.academics import SectionEntity
 from ...entities.academics.course_entity import CourseEntity
 from ...entities.office_hours import CourseSiteEntity
 from ...entities.academics.section_member_entity import SectionMemberEntity
@@ -46,6 +46,9 @@ __authors__ = ["Ajay Gandecha", "Kris Jordan"]
 __copyright__ = "Copyright 2024"
 __license__ = "MIT"
 
+APPLICANT_CSV_CHUNK_SIZE = 200
+"""Number of applications loaded at a time when exporting the applicants of a term."""
+
 
 class HiringService:
     """
@@ -586,55 +589,51 @@ class HiringService:
     def get_hiring_admin_overview(
         self, subject: User, term_id: str
     ) -> HiringAdminOverview:
-        """Get the overview for hiring during a given term for the site admin."""
+        """
+        Get the overview for hiring during a given term for the site admin.
+
+        The course sites of the term, their instructors, and their assignments are each loaded
+        with a single bulk query and merged by course site, so the number of queries does not
+        grow with the number of course sites.
+        """
         # 1. Check for hiring permissions.
         self._permission.enforce(subject, "hiring.admin", "*")
-        # 2. Find the hiring information based on course sites for a given term
-        course_site_query = (
-            select(CourseSiteEntity)
-            .join(CourseSiteEntity.term)
-            .where(TermEntity.id == term_id)
-            .options(
-                joinedload(CourseSiteEntity.sections),
-            )
-        )
-        course_site_entities = self._session.scalars(course_site_query).unique().all()
+
+        # 2. Load the hiring information of every course site in the term, by course site ID
+        course_site_entities = self._term_hiring_course_sites(term_id)
+        instructors = self._term_hiring_instructors(term_id)
+        assignment_entities = self._term_hiring_assignments(term_id)
 
         # 3. Assemble the overview models
         hiring_course_site_overviews: list[HiringCourseSiteOverview] = []
         for course_site_entity in course_site_entities:
             # Find all of the data for a course site overview
-            section_entites = course_site_entity.sections
+            section_entities = course_site_entity.sections
             sections = [
-                section.to_catalog_identity_model() for section in section_entites
+                section.to_catalog_identity_model() for section in section_entities
             ]
-            instructors: list[PublicUser] = []
-            total_enrollment = 0
-            for section_entity in section_entites:
-                instructors += [
-                    staff.user.to_public_model()
-                    for staff in section_entity.staff
-                    if staff.member_role == RosterRole.INSTRUCTOR
-                ]
-                total_enrollment += section_entity.enrolled
+            total_enrollment = sum(section.enrolled for section in section_entities)
 
+            site_assignment_entities = assignment_entities.get(
+                course_site_entity.id, []
+            )
             assignments = sorted(
                 [
                     assignment.to_overview_model()
-                    for assignment in course_site_entity.hiring_assignments
+                    for assignment in site_assignment_entities
                 ],
                 key=lambda x: x.user.last_name,
             )
             total_cost = sum([assignment.level.salary for assignment in assignments])
             coverage = self._calculate_coverage(
-                total_enrollment, course_site_entity.hiring_assignments
+                total_enrollment, site_assignment_entities
             )
 
             # Create overview with found data
             course_site_overview = HiringCourseSiteOverview(
                 course_site_id=course_site_entity.id,
                 sections=sections,
-                instructors=list(set(instructors)),
+                instructors=instructors.get(course_site_entity.id, []),
                 total_enrollment=total_enrollment,
                 total_cost=total_cost,
                 coverage=coverage,
@@ -647,6 +646,76 @@ class HiringService:
         # 4. Return hiring adming overview object
         return HiringAdminOverview(sites=hiring_course_site_overviews)
 
+    def _term_hiring_course_sites(self, term_id: str) -> list[CourseSiteEntity]:
+        """
+        Loads the course sites of a term with their sections and the sections' courses.
+        """
+        return list(
+            self._session.scalars(
+                select(CourseSiteEntity)
+                .where(CourseSiteEntity.term_id == term_id)
+                .order_by(CourseSiteEntity.id)
+                .options(
+                    selectinload(CourseSiteEntity.sections).joinedload(
+                        SectionEntity.course
+                    )
+                )
+            ).all()
+        )
+
+    def _term_hiring_instructors(self, term_id: str) -> dict[int, list[PublicUser]]:
+        """
+        Loads the distinct instructors of the sections of each course site in a term, by course
+        site ID.
+        """
+        query = (
+            select(SectionEntity.course_site_id, UserEntity)
+            .join(
+                SectionMemberEntity, SectionMemberEntity.section_id == SectionEntity.id
+            )
+            .join(UserEntity, UserEntity.id == SectionMemberEntity.user_id)
+            .join(CourseSiteEntity, CourseSiteEntity.id == SectionEntity.course_site_id)
+            .where(
+                CourseSiteEntity.term_id == term_id,
+                SectionMemberEntity.member_role == RosterRole.INSTRUCTOR,
+            )
+            .distinct()
+            .order_by(SectionEntity.course_site_id, UserEntity.id)
+        )
+        return {
+            course_site_id: [user.to_public_model() for _, user in rows]
+            for course_site_id, rows in groupby(
+                self._session.execute(query).all(), itemgetter(0)
+            )
+        }
+
+    def _term_hiring_assignments(
+        self, term_id: str
+    ) -> dict[int, list[HiringAssignmentEntity]]:
+        """
+        Loads the hiring assignments of each course site in a term, with their users and hiring
+        levels, by course site ID.
+        """
+        assignment_entities = self._session.scalars(
+            select(HiringAssignmentEntity)
+            .join(
+                CourseSiteEntity,
+                CourseSiteEntity.id == HiringAssignmentEntity.course_site_id,
+            )
+            .where(CourseSiteEntity.term_id == term_id)
+            .order_by(HiringAssignmentEntity.course_site_id, HiringAssignmentEntity.id)
+            .options(
+                joinedload(HiringAssignmentEntity.user),
+                joinedload(HiringAssignmentEntity.hiring_level),
+            )
+        ).all()
+        return {
+            course_site_id: list(assignments)
+            for course_site_id, assignments in groupby(
+                assignment_entities, attrgetter("course_site_id")
+            )
+        }
+
     def get_hiring_admin_course_overview(
         self, subject: User, course_site_id: int
     ) -> HiringAdminCourseOverview:
@@ -1083,132 +1152,192 @@ class HiringService:
             priorities=priorities,
         )
 
-    # New: Generate applicant CSV rows for a term with minimal memory use
     def iter_applicants_for_term_csv(self, subject: User, term_id: str):
         """
-        Yields dict rows for all applicants in a term. Designed to minimize memory usage by
-        iterating over applications and issuing small, targeted queries per applicant.
+        Yields dict rows for all applicants in a term.
+
+        Applications are paged by ID, `APPLICANT_CSV_CHUNK_SIZE` at a time. The assignments,
+        section preferences, and instructor selections of each page are loaded with a fixed
+        number of bulk queries and merged by application, so the number of queries grows with
+        the number of pages rather than applicants, and only one page is held in memory.
         """
         # Permissions: admin-level export
         self._permission.enforce(subject, "hiring.admin", "*")
 
-        # Get application IDs for the term (avoid loading whole objects at once)
-        app_ids = self._session.scalars(
-            select(ApplicationEntity.id).where(ApplicationEntity.term_id == term_id)
-        ).all()
-
-        for app_id in app_ids:
-            application = self._session.get(ApplicationEntity, app_id)
-            if application is None:
-                continue
-            user = application.user
-
-            # Assignments for this applicant in this term (by user_id + term), include sections and course
-            assignment_q = (
-                select(HiringAssignmentEntity)
+        last_id = -1
+        while True:
+            applications = self._session.scalars(
+                select(ApplicationEntity)
                 .where(
-                    HiringAssignmentEntity.user_id == user.id,
-                    HiringAssignmentEntity.term_id == application.term_id,
-                )
-                .options(
-                    joinedload(HiringAssignmentEntity.hiring_level),
-                    joinedload(HiringAssignmentEntity.course_site)
-                    .joinedload(CourseSiteEntity.sections)
-                    .joinedload(SectionEntity.course),
-                    joinedload(HiringAssignmentEntity.course_site)
-                    .joinedload(CourseSiteEntity.sections)
-                    .joinedload(SectionEntity.staff)
-                    .joinedload(SectionMemberEntity.user),
+                    ApplicationEntity.term_id == term_id, ApplicationEntity.id > last_id
                 )
+                .order_by(ApplicationEntity.id)
+                .limit(APPLICANT_CSV_CHUNK_SIZE)
+                .options(joinedload(ApplicationEntity.user))
+            ).all()
+            if len(applications) == 0:
+                return
+            last_id = applications[-1].id
+
+            application_ids = [application.id for application in applications]
+            assignments = self._assignments_csv_fields(
+                term_id, [application.user_id for application in applications]
             )
-            assignment_rows = self._session.scalars(assignment_q).unique().all()
-            assignments_parts: list[str] = []
-            for a in assignment_rows:
-                section = (
-                    a.course_site.sections[0]
-                    if len(a.course_site.sections) > 0
-                    else None
-                )
-                if section is None:
+            preferred_sections = self._preferred_sections_csv_fields(application_ids)
+            instructor_selections = self._instructor_selections_csv_fields(
+                application_ids
+            )
+
+            for application in applications:
+                user = application.user
+                yield {
+                    "type": application.type,
+                    "assignments": assignments.get(user.id, ""),
+                    "first_name": user.first_name,
+                    "last_name": user.last_name,
+                    "pid": str(user.pid),
+                    "email": user.email,
+                    "pronouns": user.pronouns,
+                    "program_pursued": application.program_pursued or "",
+                    "comp_227": (
+                        application.comp_227.value
+                        if application.comp_227 is not None
+                        else ""
+                    ),
+                    "intro_video_url": application.intro_video_url or "",
+                    "prior_experience": application.prior_experience or "",
+                    "advisor": application.advisor or "",
+                    "preferred_sections": preferred_sections.get(application.id, ""),
+                    "instructor_selections": instructor_selections.get(
+                        application.id, ""
+                    ),
+                }
+
+    def _assignments_csv_fields(
+        self, term_id: str, user_ids: list[int]
+    ) -> dict[int, str]:
+        """
+        Formats the assignments of applicants in a term for the applicant CSV, by user ID.
+
+        Each assignment is formatted as "LEVEL (LOAD) COURSE-SECTION (INSTRUCTORS)".
+        """
+        assignment_entities = self._session.scalars(
+            select(HiringAssignmentEntity)
+            .where(
+                HiringAssignmentEntity.user_id.in_(user_ids),
+                HiringAssignmentEntity.term_id == term_id,
+            )
+            .order_by(HiringAssignmentEntity.user_id, HiringAssignmentEntity.id)
+            .options(
+                joinedload(HiringAssignmentEntity.hiring_level),
+                selectinload(HiringAssignmentEntity.course_site)
+                .selectinload(CourseSiteEntity.sections)
+                .joinedload(SectionEntity.course),
+                selectinload(HiringAssignmentEntity.course_site)
+                .selectinload(CourseSiteEntity.sections)
+                .selectinload(SectionEntity.staff)
+                .joinedload(SectionMemberEntity.user),
+            )
+        ).all()
+
+        fields: dict[int, str] = {}
+        for user_id, user_assignments in groupby(
+            assignment_entities, attrgetter("user_id")
+        ):
+            parts: list[str] = []
+            for assignment in user_assignments:
+                sections = assignment.course_site.sections
+                if len(sections) == 0:
                     continue
+                section = sections[0]
                 course = section.course
                 course_code = f"{course.subject_code}{course.number}-{section.number}"
-                instructors = [
-                    sm.user.last_name
-                    for sm in getattr(section, "staff", [])
-                    if sm.member_role == RosterRole.INSTRUCTOR
-                ]
-                instructors_text = (
-                    ", ".join(sorted(set(instructors))) if instructors else ""
-                )
-                part = f"{a.hiring_level.title} ({a.hiring_level.load}) {course_code}"
-                if instructors_text:
-                    part += f" ({instructors_text})"
-                assignments_parts.append(part)
-            assignments_field = ", ".join(assignments_parts)
-
-            # Preferred sections (ordered by student preference asc), formatted as COURSEID.SECTION
-            pref_q = (
-                select(
-                    section_application_table.c.preference,
-                    SectionEntity.course_id,
-                    SectionEntity.number,
-                )
-                .join(
-                    SectionEntity,
-                    SectionEntity.id == section_application_table.c.section_id,
+                instructors = sorted(
+                    set(
+                        member.user.last_name
+                        for member in section.staff
+                        if member.member_role == RosterRole.INSTRUCTOR
+                    )
                 )
-                .where(section_application_table.c.application_id == app_id)
-                .order_by(section_application_table.c.preference.asc())
+                part = f"{assignment.hiring_level.title} ({assignment.hiring_level.load}) {course_code}"
+                if len(instructors) > 0:
+                    part += f" ({', '.join(instructors)})"
+                parts.append(part)
+            fields[user_id] = ", ".join(parts)
+        return fields
+
+    def _preferred_sections_csv_fields(
+        self, application_ids: list[int]
+    ) -> dict[int, str]:
+        """
+        Formats the sections applicants prefer for the applicant CSV, by application ID.
+
+        Sections are ordered by the student's preference and formatted as "COURSEID.SECTION".
+        """
+        query = (
+            select(
+                section_application_table.c.application_id,
+                SectionEntity.course_id,
+                SectionEntity.number,
             )
-            preferred_sections_list: list[str] = []
-            for pref, course_id, section_number in self._session.execute(pref_q).all():
-                preferred_sections_list.append(f"{course_id}.{section_number}")
-
-            # Instructor selections (PREFERRED reviews) ordered by review.preference,
-            # formatted as "(preference) COURSEID.SECTION"
-            reviews_q = (
-                select(ApplicationReviewEntity)
-                .where(
-                    ApplicationReviewEntity.application_id == app_id,
-                    ApplicationReviewEntity.status == ApplicationReviewStatus.PREFERRED,
-                )
-                .order_by(ApplicationReviewEntity.preference)
-                .options(
-                    joinedload(ApplicationReviewEntity.course_site).joinedload(
-                        CourseSiteEntity.sections
-                    )
+            .join(
+                SectionEntity,
+                SectionEntity.id == section_application_table.c.section_id,
+            )
+            .where(section_application_table.c.application_id.in_(application_ids))
+            .order_by(
+                section_application_table.c.application_id,
+                section_application_table.c.preference.asc(),
+            )
+        )
+        return {
+            application_id: ", ".join(
+                f"{course_id}.{section_number}"
+                for _, course_id, section_number in preferences
+            )
+            for application_id, preferences in groupby(
+                self._session.execute(query).all(), itemgetter(0)
+            )
+        }
+
+    def _instructor_selections_csv_fields(
+        self, application_ids: list[int]
+    ) -> dict[int, str]:
+        """
+        Formats the instructors' selections of applicants for the applicant CSV, by application ID.
+
+        Selections are the PREFERRED reviews, ordered by the instructor's preference and formatted
+        as "(PREFERENCE) COURSEID.SECTION".
+        """
+        review_entities = self._session.scalars(
+            select(ApplicationReviewEntity)
+            .where(
+                ApplicationReviewEntity.application_id.in_(application_ids),
+                ApplicationReviewEntity.status == ApplicationReviewStatus.PREFERRED,
+            )
+            .order_by(
+                ApplicationReviewEntity.application_id,
+                ApplicationReviewEntity.preference,
+            )
+            .options(
+                selectinload(ApplicationReviewEntity.course_site).selectinload(
+                    CourseSiteEntity.sections
                 )
             )
-            review_entities = self._session.execute(reviews_q).unique().scalars().all()
-            instructor_selection_list: list[str] = []
-            for rev in review_entities:
-                cs = rev.course_site
-                if cs is None or len(cs.sections) == 0:
+        ).all()
+
+        fields: dict[int, str] = {}
+        for application_id, reviews in groupby(
+            review_entities, attrgetter("application_id")
+        ):
+            selections: list[str] = []
+            for review in reviews:
+                course_site = review.course_site
+                if course_site is None or len(course_site.sections) == 0:
                     continue
-                sec = cs.sections[0]
-                instructor_selection_list.append(
-                    f"({rev.preference}) {sec.course_id}.{sec.number}"
+                section = course_site.sections[0]
+                selections.append(
+                    f"({review.preference}) {section.course_id}.{section.number}"
                 )
-            instructor_selections_field = ", ".join(instructor_selection_list)
-
-            yield {
-                "type": application.type,
-                "assignments": assignments_field,
-                "first_name": user.first_name,
-                "last_name": user.last_name,
-                "pid": str(user.pid),
-                "email": user.email,
-                "pronouns": user.pronouns,
-                "program_pursued": application.program_pursued or "",
-                "comp_227": (
-                    application.comp_227.value
-                    if application.comp_227 is not None
-                    else ""
-                ),
-                "intro_video_url": application.intro_video_url or "",
-                "prior_experience": application.prior_experience or "",
-                "advisor": application.advisor or "",
-                "preferred_sections": ", ".join(preferred_sections_list),
-                "instructor_selections": instructor_selections_field,
-            }
+            fields[application_id] = ", ".join(selections)
+        return fields
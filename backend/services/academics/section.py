@@ -2,13 +2,11 @@
 The Section Service allows the API to manipulate sections data in the database.
 """
 
-import requests
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
 
 from fastapi import Depends
-from sqlalchemy import select
+from sqlalchemy import Integer, String, column, select, update, values
 from sqlalchemy.orm import Session, joinedload
-from pydantic import BaseModel
 
 from ...database import db_session
 from ...models.academics import Section, CatalogSection
@@ -23,6 +21,17 @@ from ...entities.academics import SectionRoomEntity
 from ..permission import PermissionService
 
 from ...services.academics.section_member import SectionMemberService
+from .course_site import invalidate_user_course_sites
+from ..office_hours.site_access import invalidate_site_access
+from .enrollment import (
+    ENROLLMENT_TERMS,
+    EnrollmentSource,
+    EnrollmentSyncReport,
+    SectionEnrollmentData,
+    TermEnrollmentSync,
+    enrollment_source,
+    parse_enrollment,
+)
 
 from ...services.exceptions import (
     ResourceNotFoundException,
@@ -43,11 +52,13 @@ class SectionService:
         session: Session = Depends(db_session),
         permission_svc: PermissionService = Depends(),
         section_member_svc: SectionMemberService = Depends(),
+        enrollment_source: EnrollmentSource = Depends(enrollment_source),
     ):
         """Initializes the database session."""
         self._session = session
         self._permission_svc = permission_svc
         self._section_member_svc = section_member_svc
+        self._enrollment_source = enrollment_source
 
     def get_by_term(self, term_id: str) -> list[CatalogSection]:
         """Retrieves all sections from the table by a term.
@@ -234,6 +245,7 @@ class SectionService:
         )
 
         existing_instructors = self._session.scalars(instructors_query).all()
+        replaced_user_ids = [instructor.user_id for instructor in existing_instructors]
 
         for instructor in existing_instructors:
             self._session.delete(instructor)
@@ -249,6 +261,16 @@ class SectionService:
         # Commit changes
         self._session.commit()
 
+        # Replaced instructors no longer have access to the section's course site, and the
+        # courses of the section's members reflect its changes
+        member_user_ids = self._session.scalars(
+            select(SectionMemberEntity.user_id).where(
+                SectionMemberEntity.section_id == section.id
+            )
+        ).all()
+        invalidate_user_course_sites({*replaced_user_ids, *member_user_ids})
+        invalidate_site_access(replaced_user_ids)
+
         # Return edited object
         return section_entity.to_details_model()
 
@@ -276,89 +298,96 @@ class SectionService:
         self._session.delete(section_entity)
         self._session.commit()
 
-    def update_enrollment_totals(self, subject: User):
+        # Access to the course site of the section depends on all of its sections
+        invalidate_user_course_sites()
+        invalidate_site_access()
+
+    def update_enrollment_totals(
+        self, subject: User, terms: dict[str, str] = ENROLLMENT_TERMS
+    ) -> EnrollmentSyncReport:
         """
         Updates the enrollment totals for COMP course sections in the database.
-        """
-        # Currently active terms.
-        # This is hard-coded based on the availability and representation
-        # of course enrollment data from UNC's course database.
-        AVAILABLE_TERMS = {"2025+Fall": "25F", "2026+Spring": "26S"}
 
-        # Store updates to make.
-        updates: dict[tuple[str, str], SectionEnrollmentData] = {}
+        The class search pages of all terms are fetched and parsed concurrently. The totals of
+        each term are then written with a single bulk update and committed on their own, so a
+        failure to sync one term does not prevent syncing the others.
 
-        # Update enrolllment totals for every available term.
-        for term in list(AVAILABLE_TERMS.keys()):
-            try:
-                # Retrieve the data from the UNC Reports site
-                html = requests.get(
-                    f"https://reports.unc.edu/class-search/tiled/?subject=COMP&term={term}"
-                ).content
-
-                # Create HTML parser
-                soup = BeautifulSoup(html, "html.parser")
-
-                # Find cards
-                cards = soup.find_all("div", class_="card")
-
-                # Iterate over all course cards
-                for card in cards:
-                    # Find the course code and section number from title <h2>
-                    title_components = card.find("h2").text.split(" ")
-                    subject_code = title_components[0]
-                    course_number = title_components[2]
-                    section_number = title_components[3]
-
-                    # Find the available seats
-                    seat_status = (
-                        card.find("p", class_="card-available-seats")
-                        .text.strip()
-                        .split(" ")[0]
-                        .split("/")
-                    )
-                    remaining_seats = seat_status[0]
-                    total_seats = seat_status[1]
-
-                    # Find section to update
-                    course_id = subject_code.lower() + course_number
-
-                    # Add items to list to update
-                    updates[(course_id, section_number)] = SectionEnrollmentData(
-                        enrolled=int(total_seats) - int(remaining_seats),
-                        total_seats=int(total_seats),
-                    )
-
-                # Make updates for the term
-                course_ids = list(set([update[0] for update in list(updates.keys())]))
-                section_numbers = list(
-                    set([update[1] for update in list(updates.keys())])
-                )
-                sections_query = select(SectionEntity).where(
-                    SectionEntity.term_id == AVAILABLE_TERMS[term],
-                    SectionEntity.course_id.in_(course_ids),
-                    SectionEntity.number.in_(section_numbers),
-                )
+        Args:
+            subject (User): The user requesting the update.
+            terms (dict[str, str]): Terms of the class search, and the IDs of their terms in
+                the database.
 
-                section_entities = self._session.scalars(sections_query).all()
+        Returns:
+            EnrollmentSyncReport: The outcome of syncing each term.
 
-                # For every section, update the data
-                for section_entity in section_entities:
-                    if (section_entity.course_id, section_entity.number) in updates:
-                        new_enrollment_data = updates[
-                            (section_entity.course_id, section_entity.number)
-                        ]
-                        section_entity.enrolled = new_enrollment_data.enrolled
-                        section_entity.total_seats = new_enrollment_data.total_seats
+        Raises:
+            CourseDataScrapingException: If no term could be synced.
+        """
 
-                # Save changes
+        def fetch(
+            term: str,
+        ) -> tuple[dict[tuple[str, str], SectionEnrollmentData], bool]:
+            page = self._enrollment_source.fetch(term)
+            return parse_enrollment(page.chunks), page.not_modified
+
+        # Fetch and parse every term concurrently
+        with ThreadPoolExecutor(max_workers=max(len(terms), 1)) as executor:
+            fetched = {term: executor.submit(fetch, term) for term in terms}
+
+        # Apply the updates of each term in turn, as the session is not thread-safe
+        report = EnrollmentSyncReport(terms=[])
+        for term, term_id in terms.items():
+            result = TermEnrollmentSync(term=term, term_id=term_id)
+            report.terms.append(result)
+            try:
+                updates, result.not_modified = fetched[term].result()
+                result.sections = len(updates)
+                result.updated = self._apply_enrollment_updates(term_id, updates)
                 self._session.commit()
-            except:
-                raise CourseDataScrapingException(
-                    f"Error reading COMP data from UNC's database for term: {term}"
-                )
+            except Exception as e:
+                self._session.rollback()
+                result.error = f"Error reading COMP data from UNC's database for term: {term} ({e})"
+
+        if len(terms) > 0 and all(result.error for result in report.terms):
+            raise CourseDataScrapingException(
+                "; ".join(result.error for result in report.terms)
+            )
+        return report
 
+    def _apply_enrollment_updates(
+        self, term_id: str, updates: dict[tuple[str, str], SectionEnrollmentData]
+    ) -> int:
+        """
+        Updates the enrollment totals of the sections of a term with one `UPDATE ... FROM VALUES`.
 
-class SectionEnrollmentData(BaseModel):
-    enrolled: int
-    total_seats: int
+        Returns:
+            int: The number of sections updated.
+        """
+        if len(updates) == 0:
+            return 0
+        enrollment = values(
+            column("course_id", String),
+            column("number", String),
+            column("enrolled", Integer),
+            column("total_seats", Integer),
+            name="enrollment",
+        ).data(
+            [
+                (course_id, number, data.enrolled, data.total_seats)
+                for (course_id, number), data in updates.items()
+            ]
+        )
+        result = self._session.execute(
+            update(SectionEntity)
+            .where(
+                SectionEntity.term_id == term_id,
+                SectionEntity.course_id == enrollment.c.course_id,
+                SectionEntity.number == enrollment.c.number,
+            )
+            .values(
+                enrolled=enrollment.c.enrolled,
+                total_seats=enrollment.c.total_seats,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
@@ -4,14 +4,20 @@ The Section Member Service allows the API to manipulate section member data in t
 
 from io import StringIO
 import csv
+import time
 
 from fastapi import Depends, HTTPException
-from sqlalchemy import select
+from sqlalchemy import delete, or_, select
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import Session
 
 from pydantic import BaseModel
 
 from ...entities.academics.section_member_entity import SectionMemberEntity
+from ...entities.office_hours import OfficeHoursTicketEntity
+from ...entities.office_hours.user_created_tickets_table import (
+    user_created_tickets_table,
+)
 from ...models.academics.section_member import (
     SectionMember,
     SectionMemberDraft,
@@ -25,6 +31,9 @@ from ...models import User
 from ...entities.academics import SectionEntity
 from ...entities import UserEntity
 from ..permission import PermissionService
+from .course_site import CourseSiteService, invalidate_user_course_sites
+from ..office_hours.site_access import invalidate_site_access
+from ..user import invalidate_user_prefix_index
 
 from ..exceptions import ResourceNotFoundException, CoursePermissionException
 
@@ -32,6 +41,9 @@ __authors__ = ["Meghan Sun, Sadie Amato", "Ajay Gandecha"]
 __copyright__ = "Copyright 2024"
 __license__ = "MIT"
 
+ROSTER_IMPORT_BATCH_SIZE = 1000
+"""Number of rows written by each statement of a roster import."""
+
 
 class SectionMemberService:
     """Service that performs all of the actions on the `Section` table"""
@@ -40,10 +52,12 @@ class SectionMemberService:
         self,
         session: Session = Depends(db_session),
         permission_svc: PermissionService = Depends(),
+        course_site_svc: CourseSiteService = Depends(),
     ):
         """Initializes the database session."""
         self._session = session
         self._permission_svc = permission_svc
+        self._course_site_svc = course_site_svc
 
     def get_section_member_by_id(self, id: int) -> SectionMember:
         """Retrieve a section membership by its unique ID.
@@ -92,6 +106,8 @@ class SectionMemberService:
 
         self._session.add(section_membership)
         self._session.commit()
+        invalidate_user_course_sites([user_id])
+        invalidate_site_access([user_id])
 
         return section_membership.to_details_model()
 
@@ -149,14 +165,38 @@ class SectionMemberService:
 
             section_memberships.append(section_membership)
 
+        invalidate_user_course_sites([subject.id])
+        invalidate_site_access([subject.id])
+
         return [
             section_membership.to_flat_model()
             for section_membership in section_memberships
         ]
 
-    def import_users_from_csv(self, subject: User, section_id: int, csv_data: str):
+    def import_users_from_csv(
+        self, subject: User, section_id: int, csv_data: str, dry_run: bool = False
+    ) -> "UploadResponse":
         """
-        Creates section members for a course section based on an inputted CSV file.
+        Synchronizes the students of a course section with an inputted Canvas roster CSV file.
+
+        Students in the CSV who are not yet users are created, students who are not yet members
+        of the section are added, and students of the section who are not in the CSV are removed.
+        Existing users are found with a single lookup by PID or ONYEN, and users and memberships
+        are written with batched `INSERT ... ON CONFLICT DO NOTHING` statements in one transaction.
+
+        Args:
+            subject (User): The instructor importing the roster.
+            section_id (int): ID of the section whose roster is imported.
+            csv_data (str): Contents of the Canvas roster CSV file.
+            dry_run (bool): Whether to only compute the changes the import would make.
+
+        Returns:
+            UploadResponse: Summary of the changes made (or that would be made by a dry run) and
+                the time in seconds each phase of the import took.
+
+        Raises:
+            CoursePermissionException: If the subject is not an instructor of the section.
+            HTTPException(422): If the CSV is not formatted correctly or has multiple sections.
         """
         # Get the user membership of the course
         membership_query = select(SectionMemberEntity).where(
@@ -174,126 +214,228 @@ class SectionMemberService:
                 "Cannot create students for a course you are not an instructor of."
             )
 
-        # Read the csv data
-        file = StringIO(csv_data)
-        reader = csv.DictReader(file)
-
-        # Parse each row
-        students: list[StudentMemberJson] = []
-
-        unique_sections = set()
-
-        try:
-            for row in reader:
-                if (
-                    reader.line_num != 2
-                    and row["Student"] != "Student, Test"
-                    and len(row["Student"]) > 0
-                ):
-                    # Ensure that the uploaded CSV only contains one section
-                    unique_sections.add(row["Section"])
-                    if len(unique_sections) > 1:
-                        raise HTTPException(
-                            status_code=422, detail="CSV includes multiple sections."
-                        )
-
-                    name = row["Student"]
-                    pid = int(row["SIS User ID"])
-                    onyen = row["SIS Login ID"]
-                    students.append(StudentMemberJson(name=name, pid=pid, onyen=onyen))
-        except:
-            raise HTTPException(
-                status_code=422, detail="CSV is not formatted correctly."
+        timings: dict[str, float] = {}
+        started = time.perf_counter()
+
+        def phase(name: str) -> None:
+            nonlocal started
+            now = time.perf_counter()
+            timings[name] = now - started
+            started = now
+
+        # Parse the CSV into students by PID
+        students = self._parse_roster_csv(csv_data)
+        phase("parse")
+
+        # Find the users of the students, by PID, or by ONYEN for users whose PID has changed
+        existing_users_query = select(
+            UserEntity.id, UserEntity.pid, UserEntity.onyen
+        ).where(
+            or_(
+                UserEntity.pid.in_(students.keys()),
+                UserEntity.onyen.in_([student.onyen for student in students.values()]),
             )
-
-        student_pids = [student.pid for student in students]
-
-        # There are three cases:
-        #  Case 1: Student is already on the roster - we do not need to make any changes.
-        #  Case 2: Students are not on the roster, but user profiles exist - just add a SectionMemberEntity.
-        #  Case 3: User is not in the system - create a user and a relationship.
-        #  Case 4: Student is already on the roster, but not in the CSV.
-
-        # Case 1: Determine students that are already on the roster
-        existing_roster_members_query = (
-            select(SectionMemberEntity)
-            .join(UserEntity)
-            .where(SectionMemberEntity.section_id == section_id)
         )
-        existing_roster_member_entities = self._session.scalars(
-            existing_roster_members_query
-        ).all()
-        existing_roster_member_pids = [
-            member.user.pid for member in existing_roster_member_entities
-        ]
+        user_ids_by_pid: dict[int, int] = {}
+        user_ids_by_onyen: dict[str, int] = {}
+        for user_id, pid, onyen in self._session.execute(existing_users_query):
+            user_ids_by_pid[pid] = user_id
+            user_ids_by_onyen[onyen] = user_id
+        student_user_ids: dict[int, int] = {}
+        for pid, student in students.items():
+            user_id = user_ids_by_pid.get(pid, user_ids_by_onyen.get(student.onyen))
+            if user_id is not None:
+                student_user_ids[pid] = user_id
+
+        # Find the current roster of the section, by user ID
+        roster_query = select(
+            SectionMemberEntity.user_id,
+            SectionMemberEntity.id,
+            SectionMemberEntity.member_role,
+        ).where(SectionMemberEntity.section_id == section_id)
+        roster = {
+            user_id: (membership_id, member_role)
+            for user_id, membership_id, member_role in self._session.execute(
+                roster_query
+            )
+        }
+        phase("lookup")
 
-        # Case 2: Determine students that are not on the roster, but that exist in the database.
-        existing_users_query = select(UserEntity).where(
-            UserEntity.pid.in_(student_pids)
-        )
-        existing_user_entities = self._session.scalars(existing_users_query).all()
-        existing_users_pids = [member.pid for member in existing_user_entities]
-        for user in existing_user_entities:
-            if user.pid not in existing_roster_member_pids:
-                draft = SectionMemberDraft(user_id=user.id, section_id=section_id)
-                section_membership = SectionMemberEntity.from_draft_model(draft)
-                self._session.add(section_membership)
-
-        # Case 3: Find remaining students that do not exist
-        nonexisting_students = [
-            student for student in students if student.pid not in existing_users_pids
+        # Determine the changes to the roster
+        new_students = [
+            student for pid, student in students.items() if pid not in student_user_ids
         ]
-        new_student_entities = []
-
-        for student in nonexisting_students:
-            name_segments = student.name.split(",")
-            last_name = name_segments[0].strip() if len(name_segments) > 0 else ""
-            first_name = name_segments[1].strip() if len(name_segments) > 1 else ""
-            new_student = User(
-                pid=student.pid,
-                onyen=student.onyen,
-                first_name=first_name,
-                last_name=last_name,
-                email=f"{student.onyen}@email.unc.edu",
+        listed_user_ids = set(student_user_ids.values())
+        new_member_ids = listed_user_ids - roster.keys()
+        removed_members = {
+            user_id: membership_id
+            for user_id, (membership_id, member_role) in roster.items()
+            if member_role == RosterRole.STUDENT and user_id not in listed_user_ids
+        }
+        phase("diff")
+
+        if dry_run:
+            return UploadResponse(
+                uploaded=len(students),
+                created_users=len(new_students),
+                added_members=len(new_member_ids) + len(new_students),
+                removed_members=len(removed_members),
+                dry_run=True,
+                timings=timings,
             )
-            new_student_entity = UserEntity.from_model(new_student)
-            new_student_entities.append(new_student_entity)
-            self._session.add(new_student_entity)
 
-        # Commit to save new students
-        self._session.commit()
+        # Create users for new students. A student whose email conflicts with an existing user
+        # is skipped rather than failing the import.
+        created_user_count = 0
+        for start in range(0, len(new_students), ROSTER_IMPORT_BATCH_SIZE):
+            batch = new_students[start : start + ROSTER_IMPORT_BATCH_SIZE]
+            created_user_ids = self._session.scalars(
+                postgresql.insert(UserEntity)
+                .on_conflict_do_nothing()
+                .returning(UserEntity.id),
+                [self._new_student_user(student) for student in batch],
+            ).all()
+            created_user_count += len(created_user_ids)
+            new_member_ids.update(created_user_ids)
+        phase("users")
+
+        # Add memberships for new members
+        added_member_count = 0
+        member_ids_to_add = sorted(new_member_ids)
+        for start in range(0, len(member_ids_to_add), ROSTER_IMPORT_BATCH_SIZE):
+            batch = member_ids_to_add[start : start + ROSTER_IMPORT_BATCH_SIZE]
+            added_member_count += len(
+                self._session.scalars(
+                    postgresql.insert(SectionMemberEntity)
+                    .on_conflict_do_nothing(index_elements=["user_id", "section_id"])
+                    .returning(SectionMemberEntity.id),
+                    [
+                        {
+                            "user_id": user_id,
+                            "section_id": section_id,
+                            "member_role": RosterRole.STUDENT,
+                        }
+                        for user_id in batch
+                    ],
+                ).all()
+            )
+        phase("members")
 
-        # Finish Case 3, adding memberships for new members
-        for new_student in new_student_entities:
-            draft = SectionMemberDraft(user_id=new_student.id, section_id=section_id)
-            section_membership = SectionMemberEntity.from_draft_model(draft)
-            self._session.add(section_membership)
+        # Remove students not in the CSV file that are still on the roster.
+        removed_member_ids = list(removed_members.values())
+        for start in range(0, len(removed_member_ids), ROSTER_IMPORT_BATCH_SIZE):
+            batch = removed_member_ids[start : start + ROSTER_IMPORT_BATCH_SIZE]
+            self._delete_members(batch)
+        phase("removals")
 
-        # Commit changes
+        # Commit all changes at once
         self._session.commit()
+        phase("commit")
+
+        # New users are bulk inserted rather than created through the user service
+        if created_user_count > 0:
+            invalidate_user_prefix_index()
+
+        # Removed students no longer see the course, while every remaining member of the section
+        # has their courses cached in bulk so the first navigation after an import is not a miss.
+        invalidate_user_course_sites(removed_members.keys())
+        invalidate_site_access(new_member_ids | removed_members.keys())
+        member_ids_query = select(SectionMemberEntity.user_id).where(
+            SectionMemberEntity.section_id == section_id
+        )
+        self._course_site_svc.warm_user_course_sites(
+            self._session.scalars(member_ids_query).all()
+        )
+        phase("cache")
+
+        return UploadResponse(
+            uploaded=len(students),
+            created_users=created_user_count,
+            added_members=added_member_count,
+            removed_members=len(removed_members),
+            skipped=len(new_students) - created_user_count,
+            timings=timings,
+        )
 
-        # Case 4: Remove students not in the CSV file that are still on the roster.
-        students_to_remove_query = (
-            select(SectionMemberEntity)
-            .join(UserEntity)
-            .where(
-                UserEntity.pid.not_in(student_pids),
-                UserEntity.pid.in_(existing_roster_member_pids),
+    def _delete_members(self, member_ids: list[int]) -> None:
+        """
+        Deletes section memberships in bulk, along with the rows the ORM would delete with them:
+        their links to the tickets they created and the tickets they called.
+        """
+        called_tickets = select(OfficeHoursTicketEntity.id).where(
+            OfficeHoursTicketEntity.caller_id.in_(member_ids)
+        )
+        self._session.execute(
+            delete(user_created_tickets_table).where(
+                or_(
+                    user_created_tickets_table.c.member_id.in_(member_ids),
+                    user_created_tickets_table.c.ticket_id.in_(called_tickets),
+                )
             )
-            .where(
-                SectionMemberEntity.section_id == section_id,
-                SectionMemberEntity.member_role == RosterRole.STUDENT,
+        )
+        self._session.execute(
+            delete(OfficeHoursTicketEntity).where(
+                OfficeHoursTicketEntity.caller_id.in_(member_ids)
             )
         )
-        students_to_remove = self._session.scalars(students_to_remove_query).all()
-        for student in students_to_remove:
-            self._session.delete(student)
+        self._session.execute(
+            delete(SectionMemberEntity).where(SectionMemberEntity.id.in_(member_ids))
+        )
 
-        # Commit changes a final time
-        self._session.commit()
+    def _parse_roster_csv(self, csv_data: str) -> dict[int, "StudentMemberJson"]:
+        """
+        Parses the students of a Canvas roster CSV file, by PID, in the order they are listed.
 
-        # Return number added
-        return UploadResponse(uploaded=len(student_pids))
+        Raises:
+            HTTPException(422): If the CSV is not formatted correctly or has multiple sections.
+        """
+        reader = csv.DictReader(StringIO(csv_data))
+        students: dict[int, StudentMemberJson] = {}
+        section: str | None = None
+
+        try:
+            for row in reader:
+                # Skip the "Points Possible" row, Canvas' test student, and blank rows
+                if (
+                    reader.line_num == 2
+                    or row["Student"] == "Student, Test"
+                    or len(row["Student"]) == 0
+                ):
+                    continue
+
+                # Ensure that the uploaded CSV only contains one section
+                if section is None:
+                    section = row["Section"]
+                elif row["Section"] != section:
+                    raise HTTPException(
+                        status_code=422, detail="CSV includes multiple sections."
+                    )
+
+                pid = int(row["SIS User ID"])
+                if pid not in students:
+                    students[pid] = StudentMemberJson(
+                        name=row["Student"], pid=pid, onyen=row["SIS Login ID"]
+                    )
+        except (KeyError, ValueError, TypeError, csv.Error):
+            raise HTTPException(
+                status_code=422, detail="CSV is not formatted correctly."
+            )
+
+        return students
+
+    def _new_student_user(self, student: "StudentMemberJson") -> dict:
+        """Column values of the user created for a student who is not yet a user."""
+        name_segments = student.name.split(",")
+        return {
+            "pid": student.pid,
+            "onyen": student.onyen,
+            "first_name": name_segments[1].strip() if len(name_segments) > 1 else "",
+            "last_name": name_segments[0].strip() if len(name_segments) > 0 else "",
+            "email": f"{student.onyen}@email.unc.edu",
+            "pronouns": "",
+            "github": "",
+            "accepted_community_agreement": False,
+        }
 
 
 class CSVModel(BaseModel):
@@ -307,4 +449,12 @@ class StudentMemberJson(BaseModel):
 
 
 class UploadResponse(BaseModel):
+    """Summary of a roster import, or of the changes a dry run of the import would make."""
+
     uploaded: int
+    created_users: int = 0
+    added_members: int = 0
+    removed_members: int = 0
+    skipped: int = 0
+    dry_run: bool = False
+    timings: dict[str, float] = {}
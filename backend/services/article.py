@@ -2,17 +2,23 @@
 The Article Service allows the API to manipulate article data in the database.
 """
 
+from typing import Iterable
 from fastapi import Depends
-from sqlalchemy import select, func, delete
-from sqlalchemy.orm import Session
+from sqlalchemy import Select, select, func, delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload, selectinload
 from datetime import datetime
 
-from ..database import db_session
+from ..database import db_session, async_db_session
 from .exceptions import ResourceNotFoundException
 
 from ..services.event import EventService
 from ..services.permission import PermissionService
-from ..services.coworking import PolicyService, OperatingHoursService
+from ..services.coworking import (
+    PolicyService,
+    OperatingHoursService,
+    AsyncOperatingHoursService,
+)
 
 from ..entities import (
     ArticleEntity,
@@ -21,7 +27,11 @@ from ..entities import (
     EventRegistrationEntity,
     article_author_table,
 )
-from ..entities.coworking import ReservationEntity, reservation_user_table
+from ..entities.coworking import (
+    ReservationEntity,
+    SeatEntity,
+    reservation_user_table,
+)
 
 from ..models import User
 from ..models.articles import (
@@ -30,7 +40,7 @@ from ..models.articles import (
     ArticleOverview,
     ArticleDraft,
 )
-from ..models.coworking import TimeRange
+from ..models.coworking import OperatingHours, TimeRange
 from ..models.pagination import Paginated, PaginationParams
 
 __authors__ = ["Ajay Gandecha"]
@@ -57,30 +67,12 @@ class ArticleService:
     def get_welcome_overview(self, subject: User | None) -> WelcomeOverview:
         """Retrieves the welcome overview."""
         # First, retrieve the latest announcement.
-        announcement_query = (
-            select(ArticleEntity)
-            .where(ArticleEntity.is_announcement)
-            .where(ArticleEntity.state == ArticleState.PUBLISHED)
-            .order_by(ArticleEntity.published.desc())
-        )
-        announcement_entity = self._session.scalars(announcement_query).all()
-        announcement = (
-            announcement_entity[0].to_overview_model()
-            if len(announcement_entity) > 0
-            else None
-        )
+        announcement_entity = self._session.scalars(
+            _select_latest_announcement()
+        ).first()
 
         # Next, retrieve the latest news.
-        # For now, this will load a maximum of 10 articles.
-        news_query = (
-            select(ArticleEntity)
-            .where(ArticleEntity.state == ArticleState.PUBLISHED)
-            .where(ArticleEntity.is_announcement == False)
-            .order_by(ArticleEntity.published.desc())
-            .limit(10)
-        )
-        news_entities = self._session.scalars(news_query).all()
-        news = [article.to_overview_model() for article in news_entities]
+        news_entities = self._session.scalars(_select_latest_news()).all()
 
         # Load operating hours
         now = datetime.now()
@@ -90,51 +82,24 @@ class ArticleService:
             )
         )
 
-        # Load future reservations for a given user.
-        # For now, this will load a maximum of 3 future reservations.
-        future_reservations = []
+        # Load future reservations and event registrations for a given user.
+        future_reservations_entities = []
+        registered_events_entities = []
         if subject:
-            future_reservations_query = (
-                select(ReservationEntity)
-                .join(ReservationEntity.users)
-                .where(UserEntity.id == subject.id)
-                .where(ReservationEntity.start > datetime.now())
-            )
             future_reservations_entities = self._session.scalars(
-                future_reservations_query
-            ).all()
-            future_reservations = [
-                reservation.to_overview_model()
-                for reservation in future_reservations_entities
-            ]
-
-        # Finally, load future event registrations.
-        registered_events = []
-        if subject:
-            registered_events_query = (
-                select(EventRegistrationEntity)
-                .where(EventRegistrationEntity.user_id == subject.id)
-                .join(EventEntity)
-                .where(EventEntity.start >= now)
-                .order_by(EventEntity.start)
-            )
-
+                _select_future_reservations(subject, now)
+            ).unique()
             registered_events_entities = self._session.scalars(
-                registered_events_query
+                _select_registered_events(subject, now)
             ).all()
 
-            registered_events = [
-                registration.event.to_overview_model(subject)
-                for registration in registered_events_entities
-            ]
-
-        # Construct the welcome overview and return
-        return WelcomeOverview(
-            announcement=announcement,
-            latest_news=news,
-            operating_hours=operating_hours,
-            upcoming_reservations=future_reservations,
-            registered_events=registered_events,
+        return _to_welcome_overview(
+            subject,
+            announcement_entity,
+            news_entities,
+            operating_hours,
+            future_reservations_entities,
+            registered_events_entities,
         )
 
     def get_article(self, slug: str) -> ArticleOverview:
@@ -259,3 +224,142 @@ class ArticleService:
         # 3. Delete the article
         self._session.delete(article_entity)
         self._session.commit()
+
+
+class AsyncArticleService:
+    """Asynchronous variant of `ArticleService.get_welcome_overview` for `async def` routes."""
+
+    def __init__(
+        self,
+        session: AsyncSession = Depends(async_db_session),
+        policies_svc: PolicyService = Depends(),
+        operating_hours_svc: AsyncOperatingHoursService = Depends(),
+    ):
+        """Initializes the session"""
+        self._session = session
+        self._policies_svc = policies_svc
+        self._operating_hours_svc = operating_hours_svc
+
+    async def get_welcome_overview(self, subject: User | None) -> WelcomeOverview:
+        """Retrieves the welcome overview."""
+        announcement_entity = (
+            await self._session.scalars(_select_latest_announcement())
+        ).first()
+        news_entities = (await self._session.scalars(_select_latest_news())).all()
+
+        now = datetime.now()
+        operating_hours = await self._operating_hours_svc.schedule(
+            TimeRange(
+                start=now, end=now + self._policies_svc.reservation_window(subject)
+            )
+        )
+
+        future_reservations_entities = []
+        registered_events_entities = []
+        if subject:
+            future_reservations_entities = (
+                await self._session.scalars(_select_future_reservations(subject, now))
+            ).unique()
+            registered_events_entities = (
+                await self._session.scalars(_select_registered_events(subject, now))
+            ).all()
+
+        return _to_welcome_overview(
+            subject,
+            announcement_entity,
+            news_entities,
+            operating_hours,
+            future_reservations_entities,
+            registered_events_entities,
+        )
+
+
+def _select_latest_announcement() -> Select:
+    """Selects the latest published announcement, loading what its overview needs."""
+    return (
+        select(ArticleEntity)
+        .where(ArticleEntity.is_announcement)
+        .where(ArticleEntity.state == ArticleState.PUBLISHED)
+        .order_by(ArticleEntity.published.desc())
+        .limit(1)
+        .options(
+            joinedload(ArticleEntity.organization), selectinload(ArticleEntity.authors)
+        )
+    )
+
+
+def _select_latest_news() -> Select:
+    """Selects the latest published news, loading what their overviews need."""
+    # For now, this will load a maximum of 10 articles.
+    return (
+        select(ArticleEntity)
+        .where(ArticleEntity.state == ArticleState.PUBLISHED)
+        .where(ArticleEntity.is_announcement == False)
+        .order_by(ArticleEntity.published.desc())
+        .limit(10)
+        .options(
+            joinedload(ArticleEntity.organization), selectinload(ArticleEntity.authors)
+        )
+    )
+
+
+def _select_future_reservations(subject: User, now: datetime) -> Select:
+    """Selects the reservations of a user that have yet to start, loading what their overviews need."""
+    return (
+        select(ReservationEntity)
+        .join(ReservationEntity.users)
+        .where(UserEntity.id == subject.id)
+        .where(ReservationEntity.start > now)
+        .options(
+            joinedload(ReservationEntity.seats).joinedload(SeatEntity.room),
+            joinedload(ReservationEntity.room),
+        )
+    )
+
+
+def _select_registered_events(subject: User, now: datetime) -> Select:
+    """Selects the registrations of a user for events that have yet to start, loading what the
+    overviews of their events need."""
+    return (
+        select(EventRegistrationEntity)
+        .where(EventRegistrationEntity.user_id == subject.id)
+        .join(EventEntity)
+        .where(EventEntity.start >= now)
+        .order_by(EventEntity.start)
+        .options(
+            joinedload(EventRegistrationEntity.event).options(
+                joinedload(EventEntity.organization),
+                selectinload(EventEntity.registrations).joinedload(
+                    EventRegistrationEntity.user
+                ),
+            )
+        )
+    )
+
+
+def _to_welcome_overview(
+    subject: User | None,
+    announcement_entity: ArticleEntity | None,
+    news_entities: Iterable[ArticleEntity],
+    operating_hours: list[OperatingHours],
+    future_reservations_entities: Iterable[ReservationEntity],
+    registered_events_entities: Iterable[EventRegistrationEntity],
+) -> WelcomeOverview:
+    """Constructs the welcome overview from its loaded entities."""
+    return WelcomeOverview(
+        announcement=(
+            announcement_entity.to_overview_model()
+            if announcement_entity is not None
+            else None
+        ),
+        latest_news=[article.to_overview_model() for article in news_entities],
+        operating_hours=operating_hours,
+        upcoming_reservations=[
+            reservation.to_overview_model()
+            for reservation in future_reservations_entities
+        ],
+        registered_events=[
+            registration.event.to_overview_model(subject)
+            for registration in registered_events_entities
+        ],
+    )
@@ -0,0 +1,213 @@
+"""
+Bounded, time-expiring in-process caches shared by services.
+
+Several services memoize data that is expensive to derive from the database but changes rarely
+(compiled permissions, for example). Each such service owns a module-level `TTLCache` and is
+responsible for invalidating entries when it writes the data the cache is derived from.
+
+Caches are local to a single worker process. Explicit invalidation only reaches the process that
+performed the write, so every cache is bounded by a TTL to limit how long other workers may serve
+stale entries.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_registry: list["TTLCache | Snapshot"] = []
+"""Every cache constructed in this process, so that they can be cleared together."""
+
+
+class TTLCache(Generic[K, V]):
+    """Thread-safe LRU cache whose entries expire `ttl` seconds after being stored."""
+
+    _maxsize: int
+    _ttl: float
+    _entries: OrderedDict[K, tuple[float, V]]
+    _lock: Lock
+
+    def __init__(self, maxsize: int, ttl: float):
+        """Initialize a new, empty cache.
+
+        Args:
+            maxsize (int): The maximum number of entries retained; least recently used entries are evicted first.
+            ttl (float): The number of seconds an entry remains valid after it is stored.
+        """
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = Lock()
+        _registry.append(self)
+
+    def get(self, key: K) -> V | None:
+        """Get the value stored for a key.
+
+        Args:
+            key (K): The key to look up.
+
+        Returns:
+            V | None: The cached value, or None if the key is absent or its entry has expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        """Store a value for a key, evicting the least recently used entry if the cache is full.
+
+        Args:
+            key (K): The key to store the value under.
+            value (V): The value to store.
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: K) -> None:
+        """Remove the entry for a key, if present.
+
+        Args:
+            key (K): The key to remove.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate_if(self, predicate: Callable[[K, V], bool]) -> None:
+        """Remove every entry for which a predicate holds.
+
+        This scans the whole cache, so it suits invalidation on writes that are rare relative to reads.
+
+        Args:
+            predicate (Callable[[K, V], bool]): Tests the key and value of an entry.
+        """
+        with self._lock:
+            for key in [
+                key
+                for key, (_, value) in self._entries.items()
+                if predicate(key, value)
+            ]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class Snapshot(Generic[V]):
+    """A single value rebuilt at most once per `ttl` seconds, no matter how many threads request it.
+
+    When the value has expired, the first thread to request it rebuilds it while concurrent requests
+    wait for and share the result rather than each rebuilding it (single-flight). Coroutines use
+    `aget` instead, which never blocks the event loop on the lock."""
+
+    _ttl: float
+    _value: V | None
+    _expires_at: float
+    _lock: Lock
+    _pending: "asyncio.Future[V] | None"
+
+    def __init__(self, ttl: float):
+        """Initialize a new, empty snapshot.
+
+        Args:
+            ttl (float): The number of seconds a built value remains valid.
+        """
+        self._ttl = ttl
+        self._value = None
+        self._expires_at = 0.0
+        self._lock = Lock()
+        self._pending = None
+        _registry.append(self)
+
+    def get(self, build: Callable[[], V]) -> V:
+        """Get the current value, building it if there is none or it has expired.
+
+        Args:
+            build (Callable[[], V]): Builds a fresh value.
+
+        Returns:
+            V: The current value.
+        """
+        value = self._value
+        if value is not None and time.monotonic() < self._expires_at:
+            return value
+        with self._lock:
+            # Another thread may have rebuilt the value while this one waited on the lock.
+            if self._value is not None and time.monotonic() < self._expires_at:
+                return self._value
+            value = build()
+            self._value = value
+            self._expires_at = time.monotonic() + self._ttl
+            return value
+
+    async def aget(self, build: Callable[[], Awaitable[V]]) -> V:
+        """Get the current value from a coroutine, building it if there is none or it has expired.
+
+        Concurrent coroutines of the same event loop await a single build, which outlives any one of
+        them. The build must therefore not use resources of the request that happens to start it,
+        such as its session.
+
+        Args:
+            build (Callable[[], Awaitable[V]]): Builds a fresh value.
+
+        Returns:
+            V: The current value.
+        """
+        value = self._value
+        if value is not None and time.monotonic() < self._expires_at:
+            return value
+        pending = self._pending
+        if pending is None or pending.get_loop() is not asyncio.get_running_loop():
+            pending = asyncio.ensure_future(self._abuild(build))
+            self._pending = pending
+        # Shielded so that one cancelled request does not cancel the build others await.
+        return await asyncio.shield(pending)
+
+    async def _abuild(self, build: Callable[[], Awaitable[V]]) -> V:
+        try:
+            value = await build()
+            with self._lock:
+                self._value = value
+                self._expires_at = time.monotonic() + self._ttl
+            return value
+        finally:
+            if self._pending is asyncio.current_task():
+                self._pending = None
+
+    def clear(self) -> None:
+        """Discard the current value so that the next request rebuilds it."""
+        with self._lock:
+            self._value = None
+            self._expires_at = 0.0
+            self._pending = None
+
+
+def clear_caches() -> None:
+    """Clear every `TTLCache` and `Snapshot` in this process.
+
+    Used by tests, which reset the database between cases, to avoid observing entries derived from
+    a previous test's data."""
+    for cache in _registry:
+        cache.clear()
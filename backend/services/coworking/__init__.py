@@ -1,5 +1,6 @@
 from .policy import PolicyService
-from .status import StatusService
-from .operating_hours import OperatingHoursService
-from .seat import SeatService
-from .reservation import ReservationService
+from .status import StatusService, AsyncStatusService
+from .operating_hours import OperatingHoursService, AsyncOperatingHoursService
+from .seat import SeatService, AsyncSeatService
+from .reservation import ReservationService, AsyncReservationService
+from .reservation_lifecycle import ReservationLifecycleService
@@ -0,0 +1,145 @@
+"""
+Maintains the monthly check-in totals behind the signage leaderboard.
+
+The leaderboard ranks users by the time they spent in reservations checked out this month. Rather
+than summing every checked out reservation of the month for each request, `CheckinMonthlyTotalEntity`
+holds per-user, per-month sums that are updated as reservations are checked out, so the leaderboard
+reads only its top rows.
+"""
+
+from datetime import date, datetime
+from typing import Sequence
+
+from fastapi import Depends
+from sqlalchemy import Date, Select, cast, delete, func, literal_column, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from ...database import db_session
+from ...entities import UserEntity
+from ...entities.coworking import CheckinMonthlyTotalEntity, ReservationEntity
+from ...entities.coworking.reservation_user_table import reservation_user_table
+from ...models.coworking import ReservationState
+
+__authors__ = ["Will Zahrt", "Andrew Lockard"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+
+def month_of(moment: date | datetime) -> date:
+    """The first day of the month of a date or time."""
+    return date(moment.year, moment.month, 1)
+
+
+def select_top_users(month: date, limit: int) -> Select:
+    """Selects the users with the greatest totals in a month, ordered from the greatest total."""
+    return (
+        select(UserEntity)
+        .join(
+            CheckinMonthlyTotalEntity,
+            CheckinMonthlyTotalEntity.user_id == UserEntity.id,
+        )
+        .where(CheckinMonthlyTotalEntity.month == month)
+        .order_by(CheckinMonthlyTotalEntity.seconds.desc())
+        .limit(limit)
+    )
+
+
+class CheckinLeaderboardService:
+    """
+    Service that maintains the monthly check-in totals of users.
+
+    A reservation counts toward the month it ends in. Changes are flushed with the caller's session
+    and committed along with the reservation changes they reflect.
+    """
+
+    def __init__(self, session: Session = Depends(db_session)):
+        """
+        Initializes the database session.
+        """
+        self._session = session
+
+    def record_checked_out(self, reservation_ids: Sequence[int]) -> None:
+        """
+        Adds reservations that have just been checked out to the totals of their users.
+
+        Args:
+            reservation_ids (Sequence[int]): The IDs of the checked out reservations.
+        """
+        if len(reservation_ids) == 0:
+            return
+
+        statement = insert(CheckinMonthlyTotalEntity).from_select(
+            ["user_id", "month", "seconds"],
+            self._aggregate_checked_out(ReservationEntity.id.in_(reservation_ids)),
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=["user_id", "month"],
+            set_={
+                "seconds": CheckinMonthlyTotalEntity.seconds
+                + statement.excluded.seconds
+            },
+        )
+        self._session.execute(statement)
+
+    def top_users(self, month: date, limit: int) -> Sequence[UserEntity]:
+        """
+        Selects the users with the greatest totals in a month.
+
+        Args:
+            month (date): The first day of the month.
+            limit (int): The maximum number of users to select.
+
+        Returns:
+            Sequence[UserEntity]: The users, ordered from the greatest total.
+        """
+        return self._session.scalars(select_top_users(month, limit)).all()
+
+    def rebuild(self, since: date | None = None) -> None:
+        """
+        Recomputes the totals from the reservation table.
+
+        Args:
+            since (date | None): The first month to recompute. Defaults to every month.
+        """
+        if since is None:
+            self._session.execute(delete(CheckinMonthlyTotalEntity))
+            aggregate = self._aggregate_checked_out()
+        else:
+            since = month_of(since)
+            self._session.execute(
+                delete(CheckinMonthlyTotalEntity).where(
+                    CheckinMonthlyTotalEntity.month >= since
+                )
+            )
+            aggregate = self._aggregate_checked_out(
+                ReservationEntity.end >= datetime.combine(since, datetime.min.time())
+            )
+        self._session.execute(
+            insert(CheckinMonthlyTotalEntity).from_select(
+                ["user_id", "month", "seconds"], aggregate
+            )
+        )
+
+    def _aggregate_checked_out(self, *criteria) -> Select:
+        """
+        Selects the monthly totals of the users of the checked out reservations matching some
+        criteria.
+        """
+        reservation = ReservationEntity
+        user_id = reservation_user_table.c.user_id
+        month = cast(func.date_trunc(literal_column("'month'"), reservation.end), Date)
+        return (
+            select(
+                user_id.label("user_id"),
+                month.label("month"),
+                func.sum(func.extract("epoch", reservation.end - reservation.start)),
+            )
+            .select_from(reservation)
+            .join(
+                reservation_user_table,
+                reservation_user_table.c.reservation_id == reservation.id,
+            )
+            .where(reservation.state == ReservationState.CHECKED_OUT, *criteria)
+            .group_by(user_id, month)
+        )
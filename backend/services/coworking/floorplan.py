@@ -0,0 +1,54 @@
+"""Catalog of the seats and rooms of the coworking space."""
+
+from typing import Iterable
+
+from ...models import RoomDetails
+from ...models.coworking import SeatDetails
+from ...models.coworking.seat import SeatIdentity
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+
+class Floorplan:
+    """The seats and rooms of the coworking space, as prebuilt models.
+
+    Status, signage, and reservation requests each need the whole seat and room inventory, which
+    almost never changes. A floorplan is built once from the database and shared by every request
+    until the inventory changes, so its models must not be modified.
+    """
+
+    seats: tuple[SeatDetails, ...]
+    """Every seat, ordered by id."""
+
+    rooms: tuple[RoomDetails, ...]
+    """Every room, including its seats, ordered by id."""
+
+    _seats_by_id: dict[int, SeatDetails]
+
+    def __init__(self, rooms: Iterable[RoomDetails], seats: Iterable[SeatDetails]):
+        """Catalog seats and rooms.
+
+        Args:
+            rooms (Iterable[RoomDetails]): Every room, ordered by id.
+            seats (Iterable[SeatDetails]): Every seat, ordered by id.
+        """
+        self.rooms = tuple(rooms)
+        self.seats = tuple(seats)
+        self._seats_by_id = {seat.id: seat for seat in self.seats}
+
+    def get_seats(self, identities: Iterable[SeatIdentity]) -> list[SeatDetails]:
+        """Look up seats by id.
+
+        Args:
+            identities (Iterable[SeatIdentity]): The seats to look up.
+
+        Returns:
+            list[SeatDetails]: The seats that exist, in the order they were identified.
+        """
+        return [
+            self._seats_by_id[identity.id]
+            for identity in identities
+            if identity.id in self._seats_by_id
+        ]
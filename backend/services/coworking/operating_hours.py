@@ -1,12 +1,16 @@
 """Service that manages operating hours of the XL."""
 
 from fastapi import Depends
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from .exceptions import OperatingHoursCannotOverlapException
+from .operating_hours_calendar import OperatingHoursCalendar
+from ..cache import Snapshot
 from ..exceptions import ResourceNotFoundException
 from ..permission import PermissionService
 from ...models import User
-from ...database import db_session
+from ...database import db_session, async_db_session
 from ...models.coworking import OperatingHours, TimeRange
 from ...entities.coworking import OperatingHoursEntity
 
@@ -14,6 +18,12 @@ __authors__ = ["Kris Jordan"]
 __copyright__ = "Copyright 2023"
 __license__ = "MIT"
 
+_calendar: Snapshot[OperatingHoursCalendar] = Snapshot(ttl=60)
+"""Every operating hours entry of the XL, indexed by time.
+
+Cleared when operating hours are created or deleted in this process. The TTL bounds how long other
+worker processes may observe operating hours that have since changed."""
+
 
 class OperatingHoursService:
     """OperatingHoursService is the access layer to the operating hours data model."""
@@ -57,16 +67,12 @@ class OperatingHoursService:
         Returns:
             list[OperatingHours]: All operating hours the XL within the given time_range, including overlaps.
         """
-        entities = (
-            self._session.query(OperatingHoursEntity)
-            .filter(
-                OperatingHoursEntity.start <= time_range.end,
-                OperatingHoursEntity.end >= time_range.start,
-            )
-            .order_by(OperatingHoursEntity.start)
-            .all()
-        )
-        return [entity.to_model() for entity in entities]
+        return _calendar.get(self._build_calendar).schedule(time_range)
+
+    def _build_calendar(self) -> OperatingHoursCalendar:
+        """Index every operating hours entry of the XL."""
+        entities = self._session.scalars(select(OperatingHoursEntity)).all()
+        return OperatingHoursCalendar(entity.to_model() for entity in entities)
 
     def create(self, subject: User, time_range: TimeRange) -> OperatingHours:
         """Create new, open Operating Hours for XL coworking.
@@ -82,6 +88,9 @@ class OperatingHoursService:
             subject, "coworking.operating_hours.create", "coworking/operating_hours"
         )
 
+        # Conflicts are found in a freshly loaded calendar, which may include operating hours
+        # created by other worker processes since this one last loaded it.
+        _calendar.clear()
         conflicts = self.schedule(time_range)
         if len(conflicts) > 0:
             raise OperatingHoursCannotOverlapException(
@@ -91,6 +100,7 @@ class OperatingHoursService:
         entity = OperatingHoursEntity(start=time_range.start, end=time_range.end)
         self._session.add(entity)
         self._session.commit()
+        _calendar.clear()
         return entity.to_model()
 
     def delete(self, subject: User, operating_hours: OperatingHours) -> None:
@@ -114,3 +124,35 @@ class OperatingHoursService:
         )
         self._session.delete(operating_hours_entity)
         self._session.commit()
+        _calendar.clear()
+
+
+class AsyncOperatingHoursService:
+    """Asynchronous variant of `OperatingHoursService.schedule` for `async def` routes."""
+
+    def __init__(self, session: AsyncSession = Depends(async_db_session)):
+        """Initializes a new AsyncOperatingHoursService.
+
+        Args:
+            session (AsyncSession): The database session to use, typically injected by FastAPI.
+        """
+        self._session = session
+
+    async def schedule(self, time_range: TimeRange) -> list[OperatingHours]:
+        """Returns all operating hours of the XL for a given date range.
+
+        Args:
+            time_range (TimeRange): The date range to check for matching OperatingHours.
+
+        Returns:
+            list[OperatingHours]: All operating hours the XL within the given time_range, including overlaps.
+        """
+        return (await _calendar.aget(self._build_calendar)).schedule(time_range)
+
+    async def _build_calendar(self) -> OperatingHoursCalendar:
+        """Index every operating hours entry of the XL.
+
+        The build is shared by concurrent requests, so it reads with a session of its own."""
+        async with AsyncSession(self._session.bind) as session:
+            entities = (await session.scalars(select(OperatingHoursEntity))).all()
+            return OperatingHoursCalendar(entity.to_model() for entity in entities)
@@ -0,0 +1,59 @@
+"""Interval index of the operating hours of the XL."""
+
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from typing import Iterable
+
+from ...models.coworking import OperatingHours, TimeRange
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+
+class OperatingHoursCalendar:
+    """The operating hours of the XL, indexed to look up the hours overlapping a time range.
+
+    Operating hours are sorted by start. New operating hours may not overlap existing ones, but older
+    entries might, so each entry is also paired with the latest end among it and every entry before
+    it, which never decreases. The hours overlapping a range are then within the run from the first
+    entry whose latest end is not before the range starts to the last entry that starts before the
+    range ends, and both ends of the run are found by bisection.
+    """
+
+    _hours: list[OperatingHours]
+    _starts: list[datetime]
+    _latest_ends: list[datetime]
+
+    def __init__(self, hours: Iterable[OperatingHours]):
+        """Index operating hours.
+
+        Args:
+            hours (Iterable[OperatingHours]): Every operating hours entry of the XL.
+        """
+        self._hours = sorted(hours, key=lambda entry: (entry.start, entry.id or 0))
+        self._starts = [entry.start for entry in self._hours]
+        self._latest_ends = []
+        for entry in self._hours:
+            if len(self._latest_ends) == 0 or entry.end > self._latest_ends[-1]:
+                self._latest_ends.append(entry.end)
+            else:
+                self._latest_ends.append(self._latest_ends[-1])
+
+    def schedule(self, time_range: TimeRange) -> list[OperatingHours]:
+        """Look up the operating hours overlapping a time range.
+
+        Args:
+            time_range (TimeRange): The time range to look up.
+
+        Returns:
+            list[OperatingHours]: Copies of the operating hours within the time range, including
+                those that touch either of its ends, ordered by start.
+        """
+        first = bisect_left(self._latest_ends, time_range.start)
+        last = bisect_right(self._starts, time_range.end)
+        return [
+            entry.model_copy()
+            for entry in self._hours[first:last]
+            if entry.end >= time_range.start
+        ]
@@ -1,15 +1,17 @@
 """Service that manages reservations in the coworking space."""
 
 from fastapi import Depends
+from bisect import bisect_right
 from datetime import datetime, timedelta
 from random import random
 from typing import Sequence
-from sqlalchemy import or_, and_
+from sqlalchemy import ColumnElement, Select, or_, and_, exists, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, joinedload
-from backend.entities.room_entity import RoomEntity
 
 from backend.models.room_details import RoomDetails
-from ...database import db_session
+from ...database import db_session, async_db_session
 from ...models.user import User, UserIdentity
 from ..exceptions import UserPermissionException, ResourceNotFoundException
 from ...models.coworking import (
@@ -22,14 +24,19 @@ from ...models.coworking import (
     SeatAvailability,
     ReservationState,
     RoomState,
-    AvailabilityList,
     OperatingHours,
 )
 from ...entities import UserEntity
 from ...entities.coworking import ReservationEntity, SeatEntity
+from ...entities.coworking.reservation_user_table import reservation_user_table
+from ...entities.coworking.reservation_seat_table import reservation_seat_table
 from .seat import SeatService
 from .policy import PolicyService
-from .operating_hours import OperatingHoursService
+from .operating_hours import OperatingHoursService, AsyncOperatingHoursService
+from .reservation_lifecycle import ReservationLifecycleService, unexpired
+from .checkin_leaderboard import CheckinLeaderboardService
+from .room_availability import RoomAvailabilityGrid
+from .seat_availability_index import SeatAvailabilityIndex
 from ..permission import PermissionService
 
 __authors__ = ["Kris Jordan", "Matt Vu", "Yuvraj Jain"]
@@ -37,6 +44,10 @@ __copyright__ = "Copyright 2023-24"
 __license__ = "MIT"
 
 
+EXCLUSION_VIOLATION = "23P01"
+"""PostgreSQL error code raised when a row violates an exclusion constraint."""
+
+
 class ReservationException(Exception):
     def __init__(self, message: str):
         super().__init__(message)
@@ -63,6 +74,7 @@ class ReservationService:
         self._policy_svc = policy_svc
         self._operating_hours_svc = operating_hours_svc
         self._seat_svc = seats_svc
+        self._lifecycle_svc = ReservationLifecycleService(session, policy_svc)
 
     def get_reservation(self, subject: User, id: int) -> Reservation:
         """Lookup a reservation by ID.
@@ -137,28 +149,11 @@ class ReservationService:
     def _get_active_reservations_for_user(
         self, focus: UserIdentity, time_range: TimeRange
     ) -> Sequence[Reservation]:
-        reservations = (
-            self._session.query(ReservationEntity)
-            .join(ReservationEntity.users)
-            .filter(
-                ReservationEntity.start < time_range.end,
-                ReservationEntity.end > time_range.start,
-                ReservationEntity.state.not_in(
-                    [ReservationState.CANCELLED, ReservationState.CHECKED_OUT]
-                ),
-                UserEntity.id == focus.id,
+        reservations = self._session.scalars(
+            _select_active_reservations_of_user(
+                focus, time_range, self._lifecycle_svc.unexpired(datetime.now())
             )
-            .options(
-                joinedload(ReservationEntity.users), joinedload(ReservationEntity.seats)
-            )
-            .order_by(ReservationEntity.start)
-            .all()
-        )
-
-        reservations = self._state_transition_reservation_entities_by_time(
-            datetime.now(), reservations
-        )
-
+        ).unique()
         return [reservation.to_model() for reservation in reservations]
 
     def _get_active_reservations_for_user_by_state(
@@ -174,6 +169,7 @@ class ReservationService:
                 ReservationEntity.start < time_range.end,
                 ReservationEntity.end > time_range.start,
                 ReservationEntity.state == state,
+                self._lifecycle_svc.unexpired(datetime.now()),
                 UserEntity.id == focus.id,
             )
             .options(
@@ -183,10 +179,6 @@ class ReservationService:
             .all()
         )
 
-        reservations = self._state_transition_reservation_entities_by_time(
-            datetime.now(), reservations
-        )
-
         return [reservation.to_model() for reservation in reservations]
 
     def _check_user_reservation_duration(
@@ -323,48 +315,35 @@ class ReservationService:
             2 * operating_hours_time_delta.total_seconds() / 3600
         )
 
-        # Need current time to gray out slots in the past on that day.
-        current_time = datetime.now()
-        current_time_idx = self._idx_calculation(current_time, operating_hours_start)
+        grid = RoomAvailabilityGrid(
+            [room.id for room in rooms if room.id], operating_hours_duration
+        )
 
-        for room in rooms:
-            time_slots_for_room = [0] * operating_hours_duration
-
-            # # Making slots up till current time gray
-            # This code no longer required, but may be required in the future.
-            # Please keep this here for now.
-            # if date.date() == current_time.date():
-            #     for i in range(0, current_time_idx):
-            #         time_slots_for_room[i] = RoomState.UNAVAILABLE.value
-
-            if room.id == "SN156":
-                reservations = self._query_xl_reservations_by_date_for_user(
-                    date, subject
-                )
-            else:
-                reservations = self._query_confirmed_reservations_by_date_and_room(
-                    date, room.id
-                )
-            for reservation in reservations:
-                start_idx = self._idx_calculation(
-                    reservation.start, operating_hours_start
+        # Slots before the start of the grid, such as those earlier today, are clipped away.
+        for room_id, start, end, by_subject in self._query_reserved_times_by_date(
+            date, subject, [room.id for room in rooms if room.id != "SN156"]
+        ):
+            grid.reserve(
+                room_id or "SN156",
+                self._idx_calculation(start, operating_hours_start),
+                self._idx_calculation(end, operating_hours_start),
+                by_subject,
+            )
+
+        office_hours = self._policy_svc.office_hours(date=date)
+        for room_id, hours in office_hours.items():
+            for start, end in hours:
+                grid.block_for_office_hours(
+                    room_id,
+                    self._idx_calculation(start, operating_hours_start),
+                    self._idx_calculation(end, operating_hours_start),
                 )
-                end_idx = self._idx_calculation(reservation.end, operating_hours_start)
-
-                if date.date() == current_time.date():
-                    if end_idx < current_time_idx:
-                        continue
-                    start_idx = max(current_time_idx, start_idx)
-
-                for idx in range(start_idx, end_idx):
-                    # Currently only assuming single user.
-                    # TODO: If making group reservations, need to change this.
-                    if reservation.users[0].id == subject.id:
-                        time_slots_for_room[idx] = RoomState.SUBJECT_RESERVED.value
-                    else:
-                        if time_slots_for_room[idx] != RoomState.SUBJECT_RESERVED.value:
-                            time_slots_for_room[idx] = RoomState.RESERVED.value
-            reserved_date_map[room.id] = time_slots_for_room
+
+        reserved_date_map = grid.to_date_map()
+        if "SN156" in reserved_date_map:
+            del reserved_date_map["SN156"]
+
+        for room in rooms:
             capacity_map[room.id] = room.capacity
             room_type_map[room.id] = (
                 "Pairing Room"
@@ -374,13 +353,6 @@ class ReservationService:
                 else "Large Group"
             )
 
-        self._transform_date_map_for_unavailable(reserved_date_map)
-        if "SN156" in reserved_date_map:
-            del reserved_date_map["SN156"]
-        self._transform_date_map_for_officehours(
-            date, reserved_date_map, operating_hours_start, operating_hours_duration
-        )
-
         return ReservationMapDetails(
             reserved_date_map=reserved_date_map,
             capacity_map=capacity_map,
@@ -442,139 +414,68 @@ class ReservationService:
             (time.minute - operating_hours_start.minute) // 30
         )
 
-    def _transform_date_map_for_unavailable(
-        self, reserved_date_map: dict[str, list[int]]
-    ) -> None:
+    def _query_reserved_times_by_date(
+        self, date: datetime, subject: User, room_ids: list[str]
+    ) -> Sequence[tuple[str | None, datetime, datetime, bool]]:
         """
-        Modifies the reserved date map to mark certain slots as unavailable.
+        Queries the times reserved on a given date in any of the given rooms, and in the XL by the subject.
 
-        This function updates the reserved date map so that if a slot is reserved by the subject
-        (indicated by a 4), then any available slots (indicated by 0) in the same column across
-        all rooms are marked as unavailable (changed to 3).
+        A single query fetches every active (neither cancelled nor checked out, nor due to be) reservation overlapping
+        the 24-hour period starting from the beginning of the given date, that is either for one of the
+        given rooms or is the subject's own reservation of an XL seat.
 
         Args:
-            reserved_date_map (dict[str, list[int]]): The map of room reservations to be transformed.
+            date (datetime): The date for which to query reservations.
+            subject (User): The user whose XL reservations are included and whose reservations are flagged.
+            room_ids (list[str]): The IDs of the rooms for which to query reservations.
 
         Returns:
-            None: This function modifies the reserved_date_map in place.
-        """
-        # Identify the columns where 4 appears
-        columns_with_4 = set()
-        for key, values in reserved_date_map.items():
-            for i, value in enumerate(values):
-                if value == RoomState.SUBJECT_RESERVED.value:
-                    columns_with_4.add(i)
-
-        # Transform the dictionary as per the rules
-        for key, values in reserved_date_map.items():
-            for i in columns_with_4:
-                if values[i] == RoomState.AVAILABLE.value:
-                    values[i] = RoomState.UNAVAILABLE.value
-
-    def _transform_date_map_for_officehours(
-        self,
-        date: datetime,
-        reserved_date_map: dict[str, list[int]],
-        operating_hours_start: datetime,
-        operating_hours_duration: int,
-    ) -> None:
-        """
-        Transforms date map in place.
-        """
-        office_hours = self._policy_svc.office_hours(date=date)
-        for room_id, hours in office_hours.items():
-            if room_id not in reserved_date_map:
-                continue
-            for start, end in hours:
-                start_idx = max(self._idx_calculation(start, operating_hours_start), 0)
-                end_idx = min(
-                    self._idx_calculation(end, operating_hours_start),
-                    operating_hours_duration,
-                )
-                if start_idx < end_idx:
-                    for idx in range(start_idx, end_idx):
-                        reserved_date_map[room_id][idx] = RoomState.UNAVAILABLE.value
-
-    def _query_confirmed_reservations_by_date_and_room(
-        self, date: datetime, room_id: str
-    ) -> Sequence[Reservation]:
-        """
-        Queries and returns confirmed and checked-in reservations for a given date and room.
-
-        This function fetches all confirmed and checked-in reservations from the database for a specified date and room.
-        It includes reservations that have any overlap with the 24-hour period starting from the
-        beginning of the given date, and are associated with a specific room ID.
-
-        Args:
-            date (datetime): The date for which to query confirmed reservations.
-            room_id (str): The ID of the room for which to query confirmed reservations.
-
-        Returns:
-            Sequence[Reservation]: A sequence of Reservation model objects representing the confirmed reservations for the specified date and room.
+            Sequence[tuple[str | None, datetime, datetime, bool]]: The room ID (None for XL reservations),
+                start, end, and whether the subject holds the reservation, ordered by start.
         """
         start = date.replace(hour=0, minute=0, second=0, microsecond=0)
-        reservations = (
-            self._session.query(ReservationEntity)
-            .join(ReservationEntity.room)
-            .filter(
-                ReservationEntity.start < start + timedelta(hours=24),
-                ReservationEntity.end > start,
-                ReservationEntity.state.not_in(
-                    [ReservationState.CANCELLED, ReservationState.CHECKED_OUT]
-                ),
-                RoomEntity.id == room_id,
-            )
-            .options(
-                joinedload(ReservationEntity.users), joinedload(ReservationEntity.seats)
-            )
-            .order_by(ReservationEntity.start)
-            .all()
+        by_subject = exists().where(
+            reservation_user_table.c.reservation_id == ReservationEntity.id,
+            reservation_user_table.c.user_id == subject.id,
         )
-
-        return [reservation.to_model() for reservation in reservations]
-
-    def _query_xl_reservations_by_date_for_user(
-        self, date: datetime, subject: User
-    ) -> Sequence[Reservation]:
-        start = date.replace(hour=0, minute=0, second=0, microsecond=0)
-        reservations = (
-            self._session.query(ReservationEntity)
-            .join(ReservationEntity.users)
-            .filter(
+        query = (
+            select(
+                ReservationEntity.room_id,
+                ReservationEntity.start,
+                ReservationEntity.end,
+                by_subject.label("by_subject"),
+            )
+            .where(
                 ReservationEntity.start < start + timedelta(hours=24),
                 ReservationEntity.end > start,
                 ReservationEntity.state.not_in(
                     [ReservationState.CANCELLED, ReservationState.CHECKED_OUT]
                 ),
-                ReservationEntity.room == None,
-                UserEntity.id == subject.id,
+                self._lifecycle_svc.unexpired(datetime.now()),
+                or_(
+                    ReservationEntity.room_id.in_(room_ids),
+                    and_(ReservationEntity.room_id.is_(None), by_subject),
+                ),
             )
             .order_by(ReservationEntity.start)
-            .all()
         )
-
-        return [reservation.to_model() for reservation in reservations]
+        return [tuple(row) for row in self._session.execute(query).all()]
 
     def _get_reservable_rooms(self) -> Sequence[RoomDetails]:
         """
         Retrieves a list of all reservable rooms.
-        This method queries the RoomEntity table to find all rooms that are marked as reservable
-        (i.e., their 'reservable' attribute is True) and are not the room with ID 'SN156'.
-        The rooms are then ordered by their ID in ascending order.
-
-        Each room entity is converted to a RoomDetails model before being returned.
+        This method finds all rooms of the floorplan that are marked as reservable
+        (i.e., their 'reservable' attribute is True), along with the room with ID 'SN156'.
+        The rooms are ordered by their ID in ascending order.
 
         Returns:
-            Sequence[RoomDetails]: A sequence of RoomDetails models representing all the reservable rooms, excluding room 'SN156'.
+            Sequence[RoomDetails]: A sequence of RoomDetails models representing all the reservable rooms, including room 'SN156'.
         """
-        rooms = (
-            self._session.query(RoomEntity)
-            .where(or_(RoomEntity.reservable == True, RoomEntity.id == "SN156"))
-            .order_by(RoomEntity.id)
-            .all()
-        )
-
-        return [room.to_details_model() for room in rooms]
+        return [
+            room
+            for room in self._seat_svc.floorplan().rooms
+            if room.reservable or room.id == "SN156"
+        ]
 
     def get_seat_reservations(
         self, seats: Sequence[Seat], time_range: TimeRange
@@ -588,81 +489,13 @@ class ReservationService:
         Returns:
             Sequence[Reservation]: All reservations for the seats within the given time_range, including overlaps.
         """
-        reservations = (
-            self._session.query(ReservationEntity)
-            .join(ReservationEntity.seats)
-            .filter(
-                ReservationEntity.start < time_range.end,
-                ReservationEntity.end > time_range.start,
-                ReservationEntity.state.not_in(
-                    [ReservationState.CANCELLED, ReservationState.CHECKED_OUT]
-                ),
-                SeatEntity.id.in_([seat.id for seat in seats]),
-            )
-            .options(
-                joinedload(ReservationEntity.seats), joinedload(ReservationEntity.users)
+        reservations = self._session.scalars(
+            _select_active_reservations_of_seats(
+                seats, time_range, self._lifecycle_svc.unexpired(datetime.now())
             )
-            .all()
-        )
-
-        reservations = self._state_transition_reservation_entities_by_time(
-            datetime.now(), reservations
-        )
-
+        ).unique()
         return [reservation.to_model() for reservation in reservations]
 
-    def _state_transition_reservation_entities_by_time(
-        self, cutoff: datetime, reservations: Sequence[ReservationEntity]
-    ) -> Sequence[ReservationEntity]:
-        """Private, internal helper method for transitioning reservation entities
-        based on time. Three transitions are time-based:
-
-        1. Draft -> Cancelled following PolicyService#reservation_draft_timeout() after
-           the reservation's created at.
-        2. Confirmed -> Cancelled following PolicyService#reservation_checkin_timeout() after
-            the reservation's start.
-        3. Checked In -> Checked Out following the reservation's end.
-
-        Args:
-            moment (datetime): The time in which checks of expiration are made against. In
-                production, this is the current time.
-            reservations (Sequence[ReservationEntity]): The list of entities to state transition.
-
-        Returns:
-            Sequence[ReservationEntity] - All ReservationEntities that were not state transitioned.
-        """
-        valid: list[ReservationEntity] = []
-        dirty = False
-        for reservation in reservations:
-            if (
-                reservation.state == ReservationState.DRAFT
-                and reservation.created_at
-                + self._policy_svc.reservation_draft_timeout()
-                < cutoff
-            ):
-                reservation.state = ReservationState.CANCELLED
-                dirty = True
-            elif (
-                reservation.state == ReservationState.CONFIRMED
-                and reservation.start + self._policy_svc.reservation_checkin_timeout()
-                < cutoff
-            ):
-                reservation.state = ReservationState.CANCELLED
-                dirty = True
-            elif (
-                reservation.state == ReservationState.CHECKED_IN
-                and reservation.end <= cutoff
-            ):
-                reservation.state = ReservationState.CHECKED_OUT
-                dirty = True
-            else:
-                valid.append(reservation)
-
-        if dirty:
-            self._session.commit()
-
-        return valid
-
     def seat_availability(
         self, seats: Sequence[Seat], bounds: TimeRange
     ) -> Sequence[SeatAvailability]:
@@ -675,79 +508,40 @@ class ReservationService:
         Returns:
             Sequence[SeatAvailability]: All seat availability ordered by nearest and longest available.
         """
-        # No seats are available in the past
-        now = datetime.now()
-        if bounds.end <= now:
-            return []
+        return self.seat_availability_for_bounds(seats, [bounds])[0]
 
-        # Ensure the start of the bounds is at least right now
-        if bounds.start < now:
-            bounds.start = now
+    def seat_availability_for_bounds(
+        self, seats: Sequence[Seat], bounds_list: Sequence[TimeRange]
+    ) -> list[Sequence[SeatAvailability]]:
+        """Returns the availability of specific seats within each of several timeranges.
 
-        # Ensure the bounds is at least as long as a minimum reservation length, with a fudge factor
-        MINUMUM_RESERVATION_EPSILON = timedelta(minutes=1)
-        if (
-            bounds.duration()
-            < self._policy_svc.minimum_reservation_duration()
-            - MINUMUM_RESERVATION_EPSILON
-        ):
-            return []
+        Operating hours and seat reservations are fetched once, for the span of all the bounds, and
+        indexed by seat so that each bounds is a sweep over the index rather than a new computation.
 
-        # Find operating hours schedule during the requested bounds
-        open_hours = self._operating_hours_svc.schedule(bounds)
-        if len(open_hours) == 0:
-            return []
-
-        # Convert the operating hours during the bounds into an availability list
-        # and constrain the availability list within the bounds.
-        open_availability_list = self._operating_hours_to_bounded_availability_list(
-            open_hours, bounds
-        )
-        if len(open_availability_list.availability) == 0:
-            return []
-
-        # Start from a position where all seats begin with same availability as
-        # open_availability_list. From there, reservations will subtract availability
-        # from the given seat.
-        seat_availability_dict = self._initialize_seat_availability_dict(
-            seats, open_availability_list
-        )
+        Args:
+            seats (list[Seat]): The seats to check the availability of.
+            bounds_list (Sequence[TimeRange]): The time ranges of interest.
 
-        # Get all active reservations during the availability bounds for the seats.
-        reservation_range = TimeRange(
-            start=open_availability_list.availability[0].start,
-            end=open_availability_list.availability[-1].end,
-        )
+        Returns:
+            list[Sequence[SeatAvailability]]: For each bounds, in order, all seat availability ordered
+                by nearest and longest available.
+        """
+        threshold = _availability_threshold(self._policy_svc)
+        effective_bounds = _effective_bounds(bounds_list, threshold)
+        span = _span(effective_bounds)
+        if span is None:
+            return [[] for _ in bounds_list]
+
+        # Find operating hours schedule during the span of all requested bounds
+        open_hours = self._operating_hours_svc.schedule(span)
+        open_ranges_list = _open_ranges(open_hours, effective_bounds)
+        reservation_range = _span_of_open_ranges(open_ranges_list)
+        if reservation_range is None:
+            return [[] for _ in bounds_list]
+
+        # Get all active reservations of the seats during any of the open ranges
         reservations = self.get_seat_reservations(seats, reservation_range)
-
-        # Subtract all seat reservations from their availability
-        self._remove_reservations_from_availability(
-            seat_availability_dict, reservations
-        )
-
-        # Remove seats with availability below threshold
-        available_seats: list[SeatAvailability] = list(
-            self._prune_seats_below_availability_threshold(
-                list(seat_availability_dict.values()),
-                self._policy_svc.minimum_reservation_duration()
-                - MINUMUM_RESERVATION_EPSILON,
-            )
-        )
-
-        # Sort by nearest available ASC, duration DESC, reservable (False before True), with entropy
-        # The rationale for entropy is when XL is wide open for walkins, within the given seat search
-        # we'd like to mix up the order in which seats are assigned rather than always giving away
-        # the same sequence of seats (and causing more consisten wear and tear to it).
-        available_seats.sort(
-            key=lambda sa: (
-                sa.availability[0].start,
-                -1 * sa.availability[0].duration(),
-                sa.reservable,
-                random(),
-            )
-        )
-
-        return available_seats
+        return _seat_availability(seats, open_ranges_list, reservations, threshold)
 
     def draft_reservation(
         self, subject: User, request: ReservationRequest
@@ -857,11 +651,8 @@ class ReservationService:
         #             )
 
         # Look at the seats - match bounds of assigned seat's availability
-        seat_entities = []
         if request.room is None:
-            seats: list[Seat] = SeatEntity.get_models_from_identities(
-                self._session, request.seats
-            )
+            seats: list[Seat] = self._seat_svc.floorplan().get_seats(request.seats)
             seat_availability = self.seat_availability(seats, bounds)
 
             if not is_walkin:
@@ -869,34 +660,50 @@ class ReservationService:
                     seat for seat in seat_availability if seat.reservable
                 ]
 
-            if len(seat_availability) == 0:
-                raise ReservationException(
-                    "The requested seat(s) are no longer available."
-                )
-
             # TODO (limit to # of users on request if multiple users)
             # Here we constrain the reservation start/end to that of the best available seat requested.
             # This matters as walk-in availability becomes scarce (may start in the near future even though request
             # start is for right now), alternatively may end early due to reserved seat on backend.
-            seat_entities = [self._session.get(SeatEntity, seat_availability[0].id)]
-            bounds = seat_availability[0].availability[0]
+            # Concurrent drafts may claim a seat after its availability was computed, in which case the
+            # seat's exclusion constraint rejects the draft and the next best seat is tried.
+            draft = None
+            for seat in seat_availability:
+                candidate = ReservationEntity(
+                    state=ReservationState.DRAFT,
+                    start=seat.availability[0].start,
+                    end=seat.availability[0].end,
+                    users=user_entities,
+                    walkin=is_walkin,
+                    room_id=None,
+                    seats=[self._session.get(SeatEntity, seat.id)],
+                )
+                if self._insert_draft(candidate):
+                    draft = candidate
+                    break
+
+            if draft is None:
+                raise ReservationException(
+                    "The requested seat(s) are no longer available."
+                )
         else:
             # Prevent double booking a room
             conflicts = self._fetch_conflicting_room_reservations(request)
             if len(conflicts) > 0:
                 raise ReservationException("The requested room is no longer available.")
 
-        draft = ReservationEntity(
-            state=ReservationState.DRAFT,
-            start=bounds.start,
-            end=bounds.end,
-            users=user_entities,
-            walkin=is_walkin,
-            room_id=request.room.id if request.room else None,
-            seats=seat_entities,
-        )
+            draft = ReservationEntity(
+                state=ReservationState.DRAFT,
+                start=bounds.start,
+                end=bounds.end,
+                users=user_entities,
+                walkin=is_walkin,
+                room_id=request.room.id,
+                seats=[],
+            )
+            # The room's exclusion constraint rejects drafts that race a conflicting one
+            if not self._insert_draft(draft):
+                raise ReservationException("The requested room is no longer available.")
 
-        self._session.add(draft)
         self._session.commit()
         return draft.to_model()
 
@@ -944,6 +751,8 @@ class ReservationService:
             dirty = dirty or self._change_state(entity, delta.state)
             if entity.state == ReservationState.CHECKED_OUT:
                 entity.end = datetime.now()
+                self._session.flush()
+                CheckinLeaderboardService(self._session).record_checked_out([entity.id])
 
         # Handle Requested Seat Changes?
         if delta.seats is not None:
@@ -1125,50 +934,48 @@ class ReservationService:
 
     # Private helper methods
 
-    def _operating_hours_to_bounded_availability_list(
-        self, operating_hours: Sequence[OperatingHours], bounds: TimeRange
-    ) -> AvailabilityList:
-        availability = AvailabilityList(
-            availability=[
-                TimeRange(start=operating_hour.start, end=operating_hour.end)
-                for operating_hour in operating_hours
-            ]
-        )
-        availability.constrain(bounds)
-        return availability
-
-    def _initialize_seat_availability_dict(
-        self, seats: Sequence[Seat], availability: AvailabilityList
-    ) -> dict[int, SeatAvailability]:
-        return {
-            seat.id: SeatAvailability(
-                availability=availability.model_copy(deep=True).availability,
-                **seat.model_dump(),
-            )
-            for seat in seats
-            if seat.id is not None
-        }
+    def _insert_draft(self, draft: ReservationEntity) -> bool:
+        """Inserts a draft reservation unless it overlaps an active reservation of its seats or room.
 
-    def _remove_reservations_from_availability(
-        self,
-        seat_availability_dict: dict[int, SeatAvailability],
-        reservations: Sequence[Reservation],
-    ):
-        for reservation in reservations:
-            if len(reservation.seats) > 0:
-                for seat in reservation.seats:
-                    if seat.id in seat_availability_dict:
-                        seat_availability_dict[seat.id].subtract(reservation)
+        The draft is inserted within a savepoint, so that a rejected draft is rolled back without
+        affecting the rest of the transaction. The exclusion constraints treat reservations as
+        active until the sweeper transitions them, so a rejected draft expires the reservations it
+        overlaps that are due a transition and is retried once.
 
-    def _prune_seats_below_availability_threshold(
-        self, seats: Sequence[SeatAvailability], threshold: timedelta
-    ) -> Sequence[SeatAvailability]:
-        available_seats: list[SeatAvailability] = []
-        for seat in seats:
-            seat.filter_time_ranges_below(threshold)
-            if len(seat.availability) > 0:
-                available_seats.append(seat)
-        return available_seats
+        Returns:
+            bool: True if the draft was inserted, False if it was rejected as overlapping.
+        """
+        if self._try_insert_draft(draft):
+            return True
+        if draft.room_id is not None:
+            same_resource = ReservationEntity.room_id == draft.room_id
+        else:
+            same_resource = ReservationEntity.id.in_(
+                select(reservation_seat_table.c.reservation_id).where(
+                    reservation_seat_table.c.seat_id.in_(
+                        [seat.id for seat in draft.seats]
+                    )
+                )
+            )
+        expired = self._lifecycle_svc.expire(
+            datetime.now(),
+            same_resource,
+            ReservationEntity.start < draft.end,
+            ReservationEntity.end > draft.start,
+        )
+        return expired > 0 and self._try_insert_draft(draft)
+
+    def _try_insert_draft(self, draft: ReservationEntity) -> bool:
+        """Inserts a draft reservation within a savepoint, returning False if it was rejected by
+        an exclusion constraint."""
+        try:
+            with self._session.begin_nested():
+                self._session.add(draft)
+        except IntegrityError as e:
+            if getattr(e.orig, "pgcode", None) != EXCLUSION_VIOLATION:
+                raise
+            return False
+        return True
 
     def _fetch_conflicting_room_reservations(
         self, request: ReservationRequest
@@ -1188,7 +995,276 @@ class ReservationService:
                         ReservationState.CHECKED_IN,
                     )
                 ),
+                self._lifecycle_svc.unexpired(datetime.now()),
                 ReservationEntity.room_id == request.room.id,
             )
             .all()
         )
+
+
+class AsyncReservationService:
+    """Asynchronous variant of the read paths of `ReservationService` for `async def` routes.
+
+    The statements of `ReservationService` are awaited on an `AsyncSession`, and seat availability
+    is computed from their results as `ReservationService` computes it."""
+
+    def __init__(
+        self,
+        session: AsyncSession = Depends(async_db_session),
+        policy_svc: PolicyService = Depends(),
+        operating_hours_svc: AsyncOperatingHoursService = Depends(),
+    ):
+        """Initializes a new AsyncReservationService.
+
+        Args:
+            session (AsyncSession): The database session to use, typically injected by FastAPI.
+        """
+        self._session = session
+        self._policy_svc = policy_svc
+        self._operating_hours_svc = operating_hours_svc
+
+    async def get_current_reservations_for_user(
+        self, subject: User
+    ) -> Sequence[Reservation]:
+        """Find the subject's own current and upcoming reservations.
+
+        Args:
+            subject (User): The user making the request
+
+        Returns:
+            Sequence[Reservation]: Upcoming reservations for the user."""
+        now = datetime.now()
+        time_range = TimeRange(
+            start=now - timedelta(days=1),
+            end=now + self._policy_svc.reservation_window(subject),
+        )
+        reservations = await self._session.scalars(
+            _select_active_reservations_of_user(
+                subject, time_range, unexpired(self._policy_svc, now)
+            )
+        )
+        return [reservation.to_model() for reservation in reservations.unique()]
+
+    async def get_seat_reservations(
+        self, seats: Sequence[Seat], time_range: TimeRange
+    ) -> Sequence[Reservation]:
+        """Returns all reservations for a set of seats in a given time range.
+
+        Args:
+            seats (Sequence[Seat]): The list of seats to query for reservations.
+            time_range (TimeRange): The date range to check for matching reservations.
+
+        Returns:
+            Sequence[Reservation]: All reservations for the seats within the given time_range, including overlaps.
+        """
+        reservations = await self._session.scalars(
+            _select_active_reservations_of_seats(
+                seats, time_range, unexpired(self._policy_svc, datetime.now())
+            )
+        )
+        return [reservation.to_model() for reservation in reservations.unique()]
+
+    async def seat_availability(
+        self, seats: Sequence[Seat], bounds: TimeRange
+    ) -> Sequence[SeatAvailability]:
+        """Returns a list of all seat availability for specific seats within a given timerange.
+
+        Args:
+            bounds (TimeRange): The time range of interest.
+            seats (list[Seat]): The seats to check the availability of.
+
+        Returns:
+            Sequence[SeatAvailability]: All seat availability ordered by nearest and longest available.
+        """
+        threshold = _availability_threshold(self._policy_svc)
+        effective_bounds = _effective_bounds([bounds], threshold)
+        span = _span(effective_bounds)
+        if span is None:
+            return []
+
+        open_hours = await self._operating_hours_svc.schedule(span)
+        open_ranges_list = _open_ranges(open_hours, effective_bounds)
+        reservation_range = _span_of_open_ranges(open_ranges_list)
+        if reservation_range is None:
+            return []
+
+        reservations = await self.get_seat_reservations(seats, reservation_range)
+        return _seat_availability(seats, open_ranges_list, reservations, threshold)[0]
+
+
+def _select_active_reservations(
+    time_range: TimeRange, *criteria: ColumnElement[bool]
+) -> Select:
+    """Selects the active reservations overlapping a time range that match some criteria, loading
+    what their models need."""
+    return (
+        select(ReservationEntity)
+        .where(
+            ReservationEntity.start < time_range.end,
+            ReservationEntity.end > time_range.start,
+            ReservationEntity.state.not_in(
+                [ReservationState.CANCELLED, ReservationState.CHECKED_OUT]
+            ),
+            *criteria,
+        )
+        .options(
+            joinedload(ReservationEntity.users),
+            joinedload(ReservationEntity.seats).joinedload(SeatEntity.room),
+            joinedload(ReservationEntity.room),
+        )
+    )
+
+
+def _select_active_reservations_of_user(
+    focus: UserIdentity, time_range: TimeRange, *criteria: ColumnElement[bool]
+) -> Select:
+    """Selects the active reservations of a user overlapping a time range, ordered by start."""
+    return (
+        _select_active_reservations(time_range, *criteria)
+        .join(ReservationEntity.users)
+        .where(UserEntity.id == focus.id)
+        .order_by(ReservationEntity.start)
+    )
+
+
+def _select_active_reservations_of_seats(
+    seats: Sequence[Seat], time_range: TimeRange, *criteria: ColumnElement[bool]
+) -> Select:
+    """Selects the active reservations of any of some seats overlapping a time range."""
+    return (
+        _select_active_reservations(time_range, *criteria)
+        .join(ReservationEntity.seats)
+        .where(SeatEntity.id.in_([seat.id for seat in seats]))
+    )
+
+
+def _availability_threshold(policy_svc: PolicyService) -> timedelta:
+    """The shortest availability of a seat worth reporting."""
+    # Ensure the bounds is at least as long as a minimum reservation length, with a fudge factor
+    MINUMUM_RESERVATION_EPSILON = timedelta(minutes=1)
+    return policy_svc.minimum_reservation_duration() - MINUMUM_RESERVATION_EPSILON
+
+
+def _effective_bounds(
+    bounds_list: Sequence[TimeRange], threshold: timedelta
+) -> list[TimeRange | None]:
+    """Constrain each bounds to the future, or None if too little of it remains."""
+    # No seats are available in the past, so the start of each bounds is at least right now
+    now = datetime.now()
+    effective_bounds: list[TimeRange | None] = []
+    for bounds in bounds_list:
+        if bounds.end <= now:
+            effective_bounds.append(None)
+            continue
+        bounds = TimeRange(start=max(bounds.start, now), end=bounds.end)
+        effective_bounds.append(bounds if bounds.duration() >= threshold else None)
+    return effective_bounds
+
+
+def _span(bounds_list: Sequence[TimeRange | None]) -> TimeRange | None:
+    """The time range spanning every bounds, or None if there are none."""
+    valid_bounds = [bounds for bounds in bounds_list if bounds is not None]
+    if len(valid_bounds) == 0:
+        return None
+    return TimeRange(
+        start=min(bounds.start for bounds in valid_bounds),
+        end=max(bounds.end for bounds in valid_bounds),
+    )
+
+
+def _open_ranges(
+    open_hours: Sequence[OperatingHours], bounds_list: Sequence[TimeRange | None]
+) -> list[list[tuple[datetime, datetime]]]:
+    """Constrain the operating hours within each bounds."""
+    return [
+        (
+            _operating_hours_within_bounds(open_hours, bounds)
+            if bounds is not None
+            else []
+        )
+        for bounds in bounds_list
+    ]
+
+
+def _span_of_open_ranges(
+    open_ranges_list: Sequence[Sequence[tuple[datetime, datetime]]],
+) -> TimeRange | None:
+    """The time range spanning every open range, or None if there are none."""
+    open_ranges_flat = [r for open_ranges in open_ranges_list for r in open_ranges]
+    if len(open_ranges_flat) == 0:
+        return None
+    return TimeRange(
+        start=min(start for start, _ in open_ranges_flat),
+        end=max(end for _, end in open_ranges_flat),
+    )
+
+
+def _operating_hours_within_bounds(
+    operating_hours: Sequence[OperatingHours], bounds: TimeRange
+) -> list[tuple[datetime, datetime]]:
+    """Constrain sorted, disjoint operating hours to the given bounds."""
+    ends = [operating_hour.end for operating_hour in operating_hours]
+    open_ranges: list[tuple[datetime, datetime]] = []
+    for operating_hour in operating_hours[bisect_right(ends, bounds.start) :]:
+        if operating_hour.start >= bounds.end:
+            break
+        open_ranges.append(
+            (
+                max(operating_hour.start, bounds.start),
+                min(operating_hour.end, bounds.end),
+            )
+        )
+    return open_ranges
+
+
+def _seat_availability(
+    seats: Sequence[Seat],
+    open_ranges_list: Sequence[Sequence[tuple[datetime, datetime]]],
+    reservations: Sequence[Reservation],
+    threshold: timedelta,
+) -> list[Sequence[SeatAvailability]]:
+    """Subtracts the reservations of the seats from each list of open ranges."""
+    # Index the reservations by seat, so that each list of open ranges is a sweep over the index
+    index = SeatAvailabilityIndex(
+        (seat.id, reservation.start, reservation.end)
+        for reservation in reservations
+        for seat in reservation.seats
+        if seat.id is not None
+    )
+
+    results: list[Sequence[SeatAvailability]] = [[] for _ in open_ranges_list]
+    for i, open_ranges in enumerate(open_ranges_list):
+        if len(open_ranges) == 0:
+            continue
+
+        # Subtract each seat's reservations from the open ranges, removing seats with
+        # availability below threshold
+        available_seats: list[SeatAvailability] = []
+        for seat in seats:
+            if seat.id is None:
+                continue
+            availability = [
+                TimeRange(start=start, end=end)
+                for start, end in index.available(seat.id, open_ranges)
+                if end - start >= threshold
+            ]
+            if len(availability) > 0:
+                available_seats.append(
+                    SeatAvailability(availability=availability, **seat.model_dump())
+                )
+
+        # Sort by nearest available ASC, duration DESC, reservable (False before True), with entropy
+        # The rationale for entropy is when XL is wide open for walkins, within the given seat search
+        # we'd like to mix up the order in which seats are assigned rather than always giving away
+        # the same sequence of seats (and causing more consisten wear and tear to it).
+        available_seats.sort(
+            key=lambda sa: (
+                sa.availability[0].start,
+                -1 * sa.availability[0].duration(),
+                sa.reservable,
+                random(),
+            )
+        )
+        results[i] = available_seats
+
+    return results
@@ -0,0 +1,195 @@
+"""Service that applies the time-based state transitions of reservations."""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Callable
+
+from fastapi import Depends
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import ColumnElement, and_, not_, update
+from sqlalchemy.orm import Session
+
+from ...database import db_session, engine
+from ...entities.coworking import ReservationEntity
+from ...models.coworking import ReservationState
+from .policy import PolicyService
+from .checkin_leaderboard import CheckinLeaderboardService
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2023-24"
+__license__ = "MIT"
+
+_logger = logging.getLogger(__name__)
+
+
+class ReservationLifecycleService:
+    """ReservationLifecycleService expires reservations whose time has passed.
+
+    Three transitions are time-based:
+
+    1. Draft -> Cancelled following PolicyService#reservation_draft_timeout() after
+       the reservation's created at.
+    2. Confirmed -> Cancelled following PolicyService#reservation_checkin_timeout() after
+       the reservation's start.
+    3. Checked In -> Checked Out following the reservation's end.
+
+    The transitions are written by `sweep`, which is run periodically by `sweep_periodically`.
+    Between sweeps, read paths exclude reservations that are due a transition with the criteria
+    of `unexpired`, rather than writing the transitions themselves.
+
+    The exclusion constraints on the seats and rooms of reservations, however, treat every draft
+    and confirmed reservation as active until it is transitioned. Drafts rejected by a constraint
+    expire the reservations they overlap and are retried once, but the sweeper must keep running
+    for reservations to be expired in general, so it should not be disabled while the
+    constraints exist.
+    """
+
+    def __init__(
+        self,
+        session: Session = Depends(db_session),
+        policy_svc: PolicyService = Depends(),
+    ):
+        """Initializes a new ReservationLifecycleService.
+
+        Args:
+            session (Session): The database session to use, typically injected by FastAPI.
+            policy_svc (PolicyService): The policies that define the timeouts of reservations.
+        """
+        self._session = session
+        self._policy_svc = policy_svc
+
+    def transitions(
+        self, now: datetime
+    ) -> list[tuple[ReservationState, ReservationState, ColumnElement[bool]]]:
+        """The time-based transitions of reservations, as defined by `transitions`."""
+        return transitions(self._policy_svc, now)
+
+    def unexpired(self, now: datetime) -> ColumnElement[bool]:
+        """Criteria for reservations that are not due a time-based transition, as defined by `unexpired`."""
+        return unexpired(self._policy_svc, now)
+
+    def expire(self, now: datetime, *criteria: ColumnElement[bool]) -> int:
+        """Applies the time-based transitions to the reservations due them that match some criteria.
+
+        Each transition is a single UPDATE, so reservations are not loaded to be expired. Checked
+        out reservations are added to the check-in totals of the leaderboard. Changes are made with
+        the caller's session and committed by the caller.
+
+        Args:
+            now (datetime): The time against which expiration is checked.
+            *criteria (ColumnElement[bool]): Criteria limiting the reservations to expire.
+
+        Returns:
+            int: The number of reservations transitioned.
+        """
+        transitioned = 0
+        for state, next_state, expired in self.transitions(now):
+            statement = (
+                update(ReservationEntity)
+                .where(ReservationEntity.state == state, expired, *criteria)
+                .values(state=next_state)
+            )
+            if next_state == ReservationState.CHECKED_OUT:
+                # The reservations checked out are returned to add them to the leaderboard
+                checked_out = self._session.scalars(
+                    statement.returning(ReservationEntity.id)
+                ).all()
+                CheckinLeaderboardService(self._session).record_checked_out(checked_out)
+                transitioned += len(checked_out)
+            else:
+                transitioned += self._session.execute(statement).rowcount
+        return transitioned
+
+    def sweep(self, now: datetime | None = None) -> int:
+        """Applies the time-based transitions to all reservations due them and commits them.
+
+        Args:
+            now (datetime | None): The time against which expiration is checked. Defaults to
+                the current time.
+
+        Returns:
+            int: The number of reservations transitioned.
+        """
+        transitioned = self.expire(now if now is not None else datetime.now())
+        self._session.commit()
+        return transitioned
+
+
+def transitions(
+    policy_svc: PolicyService, now: datetime
+) -> list[tuple[ReservationState, ReservationState, ColumnElement[bool]]]:
+    """The time-based transitions of reservations.
+
+    Args:
+        policy_svc (PolicyService): The policies that define the timeouts of reservations.
+        now (datetime): The time against which expiration is checked.
+
+    Returns:
+        list[tuple[ReservationState, ReservationState, ColumnElement[bool]]]: For each
+            transition, the state it applies to, the state it transitions to, and the
+            criteria for a reservation in the former state to be due the transition.
+    """
+    return [
+        (
+            ReservationState.DRAFT,
+            ReservationState.CANCELLED,
+            ReservationEntity.created_at < now - policy_svc.reservation_draft_timeout(),
+        ),
+        (
+            ReservationState.CONFIRMED,
+            ReservationState.CANCELLED,
+            ReservationEntity.start < now - policy_svc.reservation_checkin_timeout(),
+        ),
+        (
+            ReservationState.CHECKED_IN,
+            ReservationState.CHECKED_OUT,
+            ReservationEntity.end <= now,
+        ),
+    ]
+
+
+def unexpired(policy_svc: PolicyService, now: datetime) -> ColumnElement[bool]:
+    """Criteria for reservations that are not due a time-based transition.
+
+    The criteria are independent of any session, so read paths on sync and async sessions alike
+    exclude reservations due a transition with them.
+
+    Args:
+        policy_svc (PolicyService): The policies that define the timeouts of reservations.
+        now (datetime): The time against which expiration is checked. In production, this is
+            the current time.
+
+    Returns:
+        ColumnElement[bool]: Criteria that exclude reservations due a transition.
+    """
+    return and_(
+        *(
+            not_(and_(ReservationEntity.state == state, expired))
+            for state, _, expired in transitions(policy_svc, now)
+        )
+    )
+
+
+def sweep_reservations(now: datetime) -> int:
+    """Sweeps reservations with a session of its own, for use outside of a request."""
+    with Session(engine) as session:
+        return ReservationLifecycleService(session, PolicyService()).sweep(now)
+
+
+async def sweep_periodically(
+    interval: timedelta, clock: Callable[[], datetime] = datetime.now
+) -> None:
+    """Sweeps reservations every `interval` until cancelled.
+
+    Args:
+        interval (timedelta): The time between sweeps.
+        clock (Callable[[], datetime]): The source of the current time for each sweep.
+    """
+    while True:
+        try:
+            await run_in_threadpool(sweep_reservations, clock())
+        except Exception:
+            # A failed sweep is retried at the next interval
+            _logger.exception("Failed to sweep reservations")
+        await asyncio.sleep(interval.total_seconds())
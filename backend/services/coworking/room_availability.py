@@ -0,0 +1,108 @@
+"""Bitmap-backed grid of room reservation states used to build the room reservation map."""
+
+from ...models.coworking import RoomState
+
+__authors__ = ["Kris Jordan", "Yuvraj Jain"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+
+class RoomAvailabilityGrid:
+    """Grid of rooms by half-hour time slots for a single day.
+
+    Each room's row is kept as three integer bitmaps (bit `i` represents slot `i`): slots reserved
+    by other users, slots reserved by the subject, and slots blocked off for office hours. The
+    rules that combine them into `RoomState` values are applied across whole rows at once with
+    bitwise operations rather than slot by slot.
+    """
+
+    _number_of_slots: int
+    _reserved: dict[str, int]
+    _subject_reserved: dict[str, int]
+    _office_hours: dict[str, int]
+
+    def __init__(self, room_ids: list[str], number_of_slots: int):
+        """Initialize a grid where every slot of every room is available.
+
+        Args:
+            room_ids (list[str]): The ids of the rooms in the grid, in display order.
+            number_of_slots (int): The number of half-hour slots in each room's row.
+        """
+        self._number_of_slots = max(number_of_slots, 0)
+        self._reserved = {room_id: 0 for room_id in room_ids}
+        self._subject_reserved = {room_id: 0 for room_id in room_ids}
+        self._office_hours = {room_id: 0 for room_id in room_ids}
+
+    def _slot_mask(self, start_idx: int, end_idx: int) -> int:
+        """Bitmap of slots `[start_idx, end_idx)` clipped to the bounds of the grid."""
+        start_idx = max(start_idx, 0)
+        end_idx = min(end_idx, self._number_of_slots)
+        if start_idx >= end_idx:
+            return 0
+        return ((1 << (end_idx - start_idx)) - 1) << start_idx
+
+    def reserve(
+        self, room_id: str, start_idx: int, end_idx: int, by_subject: bool
+    ) -> None:
+        """Mark slots `[start_idx, end_idx)` of a room as reserved.
+
+        Args:
+            room_id (str): The room reserved.
+            start_idx (int): The first slot reserved.
+            end_idx (int): The slot after the last slot reserved.
+            by_subject (bool): Whether the subject the grid is built for holds the reservation.
+        """
+        if room_id not in self._reserved:
+            return
+        mask = self._slot_mask(start_idx, end_idx)
+        if by_subject:
+            self._subject_reserved[room_id] |= mask
+        else:
+            self._reserved[room_id] |= mask
+
+    def block_for_office_hours(self, room_id: str, start_idx: int, end_idx: int):
+        """Mark slots `[start_idx, end_idx)` of a room as unavailable due to office hours.
+
+        Args:
+            room_id (str): The room hosting office hours.
+            start_idx (int): The first slot blocked.
+            end_idx (int): The slot after the last slot blocked.
+        """
+        if room_id not in self._office_hours:
+            return
+        self._office_hours[room_id] |= self._slot_mask(start_idx, end_idx)
+
+    def to_date_map(self) -> dict[str, list[int]]:
+        """Resolve the grid into a map of room ids to lists of `RoomState` values.
+
+        A slot reserved by the subject takes precedence over other reservations. While the subject
+        holds a reservation in some room, the open slots of every other room in that column are
+        unavailable to them. Office hours make a slot unavailable regardless of reservations.
+
+        Returns:
+            dict[str, list[int]]: The `RoomState` value of each slot of each room.
+        """
+        subject_columns = 0
+        for mask in self._subject_reserved.values():
+            subject_columns |= mask
+
+        date_map: dict[str, list[int]] = {}
+        for room_id, reserved in self._reserved.items():
+            subject_reserved = self._subject_reserved[room_id]
+            office_hours = self._office_hours[room_id]
+            unavailable = office_hours | (
+                subject_columns & ~(reserved | subject_reserved)
+            )
+            subject_reserved &= ~unavailable
+            reserved &= ~(unavailable | subject_reserved)
+            date_map[room_id] = [
+                RoomState.UNAVAILABLE.value
+                if unavailable >> idx & 1
+                else RoomState.SUBJECT_RESERVED.value
+                if subject_reserved >> idx & 1
+                else RoomState.RESERVED.value
+                if reserved >> idx & 1
+                else RoomState.AVAILABLE.value
+                for idx in range(self._number_of_slots)
+            ]
+        return date_map
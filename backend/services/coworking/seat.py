@@ -1,15 +1,31 @@
 """Service that manages seats in the coworking space."""
 
+from typing import Sequence
 from fastapi import Depends
-from sqlalchemy.orm import Session
-from ...database import db_session
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
+from ...database import db_session, async_db_session
 from ...models.coworking import Seat, SeatDetails
-from ...entities.coworking import SeatEntity
+from ...entities import RoomEntity
+from ..cache import Snapshot
+from .floorplan import Floorplan
 
 __authors__ = ["Kris Jordan"]
 __copyright__ = "Copyright 2023"
 __license__ = "MIT"
 
+_floorplan: Snapshot[Floorplan] = Snapshot(ttl=5 * 60)
+"""The seats and rooms of the coworking space.
+
+Cleared when rooms are created, updated, or deleted in this process. The TTL bounds how long other
+worker processes may observe seats and rooms that have since changed."""
+
+
+def invalidate_floorplan() -> None:
+    """Discard the floorplan after a change to the seats or rooms of the coworking space."""
+    _floorplan.clear()
+
 
 class SeatService:
     """SeatService is the access layer to coworking seats."""
@@ -26,7 +42,73 @@ class SeatService:
         """Returns all seats in the coworking space.
 
         Returns:
-            list[SeatDetails]: All rooms in the coworking space orderd by increasing capacity.
+            list[SeatDetails]: All seats in the coworking space ordered by id.
+        """
+        return list(self.floorplan().seats)
+
+    def floorplan(self) -> Floorplan:
+        """Returns the seats and rooms of the coworking space.
+
+        Returns:
+            Floorplan: The current floorplan, whose models are shared and must not be modified.
         """
-        entities = self._session.query(SeatEntity).all()
-        return [entity.to_model() for entity in entities]
+        return _floorplan.get(self._build_floorplan)
+
+    def _build_floorplan(self) -> Floorplan:
+        """Catalog every seat and room, loading each room's seats in a single query."""
+        return _to_floorplan(self._session.scalars(_select_rooms()).all())
+
+
+class AsyncSeatService:
+    """Asynchronous variant of the read paths of `SeatService` for `async def` routes."""
+
+    def __init__(self, session: AsyncSession = Depends(async_db_session)):
+        """Initializes a new AsyncSeatService.
+
+        Args:
+            session (AsyncSession): The database session to use, typically injected by FastAPI.
+        """
+        self._session = session
+
+    async def list(self) -> list[SeatDetails]:
+        """Returns all seats in the coworking space.
+
+        Returns:
+            list[SeatDetails]: All seats in the coworking space ordered by id.
+        """
+        return list((await self.floorplan()).seats)
+
+    async def floorplan(self) -> Floorplan:
+        """Returns the seats and rooms of the coworking space.
+
+        Returns:
+            Floorplan: The current floorplan, whose models are shared and must not be modified.
+        """
+        return await _floorplan.aget(self._build_floorplan)
+
+    async def _build_floorplan(self) -> Floorplan:
+        """Catalog every seat and room.
+
+        The build is shared by concurrent requests, so it reads with a session of its own."""
+        async with AsyncSession(self._session.bind) as session:
+            return _to_floorplan((await session.scalars(_select_rooms())).all())
+
+
+def _select_rooms() -> Select:
+    """Selects every room, loading each room's seats in a single query."""
+    return (
+        select(RoomEntity)
+        .options(selectinload(RoomEntity.seats))
+        .order_by(RoomEntity.id)
+    )
+
+
+def _to_floorplan(rooms: Sequence[RoomEntity]) -> Floorplan:
+    """Catalogs rooms whose seats are loaded."""
+    seats = sorted(
+        (seat for room in rooms for seat in room.seats), key=lambda seat: seat.id
+    )
+    return Floorplan(
+        (room.to_details_model() for room in rooms),
+        (seat.to_model() for seat in seats),
+    )
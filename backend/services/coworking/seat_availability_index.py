@@ -0,0 +1,85 @@
+"""Interval index of seat reservations used to compute seat availability."""
+
+from bisect import bisect_right
+from collections import defaultdict
+from datetime import datetime
+from typing import Iterable
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+
+class SeatAvailabilityIndex:
+    """Busy intervals of each seat, merged and sorted, for subtracting from open hours.
+
+    Each seat's reservations are collapsed into disjoint intervals stored as parallel sorted lists of
+    starts and ends. Subtracting them from a list of open ranges is then a single merge-style sweep
+    that begins at a bisected position, rather than a rebuild of the availability list per reservation.
+    """
+
+    _starts: dict[int, list[datetime]]
+    _ends: dict[int, list[datetime]]
+
+    def __init__(self, reservations: Iterable[tuple[int, datetime, datetime]]):
+        """Index the busy intervals of seats.
+
+        Args:
+            reservations (Iterable[tuple[int, datetime, datetime]]): Seat id, start, and end of each
+                seat's reservations, in any order.
+        """
+        by_seat: defaultdict[int, list[tuple[datetime, datetime]]] = defaultdict(list)
+        for seat_id, start, end in reservations:
+            if start < end:
+                by_seat[seat_id].append((start, end))
+
+        self._starts = {}
+        self._ends = {}
+        for seat_id, intervals in by_seat.items():
+            intervals.sort()
+            starts: list[datetime] = []
+            ends: list[datetime] = []
+            for start, end in intervals:
+                if len(ends) > 0 and start <= ends[-1]:
+                    if end > ends[-1]:
+                        ends[-1] = end
+                else:
+                    starts.append(start)
+                    ends.append(end)
+            self._starts[seat_id] = starts
+            self._ends[seat_id] = ends
+
+    def available(
+        self, seat_id: int, open_ranges: list[tuple[datetime, datetime]]
+    ) -> list[tuple[datetime, datetime]]:
+        """Subtract a seat's busy intervals from sorted, disjoint open ranges.
+
+        Args:
+            seat_id (int): The seat of interest.
+            open_ranges (list[tuple[datetime, datetime]]): The ranges the seat could be available in.
+
+        Returns:
+            list[tuple[datetime, datetime]]: The sorted ranges in which the seat is open and not reserved.
+        """
+        starts = self._starts.get(seat_id)
+        if starts is None or len(open_ranges) == 0:
+            return list(open_ranges)
+        ends = self._ends[seat_id]
+
+        available: list[tuple[datetime, datetime]] = []
+        i = bisect_right(ends, open_ranges[0][0])
+        for open_start, open_end in open_ranges:
+            while i < len(ends) and ends[i] <= open_start:
+                i += 1
+            cursor = open_start
+            while i < len(starts) and starts[i] < open_end:
+                if starts[i] > cursor:
+                    available.append((cursor, starts[i]))
+                if ends[i] > cursor:
+                    cursor = ends[i]
+                if ends[i] > open_end:
+                    break
+                i += 1
+            if cursor < open_end:
+                available.append((cursor, open_end))
+        return available
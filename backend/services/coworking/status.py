@@ -4,9 +4,9 @@ from fastapi import Depends
 from datetime import datetime
 from sqlalchemy.orm import Session
 from ...database import db_session
-from .reservation import ReservationService
-from .operating_hours import OperatingHoursService
-from .seat import SeatService
+from .reservation import ReservationService, AsyncReservationService
+from .operating_hours import OperatingHoursService, AsyncOperatingHoursService
+from .seat import SeatService, AsyncSeatService
 from ...models.coworking import Status, TimeRange
 from ...models import User
 from .policy import PolicyService
@@ -63,3 +63,52 @@ class StatusService:
             seat_availability=seat_availability,
             operating_hours=operating_hours,
         )
+
+
+class AsyncStatusService:
+    """Asynchronous variant of `StatusService` for `async def` routes.
+
+    The subject's reservations and the reservations of seats are selected on an `AsyncSession`, while
+    seats and operating hours are usually served from the snapshots shared with `StatusService`."""
+
+    def __init__(
+        self,
+        policies_svc: PolicyService = Depends(),
+        operating_hours_svc: AsyncOperatingHoursService = Depends(),
+        seat_svc: AsyncSeatService = Depends(),
+        reservation_svc: AsyncReservationService = Depends(),
+    ):
+        self._policies_svc = policies_svc
+        self._reservation_svc = reservation_svc
+        self._operating_hours_svc = operating_hours_svc
+        self._seat_svc = seat_svc
+
+    async def get_coworking_status(self, subject: User) -> Status:
+        """All-in-one endpoint for a user to simultaneously get their own upcoming reservations and current status of the XL."""
+        my_reservations = await self._reservation_svc.get_current_reservations_for_user(
+            subject
+        )
+
+        now = datetime.now()
+        walkin_window = TimeRange(
+            start=now,
+            end=now
+            + self._policies_svc.walkin_window(subject)
+            + 3 * self._policies_svc.walkin_initial_duration(subject),
+        )
+        seats = await self._seat_svc.list()
+        seat_availability = await self._reservation_svc.seat_availability(
+            seats, walkin_window
+        )
+
+        operating_hours = await self._operating_hours_svc.schedule(
+            TimeRange(
+                start=now, end=now + self._policies_svc.reservation_window(subject)
+            )
+        )
+
+        return Status(
+            my_reservations=my_reservations,
+            seat_availability=seat_availability,
+            operating_hours=operating_hours,
+        )
@@ -2,11 +2,14 @@
 The Event Service allows the API to manipulate event data in the database.
 """
 
+import base64
+import json
 from typing import Sequence
 
 from fastapi import Depends
-from sqlalchemy import func, select, and_, func, or_, exists, or_
-from sqlalchemy.orm import Session, aliased
+from sqlalchemy import Select, func, select, or_, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, aliased, joinedload, selectinload
 from backend.entities.user_entity import UserEntity
 from backend.models.event_registration import EventRegistration, NewEventRegistration
 from ..models.public_user import PublicUser
@@ -15,7 +18,7 @@ from backend.models.pagination import Paginated, PaginationParams
 from backend.models.registration_type import RegistrationType
 
 from ..models import User, Paginated, EventPaginationParams
-from ..database import db_session
+from ..database import db_session, async_db_session
 from backend.models.event import (
     EventDraft,
     EventOverview,
@@ -68,65 +71,46 @@ class EventService:
     ) -> Paginated[EventOverview]:
         """List Events.
 
+        Events are paged through by page number or, when `pagination_params.cursor` is not None,
+        by a cursor over their start time and id, which is equally fast however deep the page.
+
         Parameters:
             pagination_params: The pagination parameters.
 
         Returns:
             Paginated[Event]: The paginated list of events.
-        """
 
-        statement = select(EventEntity)
-        length_statement = select(func.count()).select_from(EventEntity)
-        if pagination_params.range_start != "":
-            range_start = pagination_params.range_start
-            range_end = pagination_params.range_end
-            criteria = and_(
-                EventEntity.start >= datetime.fromisoformat(range_start),
-                EventEntity.start <= datetime.fromisoformat(range_end),
-            )
-            statement = statement.where(criteria)
-            length_statement = length_statement.where(criteria)
-
-        if pagination_params.filter != "":
-            query = pagination_params.filter
+        Raises:
+            ValueError: If the cursor is malformed.
+        """
 
-            criteria = or_(
-                EventEntity.name.ilike(f"%{query}%"),
-                EventEntity.description.ilike(f"%{query}%"),
-                exists().where(
-                    OrganizationEntity.id == EventEntity.organization_id,
-                    OrganizationEntity.name.ilike(f"%{query}%"),
-                ),
-                exists().where(
-                    OrganizationEntity.id == EventEntity.organization_id,
-                    OrganizationEntity.slug.ilike(f"%{query}%"),
-                ),
+        statement = _filter_events(pagination_params)
+        if pagination_params.count:
+            length = self._session.scalar(
+                statement.with_only_columns(func.count(EventEntity.id))
             )
-            statement = statement.where(criteria)
-            length_statement = length_statement.where(criteria)
+        else:
+            length = self._estimate_count(statement)
 
-        offset = pagination_params.page * pagination_params.page_size
-        limit = pagination_params.page_size
-
-        if pagination_params.order_by != "":
-            statement = (
-                statement.order_by(getattr(EventEntity, pagination_params.order_by))
-                if pagination_params.ascending
-                else statement.order_by(
-                    getattr(EventEntity, pagination_params.order_by).desc()
-                )
-            )
+        entities = self._session.scalars(
+            _page_of_events(statement, pagination_params)
+        ).all()
+        return _paginate_events(entities, pagination_params, subject, length)
 
-        statement = statement.offset(offset).limit(limit)
+    def _estimate_count(self, statement: Select) -> int:
+        """Estimates the number of rows a statement selects from the query planner's statistics.
 
-        length = self._session.execute(length_statement).scalar()
-        entities = self._session.execute(statement).scalars()
+        Parameters:
+            statement: The statement to estimate.
 
-        return Paginated(
-            items=[entity.to_overview_model(subject) for entity in entities],
-            length=length,
-            params=pagination_params,
-        )
+        Returns:
+            int: The number of rows the planner expects the statement to select.
+        """
+        connection = self._session.connection()
+        plan = connection.exec_driver_sql(
+            *_explain(statement, connection.dialect)
+        ).scalar_one()
+        return _planned_rows(plan)
 
     def create(self, subject: User, event: EventDraft) -> EventOverview:
         """
@@ -748,3 +732,179 @@ class EventService:
 
         # 3. Return the event status.
         return EventStatusOverview(featured=featured_event, registered=[])
+
+
+class AsyncEventService:
+    """Asynchronous variant of the read paths of `EventService` for `async def` routes.
+
+    The statements of `EventService` are awaited on an `AsyncSession`, so the event loop serves other
+    requests while the database answers. Relationships are loaded eagerly, because lazy loads cannot
+    be awaited."""
+
+    def __init__(self, session: AsyncSession = Depends(async_db_session)):
+        """Initializes the `AsyncEventService` session"""
+        self._session = session
+
+    async def get_paginated_events(
+        self,
+        pagination_params: EventPaginationParams,
+        subject: User | None = None,
+    ) -> Paginated[EventOverview]:
+        """List Events.
+
+        Parameters:
+            pagination_params: The pagination parameters.
+
+        Returns:
+            Paginated[Event]: The paginated list of events.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+        """
+        statement = _filter_events(pagination_params)
+        if pagination_params.count:
+            length = await self._session.scalar(
+                statement.with_only_columns(func.count(EventEntity.id))
+            )
+        else:
+            length = await self._estimate_count(statement)
+
+        entities = (
+            await self._session.scalars(_page_of_events(statement, pagination_params))
+        ).all()
+        return _paginate_events(entities, pagination_params, subject, length)
+
+    async def _estimate_count(self, statement: Select) -> int:
+        """Estimates the number of rows a statement selects, as `EventService._estimate_count` does."""
+        connection = await self._session.connection()
+        result = await connection.exec_driver_sql(
+            *_explain(statement, connection.dialect)
+        )
+        return _planned_rows(result.scalar_one())
+
+
+def _filter_events(pagination_params: EventPaginationParams) -> Select:
+    """Selects the events within the date range and matching the filter of the pagination parameters."""
+    statement = select(EventEntity)
+    if pagination_params.range_start != "":
+        range_start = pagination_params.range_start
+        range_end = pagination_params.range_end
+        statement = statement.where(
+            EventEntity.start >= datetime.fromisoformat(range_start),
+            EventEntity.start <= datetime.fromisoformat(range_end),
+        )
+
+    if pagination_params.filter != "":
+        query = pagination_params.filter.lower()
+        statement = statement.join(EventEntity.organization).where(
+            or_(
+                EventEntity.search_text.contains(query, autoescape=True),
+                OrganizationEntity.search_text.contains(query, autoescape=True),
+            )
+        )
+    return statement
+
+
+def _page_of_events(
+    statement: Select, pagination_params: EventPaginationParams
+) -> Select:
+    """Orders and limits filtered events to a page, loading what their overviews need.
+
+    A page by cursor selects one more event than the page holds, to learn if another page follows.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    statement = statement.options(
+        joinedload(EventEntity.organization),
+        selectinload(EventEntity.registrations).joinedload(
+            EventRegistrationEntity.user
+        ),
+    )
+
+    if pagination_params.cursor is not None:
+        ascending = pagination_params.ascending != "false"
+        if pagination_params.cursor != "":
+            position = tuple_(EventEntity.start, EventEntity.id)
+            after = _decode_event_cursor(pagination_params.cursor)
+            statement = statement.where(
+                position > after if ascending else position < after
+            )
+        order = (EventEntity.start, EventEntity.id)
+        return statement.order_by(
+            *(order if ascending else (column.desc() for column in order))
+        ).limit(pagination_params.page_size + 1)
+
+    offset = pagination_params.page * pagination_params.page_size
+    limit = pagination_params.page_size
+
+    if pagination_params.order_by != "":
+        statement = (
+            statement.order_by(getattr(EventEntity, pagination_params.order_by))
+            if pagination_params.ascending
+            else statement.order_by(
+                getattr(EventEntity, pagination_params.order_by).desc()
+            )
+        )
+
+    return statement.offset(offset).limit(limit)
+
+
+def _paginate_events(
+    entities: Sequence[EventEntity],
+    pagination_params: EventPaginationParams,
+    subject: User | None,
+    length: int,
+) -> Paginated[EventOverview]:
+    """Builds a page from the events selected by `_page_of_events`."""
+    next_cursor = None
+    if (
+        pagination_params.cursor is not None
+        and len(entities) > pagination_params.page_size
+    ):
+        entities = entities[: pagination_params.page_size]
+        next_cursor = _encode_event_cursor(entities[-1])
+
+    return Paginated(
+        items=[entity.to_overview_model(subject) for entity in entities],
+        length=length,
+        params=pagination_params,
+        next_cursor=next_cursor,
+    )
+
+
+def _explain(statement: Select, dialect) -> tuple[str, tuple | dict]:
+    """Compiles a statement into the SQL and parameters that ask the planner to estimate it."""
+    compiled = statement.compile(dialect=dialect)
+    parameters = (
+        compiled.params
+        if compiled.positiontup is None
+        else tuple(compiled.params[name] for name in compiled.positiontup)
+    )
+    return f"EXPLAIN (FORMAT JSON) {compiled}", parameters
+
+
+def _planned_rows(plan: list | str) -> int:
+    """Reads the number of rows the planner expects from an `EXPLAIN (FORMAT JSON)` plan."""
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def _encode_event_cursor(event: EventEntity) -> str:
+    """Encodes the position of an event in start time order as an opaque cursor."""
+    position = json.dumps([event.start.isoformat(), event.id])
+    return base64.urlsafe_b64encode(position.encode()).decode()
+
+
+def _decode_event_cursor(cursor: str) -> tuple[datetime, int]:
+    """Decodes the position of an event from a cursor made by `_encode_event_cursor`.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        start, id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(start), int(id)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Malformed cursor: {cursor}") from e
@@ -7,11 +7,24 @@ In more complex deployments, where multiple backing services may be depended upo
 would necessarily also become more complex to reflect the health of all subsystems.
 
 In this context health does not refer to correctness as much as running, connected, and responsive.
+The serving worker's connection pools are also reported, to administrators, to monitor contention for connections.
 """
 
 from fastapi import Depends
 from sqlalchemy import text
-from ..database import Session, db_session
+from sqlalchemy.pool import QueuePool
+from ..database import (
+    Session,
+    db_session,
+    engine,
+    async_engine,
+    pool_metrics,
+    async_pool_metrics,
+    PoolMetrics,
+)
+from ..models import User
+from ..models.health import DatabasePoolStatus, DatabasePoolsStatus
+from .permission import PermissionService
 
 __authors__ = ["Kris Jordan"]
 __copyright__ = "Copyright 2023"
@@ -20,12 +33,52 @@ __license__ = "MIT"
 
 class HealthService:
     _session: Session
+    _permission_svc: PermissionService
 
-    def __init__(self, session: Session = Depends(db_session)):
+    def __init__(
+        self,
+        session: Session = Depends(db_session),
+        permission_svc: PermissionService = Depends(),
+    ):
         self._session = session
+        self._permission_svc = permission_svc
 
     def check(self):
         stmt = text("SELECT 'OK', NOW()")
         result = self._session.execute(stmt)
         row = result.all()[0]
         return str(f"{row[0]} @ {row[1]}")
+
+    def get_pool_status(self, subject: User) -> DatabasePoolsStatus:
+        """
+        Reports the connection pools of the serving worker.
+
+        Args:
+            subject: The user requesting the report, who must be permitted to view it.
+
+        Returns:
+            DatabasePoolsStatus: The state of the sync and async connection pools.
+
+        Raises:
+            UserPermissionException: If the subject may not view the report.
+        """
+        self._permission_svc.enforce(subject, "health.pools.view", "health")
+        return DatabasePoolsStatus(
+            database_pool=self.pool_status(engine.pool, pool_metrics),
+            async_database_pool=self.pool_status(async_engine.pool, async_pool_metrics),
+        )
+
+    def pool_status(self, pool: QueuePool, metrics: PoolMetrics) -> DatabasePoolStatus:
+        return DatabasePoolStatus(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),
+            checkout_wait_seconds_total=metrics.checkout_wait_seconds_total,
+            checkout_wait_seconds_max=metrics.checkout_wait_seconds_max,
+            connections_opened=metrics.connections_opened,
+            checkouts=metrics.checkouts,
+            checkins=metrics.checkins,
+            checkout_seconds_total=metrics.checkout_seconds_total,
+            checkout_seconds_max=metrics.checkout_seconds_max,
+        )
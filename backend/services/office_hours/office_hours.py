@@ -5,7 +5,7 @@ Service for office hour events.
 import math
 from typing import Type, TypeVar
 from fastapi import Depends
-from sqlalchemy import select, exists, and_, func
+from sqlalchemy import select, and_, or_, func
 from sqlalchemy.orm import Session, joinedload, selectinload
 
 from ...models.office_hours.office_hours_details import PrimaryOfficeHoursDetails
@@ -21,9 +21,7 @@ from ...models.academics.my_courses import (
 from ...models.office_hours.office_hours import OfficeHours, NewOfficeHours
 from ...models.office_hours.ticket import TicketState
 from ...entities.entity_base import EntityBase
-from ...entities.academics.section_entity import SectionEntity
 from ...entities.office_hours import (
-    CourseSiteEntity,
     OfficeHoursEntity,
     OfficeHoursTicketEntity,
 )
@@ -32,6 +30,8 @@ from ...entities.office_hours.user_created_tickets_table import (
 )
 from ...entities.academics.section_member_entity import SectionMemberEntity
 from ..exceptions import CoursePermissionException, ResourceNotFoundException
+from .site_access import CourseSiteAccess, CourseSiteAccessService
+from .ticket_rollup import OfficeHoursTicketRollupService
 
 __authors__ = ["Ajay Gandecha", "Jade Keegan", "Kris Jordan"]
 __copyright__ = "Copyright 2024"
@@ -69,15 +69,15 @@ class OfficeHoursService:
         office_hours_entity = self._get_entity_or_raise(
             OfficeHoursEntity, office_hours_id
         )
-        course_site_entity = self._get_entity_or_raise(
-            CourseSiteEntity, office_hours_entity.course_site_id
-        )
-        section_member_entity = self._get_membership_or_raise(user, course_site_entity)
-
-        self._enforce_membership_level(
-            section_member_entity,
-            {RosterRole.INSTRUCTOR, RosterRole.GTA, RosterRole.UTA},
+        access = CourseSiteAccessService(self._session).get(
+            user, office_hours_entity.course_site_id
         )
+        if access.role is None:
+            raise CoursePermissionException("User is not a member of the course site.")
+        if access.role not in {RosterRole.INSTRUCTOR, RosterRole.GTA, RosterRole.UTA}:
+            raise CoursePermissionException(
+                "User does not have the required membership level."
+            )
 
         return self._to_oh_queue_overview(user, office_hours_entity)
 
@@ -94,45 +94,6 @@ class OfficeHoursService:
 
         return entity
 
-    def _get_membership_or_raise(
-        self, user: User, course_site_entity: CourseSiteEntity
-    ) -> SectionMemberEntity:
-        """
-        Gets the membership for a user in a course site.
-        """
-        # Use an enhanced query to check if a course site exists.
-        section_member_query = select(SectionMemberEntity).where(
-            SectionMemberEntity.user_id == user.id,
-            SectionMemberEntity.section_id.in_(
-                [section.id for section in course_site_entity.sections]
-            ),
-        )
-
-        section_membership = self._session.scalars(section_member_query).first()
-
-        if section_membership is None:
-            raise CoursePermissionException("User is not a member of the course site.")
-
-        return section_membership
-
-    def _enforce_membership_level(
-        self, section_member_entity: SectionMemberEntity, roles: set[RosterRole]
-    ) -> None:
-        """
-        Enforces that a user has a specific membership level.
-
-        Args:
-            section_member_entity (SectionMemberEntity): The membership entity.
-            roles (set[RosterRole]): The roles that the user must have.
-
-        Raises:
-            CoursePermissionException: If the user does not have the required membership.
-        """
-        if section_member_entity.member_role not in roles:
-            raise CoursePermissionException(
-                "User does not have the required membership level."
-            )
-
     def get_office_hour_get_help_overview(
         self, user: User, office_hours_id: int
     ) -> OfficeHourGetHelpOverview:
@@ -157,34 +118,10 @@ class OfficeHoursService:
         # Check permissions
         self._check_site_student_permissions(user, queue_entity.course_site_id)
 
-        # Get ticket for user, if any
-        active_tickets_query = (
-            select(OfficeHoursTicketEntity)
-            .join(user_created_tickets_table)
-            .where(OfficeHoursTicketEntity.office_hours_id == office_hours_id)
-            # .where(user_created_tickets_table.member_id == )
-        )
-        active_tickets = [
-            ticket
-            for ticket in queue_entity.tickets
-            if user.id in [creator.user_id for creator in ticket.creators]
-            and ticket.state in [TicketState.QUEUED, TicketState.CALLED]
-        ]
-
-        active_ticket = active_tickets[0] if len(active_tickets) > 0 else None
-
-        # Find queue position
-        queue_tickets: list[OfficeHoursTicketEntity] = sorted(
-            [
-                ticket
-                for ticket in queue_entity.tickets
-                if ticket.state == TicketState.QUEUED
-            ],
-            key=lambda ticket: ticket.created_at,
-        )
-
+        # Get ticket for user, if any, and its position in the queue
+        active_ticket = self._get_active_ticket(user, office_hours_id)
         queue_position = (
-            queue_tickets.index(active_ticket) + 1
+            self.get_queue_position(active_ticket)
             if active_ticket and active_ticket.state == TicketState.QUEUED
             else -1
         )
@@ -201,6 +138,67 @@ class OfficeHoursService:
             queue_position=queue_position,
         )
 
+    def get_queue_position(self, ticket: OfficeHoursTicketEntity) -> int:
+        """
+        Finds the position of a queued ticket in its office hours queue.
+
+        The position is one more than the number of queued tickets created before the ticket,
+        which the partial index of queued tickets counts without loading the event's tickets.
+
+        Args:
+            ticket (OfficeHoursTicketEntity): A queued ticket.
+
+        Returns:
+            int: The 1-based position of the ticket in the queue.
+        """
+        ahead_query = (
+            select(func.count())
+            .select_from(OfficeHoursTicketEntity)
+            .where(
+                OfficeHoursTicketEntity.office_hours_id == ticket.office_hours_id,
+                OfficeHoursTicketEntity.state == TicketState.QUEUED,
+                or_(
+                    OfficeHoursTicketEntity.created_at < ticket.created_at,
+                    and_(
+                        OfficeHoursTicketEntity.created_at == ticket.created_at,
+                        OfficeHoursTicketEntity.id < ticket.id,
+                    ),
+                ),
+            )
+        )
+        return self._session.scalar(ahead_query) + 1
+
+    def _get_active_ticket(
+        self, user: User, office_hours_id: int
+    ) -> OfficeHoursTicketEntity | None:
+        """Finds the queued or called ticket a user created for an office hours event, if any."""
+        active_ticket_query = (
+            select(OfficeHoursTicketEntity)
+            .join(user_created_tickets_table)
+            .join(
+                SectionMemberEntity,
+                SectionMemberEntity.id == user_created_tickets_table.c.member_id,
+            )
+            .where(
+                OfficeHoursTicketEntity.office_hours_id == office_hours_id,
+                OfficeHoursTicketEntity.state.in_(
+                    [TicketState.QUEUED, TicketState.CALLED]
+                ),
+                SectionMemberEntity.user_id == user.id,
+            )
+            .order_by(OfficeHoursTicketEntity.id)
+            .limit(1)
+            .options(
+                selectinload(OfficeHoursTicketEntity.creators).joinedload(
+                    SectionMemberEntity.user
+                ),
+                joinedload(OfficeHoursTicketEntity.caller).joinedload(
+                    SectionMemberEntity.user
+                ),
+            )
+        )
+        return self._session.scalars(active_ticket_query).one_or_none()
+
     def _to_oh_queue_overview(
         self, user: User, oh_event: OfficeHoursEntity
     ) -> OfficeHourQueueOverview:
@@ -275,25 +273,16 @@ class OfficeHoursService:
         Returns:
             OfficeHourEventRoleOverview
         """
-        # Create query off of the member query for just the members matching
-        # with the current user (used to determine permissions)
-        user_member_query = (
-            select(SectionMemberEntity)
-            .where(SectionMemberEntity.user_id == user.id)
-            .join(SectionEntity)
-            .join(CourseSiteEntity)
-            .join(OfficeHoursEntity)
-            .where(OfficeHoursEntity.id == office_hours_id)
+        access = CourseSiteAccessService(self._session).get_for_office_hours(
+            user, office_hours_id
         )
 
-        user_members = self._session.scalars(user_member_query).unique().all()
-
-        if len(user_members) == 0:
+        if access.role is None:
             raise CoursePermissionException(
                 "User is not a member of the office hour event."
             )
 
-        return OfficeHourEventRoleOverview(role=user_members[0].member_role.value)
+        return OfficeHourEventRoleOverview(role=access.role.value)
 
     def create(self, user: User, site_id: int, event: NewOfficeHours) -> OfficeHours:
         """
@@ -355,6 +344,8 @@ class OfficeHoursService:
         # Check permissions
         self._check_site_admin_permissions(user, site_id)
 
+        # Deleting the event deletes its tickets, which must leave the statistics
+        OfficeHoursTicketRollupService(self._session).remove_office_hours(event_id)
         self._session.delete(office_hours_entity)
         self._session.commit()
 
@@ -375,98 +366,25 @@ class OfficeHoursService:
 
         return office_hours_entity.to_primary_details_model()
 
-    def _check_site_admin_permissions(self, user: User, site_id: int):
-        # Use an enhanced query to check if a course site exists.
-        course_site_exists_query = exists().where(CourseSiteEntity.id == site_id)
-        course_site_exists = self._session.query(course_site_exists_query).scalar()
-
-        if not course_site_exists:
-            raise ResourceNotFoundException(
-                f"Course site with ID: {site_id} not found."
-            )
-
-        # Determine whether a student does not have permissions for any site.
-        #
-        # This query does this by first selecting section rows, joined to
-        # course site. An outer join then joins with section member data, only
-        # where the section member is for the section selected, is the user who
-        # made the request, and where the member is *not* a student (ie, is
-        # a UTA, GTA, or INSTRUCTOR ).
-        #
-        # Finally, we count the sections where the course site ID matches and
-        # where the user does *not* exist as a UTA/GTA/INSTRUCTOR user. We can
-        # check for this by counting where the member ID is none.
-        #
-        # Ultimately, this query should result in a number counting the number of
-        # sections in the course site for which the user is not authorized. If
-        # this number is 0, the user passes site permissions. If this number is
-        # > 0, then this should fail.
-
-        no_permissions_query = (
-            select(func.count())
-            .select_from(SectionEntity)
-            .join(SectionEntity.course_site)
-            .outerjoin(
-                SectionMemberEntity,
-                and_(
-                    SectionMemberEntity.section_id == SectionEntity.id,
-                    SectionMemberEntity.user_id == user.id,
-                    SectionMemberEntity.member_role != RosterRole.STUDENT,
-                ),
-            )
-            .where(CourseSiteEntity.id == site_id, SectionMemberEntity.id == None)
-        )
-
-        no_permissions_length = self._session.execute(no_permissions_query).scalar()
-
-        if no_permissions_length is not None and no_permissions_length > 0:
+    def _check_site_admin_permissions(
+        self, user: User, site_id: int
+    ) -> CourseSiteAccess:
+        # Users may administer a course site only when they are a UTA, GTA, or instructor of
+        # every one of its sections.
+        access = CourseSiteAccessService(self._session).get(user, site_id)
+        if not access.is_staff_of_every_section():
             raise CoursePermissionException(
                 "Cannot access a course page containing a section you are not an instructor for."
             )
-
-    def _check_site_student_permissions(self, user: User, site_id: int):
-        # Use an enhanced query to check if a course site exists.
-        course_site_exists_query = exists().where(CourseSiteEntity.id == site_id)
-        course_site_exists = self._session.query(course_site_exists_query).scalar()
-
-        if not course_site_exists:
-            raise ResourceNotFoundException(
-                f"Course site with ID: {site_id} not found."
-            )
-
-        # Determine whether a student does not have permissions for any site.
-        #
-        # This query does this by first selecting section rows, joined to
-        # course site. An outer join then joins with section member data, only
-        # where the section member is for the section selected, is the user who
-        # made the request, and where the member is a student (not a UTA, etc)
-        #
-        # Finally, we count the sections where the course site ID matches and
-        # where the user exists as a student. We can check for this by counting
-        # where the member ID is not none.
-        #
-        # Ultimately, this query should result in a number counting the number of
-        # sections in the course site for which the user is a student. If
-        # this number is 0, the user passes site fails.
-
-        is_student_query = (
-            select(func.count())
-            .select_from(SectionEntity)
-            .join(SectionEntity.course_site)
-            .outerjoin(
-                SectionMemberEntity,
-                and_(
-                    SectionMemberEntity.section_id == SectionEntity.id,
-                    SectionMemberEntity.user_id == user.id,
-                    SectionMemberEntity.member_role == RosterRole.STUDENT,
-                ),
-            )
-            .where(CourseSiteEntity.id == site_id, SectionMemberEntity.id != None)
-        )
-
-        is_student_length = self._session.execute(is_student_query).scalar()
-
-        if is_student_length == 0:
+        return access
+
+    def _check_site_student_permissions(
+        self, user: User, site_id: int
+    ) -> CourseSiteAccess:
+        # Users may get help in a course site when they are a student of any of its sections.
+        access = CourseSiteAccessService(self._session).get(user, site_id)
+        if not access.is_student():
             raise CoursePermissionException(
                 "You cannot access office hours for a class you are not enrolled in."
             )
+        return access
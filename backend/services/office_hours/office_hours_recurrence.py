@@ -8,6 +8,7 @@ from backend.services.exceptions import (
     ResourceNotFoundException,
 )
 from backend.services.office_hours.office_hours import OfficeHoursService
+from backend.services.office_hours.ticket_rollup import OfficeHoursTicketRollupService
 
 from ...database import db_session
 from ...models.user import User
@@ -204,5 +205,8 @@ class OfficeHoursRecurrenceService:
             self._session.scalars(future_events_query).unique().all()
         )
 
+        # Deleting the events deletes their tickets, which must leave the statistics
+        rollup_svc = OfficeHoursTicketRollupService(self._session)
         for entity in future_event_entities:
+            rollup_svc.remove_office_hours(entity.id)
             self._session.delete(entity)
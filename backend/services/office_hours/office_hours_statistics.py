@@ -1,8 +1,9 @@
-from datetime import datetime, timedelta
+from datetime import date, datetime, time, timedelta
+from typing import Iterator
 from fastapi import Depends
 from sqlalchemy import select
-from sqlalchemy.orm import Session, aliased, joinedload
-from sqlalchemy import func, select, and_, func, Select
+from sqlalchemy.orm import Session, aliased, joinedload, selectinload
+from sqlalchemy import Float, cast, func, select, and_, or_, func, Select
 
 from backend.entities.academics.section_entity import SectionEntity
 from backend.entities.user_entity import UserEntity
@@ -10,6 +11,7 @@ from backend.models.roster_role import RosterRole
 
 from ...models.office_hours.office_hours_statistics import StatisticsFilterData
 from backend.models.office_hours.ticket_statistics import OfficeHoursTicketStatistics
+from backend.models.office_hours.ticket import OfficeHoursTicketCsvRow
 from backend.models.office_hours.ticket_type import TicketType
 
 from ...models.office_hours.ticket_state import TicketState
@@ -18,6 +20,9 @@ from ...entities.academics.section_member_entity import SectionMemberEntity
 from ...entities.office_hours import user_created_tickets_table
 from ...entities.office_hours.course_site_entity import CourseSiteEntity
 from ...entities.office_hours.office_hours_entity import OfficeHoursEntity
+from ...entities.office_hours.ticket_daily_rollup_entity import (
+    OfficeHoursTicketDailyRollupEntity,
+)
 
 from ...database import db_session
 
@@ -32,6 +37,9 @@ __authors__ = ["Ajay Gandecha", "Jade Keegan", "Mira Mohan", "Lauren Ferlito"]
 __copyright__ = "Copyright 2025"
 __license__ = "MIT"
 
+CSV_BATCH_SIZE = 500
+"""Number of tickets fetched from the database at a time when streaming a CSV."""
+
 
 class OfficeHoursStatisticsService:
     """
@@ -83,13 +91,11 @@ class OfficeHoursStatisticsService:
         )
 
         # Filter by Start/End Range
-        if pagination_params.range_start != "" and pagination_params.range_end != "":
-            range_start = pagination_params.range_start
-            range_end = pagination_params.range_end
+        range_start, range_end = self._parse_range(pagination_params)
+        if range_start is not None and range_end is not None:
             criteria = and_(
-                OfficeHoursTicketEntity.created_at
-                >= datetime.fromisoformat(range_start),
-                OfficeHoursTicketEntity.created_at <= datetime.fromisoformat(range_end),
+                OfficeHoursTicketEntity.created_at >= range_start,
+                OfficeHoursTicketEntity.created_at <= range_end,
             )
             statement = statement.where(criteria)
             length_statement = length_statement.where(criteria)
@@ -131,102 +137,158 @@ class OfficeHoursStatisticsService:
     ) -> OfficeHoursTicketStatistics:
         """
         Retrieve various statistics for a course site.
+
+        Statistics are summed from the daily ticket rollups for every day wholly within the
+        filtered range. Tickets on partially covered days, tickets without a caller, and requests
+        filtering by student, which rollups do not track, are aggregated from the tickets directly.
         """
         # Check permissions
         self._office_hours_svc._check_site_admin_permissions(user, site_id)
 
-        # Call create_ticket_query to get the statements
-        statement, length_statement = self.create_ticket_query(
-            site_id, pagination_params
-        )
-        # Create a subquery from statement
-        stmt_subquery = statement.subquery()
-
-        # Create an alias to reference the subquery's columns
-        ticket_alias = aliased(OfficeHoursTicketEntity, stmt_subquery)
-
-        # Total tickets
-        result = self._session.execute(length_statement).scalar()
-        total_tickets = float(result) if result is not None else 0
-
-        # Total tickets per week
-        today = datetime.today()
-        start_of_week = (
-            today - timedelta(days=today.weekday() + 1)
-            if today.weekday() != 6
-            else today
-        )
+        statement, _ = self.create_ticket_query(site_id, pagination_params)
 
-        week_tickets_statement = (
-            select(func.count())
-            .select_from(stmt_subquery)
-            .where(ticket_alias.created_at >= start_of_week)
-        )
-        result = self._session.execute(week_tickets_statement).scalar()
-        week_tickets = float(result) if result is not None else 0
-
-        # Avg wait time
-        avg_wait_time_statement = (
-            select(
-                func.avg(
-                    func.extract(
-                        "epoch",
-                        ticket_alias.called_at - ticket_alias.created_at,
-                    )
-                )
-            )
-            .select_from(stmt_subquery)
-            .where(ticket_alias.called_at.isnot(None))
+        # The week starts at midnight on Sunday
+        today = date.today()
+        start_of_week = datetime.combine(
+            today - timedelta(days=(today.weekday() + 1) % 7), time()
         )
 
-        result = self._session.execute(avg_wait_time_statement).scalar()
-        avg_wait_time = float(result) if result is not None else 0
-
-        avg_wait_time_minutes = avg_wait_time / 60 if avg_wait_time else 0
+        if len(pagination_params.student_ids) != 0:
+            return self._to_statistics(self._ticket_totals(statement, start_of_week))
+
+        range_start, range_end = self._parse_range(pagination_params)
+        # Rollups cover [first_day, end_day); tickets outside of it are aggregated directly.
+        first_day = (
+            None
+            if range_start is None
+            else range_start.date()
+            + timedelta(days=0 if range_start.time() == time() else 1)
+        )
+        end_day = None if range_end is None else range_end.date()
 
-        # Avg duration
-        avg_duration_statement = (
-            select(
-                func.avg(
-                    func.extract(
-                        "epoch",
-                        ticket_alias.closed_at - ticket_alias.called_at,
-                    )
-                )
+        ticket_criteria = [OfficeHoursTicketEntity.caller_id.is_(None)]
+        if first_day is not None:
+            ticket_criteria.append(
+                OfficeHoursTicketEntity.created_at < datetime.combine(first_day, time())
             )
-            .select_from(stmt_subquery)
-            .where(ticket_alias.closed_at.isnot(None))
+        if end_day is not None:
+            ticket_criteria.append(
+                OfficeHoursTicketEntity.created_at >= datetime.combine(end_day, time())
+            )
+        ticket_totals = self._ticket_totals(
+            statement.where(or_(*ticket_criteria)), start_of_week
         )
-        result = self._session.execute(avg_duration_statement).scalar()
-        avg_duration = float(result) if result is not None else 0
-
-        avg_duration_minutes = avg_duration / 60 if avg_duration else 0
-
-        # Total conceptual
-        conceptual_help_statement = (
-            select(func.count())
-            .select_from(stmt_subquery)
-            .where(ticket_alias.type == TicketType.CONCEPTUAL_HELP)
+        rollup_totals = self._rollup_totals(
+            site_id, pagination_params.staff_ids, first_day, end_day, start_of_week
         )
-        result = self._session.execute(conceptual_help_statement).scalar()
-        total_conceptual_help = float(result) if result is not None else 0
-
-        # Total assignment
-        assignment_help_statement = (
-            select(func.count())
-            .select_from(stmt_subquery)
-            .where(ticket_alias.type == TicketType.ASSIGNMENT_HELP)
+        return self._to_statistics(
+            {key: ticket_totals[key] + rollup_totals[key] for key in ticket_totals}
         )
-        result = self._session.execute(assignment_help_statement).scalar()
-        total_assignment_help = float(result) if result is not None else 0
 
+    def _ticket_totals(self, statement: Select, start_of_week: datetime) -> dict:
+        """
+        Aggregates the tickets selected by a statement in a single pass.
+        """
+        subquery = statement.order_by(None).subquery()
+        ticket = aliased(OfficeHoursTicketEntity, subquery)
+        wait = cast(func.extract("epoch", ticket.called_at - ticket.created_at), Float)
+        duration = cast(
+            func.extract("epoch", ticket.closed_at - ticket.called_at), Float
+        )
+        totals_statement = select(
+            func.count().label("total"),
+            func.count().filter(ticket.created_at >= start_of_week).label("weekly"),
+            func.count()
+            .filter(ticket.type == TicketType.CONCEPTUAL_HELP)
+            .label("conceptual"),
+            func.count()
+            .filter(ticket.type == TicketType.ASSIGNMENT_HELP)
+            .label("assignment"),
+            func.coalesce(func.sum(wait), 0).label("wait_seconds"),
+            func.count(wait).label("wait_count"),
+            func.coalesce(func.sum(duration), 0).label("duration_seconds"),
+            func.count(duration).label("duration_count"),
+        ).select_from(subquery)
+        return self._session.execute(totals_statement).one()._asdict()
+
+    def _rollup_totals(
+        self,
+        site_id: int,
+        staff_ids: list[int],
+        first_day: date | None,
+        end_day: date | None,
+        start_of_week: datetime,
+    ) -> dict:
+        """
+        Sums the daily ticket rollups of a course site in a single pass.
+        """
+        rollup = OfficeHoursTicketDailyRollupEntity
+        totals_statement = select(
+            func.coalesce(func.sum(rollup.ticket_count), 0).label("total"),
+            func.coalesce(
+                func.sum(rollup.ticket_count).filter(
+                    rollup.day >= start_of_week.date()
+                ),
+                0,
+            ).label("weekly"),
+            func.coalesce(func.sum(rollup.conceptual_count), 0).label("conceptual"),
+            func.coalesce(func.sum(rollup.assignment_count), 0).label("assignment"),
+            func.coalesce(func.sum(rollup.wait_seconds), 0).label("wait_seconds"),
+            func.coalesce(func.sum(rollup.wait_count), 0).label("wait_count"),
+            func.coalesce(func.sum(rollup.duration_seconds), 0).label(
+                "duration_seconds"
+            ),
+            func.coalesce(func.sum(rollup.duration_count), 0).label("duration_count"),
+        ).where(rollup.course_site_id == site_id)
+        if first_day is not None:
+            totals_statement = totals_statement.where(rollup.day >= first_day)
+        if end_day is not None:
+            totals_statement = totals_statement.where(rollup.day < end_day)
+        if len(staff_ids) != 0:
+            totals_statement = totals_statement.join(
+                SectionMemberEntity, SectionMemberEntity.id == rollup.caller_id
+            ).where(SectionMemberEntity.user_id.in_(staff_ids))
+        return self._session.execute(totals_statement).one()._asdict()
+
+    def _to_statistics(self, totals: dict) -> OfficeHoursTicketStatistics:
+        """
+        Converts ticket totals into statistics, with average times in minutes.
+        """
         return OfficeHoursTicketStatistics(
-            total_tickets=total_tickets,
-            total_tickets_weekly=week_tickets,
-            average_wait_time=avg_wait_time_minutes,
-            average_duration=avg_duration_minutes,
-            total_conceptual=total_conceptual_help,
-            total_assignment=total_assignment_help,
+            total_tickets=totals["total"],
+            total_tickets_weekly=totals["weekly"],
+            average_wait_time=(
+                float(totals["wait_seconds"]) / totals["wait_count"] / 60
+                if totals["wait_count"]
+                else 0
+            ),
+            average_duration=(
+                float(totals["duration_seconds"]) / totals["duration_count"] / 60
+                if totals["duration_count"]
+                else 0
+            ),
+            total_conceptual=totals["conceptual"],
+            total_assignment=totals["assignment"],
+        )
+
+    def _parse_range(
+        self, pagination_params: TicketPaginationParams
+    ) -> tuple[datetime | None, datetime | None]:
+        """
+        Parses the range filter into naive local times, matching how ticket times are stored.
+        """
+        if pagination_params.range_start == "" or pagination_params.range_end == "":
+            return None, None
+        return tuple(
+            (
+                parsed.astimezone().replace(tzinfo=None)
+                if parsed.tzinfo is not None
+                else parsed
+            )
+            for parsed in (
+                datetime.fromisoformat(pagination_params.range_start),
+                datetime.fromisoformat(pagination_params.range_end),
+            )
         )
 
     def get_paginated_tickets(
@@ -301,9 +363,14 @@ class OfficeHoursStatisticsService:
 
     def get_ticket_csv(
         self, user: User, site_id: int, pagination_params: TicketPaginationParams
-    ):
+    ) -> Iterator[OfficeHoursTicketCsvRow]:
         """
-        Get a CSV of the tickets for a given course site.
+        Get the CSV rows of the tickets for a given course site.
+
+        Rows are streamed from a server-side cursor in batches, so memory use does not grow with
+        the number of tickets. Permissions are checked immediately, but the query only runs as the
+        returned iterator is consumed. The session is closed once iteration ends, since that may
+        happen after the request's dependencies are torn down.
         """
         # Check permissions
         self._office_hours_svc._check_site_admin_permissions(user, site_id)
@@ -311,15 +378,36 @@ class OfficeHoursStatisticsService:
         # Create query to load all ticket data
         statement, _ = self.create_ticket_query(site_id, pagination_params)
 
-        # Perform a joined load so that caller and creators data are populated for the
-        # resulting ticket entities
+        # Filtering by student joins to ticket creators, which repeats tickets with several
+        # matching creators
+        if len(pagination_params.student_ids) != 0:
+            statement = statement.distinct()
+
+        # Eagerly load callers and creators batch by batch. Collections cannot be joined when
+        # streaming, so creators are loaded with a second query per batch.
         statement = statement.options(
-            joinedload(OfficeHoursTicketEntity.caller),
-            joinedload(OfficeHoursTicketEntity.creators),
-        )
+            joinedload(OfficeHoursTicketEntity.caller).joinedload(
+                SectionMemberEntity.user
+            ),
+            selectinload(OfficeHoursTicketEntity.creators).joinedload(
+                SectionMemberEntity.user
+            ),
+        ).execution_options(yield_per=CSV_BATCH_SIZE)
 
-        # Load entities
-        entities = self._session.execute(statement).unique().scalars()
+        return self._stream_ticket_csv(statement)
 
-        # Convert entities to CSV format with expected data
-        return [entity.to_csv_model() for entity in entities]
+    def _stream_ticket_csv(
+        self, statement: Select
+    ) -> Iterator[OfficeHoursTicketCsvRow]:
+        """
+        Yields the CSV rows of the tickets selected by a streaming statement.
+        """
+        try:
+            for batch in self._session.scalars(statement).partitions():
+                for entity in batch:
+                    yield entity.to_csv_model()
+                    # Release each ticket once converted. Callers and creators are kept, as
+                    # they are bounded by the roster and repeat across batches.
+                    self._session.expunge(entity)
+        finally:
+            self._session.close()
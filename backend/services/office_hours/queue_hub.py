@@ -0,0 +1,195 @@
+"""
+Publish/subscribe hub pushing office hours queue updates to WebSocket subscribers.
+
+Ticket changes are published by `OfficeHourTicketService` from synchronous request handlers, while
+subscribers are WebSocket connections waiting on the event loop. `OfficeHoursQueueHub` delivers
+updates between the two within a single process.
+
+Production runs several worker processes, so a ticket may change in a different process than the
+one holding a subscriber's connection. `PostgresOfficeHoursQueueHub` relays updates between workers
+through PostgreSQL's LISTEN/NOTIFY, which requires no infrastructure beyond the database.
+"""
+
+import asyncio
+import logging
+import select
+import threading
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from sqlalchemy import Engine, text
+
+from ...database import engine, _in_production
+from ...models.office_hours.queue_update import OfficeHoursQueueUpdate
+
+__authors__ = ["Ajay Gandecha", "Kris Jordan"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+_logger = logging.getLogger(__name__)
+
+
+class OfficeHoursQueueSubscription:
+    """The stream of updates to one office hours queue received by one subscriber."""
+
+    office_hours_id: int
+    _queue: asyncio.Queue[OfficeHoursQueueUpdate]
+    _loop: asyncio.AbstractEventLoop
+
+    def __init__(self, office_hours_id: int):
+        self.office_hours_id = office_hours_id
+        self._queue = asyncio.Queue()
+        self._loop = asyncio.get_running_loop()
+
+    def _put(self, update: OfficeHoursQueueUpdate) -> None:
+        """Thread-safe hand-off of an update to the subscriber's event loop."""
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, update)
+
+    async def get(self) -> OfficeHoursQueueUpdate:
+        """Waits for the next update to the queue."""
+        return await self._queue.get()
+
+
+class OfficeHoursQueueHub:
+    """In-process hub delivering office hours queue updates to subscribers of the same process."""
+
+    _subscriptions: defaultdict[int, set[OfficeHoursQueueSubscription]]
+    _lock: threading.Lock
+
+    def __init__(self):
+        self._subscriptions = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def publish(self, update: OfficeHoursQueueUpdate) -> None:
+        """Publishes an update to every subscriber of its office hours queue.
+
+        Args:
+            update (OfficeHoursQueueUpdate): The change to the queue.
+        """
+        self._deliver(update)
+
+    def _deliver(self, update: OfficeHoursQueueUpdate) -> None:
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(update.office_hours_id, ()))
+        for subscription in subscriptions:
+            try:
+                subscription._put(update)
+            except RuntimeError:
+                # The subscriber's event loop has closed.
+                self._unsubscribe(subscription)
+
+    @asynccontextmanager
+    async def subscribe(
+        self, office_hours_id: int
+    ) -> AsyncIterator[OfficeHoursQueueSubscription]:
+        """Subscribes to updates of an office hours queue for the duration of the context.
+
+        Args:
+            office_hours_id (int): The ID of the office hours event whose queue to follow.
+
+        Yields:
+            OfficeHoursQueueSubscription: The stream of updates.
+        """
+        subscription = OfficeHoursQueueSubscription(office_hours_id)
+        with self._lock:
+            self._subscriptions[office_hours_id].add(subscription)
+        try:
+            yield subscription
+        finally:
+            self._unsubscribe(subscription)
+
+    def _unsubscribe(self, subscription: OfficeHoursQueueSubscription) -> None:
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.office_hours_id)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if len(subscriptions) == 0:
+                    del self._subscriptions[subscription.office_hours_id]
+
+
+class PostgresOfficeHoursQueueHub(OfficeHoursQueueHub):
+    """Hub relaying office hours queue updates between worker processes via PostgreSQL LISTEN/NOTIFY.
+
+    Published updates are sent as notifications rather than delivered directly. Every worker,
+    including the publisher, runs a listener thread that delivers received notifications to its
+    own subscribers. The listener starts with the first subscription.
+    """
+
+    CHANNEL = "office_hours_queue"
+
+    # PostgreSQL rejects notification payloads of 8000 bytes or more.
+    _MAX_PAYLOAD_BYTES = 7900
+
+    _engine: Engine
+    _listener: threading.Thread | None
+
+    def __init__(self, engine: Engine):
+        super().__init__()
+        self._engine = engine
+        self._listener = None
+
+    def publish(self, update: OfficeHoursQueueUpdate) -> None:
+        payload = update.model_dump_json()
+        if len(payload.encode()) > self._MAX_PAYLOAD_BYTES:
+            payload = update.redacted().model_dump_json()
+        with self._engine.connect() as connection:
+            connection.execute(
+                text("SELECT pg_notify(:channel, :payload)"),
+                {"channel": self.CHANNEL, "payload": payload},
+            )
+            connection.commit()
+
+    @asynccontextmanager
+    async def subscribe(
+        self, office_hours_id: int
+    ) -> AsyncIterator[OfficeHoursQueueSubscription]:
+        self._start_listener()
+        async with super().subscribe(office_hours_id) as subscription:
+            yield subscription
+
+    def _start_listener(self) -> None:
+        with self._lock:
+            if self._listener is None:
+                self._listener = threading.Thread(
+                    target=self._listen, name="office-hours-queue-listener", daemon=True
+                )
+                self._listener.start()
+
+    def _listen(self) -> None:
+        """Listener thread body, reconnecting after connection failures."""
+        while True:
+            try:
+                connection = self._engine.raw_connection()
+                try:
+                    dbapi_connection = connection.driver_connection
+                    dbapi_connection.autocommit = True
+                    dbapi_connection.cursor().execute(f"LISTEN {self.CHANNEL}")
+                    while True:
+                        readable, _, _ = select.select([dbapi_connection], [], [], 30)
+                        if readable:
+                            dbapi_connection.poll()
+                            while dbapi_connection.notifies:
+                                notify = dbapi_connection.notifies.pop(0)
+                                self._deliver(
+                                    OfficeHoursQueueUpdate.model_validate_json(
+                                        notify.payload
+                                    )
+                                )
+                finally:
+                    connection.invalidate()
+            except Exception:
+                _logger.exception("Office hours queue listener failed; reconnecting")
+                time.sleep(5)
+
+
+_hub: OfficeHoursQueueHub = (
+    PostgresOfficeHoursQueueHub(engine) if _in_production() else OfficeHoursQueueHub()
+)
+"""The hub of this process. Production runs multiple workers, so relays through PostgreSQL."""
+
+
+def office_hours_queue_hub() -> OfficeHoursQueueHub:
+    """Dependency injection function for the process' office hours queue hub."""
+    return _hub
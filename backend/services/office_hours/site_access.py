@@ -0,0 +1,188 @@
+"""
+Cache of the memberships users hold in the sections of course sites.
+
+Office hours permission checks resolve which roles a user holds in a course site, which otherwise
+costs a query for the site and a query joining its sections to the user's memberships on every
+check. Statistics, queue, event, recurrence, and ticket endpoints often check the same user and
+site more than once per request, and again on every poll, so the resolved memberships are cached
+by user and course site.
+"""
+
+from typing import Iterable
+
+from fastapi import Depends
+from sqlalchemy import and_, select
+from sqlalchemy.orm import Session
+
+from ...database import db_session
+from ...models.user import User
+from ...models.academics.section_member import RosterRole
+from ...entities.academics.section_entity import SectionEntity
+from ...entities.academics.section_member_entity import SectionMemberEntity
+from ...entities.office_hours import CourseSiteEntity, OfficeHoursEntity
+from ..exceptions import ResourceNotFoundException
+from ..cache import TTLCache
+
+__authors__ = ["Ajay Gandecha", "Kris Jordan"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+
+class CourseSiteAccess:
+    """The memberships a user holds in the sections of a course site."""
+
+    memberships: dict[int, list[tuple[int, RosterRole]]]
+    """The id and role of each of the user's memberships, by the id of every section of the site,
+    including the sections the user is not a member of."""
+
+    def __init__(self, memberships: dict[int, list[tuple[int, RosterRole]]]):
+        self.memberships = memberships
+
+    @property
+    def roles(self) -> set[RosterRole]:
+        """The roles the user holds in any section of the site."""
+        return {role for members in self.memberships.values() for _, role in members}
+
+    @property
+    def role(self) -> RosterRole | None:
+        """The role of the user's first membership in the site, ordered by section, if any."""
+        for members in self.memberships.values():
+            for _, role in members:
+                return role
+        return None
+
+    @property
+    def member_ids(self) -> list[int]:
+        """The ids of the user's memberships in the site, ordered by section."""
+        return [
+            member_id
+            for members in self.memberships.values()
+            for member_id, _ in members
+        ]
+
+    def is_staff_of_every_section(self) -> bool:
+        """Whether the user is a UTA, GTA, or instructor of every section of the site."""
+        return all(
+            any(role != RosterRole.STUDENT for _, role in members)
+            for members in self.memberships.values()
+        )
+
+    def is_student(self) -> bool:
+        """Whether the user is a student of any section of the site."""
+        return RosterRole.STUDENT in self.roles
+
+
+_site_access: TTLCache[tuple[int, int], CourseSiteAccess] = TTLCache(
+    maxsize=8192, ttl=60
+)
+"""The access of each user to each course site, by user id and course site id.
+
+Entries are invalidated by roster and course site changes made in this process. The TTL bounds how
+long other worker processes may observe access to a course site that has since changed."""
+
+
+def invalidate_site_access(user_ids: Iterable[int] | None = None) -> None:
+    """Discard cached course site access after a change to rosters or course sites.
+
+    Args:
+        user_ids (Iterable[int] | None): The users whose memberships changed, or None if any
+            number of users' access may have changed.
+    """
+    if user_ids is None:
+        _site_access.clear()
+    else:
+        user_ids = set(user_ids)
+        _site_access.invalidate_if(lambda key, _: key[0] in user_ids)
+
+
+class CourseSiteAccessService:
+    """
+    Service that resolves the access of users to course sites.
+    """
+
+    def __init__(self, session: Session = Depends(db_session)):
+        """
+        Initializes the database session.
+        """
+        self._session = session
+
+    def get(self, user: User, site_id: int) -> CourseSiteAccess:
+        """
+        Resolves the memberships of a user in the sections of a course site.
+
+        Args:
+            user (User): The user whose access is resolved.
+            site_id (int): The ID of the course site.
+
+        Returns:
+            CourseSiteAccess: The user's memberships in the course site.
+
+        Raises:
+            ResourceNotFoundException: If the course site does not exist.
+        """
+        access = _site_access.get((user.id, site_id))
+        if access is not None:
+            return access
+
+        # Every section of the site is selected, along with the user's memberships in it, if any.
+        # A site without any sections still yields a row, so no rows means the site is missing.
+        rows = self._session.execute(
+            select(
+                SectionEntity.id,
+                SectionMemberEntity.id,
+                SectionMemberEntity.member_role,
+            )
+            .select_from(CourseSiteEntity)
+            .outerjoin(
+                SectionEntity, SectionEntity.course_site_id == CourseSiteEntity.id
+            )
+            .outerjoin(
+                SectionMemberEntity,
+                and_(
+                    SectionMemberEntity.section_id == SectionEntity.id,
+                    SectionMemberEntity.user_id == user.id,
+                ),
+            )
+            .where(CourseSiteEntity.id == site_id)
+            .order_by(SectionEntity.id, SectionMemberEntity.id)
+        ).all()
+
+        if len(rows) == 0:
+            raise ResourceNotFoundException(
+                f"Course site with ID: {site_id} not found."
+            )
+
+        memberships: dict[int, list[tuple[int, RosterRole]]] = {}
+        for section_id, member_id, member_role in rows:
+            if section_id is None:
+                continue
+            members = memberships.setdefault(section_id, [])
+            if member_id is not None:
+                members.append((member_id, member_role))
+
+        access = CourseSiteAccess(memberships)
+        _site_access.set((user.id, site_id), access)
+        return access
+
+    def get_for_office_hours(
+        self, user: User, office_hours_id: int
+    ) -> CourseSiteAccess:
+        """
+        Resolves the memberships of a user in the course site of an office hours event.
+
+        Args:
+            user (User): The user whose access is resolved.
+            office_hours_id (int): The ID of the office hours event.
+
+        Returns:
+            CourseSiteAccess: The user's memberships in the event's course site.
+
+        Raises:
+            ResourceNotFoundException: If the office hours event does not exist.
+        """
+        office_hours_entity = self._session.get(OfficeHoursEntity, office_hours_id)
+        if office_hours_entity is None:
+            raise ResourceNotFoundException(
+                f"Office hours event with ID: {office_hours_id} not found."
+            )
+        return self.get(user, office_hours_entity.course_site_id)
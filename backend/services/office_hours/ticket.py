@@ -19,6 +19,7 @@ from ...models.office_hours.ticket import (
     NewOfficeHoursTicket,
     OfficeHoursTicketClosePayload,
 )
+from ...models.office_hours.queue_update import OfficeHoursQueueUpdate
 
 from ...entities.academics.section_entity import SectionEntity
 from ...entities.office_hours import (
@@ -29,6 +30,9 @@ from ...entities.office_hours import (
 from ...entities.academics.section_member_entity import SectionMemberEntity
 from ..exceptions import CoursePermissionException, ResourceNotFoundException
 from ...entities.office_hours import user_created_tickets_table
+from .queue_hub import OfficeHoursQueueHub, office_hours_queue_hub
+from .site_access import CourseSiteAccessService
+from .ticket_rollup import OfficeHoursTicketRollupService
 
 __authors__ = ["Ajay Gandecha"]
 __copyright__ = "Copyright 2024"
@@ -40,11 +44,31 @@ class OfficeHourTicketService:
     Service that performs all of the actions for office hour tickets.
     """
 
-    def __init__(self, session: Session = Depends(db_session)):
+    def __init__(
+        self,
+        session: Session = Depends(db_session),
+        queue_hub: OfficeHoursQueueHub = Depends(office_hours_queue_hub),
+    ):
         """
-        Initializes the database session.
+        Initializes the database session and the hub ticket changes are published to.
         """
         self._session = session
+        self._queue_hub = queue_hub
+
+    def _publish(
+        self, ticket_entity: OfficeHoursTicketEntity
+    ) -> OfficeHourTicketOverview:
+        """
+        Publishes a changed ticket to subscribers of its office hours queue.
+
+        Returns:
+            OfficeHourTicketOverview: The changed ticket.
+        """
+        overview = ticket_entity.to_overview_model()
+        self._queue_hub.publish(
+            OfficeHoursQueueUpdate.from_ticket(ticket_entity.office_hours_id, overview)
+        )
+        return overview
 
     def call_ticket(self, user: User, ticket_id: int) -> OfficeHourTicketOverview:
         """
@@ -67,37 +91,27 @@ class OfficeHourTicketService:
                 "Cannot call a ticket that is not in the queue."
             )
 
-        # Create query off of the member query for just the members matching
-        # with the current user (used to determine permissions)
-        user_member_query = (
-            select(SectionMemberEntity)
-            .where(SectionMemberEntity.user_id == user.id)
-            .join(SectionEntity)
-            .join(CourseSiteEntity)
-            .join(OfficeHoursEntity)
-            .where(OfficeHoursEntity.id == ticket_entity.office_hours_id)
+        # Resolve the user's memberships in the course (used to determine permissions)
+        access = CourseSiteAccessService(self._session).get_for_office_hours(
+            user, ticket_entity.office_hours_id
         )
 
-        user_members = self._session.scalars(user_member_query).unique().all()
-
         # If the user is not a member of the looked up course, throw an error
-        if len(user_members) == 0 or RosterRole.STUDENT in [
-            member.member_role for member in user_members
-        ]:
+        if len(access.member_ids) == 0 or RosterRole.STUDENT in access.roles:
             raise CoursePermissionException(
                 "Not allowed to call if a ticket if you are not a UTA, GTA, or instructor for."
             )
 
         # Call the ticket
-        ticket_entity.caller_id = user_members[0].id
+        ticket_entity.caller_id = access.member_ids[0]
         ticket_entity.called_at = datetime.now()
         ticket_entity.state = TicketState.CALLED
 
         # Save changes
         self._session.commit()
 
-        # Return the changed ticket
-        return ticket_entity.to_overview_model()
+        # Publish and return the changed ticket
+        return self._publish(ticket_entity)
 
     def cancel_ticket(self, user: User, ticket_id: int) -> OfficeHourTicketOverview:
         """
@@ -112,24 +126,16 @@ class OfficeHourTicketService:
         if not ticket_entity:
             raise ResourceNotFoundException(f"Ticket not found with ID: {ticket_id}")
 
-        # Create query off of the member query for just the members matching
-        # with the current user (used to determine permissions)
-        user_member_query = (
-            select(SectionMemberEntity)
-            .where(SectionMemberEntity.user_id == user.id)
-            .join(SectionEntity)
-            .join(CourseSiteEntity)
-            .join(OfficeHoursEntity)
-            .where(OfficeHoursEntity.id == ticket_entity.office_hours_id)
+        # Resolve the user's memberships in the course (used to determine permissions)
+        access = CourseSiteAccessService(self._session).get_for_office_hours(
+            user, ticket_entity.office_hours_id
         )
 
-        user_members = self._session.scalars(user_member_query).unique().all()
-        user_member = user_members[0] if len(user_members) > 0 else None
-
         # If the user is not a member of the looked up course, throw an error
-        if not user_member or (
-            user_member.member_role == RosterRole.STUDENT
-            and user_member.id not in [creator.id for creator in ticket_entity.creators]
+        if access.role is None or (
+            access.role == RosterRole.STUDENT
+            and access.member_ids[0]
+            not in [creator.id for creator in ticket_entity.creators]
         ):
             raise CoursePermissionException(
                 "Not allowed to cancel if a ticket if you are not a UTA, GTA, or instructor for it, or you did not open it."
@@ -141,8 +147,8 @@ class OfficeHourTicketService:
         # Save changes
         self._session.commit()
 
-        # Return the changed ticket
-        return ticket_entity.to_overview_model()
+        # Publish and return the changed ticket
+        return self._publish(ticket_entity)
 
     def close_ticket(
         self, user: User, ticket_id: int, payload: OfficeHoursTicketClosePayload
@@ -164,23 +170,13 @@ class OfficeHourTicketService:
                 "Cannot close a ticket that has not been called."
             )
 
-        # Create query off of the member query for just the members matching
-        # with the current user (used to determine permissions)
-        user_member_query = (
-            select(SectionMemberEntity)
-            .where(SectionMemberEntity.user_id == user.id)
-            .join(SectionEntity)
-            .join(CourseSiteEntity)
-            .join(OfficeHoursEntity)
-            .where(OfficeHoursEntity.id == ticket_entity.office_hours_id)
+        # Resolve the user's memberships in the course (used to determine permissions)
+        access = CourseSiteAccessService(self._session).get_for_office_hours(
+            user, ticket_entity.office_hours_id
         )
 
-        user_members = self._session.scalars(user_member_query).unique().all()
-
         # If the user is not a member of the looked up course, throw an error
-        if len(user_members) == 0 or RosterRole.STUDENT in [
-            member.member_role for member in user_members
-        ]:
+        if len(access.member_ids) == 0 or RosterRole.STUDENT in access.roles:
             raise CoursePermissionException(
                 "Not allowed to call if a ticket if you are not a UTA, GTA, or instructor for."
             )
@@ -190,12 +186,15 @@ class OfficeHourTicketService:
         ticket_entity.state = TicketState.CLOSED
         ticket_entity.have_concerns = payload.has_concerns
         ticket_entity.caller_notes = payload.caller_notes
+        OfficeHoursTicketRollupService(self._session).record_closed_ticket(
+            ticket_entity
+        )
 
         # Save changes
         self._session.commit()
 
-        # Return the changed ticket
-        return ticket_entity.to_overview_model()
+        # Publish and return the changed ticket
+        return self._publish(ticket_entity)
 
     def create_ticket(
         self, user: User, ticket: NewOfficeHoursTicket
@@ -348,5 +347,5 @@ class OfficeHourTicketService:
 
         self._session.commit()
 
-        # Return details model
-        return oh_ticket_entity.to_overview_model()
+        # Publish and return details model
+        return self._publish(oh_ticket_entity)
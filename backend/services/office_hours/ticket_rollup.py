@@ -0,0 +1,158 @@
+"""
+Maintains daily rollups of closed office hours tickets.
+
+Office hours statistics are aggregates over every closed ticket of a course site. Rather than
+scanning the tickets for each request, `OfficeHoursTicketDailyRollupEntity` holds per-site, per-day,
+per-caller sums that are updated as tickets are closed or deleted.
+"""
+
+from fastapi import Depends
+from sqlalchemy import Select, delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from ...database import db_session
+from ...entities.office_hours import OfficeHoursEntity, OfficeHoursTicketEntity
+from ...entities.office_hours.ticket_daily_rollup_entity import (
+    OfficeHoursTicketDailyRollupEntity,
+)
+from ...models.office_hours.ticket_state import TicketState
+from ...models.office_hours.ticket_type import TicketType
+
+__authors__ = ["Ajay Gandecha", "Jade Keegan"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+_KEYS = ("course_site_id", "day", "caller_id")
+_COUNTERS = (
+    "ticket_count",
+    "conceptual_count",
+    "assignment_count",
+    "wait_seconds",
+    "wait_count",
+    "duration_seconds",
+    "duration_count",
+)
+
+
+class OfficeHoursTicketRollupService:
+    """
+    Service that maintains the daily rollups of closed office hours tickets.
+
+    Changes are flushed with the caller's session and committed along with the ticket changes
+    they reflect.
+    """
+
+    def __init__(self, session: Session = Depends(db_session)):
+        """
+        Initializes the database session.
+        """
+        self._session = session
+
+    def record_closed_ticket(self, ticket: OfficeHoursTicketEntity) -> None:
+        """
+        Adds a ticket that has just been closed to its rollup.
+
+        Args:
+            ticket (OfficeHoursTicketEntity): The closed ticket.
+        """
+        if ticket.caller_id is None:
+            # Statistics include uncalled tickets from the ticket table directly.
+            return
+
+        waited = ticket.called_at is not None
+        lasted = ticket.called_at is not None and ticket.closed_at is not None
+        statement = insert(OfficeHoursTicketDailyRollupEntity).values(
+            course_site_id=ticket.office_hours.course_site_id,
+            day=ticket.created_at.date(),
+            caller_id=ticket.caller_id,
+            ticket_count=1,
+            conceptual_count=int(ticket.type == TicketType.CONCEPTUAL_HELP),
+            assignment_count=int(ticket.type == TicketType.ASSIGNMENT_HELP),
+            wait_seconds=(
+                (ticket.called_at - ticket.created_at).total_seconds() if waited else 0
+            ),
+            wait_count=int(waited),
+            duration_seconds=(
+                (ticket.closed_at - ticket.called_at).total_seconds() if lasted else 0
+            ),
+            duration_count=int(lasted),
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=list(_KEYS),
+            set_={
+                counter: getattr(OfficeHoursTicketDailyRollupEntity, counter)
+                + statement.excluded[counter]
+                for counter in _COUNTERS
+            },
+        )
+        self._session.execute(statement)
+
+    def remove_office_hours(self, office_hours_id: int) -> None:
+        """
+        Subtracts the closed tickets of an office hours event, which is about to be deleted, from
+        the rollups.
+
+        Args:
+            office_hours_id (int): The ID of the office hours event.
+        """
+        removed = self._aggregate_closed_tickets(
+            OfficeHoursTicketEntity.office_hours_id == office_hours_id
+        ).subquery()
+        rollup = OfficeHoursTicketDailyRollupEntity
+        self._session.execute(
+            update(rollup)
+            .where(*[getattr(rollup, key) == removed.c[key] for key in _KEYS])
+            .values(
+                {
+                    counter: getattr(rollup, counter) - removed.c[counter]
+                    for counter in _COUNTERS
+                }
+            )
+        )
+        self._session.execute(delete(rollup).where(rollup.ticket_count <= 0))
+
+    def rebuild(self) -> None:
+        """
+        Recomputes every rollup from the ticket table.
+        """
+        self._session.execute(delete(OfficeHoursTicketDailyRollupEntity))
+        self._session.execute(
+            insert(OfficeHoursTicketDailyRollupEntity).from_select(
+                list(_KEYS) + list(_COUNTERS), self._aggregate_closed_tickets()
+            )
+        )
+
+    def _aggregate_closed_tickets(self, *criteria) -> Select:
+        """
+        Selects the rollups of the closed, called tickets matching some criteria.
+        """
+        ticket = OfficeHoursTicketEntity
+        wait = func.extract("epoch", ticket.called_at - ticket.created_at)
+        duration = func.extract("epoch", ticket.closed_at - ticket.called_at)
+        day = func.date(ticket.created_at)
+        return (
+            select(
+                OfficeHoursEntity.course_site_id.label("course_site_id"),
+                day.label("day"),
+                ticket.caller_id.label("caller_id"),
+                func.count().label("ticket_count"),
+                func.count()
+                .filter(ticket.type == TicketType.CONCEPTUAL_HELP)
+                .label("conceptual_count"),
+                func.count()
+                .filter(ticket.type == TicketType.ASSIGNMENT_HELP)
+                .label("assignment_count"),
+                func.coalesce(func.sum(wait), 0).label("wait_seconds"),
+                func.count(wait).label("wait_count"),
+                func.coalesce(func.sum(duration), 0).label("duration_seconds"),
+                func.count(duration).label("duration_count"),
+            )
+            .join(OfficeHoursEntity)
+            .where(
+                ticket.state == TicketState.CLOSED,
+                ticket.caller_id.isnot(None),
+                *criteria,
+            )
+            .group_by(OfficeHoursEntity.course_site_id, day, ticket.caller_id)
+        )
@@ -9,17 +9,125 @@ import re
 from fastapi import Depends
 from functools import lru_cache
 from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from ..database import db_session
+from ..database import db_session, async_db_session
 from ..models import User, Permission, Role, RoleDetails
-from ..entities import UserEntity, PermissionEntity, RoleEntity
+from ..entities import UserEntity, PermissionEntity, RoleEntity, user_role_table
 from ..services.exceptions import UserPermissionException
+from .cache import TTLCache
+from .principal import invalidate_principals
 
 __authors__ = ["Kris Jordan"]
 __copyright__ = "Copyright 2023"
 __license__ = "MIT"
 
 
+class CompiledPermissions:
+    """A user's permissions, from direct and role grants, merged into a prefix trie keyed by action.
+
+    Every permission pattern is indexed by its literal prefix, the characters preceding its first `*`.
+    Checking an action walks the trie one character at a time, so only grants whose literal prefix
+    matches the action are ever tested against the resource. Decisions are memoized per
+    (action, resource) pair, as routes tend to enforce the same few checks repeatedly."""
+
+    _MAX_DECISIONS = 256
+
+    _root: "_PermissionTrieNode"
+    _decisions: dict[tuple[str, str], bool]
+
+    def __init__(self, patterns: list[tuple[str, str]]):
+        """Compile a list of permission patterns.
+
+        Args:
+            patterns (list[tuple[str, str]]): The (action, resource) patterns granted to a user.
+        """
+        self._root = _PermissionTrieNode()
+        self._decisions = {}
+        for action, resource in patterns:
+            self._insert(action, resource)
+
+    def _insert(self, action: str, resource: str) -> None:
+        wildcard_index = action.find("*")
+        prefix = action if wildcard_index == -1 else action[:wildcard_index]
+        node = self._root
+        for character in prefix:
+            node = node.children.setdefault(character, _PermissionTrieNode())
+        resource_re = PermissionService._expand_pattern(resource)
+        if wildcard_index == -1:
+            node.exact.append(resource_re)
+        else:
+            node.wildcard.append(
+                (PermissionService._expand_pattern(action), resource_re)
+            )
+
+    def check(self, action: str, resource: str) -> bool:
+        """Check whether the compiled permissions allow an action on a resource.
+
+        Args:
+            action (str): The action in question.
+            resource (str): The resource in question.
+
+        Returns:
+            bool: True if some permission allows the action on the resource, False otherwise.
+        """
+        decision = self._decisions.get((action, resource))
+        if decision is None:
+            decision = self._lookup(action, resource)
+            if len(self._decisions) < self._MAX_DECISIONS:
+                self._decisions[(action, resource)] = decision
+        return decision
+
+    def _lookup(self, action: str, resource: str) -> bool:
+        node = self._root
+        for character in action:
+            if node.matches_wildcard(action, resource):
+                return True
+            node = node.children.get(character)
+            if node is None:
+                return False
+        if node.matches_wildcard(action, resource):
+            return True
+        return any(
+            resource_re.fullmatch(resource) is not None for resource_re in node.exact
+        )
+
+
+class _PermissionTrieNode:
+    """A node of the `CompiledPermissions` trie, holding the grants whose literal action prefix ends here."""
+
+    __slots__ = ("children", "exact", "wildcard")
+
+    children: dict[str, "_PermissionTrieNode"]
+    exact: list[re.Pattern]
+    """Resource patterns of grants whose action is exactly the path to this node."""
+    wildcard: list[tuple[re.Pattern, re.Pattern]]
+    """Action and resource patterns of grants whose action contains a `*` after this prefix."""
+
+    def __init__(self):
+        self.children = {}
+        self.exact = []
+        self.wildcard = []
+
+    def matches_wildcard(self, action: str, resource: str) -> bool:
+        for action_re, resource_re in self.wildcard:
+            if (
+                action_re.fullmatch(action) is not None
+                and resource_re.fullmatch(resource) is not None
+            ):
+                return True
+        return False
+
+
+_compiled_permissions: TTLCache[int, CompiledPermissions] = TTLCache(
+    maxsize=2048, ttl=60
+)
+"""Compiled permissions by user id.
+
+Entries are invalidated by grants, revocations, and role membership changes made in this process.
+The TTL bounds how long other worker processes may observe permissions that have since changed."""
+
+
 class PermissionService:
     """PermissionService grants, revokes, tests, and enforces permissions for users and roles in the system."""
 
@@ -83,6 +191,7 @@ class PermissionService:
 
         self._session.add(permission_entity)
         self._session.commit()
+        self.invalidate(grantee.id if type(grantee) is User else None)
         return True
 
     def revoke(self, revoker: User, permission: Permission) -> bool:
@@ -108,8 +217,10 @@ class PermissionService:
         self.enforce(revoker, "permission.revoke", f"permission/{permission_entity.id}")
         self.enforce(revoker, permission_entity.action, permission_entity.resource)
 
+        user_id = permission_entity.user_id
         self._session.delete(permission_entity)
         self._session.commit()
+        self.invalidate(user_id)
         return True
 
     def enforce(self, subject: User, action: str, resource: str) -> None:
@@ -132,20 +243,51 @@ class PermissionService:
     def check(self, subject: User, action: str, resource: str) -> bool:
         """Check if a user has permission to carry out an action on a resource.
 
+        Permissions are compiled once per user and cached, so checks usually require no queries.
+
         Args:
             subject (User): The user to check permissions for.
+            action (str): The action in question.
+            resource (str): The resource in question.
 
         Returns:
             bool: True if the user has permission to carry out the action on the resource, False otherwise.
         """
-        # Check user permissions
-        user_perms = self._get_user_permissions(subject)
-        if self._has_permission(user_perms, action, resource):
-            return True
+        return self._get_compiled_permissions(subject).check(action, resource)
 
-        # Check role permissions
-        role_permissions = self._get_user_roles_permissions(subject)
-        return self._has_permission(role_permissions, action, resource)
+    def invalidate(self, user_id: int | None = None) -> None:
+        """Discard cached compiled permissions after a change to grants or role memberships.
+
+        Args:
+            user_id (int | None): The user whose permissions changed, or None if the permissions of
+                any number of users may have changed (e.g. a grant to a role).
+        """
+        if user_id is None:
+            _compiled_permissions.clear()
+        else:
+            _compiled_permissions.invalidate(user_id)
+        # Principals carry the permissions of their user
+        invalidate_principals(user_id)
+
+    def _get_compiled_permissions(self, subject: User) -> CompiledPermissions:
+        """Get the compiled permissions of a user, from the cache when possible.
+
+        Args:
+            subject (User): The user to get compiled permissions for.
+
+        Returns:
+            CompiledPermissions: The user's direct and role permissions."""
+        compiled = _compiled_permissions.get(subject.id)
+        if compiled is None:
+            permissions = self._get_user_permissions(
+                subject
+            ) + self._get_user_roles_permissions(subject)
+            compiled = CompiledPermissions(
+                [(permission.action, permission.resource) for permission in permissions]
+            )
+            if subject.id is not None:
+                _compiled_permissions.set(subject.id, compiled)
+        return compiled
 
     def _get_user_permissions(self, subject: User) -> list[PermissionEntity]:
         """Get the permissions for a user.
@@ -180,24 +322,6 @@ class PermissionService:
         )
         return [p for p in self._session.execute(role_query).scalars()]
 
-    def _has_permission(
-        self, permissions: list[PermissionEntity], action: str, resource: str
-    ) -> bool:
-        """Check if a user has permission to carry out an action on a resource in a list of permissions.
-
-        Args:
-            permissions (list[PermissionEntity]): The permissions to check.
-            action (str): The action in question.
-            resource (str): The resource in question.
-
-        Returns:
-            bool: True if the user has permission to carry out the action on the resource, False otherwise.
-        """
-        for permission in permissions:
-            if self._check_permission(permission, action, resource):
-                return True
-        return False
-
     def _check_permission(
         self, permission: PermissionEntity, action: str, resource: str
     ) -> bool:
@@ -218,8 +342,9 @@ class PermissionService:
         else:
             return False
 
+    @staticmethod
     @lru_cache()
-    def _expand_pattern(self, pattern: str) -> re.Pattern:
+    def _expand_pattern(pattern: str) -> re.Pattern:
         """Expand a permission pattern into a regular expression.
 
         This function is memoized to avoid recompiling the same regular expression multiple times.
@@ -231,3 +356,37 @@ class PermissionService:
             re.Pattern: The compiled regular expression."""
         search = pattern.replace("*", ".*")
         return re.compile(f"^{search}$")
+
+
+class AsyncPermissionService:
+    """Asynchronous variant of `PermissionService.get_permissions`, which authenticates `async def` routes."""
+
+    _session: AsyncSession
+
+    def __init__(self, session: AsyncSession = Depends(async_db_session)):
+        """Initialize a new AsyncPermissionService instance.
+
+        Args:
+            session (AsyncSession): The SQLAlchemy session to use for database operations."""
+        self._session = session
+
+    async def get_permissions(self, subject: User) -> list[Permission]:
+        """Get the permissions for a user, granted directly and then through their roles.
+
+        Args:
+            subject (User): The user to get permissions for.
+
+        Returns:
+            list[Permission]: The permissions for the user."""
+        user_permissions = await self._session.scalars(
+            select(PermissionEntity).where(PermissionEntity.user_id == subject.id)
+        )
+        permissions = list(user_permissions)
+        role_ids = select(user_role_table.c.role_id).where(
+            user_role_table.c.user_id == subject.id
+        )
+        roles_permissions = await self._session.scalars(
+            select(PermissionEntity).where(PermissionEntity.role_id.in_(role_ids))
+        )
+        permissions.extend(roles_permissions)
+        return [permission.to_model() for permission in permissions]
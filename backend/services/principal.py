@@ -0,0 +1,67 @@
+"""
+Cache of the users that bearer tokens authenticate.
+
+Every authenticated request resolves its token to a `UserDetails` principal, which otherwise
+costs a query for the user and queries for their permissions. Principals are cached by the token
+that authenticated them, and invalidated when the user or their permissions change.
+"""
+
+import time
+
+from ..models import UserDetails
+from .cache import TTLCache
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+_principals: TTLCache[str, tuple[float, UserDetails]] = TTLCache(maxsize=4096, ttl=60)
+"""Principals, and the time (in seconds since the epoch) their token expires, by token.
+
+Entries are invalidated by updates to users and changes to permissions made in this process.
+The TTL bounds how long other worker processes may observe a principal that has since changed."""
+
+
+def get_principal(token: str) -> UserDetails | None:
+    """Get the principal a token was last resolved to.
+
+    Args:
+        token (str): The encoded bearer token.
+
+    Returns:
+        UserDetails | None: A copy of the cached principal, or None if there is no entry or the
+            token has since expired.
+    """
+    entry = _principals.get(token)
+    if entry is None:
+        return None
+    expires_at, user = entry
+    if expires_at <= time.time():
+        _principals.invalidate(token)
+        return None
+    # Routes may modify their subject, which must not modify the cached principal.
+    return user.model_copy(deep=True)
+
+
+def cache_principal(token: str, expires_at: float, user: UserDetails) -> None:
+    """Cache the principal a token resolved to.
+
+    Args:
+        token (str): The encoded bearer token, whose signature has been verified.
+        expires_at (float): The time the token expires, in seconds since the epoch.
+        user (UserDetails): The user the token authenticates.
+    """
+    _principals.set(token, (expires_at, user.model_copy(deep=True)))
+
+
+def invalidate_principals(user_id: int | None = None) -> None:
+    """Discard cached principals after a change to a user or permissions.
+
+    Args:
+        user_id (int | None): The user who changed, or None if any number of users may have
+            changed (e.g. a grant to a role).
+    """
+    if user_id is None:
+        _principals.clear()
+    else:
+        _principals.invalidate_if(lambda _, entry: entry[1].id == user_id)
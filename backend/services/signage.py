@@ -3,16 +3,18 @@ Service to collect and organize the information for CSXL Signage
 """
 
 from fastapi import Depends
-from sqlalchemy import select, func, not_, exists
-from sqlalchemy.orm import Session
+from sqlalchemy import Select, select, not_, exists
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from backend.models.coworking.reservation import ReservationState
 from backend.models.office_hours.ticket_state import TicketState
 
-from ..database import db_session
+from ..database import db_session, async_db_session
 
 from datetime import datetime, timedelta
-from ..models.coworking import TimeRange
+from typing import Sequence
+from ..models.coworking import SeatAvailability, TimeRange
 
 from ..models.signage import (
     SignageOverviewFast,
@@ -21,13 +23,33 @@ from ..models.signage import (
     SignageAnnouncement,
     SignageProfile,
 )
-from ..services.coworking import ReservationService, SeatService
+from ..services.coworking import (
+    ReservationService,
+    SeatService,
+    PolicyService,
+    AsyncReservationService,
+    AsyncSeatService,
+    AsyncOperatingHoursService,
+)
+from ..services.coworking.checkin_leaderboard import (
+    CheckinLeaderboardService,
+    month_of,
+    select_top_users,
+)
 from ..services import RoomService
 
-from ..entities import ArticleEntity, RoomEntity, UserEntity, EventEntity
+from ..entities import (
+    ArticleEntity,
+    RoomEntity,
+    UserEntity,
+    EventEntity,
+    EventRegistrationEntity,
+)
+from ..entities.academics import SectionEntity
 from ..entities.coworking import ReservationEntity
-from ..entities.office_hours import OfficeHoursEntity
+from ..entities.office_hours import OfficeHoursEntity, CourseSiteEntity
 from ..models.articles import ArticleState
+from .cache import Snapshot
 
 __authors__ = ["Andrew Lockard", "Will Zahrt", "Audrey Toney"]
 __copyright__ = "Copyright 2024"
@@ -38,6 +60,11 @@ MAX_LEADERBOARD_SLOTS = 10
 MAX_EVENTS = 5
 MAX_ANNOUCEMENTS = 3
 
+# Every display polls signage independently, so serialized payloads are shared process-wide.
+# The TTLs are well under the displays' refresh intervals (20 seconds fast, 20 minutes slow).
+_fast_snapshot: Snapshot[bytes] = Snapshot(ttl=10)
+_slow_snapshot: Snapshot[bytes] = Snapshot(ttl=5 * 60)
+
 
 class SignageService:
     """
@@ -56,9 +83,8 @@ class SignageService:
         self._seat_svc = seat_svc
         self.room_svc = room_svc
 
-    def to_signage_office_hours_model(
-        self, entity: OfficeHoursEntity
-    ) -> SignageOfficeHours:
+    @staticmethod
+    def to_signage_office_hours_model(entity: OfficeHoursEntity) -> SignageOfficeHours:
         """Converts OfficeHoursEntity into the SignageOfficeHours model"""
         min_section_num = min(
             map(lambda section: section.number, entity.course_site.sections)
@@ -88,147 +114,290 @@ class SignageService:
             ),
         )
 
+    @staticmethod
     def to_signage_announcements_model(
-        self, announcement_entity: ArticleEntity
+        announcement_entity: ArticleEntity,
     ) -> SignageAnnouncement:
         """Converts an ArticleEntity into the model used to send announcements to signage"""
         return SignageAnnouncement(title=announcement_entity.title)
 
-    def to_signage_profile_model(self, user_entity: UserEntity) -> SignageProfile:
+    @staticmethod
+    def to_signage_profile_model(user_entity: UserEntity) -> SignageProfile:
         return SignageProfile(
             first_name=user_entity.first_name,
             last_name=user_entity.last_name,
             github_avatar=user_entity.github_avatar,
         )
 
+    def get_fast_data_json(self) -> bytes:
+        """
+        Gets the serialized data for the fast API route, shared by all displays for a few seconds
+        """
+        return _fast_snapshot.get(
+            lambda: self.get_fast_data().model_dump_json().encode()
+        )
+
+    def get_slow_data_json(self) -> bytes:
+        """
+        Gets the serialized data for the slow API route, shared by all displays for a few minutes
+        """
+        return _slow_snapshot.get(
+            lambda: self.get_slow_data().model_dump_json().encode()
+        )
+
     def get_fast_data(self) -> SignageOverviewFast:
         """
         Gets the data for the fast API route
         """
         # Office Hours
         now = datetime.now()
-        office_hours_query = (
-            select(OfficeHoursEntity)
-            .filter(
-                OfficeHoursEntity.start_time <= now, OfficeHoursEntity.end_time >= now
-            )
-            .order_by(OfficeHoursEntity.id.asc())
-        )
-        active_office_hours_entities = self._session.scalars(office_hours_query).all()
-        active_office_hours = [
-            self.to_signage_office_hours_model(office_hours)
-            for office_hours in active_office_hours_entities
-        ]
+        active_office_hours_entities = self._session.scalars(
+            _select_active_office_hours(now)
+        ).all()
 
         # Get Rooms that do not have an active reservation for this moment in time
-        room_query = (
-            select(RoomEntity)
-            .where(
-                RoomEntity.reservable,
-                not_(
-                    exists().where(
-                        ReservationEntity.room_id == RoomEntity.id,
-                        ReservationEntity.start <= now,
-                        ReservationEntity.end > now,
-                        ReservationEntity.state.not_in(
-                            [ReservationState.CANCELLED, ReservationState.CHECKED_OUT]
-                        ),
-                    )
-                ),
-            )
-            .order_by(RoomEntity.room.desc())
-        )
-        room_entities = self._session.scalars(room_query).all()
-        available_rooms = [room.to_model().id for room in room_entities]
+        room_entities = self._session.scalars(_select_available_rooms(now)).all()
 
         # Seats
-        now = datetime.now()
-        walkin_window = TimeRange(
-            start=now,
-            end=now
-            + timedelta(
-                hours=6, minutes=10
-            ),  # Makes sure open seats are available for 2hr walkin reservation
-        )
         seats = self._seat_svc.list()  # All Seats are fair game for walkin purposes
         seat_availability = self._reservation_svc.seat_availability(
-            seats, walkin_window
+            seats, _walkin_window()
         )
 
-        return SignageOverviewFast(
-            active_office_hours=active_office_hours,
-            available_rooms=available_rooms,
-            seat_availability=seat_availability,
+        return _to_fast_overview(
+            active_office_hours_entities, room_entities, seat_availability
         )
 
     def get_slow_data(self) -> SignageOverviewSlow:
         # Newest News
-        news_query = (
-            select(ArticleEntity)
-            .where(ArticleEntity.is_announcement == False)
-            .where(ArticleEntity.state == ArticleState.PUBLISHED)
-            .order_by(ArticleEntity.published.desc())
-            .limit(MAX_ARTICLES)
-        )
-        news_entities = self._session.scalars(news_query).all()
-        newest_news = [news.to_overview_model() for news in news_entities]
+        news_entities = self._session.scalars(_select_newest_news()).all()
 
         # Checkin Leaderboard
-        start_of_month = datetime.today().replace(
-            day=1, hour=0, minute=0, second=0, microsecond=0
+        # Totals are accumulated as reservations are checked out, so only the top rows are read
+        user_entities = CheckinLeaderboardService(self._session).top_users(
+            month_of(datetime.today()), MAX_LEADERBOARD_SLOTS
         )
 
-        # Creates a function that sums up all of the seconds elapsed during a reservation
-        # for a given aggregate. Since we group by users, this function will calculate
-        # the total time in seconds that a user has been checked in to the XL since
-        # the start of the month.
-        reservation_length_sum_fn = func.sum(
-            func.extract("epoch", ReservationEntity.end - ReservationEntity.start)
+        # Newest Events
+        event_entities = self._session.scalars(_select_newest_events()).all()
+
+        # Announcements
+        announcement_entities = self._session.scalars(_select_announcements()).all()
+
+        return _to_slow_overview(
+            news_entities, user_entities, event_entities, announcement_entities
+        )
+
+
+class AsyncSignageService:
+    """
+    Asynchronous variant of `SignageService` for `async def` routes
+
+    The serialized data is shared with `SignageService` through the same snapshots. A snapshot is
+    built once for every display awaiting it, so it is built with a session of its own rather than
+    that of the request that happened to start the build.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession = Depends(async_db_session),
+        reservation_svc: AsyncReservationService = Depends(),
+        seat_svc: AsyncSeatService = Depends(),
+    ):
+        self._session = session
+        self._reservation_svc = reservation_svc
+        self._seat_svc = seat_svc
+
+    async def get_fast_data_json(self) -> bytes:
+        """
+        Gets the serialized data for the fast API route, shared by all displays for a few seconds
+        """
+        return await _fast_snapshot.aget(self._build_fast_data_json)
+
+    async def get_slow_data_json(self) -> bytes:
+        """
+        Gets the serialized data for the slow API route, shared by all displays for a few minutes
+        """
+        return await _slow_snapshot.aget(self._build_slow_data_json)
+
+    async def _build_fast_data_json(self) -> bytes:
+        async with AsyncSession(self._session.bind) as session:
+            signage_svc = _async_signage_service(session)
+            return (await signage_svc.get_fast_data()).model_dump_json().encode()
+
+    async def _build_slow_data_json(self) -> bytes:
+        async with AsyncSession(self._session.bind) as session:
+            signage_svc = _async_signage_service(session)
+            return (await signage_svc.get_slow_data()).model_dump_json().encode()
+
+    async def get_fast_data(self) -> SignageOverviewFast:
+        """
+        Gets the data for the fast API route
+        """
+        now = datetime.now()
+        active_office_hours_entities = (
+            await self._session.scalars(_select_active_office_hours(now))
+        ).all()
+        room_entities = (
+            await self._session.scalars(_select_available_rooms(now))
+        ).all()
+        seats = await self._seat_svc.list()
+        seat_availability = await self._reservation_svc.seat_availability(
+            seats, _walkin_window()
+        )
+        return _to_fast_overview(
+            active_office_hours_entities, room_entities, seat_availability
         )
 
-        top_users_query = (
-            select(
-                UserEntity,
-                reservation_length_sum_fn.label("total_time_seconds"),
+    async def get_slow_data(self) -> SignageOverviewSlow:
+        """
+        Gets the data for the slow API route
+        """
+        news_entities = (await self._session.scalars(_select_newest_news())).all()
+        user_entities = (
+            await self._session.scalars(
+                select_top_users(month_of(datetime.today()), MAX_LEADERBOARD_SLOTS)
             )
-            .join(ReservationEntity.users)
-            .where(ReservationEntity.end >= start_of_month)
-            .where(ReservationEntity.state == ReservationState.CHECKED_OUT)
-            .group_by(UserEntity.id)
-            .order_by(reservation_length_sum_fn.desc())
-            .limit(MAX_LEADERBOARD_SLOTS)
+        ).all()
+        event_entities = (await self._session.scalars(_select_newest_events())).all()
+        announcement_entities = (
+            await self._session.scalars(_select_announcements())
+        ).all()
+        return _to_slow_overview(
+            news_entities, user_entities, event_entities, announcement_entities
         )
 
-        user_entities: list[UserEntity] = self._session.scalars(top_users_query).all()
-        top_users = [self.to_signage_profile_model(user) for user in user_entities]
 
-        # Newest Events
-        events_query = (
-            select(EventEntity)
-            .where(EventEntity.end >= datetime.now())
-            .order_by(EventEntity.start.desc())
-            .limit(MAX_EVENTS)
+def _async_signage_service(session: AsyncSession) -> AsyncSignageService:
+    """An `AsyncSignageService` that reads with the given session only."""
+    return AsyncSignageService(
+        session,
+        AsyncReservationService(
+            session, PolicyService(), AsyncOperatingHoursService(session)
+        ),
+        AsyncSeatService(session),
+    )
+
+
+def _select_active_office_hours(now: datetime) -> Select:
+    """Selects the office hours in progress, loading what their signage models need."""
+    return (
+        select(OfficeHoursEntity)
+        .filter(OfficeHoursEntity.start_time <= now, OfficeHoursEntity.end_time >= now)
+        .order_by(OfficeHoursEntity.id.asc())
+        .options(
+            joinedload(OfficeHoursEntity.course_site)
+            .selectinload(CourseSiteEntity.sections)
+            .joinedload(SectionEntity.course),
+            joinedload(OfficeHoursEntity.room),
+            selectinload(OfficeHoursEntity.tickets),
         )
-        event_entities = self._session.scalars(events_query).all()
-        events = [event.to_overview_model() for event in event_entities]
+    )
 
-        # Announcements
-        announcement_query = (
-            select(ArticleEntity)
-            .where(ArticleEntity.is_announcement)
-            .where(ArticleEntity.state == ArticleState.PUBLISHED)
-            .order_by(ArticleEntity.published.desc())
-            .limit(MAX_ANNOUCEMENTS)
-        )
-        announcement_entities = self._session.scalars(announcement_query).all()
-        announcements = [
-            self.to_signage_announcements_model(announcement)
-            for announcement in announcement_entities
-        ]
 
-        return SignageOverviewSlow(
-            newest_news=newest_news,
-            events=events,
-            top_users=top_users,
-            announcements=announcements,
+def _select_available_rooms(now: datetime) -> Select:
+    """Selects the reservable rooms without an active reservation at this moment in time."""
+    return (
+        select(RoomEntity)
+        .where(
+            RoomEntity.reservable,
+            not_(
+                exists().where(
+                    ReservationEntity.room_id == RoomEntity.id,
+                    ReservationEntity.start <= now,
+                    ReservationEntity.end > now,
+                    ReservationEntity.state.not_in(
+                        [ReservationState.CANCELLED, ReservationState.CHECKED_OUT]
+                    ),
+                )
+            ),
+        )
+        .order_by(RoomEntity.room.desc())
+    )
+
+
+def _walkin_window() -> TimeRange:
+    """The time range in which seats must be open to be shown as available for walkins."""
+    now = datetime.now()
+    return TimeRange(
+        start=now,
+        end=now
+        + timedelta(
+            hours=6, minutes=10
+        ),  # Makes sure open seats are available for 2hr walkin reservation
+    )
+
+
+def _select_newest_news() -> Select:
+    """Selects the newest published news, loading what their overviews need."""
+    return (
+        select(ArticleEntity)
+        .where(ArticleEntity.is_announcement == False)
+        .where(ArticleEntity.state == ArticleState.PUBLISHED)
+        .order_by(ArticleEntity.published.desc())
+        .limit(MAX_ARTICLES)
+        .options(
+            joinedload(ArticleEntity.organization), selectinload(ArticleEntity.authors)
+        )
+    )
+
+
+def _select_newest_events() -> Select:
+    """Selects the newest events that have not ended, loading what their overviews need."""
+    return (
+        select(EventEntity)
+        .where(EventEntity.end >= datetime.now())
+        .order_by(EventEntity.start.desc())
+        .limit(MAX_EVENTS)
+        .options(
+            joinedload(EventEntity.organization),
+            selectinload(EventEntity.registrations).joinedload(
+                EventRegistrationEntity.user
+            ),
         )
+    )
+
+
+def _select_announcements() -> Select:
+    """Selects the newest published announcements."""
+    return (
+        select(ArticleEntity)
+        .where(ArticleEntity.is_announcement)
+        .where(ArticleEntity.state == ArticleState.PUBLISHED)
+        .order_by(ArticleEntity.published.desc())
+        .limit(MAX_ANNOUCEMENTS)
+    )
+
+
+def _to_fast_overview(
+    office_hours_entities: Sequence[OfficeHoursEntity],
+    room_entities: Sequence[RoomEntity],
+    seat_availability: Sequence[SeatAvailability],
+) -> SignageOverviewFast:
+    return SignageOverviewFast(
+        active_office_hours=[
+            SignageService.to_signage_office_hours_model(office_hours)
+            for office_hours in office_hours_entities
+        ],
+        available_rooms=[room.to_model().id for room in room_entities],
+        seat_availability=seat_availability,
+    )
+
+
+def _to_slow_overview(
+    news_entities: Sequence[ArticleEntity],
+    user_entities: Sequence[UserEntity],
+    event_entities: Sequence[EventEntity],
+    announcement_entities: Sequence[ArticleEntity],
+) -> SignageOverviewSlow:
+    return SignageOverviewSlow(
+        newest_news=[news.to_overview_model() for news in news_entities],
+        events=[event.to_overview_model() for event in event_entities],
+        top_users=[
+            SignageService.to_signage_profile_model(user) for user in user_entities
+        ],
+        announcements=[
+            SignageService.to_signage_announcements_model(announcement)
+            for announcement in announcement_entities
+        ],
+    )
@@ -4,18 +4,39 @@ The User Service provides access to the User model and its associated database o
 """
 
 from fastapi import Depends
-from sqlalchemy import select, or_, func, cast, String
+from sqlalchemy import select, or_, func, cast, case, String
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from ..database import db_session
+from ..database import db_session, async_db_session
+from ..env import getenv
 from ..models import User, UserDetails, Paginated, PaginationParams, PublicUser
 from ..entities import UserEntity
 from .exceptions import ResourceNotFoundException
-from .permission import PermissionService
+from .permission import PermissionService, AsyncPermissionService
+from .principal import invalidate_principals
+from .cache import Snapshot
+from .user_prefix_index import UserPrefixIndex
 
 __authors__ = ["Kris Jordan"]
 __copyright__ = "Copyright 2023"
 __license__ = "MIT"
 
+_SEARCH_LIMIT = 50
+_SEARCH_ORDER = (UserEntity.first_name, UserEntity.last_name, UserEntity.id)
+_TRIGRAM_LENGTH = 3
+
+_PREFIX_INDEX_ENABLED = getenv("USER_SEARCH_PREFIX_INDEX", "true").lower() == "true"
+_prefix_index: Snapshot[UserPrefixIndex] = Snapshot(ttl=5 * 60)
+"""Users by prefix, for searches shorter than a trigram.
+
+Cleared when users are created or updated in this process. The TTL bounds how long other worker
+processes may omit new or renamed users from the shortest searches."""
+
+
+def invalidate_user_prefix_index() -> None:
+    """Discard the prefix index of user searches after users are created or renamed."""
+    _prefix_index.clear()
+
 
 class UserService:
     _session: Session
@@ -88,7 +109,11 @@ class UserService:
         return user_entity.to_public_model()
 
     def search(self, _subject: User, query: str) -> list[User]:
-        """Search for users by their name, onyen, email.
+        """Search for users by their name, onyen, email, or PID.
+
+        Users whose full name, last name, onyen, or PID begins with the query are ranked first,
+        followed by users who contain it anywhere, including in their email. Users of equal rank
+        are ordered by name.
 
         Args:
             subject: The user performing the action.
@@ -97,46 +122,54 @@ class UserService:
         Returns:
             list[User]: The list of users matching the query.
         """
-        # First attempt: Query for users by name, onyen, or PID from start of string
+        if len(query) < _TRIGRAM_LENGTH and _PREFIX_INDEX_ENABLED:
+            # The trigram index cannot narrow such short queries; most match many users by prefix.
+            index = _prefix_index.get(self._build_prefix_index)
+            ids = index.search(query)
+            if ids is not None:
+                entities = self._session.scalars(
+                    select(UserEntity).where(UserEntity.id.in_(ids))
+                ).all()
+                by_id = {entity.id: entity for entity in entities}
+                return [by_id[id].to_model() for id in ids if id in by_id]
+
+        prefix_match = or_(
+            func.concat(UserEntity.first_name, " ", UserEntity.last_name).istartswith(
+                query, autoescape=True
+            ),
+            UserEntity.last_name.istartswith(query, autoescape=True),
+            UserEntity.onyen.istartswith(query, autoescape=True),
+            cast(UserEntity.pid, String).startswith(query, autoescape=True),
+        )
         statement = (
             select(UserEntity)
-            .where(
-                or_(
-                    func.concat(UserEntity.first_name, " ", UserEntity.last_name).ilike(
-                        f"{query}%"
-                    ),
-                    UserEntity.last_name.ilike(f"{query}%"),
-                    UserEntity.onyen.ilike(f"{query}%"),
-                    cast(UserEntity.pid, String).ilike(f"{query}%"),
-                )
+            .where(UserEntity.search_text.contains(query.lower(), autoescape=True))
+            .order_by(
+                case((prefix_match, 0), else_=1),
+                *_SEARCH_ORDER,
             )
-            .order_by(UserEntity.first_name, UserEntity.last_name)
-            .limit(50)
+            .limit(_SEARCH_LIMIT)
         )
-        entities = self._session.execute(statement).scalars().all()
-
-        # Second attempt: match in the middle of strings and also search email
-        if len(entities) == 0:
-            statement = (
-                select(UserEntity)
-                .where(
-                    or_(
-                        func.concat(
-                            UserEntity.first_name, " ", UserEntity.last_name
-                        ).ilike(f"%{query}%"),
-                        UserEntity.last_name.ilike(f"%{query}%"),
-                        UserEntity.onyen.ilike(f"%{query}%"),
-                        UserEntity.email.ilike(f"%{query}%"),
-                        cast(UserEntity.pid, String).ilike(f"%{query}%"),
-                    )
-                )
-                .order_by(UserEntity.first_name, UserEntity.last_name)
-                .limit(50)
-            )
-            entities = self._session.execute(statement).scalars().all()
-
+        entities = self._session.scalars(statement).all()
         return [entity.to_model() for entity in entities]
 
+    def _build_prefix_index(self) -> UserPrefixIndex:
+        """Index every user by prefix, in the order search results are ranked."""
+        rows = self._session.execute(
+            select(
+                UserEntity.id,
+                UserEntity.first_name,
+                UserEntity.last_name,
+                UserEntity.onyen,
+                UserEntity.pid,
+            )
+            .order_by(*_SEARCH_ORDER)
+            .execution_options(yield_per=10_000)
+        )
+        return UserPrefixIndex(
+            (tuple(row) for row in rows), depth=_TRIGRAM_LENGTH - 1, limit=_SEARCH_LIMIT
+        )
+
     def list(
         self, subject: User, pagination_params: PaginationParams
     ) -> Paginated[User]:
@@ -207,12 +240,14 @@ class UserService:
         entity = UserEntity.from_model(user)
         self._session.add(entity)
         self._session.commit()
+        invalidate_user_prefix_index()
         return entity.to_model()
 
     def update(self, subject: User, user: User) -> User:
         """Update a User.
 
         If the subject is not the user, the subject must have the `user.update` permission.
+        Cached principals of the user are invalidated.
 
         Args:
             subject: The user performing the action.
@@ -229,4 +264,42 @@ class UserService:
         entity = self._session.get(UserEntity, user.id)
         entity.update(user)
         self._session.commit()
+        # Includes acceptance of the community agreement and linking of GitHub accounts
+        invalidate_principals(entity.id)
+        invalidate_user_prefix_index()
         return entity.to_model()
+
+
+class AsyncUserService:
+    """Asynchronous variant of `UserService.get`, which authenticates `async def` routes."""
+
+    _session: AsyncSession
+    _permission: AsyncPermissionService
+
+    def __init__(
+        self,
+        session: AsyncSession = Depends(async_db_session),
+        permission: AsyncPermissionService = Depends(),
+    ):
+        """Initialize the Async User Service."""
+        self._session = session
+        self._permission = permission
+
+    async def get(self, pid: int) -> UserDetails | None:
+        """Get a User by PID.
+
+        Args:
+            pid: The PID of the user.
+
+        Returns:
+            UserDetails | None: The user or None if not found.
+        """
+        query = select(UserEntity).where(UserEntity.pid == pid)
+        user_entity: UserEntity | None = await self._session.scalar(query)
+        if user_entity is None:
+            return None
+        user = user_entity.to_model()
+        return UserDetails(
+            **user.model_dump(),
+            permissions=await self._permission.get_permissions(user),
+        )
@@ -0,0 +1,73 @@
+"""Prefix index of users that answers the shortest user searches."""
+
+from typing import Iterable
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+
+class UserPrefixIndex:
+    """The first users, in search result order, whose full name, last name, ONYEN, or PID begins
+    with each prefix of up to `depth` characters.
+
+    Searches shorter than a trigram cannot use the trigram index of user search and match so many
+    users that ranking them in the database sorts a large fraction of the table. Every such search
+    is instead a lookup of a precomputed list of user ids, the flattened levels of a prefix trie that
+    is `depth` characters deep. Users must be indexed in the order search results are ranked, so
+    each list holds the first `limit` prefix matches without being sorted.
+    """
+
+    _depth: int
+    _limit: int
+    _users: dict[str, list[int]]
+
+    def __init__(
+        self,
+        users: Iterable[tuple[int, str, str, str, int]],
+        depth: int = 2,
+        limit: int = 50,
+    ):
+        """Index users.
+
+        Args:
+            users (Iterable[tuple[int, str, str, str, int]]): Id, first name, last name, ONYEN, and
+                PID of each user, in the order search results are ranked.
+            depth (int): The length of the longest prefix indexed.
+            limit (int): The number of users indexed for each prefix.
+        """
+        self._depth = depth
+        self._limit = limit
+        self._users = {}
+        for id, first_name, last_name, onyen, pid in users:
+            keys = (
+                f"{first_name} {last_name}".lower(),
+                last_name.lower(),
+                onyen.lower(),
+                str(pid),
+            )
+            prefixes = {key[:length] for key in keys for length in range(1, depth + 1)}
+            for prefix in prefixes:
+                if prefix == "":
+                    continue
+                matches = self._users.setdefault(prefix, [])
+                if len(matches) < limit:
+                    matches.append(id)
+
+    def search(self, prefix: str) -> list[int] | None:
+        """Look up the first users whose keys begin with a prefix.
+
+        Args:
+            prefix (str): The prefix searched for, of at most `depth` characters.
+
+        Returns:
+            list[int] | None: The ids of the first `limit` users matching the prefix, in search result
+                order, or None if fewer than `limit` users match, in which case a search must also
+                rank users who contain the prefix elsewhere.
+        """
+        if len(prefix) > self._depth:
+            return None
+        matches = self._users.get(prefix.lower())
+        if matches is None or len(matches) < self._limit:
+            return None
+        return matches
@@ -173,6 +173,21 @@ def test_subtract_availability_after_last(time: dict[str, datetime]):
     assert availability_list.availability[0].end == time[IN_THIRTY_MINUTES]
 
 
+def test_subtract_availability_between(time: dict[str, datetime]):
+    availability_list = AvailabilityList(
+        availability=[
+            TimeRange(start=time[NOW], end=time[IN_THIRTY_MINUTES]),
+            TimeRange(start=time[IN_TWO_HOURS], end=time[IN_THREE_HOURS]),
+        ]
+    )
+    availability_list.subtract(
+        TimeRange(start=time[IN_ONE_HOUR], end=time[IN_ONE_HOUR] + FIVE_MINUTES)
+    )
+    assert len(availability_list.availability) == 2
+    assert availability_list.availability[0].end == time[IN_THIRTY_MINUTES]
+    assert availability_list.availability[1].start == time[IN_TWO_HOURS]
+
+
 def test_subtract_all_availability_across_multiple(time: dict[str, datetime]):
     availability_list = AvailabilityList(
         availability=[
@@ -10,6 +10,7 @@ from ....models.academics.my_courses import (
     CourseSiteOverview,
 )
 from ....models.office_hours.course_site import CourseSite, UpdatedCourseSite
+from ....models.roster_role import RosterRole
 from ....services.academics.course_site import CourseSiteService
 from ....services.exceptions import CoursePermissionException, ResourceNotFoundException
 
@@ -84,6 +85,30 @@ def test_get_course_site_roster_filter(course_site_svc: CourseSiteService):
         assert item.last_name == filter
 
 
+def test_get_course_site_roster_pages(course_site_svc: CourseSiteService):
+    """Ensures that roster pages partition the deduplicated, role-ordered roster."""
+    roster = course_site_svc.get_course_site_roster(
+        user_data.instructor, office_hours_data.comp_110_site.id, PaginationParams()
+    )
+    assert [item.role for item in roster.items] == [
+        RosterRole.INSTRUCTOR.value,
+        RosterRole.UTA.value,
+        RosterRole.STUDENT.value,
+        RosterRole.STUDENT.value,
+    ]
+
+    pages = [
+        course_site_svc.get_course_site_roster(
+            user_data.instructor,
+            office_hours_data.comp_110_site.id,
+            PaginationParams(page=page, page_size=1),
+        )
+        for page in range(roster.length + 1)
+    ]
+    assert all(page.length == roster.length for page in pages)
+    assert [item for page in pages for item in page.items] == roster.items
+
+
 def test_get_course_site_roster_not_member(course_site_svc: CourseSiteService):
     """Ensures that non-members are unable to access course rosters."""
     pagination_params = PaginationParams()
@@ -0,0 +1,85 @@
+"""Tests for the sources and parsing of section enrollment totals."""
+
+import pytest
+
+from ....services.academics import enrollment
+from ....services.academics.enrollment import (
+    ReportsEnrollmentSource,
+    SectionEnrollmentData,
+    parse_enrollment,
+)
+
+from . import section_data
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+
+def test_parse_enrollment_in_chunks():
+    """Pages are parsed incrementally, including cards split across chunks."""
+    page = section_data.enrollment_html.encode()
+    chunks = [page[i : i + 7] for i in range(0, len(page), 7)]
+
+    assert parse_enrollment(chunks) == {
+        ("comp110", "001"): SectionEnrollmentData(enrolled=275, total_seats=300),
+        ("comp110", "002"): SectionEnrollmentData(enrolled=150, total_seats=150),
+        ("comp999", "001"): SectionEnrollmentData(enrolled=5, total_seats=10),
+    }
+
+
+def test_parse_enrollment_malformed_card():
+    """A card without available seats fails the page rather than being misread."""
+    page = b'<div class="card"><h2>COMP - 110 001</h2></div>'
+    with pytest.raises(ValueError):
+        parse_enrollment([page])
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, content: bytes = b"", headers: dict = {}):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers
+
+    def iter_content(self, chunk_size: int):
+        for i in range(0, len(self.content), chunk_size):
+            yield self.content[i : i + chunk_size]
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise Exception(f"HTTP {self.status_code}")
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def test_reports_source_conditional_requests(monkeypatch: pytest.MonkeyPatch, tmp_path):
+    """Pages are revalidated with their ETag and read from the cache when unchanged."""
+    page = section_data.enrollment_html.encode()
+    requests_headers: list[dict] = []
+    responses = [
+        FakeResponse(200, page, {"ETag": '"v1"'}),
+        FakeResponse(304),
+    ]
+
+    def get(url, headers, timeout, stream):
+        requests_headers.append(headers)
+        return responses.pop(0)
+
+    monkeypatch.setattr(enrollment.requests, "get", get)
+    source = ReportsEnrollmentSource(str(tmp_path))
+
+    first = source.fetch("2025+Fall")
+    assert not first.not_modified
+    assert parse_enrollment(first.chunks) == parse_enrollment([page])
+
+    second = source.fetch("2025+Fall")
+    assert second.not_modified
+    assert b"".join(second.chunks) == page
+    assert requests_headers == [{}, {"If-None-Match": '"v1"'}]
@@ -8,6 +8,7 @@ from ....services.academics.section_member import SectionMemberService
 from ....services import PermissionService
 from ....services.academics import TermService, CourseService, SectionService
 from ....services.academics.course_site import CourseSiteService
+from ....services.academics.enrollment import enrollment_source
 
 __authors__ = ["Ajay Gandecha"]
 __copyright__ = "Copyright 2023"
@@ -33,15 +34,25 @@ def course_svc(session: Session, permission_svc: PermissionService):
 
 
 @pytest.fixture()
-def section_svc(session: Session, permission_svc: PermissionService):
+def section_svc(
+    session: Session,
+    permission_svc: PermissionService,
+    section_member_svc: SectionMemberService,
+):
     """SectionService fixture."""
-    return SectionService(session, permission_svc)
+    return SectionService(
+        session, permission_svc, section_member_svc, enrollment_source()
+    )
 
 
 @pytest.fixture()
-def section_member_svc(session: Session, permission_svc: PermissionService):
+def section_member_svc(
+    session: Session,
+    permission_svc: PermissionService,
+    course_site_svc: CourseSiteService,
+):
     """SectionMemberService fixture."""
-    return SectionMemberService(session, permission_svc)
+    return SectionMemberService(session, permission_svc, course_site_svc)
 
 
 @pytest.fixture()
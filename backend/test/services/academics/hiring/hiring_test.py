@@ -3,6 +3,8 @@
 # PyTest
 import pytest
 from unittest.mock import create_autospec
+from sqlalchemy import event
+from sqlalchemy.orm import Session
 
 from backend.services.exceptions import (
     UserPermissionException,
@@ -16,7 +18,7 @@ from .....models.academics.hiring.application_review import (
     ApplicationReviewOverview,
     ApplicationReviewStatus,
 )
-from .....services.academics import HiringService
+from .....services.academics import HiringService, hiring
 from .....services.application import ApplicationService
 from .....services.academics.course_site import CourseSiteService
 
@@ -155,6 +157,36 @@ def test_get_hiring_admin_overview(hiring_svc: HiringService):
     assert len(hiring_admin_overview.sites) == 2
 
 
+def test_get_hiring_admin_overview_query_count(
+    hiring_svc: HiringService, session: Session
+):
+    """Ensures that the hiring admin overview is loaded with a fixed number of queries."""
+    user = user_data.root
+    term = term_data.current_term
+
+    def count_queries() -> int:
+        session.expunge_all()
+        statements: list[str] = []
+
+        def count_statement(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(session.get_bind(), "before_cursor_execute", count_statement)
+        try:
+            hiring_svc.get_hiring_admin_overview(user, term.id)
+        finally:
+            event.remove(session.get_bind(), "before_cursor_execute", count_statement)
+        return len(statements)
+
+    hiring_svc.get_hiring_admin_overview(user, term.id)
+    queries = count_queries()
+    hiring_svc.create_missing_course_sites_for_term(user, term.id)
+    overview = hiring_svc.get_hiring_admin_overview(user, term.id)
+
+    assert len(overview.sites) > 2
+    assert count_queries() == queries
+
+
 def test_get_hiring_admin_overview_checks_permission(hiring_svc: HiringService):
     """Ensures that nobody else is able to check the hiring data."""
     with pytest.raises(UserPermissionException):
@@ -303,3 +335,57 @@ def test_get_phd_applicants(hiring_svc: HiringService):
     assert len(applicants) > 0
     for applicant in applicants:
         assert applicant.program_pursued in {"PhD", "PhD (ABD)"}
+
+
+def test_iter_applicants_for_term_csv(hiring_svc: HiringService):
+    """Test that the applicant CSV rows merge each applicant's assignments and preferences."""
+    rows = list(
+        hiring_svc.iter_applicants_for_term_csv(
+            user_data.root, term_data.current_term.id
+        )
+    )
+    assert len(rows) == 5
+
+    sally = next(row for row in rows if row["first_name"] == "Sally")
+    assert sally["assignments"] == ""
+    assert sally["preferred_sections"] == "comp110.001"
+    assert sally["instructor_selections"] == "(0) comp110.001"
+
+    stewie = next(row for row in rows if row["first_name"] == "Stewie")
+    assert stewie["assignments"] == "UTA Full Time (1.0) COMP110-001 (Instructor)"
+    assert stewie["preferred_sections"] == "comp301.001, comp110.001, comp110.002"
+    assert stewie["instructor_selections"] == ""
+
+
+def test_iter_applicants_for_term_csv_queries_per_chunk(
+    hiring_svc: HiringService, session: Session, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that the applicant CSV is loaded with a fixed number of queries per chunk."""
+    rows = list(
+        hiring_svc.iter_applicants_for_term_csv(
+            user_data.root, term_data.current_term.id
+        )
+    )
+    session.expunge_all()
+
+    statements: list[str] = []
+
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    monkeypatch.setattr(hiring, "APPLICANT_CSV_CHUNK_SIZE", 2)
+    event.listen(session.get_bind(), "before_cursor_execute", count_statement)
+    try:
+        chunked_rows = list(
+            hiring_svc.iter_applicants_for_term_csv(
+                user_data.root, term_data.current_term.id
+            )
+        )
+    finally:
+        event.remove(session.get_bind(), "before_cursor_execute", count_statement)
+
+    assert chunked_rows == rows
+    # Three chunks of applications, each with at most one query for the applications, four for
+    # their assignments, one for their preferences and three for their reviews, and a final
+    # query that finds no more applications
+    assert len(statements) <= 3 * 9 + 1
@@ -548,6 +548,34 @@ Points Possible,,,,,(read only),(read only),(read only),(read only),(read only),
 "Jordan, Kris",0,89898989,kjordan,COMP301.001.S224,,,,,,,,,,,,,,,,"""
 
 
+enrollment_html = """<!DOCTYPE html>
+<html>
+<body>
+<div class="row">
+  <div class="card col">
+    <div class="card-body">
+      <h2 class="card-title">COMP - 110 001</h2>
+      <p class="card-text">Introduction to Programming &amp; Data Science</p>
+      <p class="card-available-seats">25/300 seats available</p>
+    </div>
+  </div>
+  <div class="card col">
+    <div class="card-body">
+      <h2 class="card-title">COMP - 110 002</h2>
+      <p class="card-available-seats">0/150 seats available</p>
+    </div>
+  </div>
+  <div class="card col">
+    <div class="card-body">
+      <h2 class="card-title">COMP - 999 001</h2>
+      <p class="card-available-seats">5/10 seats available</p>
+    </div>
+  </div>
+</div>
+</body>
+</html>
+"""
+
 bad_roster_csv = """Student,Assignments Current Points,Assignments Final Points,Assignments Current Score,Assignments Unposted Current Score,Assignments Final Score,Assignments Unposted Final Score,Current Points,Final Points,Current Score,Unposted Current Score,Final Score,Unposted Final Score,Current Grade,Unposted Current Grade,Final Grade,Unposted Final Grade
 Points Possible,,,,,(read only),(read only),(read only),(read only),(read only),(read only),(read only),(read only),(read only),(read only),(read only),(read only),(read only),(read only),(read only),(read only)
 "Root, Rhonda",0,999999999,,,,,,,,,,,,,,,
@@ -3,17 +3,28 @@
 import pytest
 
 from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.orm import Session
 
 from ....models.office_hours.course_site_details import CourseSiteDetails
 from ....models.academics.section_member import SectionMember
 from ....models.roster_role import RosterRole
 from ....models.pagination import PaginationParams
 
+from ....entities import UserEntity
+from ....entities.academics import SectionMemberEntity
+from ....entities.office_hours import (
+    OfficeHoursTicketEntity,
+    user_created_tickets_table,
+)
+from ....services import user as user_module
+from ....services.academics import course_site as course_site_module
+from ....services.academics.course_site import CourseSiteService
 from ....services.academics.section_member import SectionMemberService
 from ....services.exceptions import ResourceNotFoundException, CoursePermissionException
 
 # Imported fixtures provide dependencies injected for the tests as parameters.
-from .fixtures import permission_svc, section_member_svc
+from .fixtures import permission_svc, section_member_svc, course_site_svc
 
 # Import the setup_teardown fixture explicitly to load entities in database
 from ..core_data import setup_insert_data_fixture as insert_order_0
@@ -89,6 +100,183 @@ def test_create_from_csv_remove(section_member_svc: SectionMemberService):
     )
 
 
+def test_create_from_csv_remove_ticket_creator(
+    section_member_svc: SectionMemberService, session: Session
+):
+    """Students who created tickets can be removed from a roster, keeping their tickets."""
+    ticket_creator = section_data.comp110_student_1
+    response = section_member_svc.import_users_from_csv(
+        user_data.instructor,
+        section_data.comp_110_001_current_term.id,
+        csv_data=section_data.smaller_roster_csv,
+    )
+
+    assert response.removed_members == 2
+    assert session.get(SectionMemberEntity, ticket_creator.id) is None
+    assert (
+        session.scalars(
+            select(user_created_tickets_table.c.ticket_id).where(
+                user_created_tickets_table.c.member_id == ticket_creator.id
+            )
+        ).all()
+        == []
+    )
+    assert (
+        session.get(
+            OfficeHoursTicketEntity, office_hours_data.comp_110_closed_ticket.id
+        )
+        is not None
+    )
+
+
+def test_create_from_csv_dry_run(
+    section_member_svc: SectionMemberService, session: Session
+):
+    """A dry run reports the changes an import would make without making them."""
+    section_id = section_data.comp_301_001_current_term.id
+    roster_query = select(SectionMemberEntity.user_id).where(
+        SectionMemberEntity.section_id == section_id
+    )
+    roster = set(session.scalars(roster_query).all())
+
+    dry_run = section_member_svc.import_users_from_csv(
+        user_data.instructor, section_id, section_data.roster_csv, dry_run=True
+    )
+    assert dry_run.dry_run
+    assert set(session.scalars(roster_query).all()) == roster
+
+    summary = section_member_svc.import_users_from_csv(
+        user_data.instructor, section_id, section_data.roster_csv
+    )
+    assert not summary.dry_run
+    assert (
+        summary.uploaded,
+        summary.created_users,
+        summary.added_members,
+        summary.removed_members,
+    ) == (
+        dry_run.uploaded,
+        dry_run.created_users,
+        dry_run.added_members,
+        dry_run.removed_members,
+    )
+    assert summary.created_users == 2
+    assert summary.skipped == 0
+    assert "commit" in summary.timings
+
+    # Importing the same roster again makes no changes
+    repeated = section_member_svc.import_users_from_csv(
+        user_data.instructor, section_id, section_data.roster_csv
+    )
+    assert (
+        repeated.created_users,
+        repeated.added_members,
+        repeated.removed_members,
+    ) == (0, 0, 0)
+
+
+def test_create_from_csv_large_roster(
+    section_member_svc: SectionMemberService, session: Session
+):
+    """Large rosters are imported in batches, replacing the students of the section."""
+    section_id = section_data.comp_301_001_current_term.id
+    header = section_data.roster_csv.splitlines()[:2]
+    rows = [
+        f'"Student{i}, Test{i}",0,{500000000 + i},student{i},COMP301.001.S224'
+        for i in range(2500)
+    ]
+
+    summary = section_member_svc.import_users_from_csv(
+        user_data.instructor, section_id, "\n".join(header + rows)
+    )
+
+    assert summary.uploaded == 2500
+    assert summary.created_users == 2500
+    assert summary.added_members == 2500
+    assert summary.removed_members == 1
+    students = session.scalars(
+        select(UserEntity.pid)
+        .join(SectionMemberEntity)
+        .where(
+            SectionMemberEntity.section_id == section_id,
+            SectionMemberEntity.member_role == RosterRole.STUDENT,
+        )
+    ).all()
+    assert sorted(students) == [500000000 + i for i in range(2500)]
+
+
+def test_create_from_csv_warms_course_sites(
+    section_member_svc: SectionMemberService, session: Session
+):
+    """Importing a roster caches the course sites of every member of the section."""
+    section_member_svc.import_users_from_csv(
+        user_data.instructor,
+        section_data.comp_301_001_current_term.id,
+        csv_data=section_data.roster_csv,
+    )
+    new_student = session.scalars(
+        select(UserEntity).where(UserEntity.pid == 345345345)
+    ).one()
+
+    terms = course_site_module._user_course_sites.get(new_student.id)
+    assert terms is not None
+    assert [site.id for term in terms for site in term.sites] == [
+        office_hours_data.comp_301_site.id
+    ]
+
+
+def test_create_from_csv_invalidates_user_prefix_index(
+    section_member_svc: SectionMemberService,
+):
+    """Importing a roster that creates users discards the prefix index of user searches."""
+    stale = object()
+    assert user_module._prefix_index.get(lambda: stale) is stale
+
+    section_member_svc.import_users_from_csv(
+        user_data.instructor,
+        section_data.comp_301_001_current_term.id,
+        csv_data=section_data.roster_csv,
+    )
+
+    assert user_module._prefix_index.get(object) is not stale
+
+
+def test_add_section_member_invalidates_course_sites(
+    section_member_svc: SectionMemberService,
+    course_site_svc: CourseSiteService,
+    session: Session,
+):
+    """Course sites are cached per user until the user's section memberships change."""
+
+    def site_ids() -> list[int]:
+        terms = course_site_svc.get_user_course_sites(user_data.root)
+        return sorted(site.id for term in terms for site in term.sites)
+
+    assert site_ids() == []
+
+    # Writes that bypass the section member service are not observed until invalidation
+    session.add(
+        SectionMemberEntity(
+            user_id=user_data.root.id,
+            section_id=section_data.comp_110_001_current_term.id,
+            member_role=RosterRole.STUDENT,
+        )
+    )
+    session.commit()
+    assert site_ids() == []
+
+    section_member_svc.add_section_member(
+        user_data.root,
+        section_data.comp_301_001_current_term.id,
+        user_data.root.id,
+        RosterRole.STUDENT,
+    )
+    assert site_ids() == [
+        office_hours_data.comp_110_site.id,
+        office_hours_data.comp_301_site.id,
+    ]
+
+
 def test_create_from_csv_not_instructor(section_member_svc: SectionMemberService):
     with pytest.raises(CoursePermissionException):
         section_member_svc.import_users_from_csv(
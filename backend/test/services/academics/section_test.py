@@ -2,17 +2,26 @@
 
 from unittest.mock import create_autospec
 import pytest
+from sqlalchemy.orm import Session
 from backend.models.roster_role import RosterRole
 from backend.services.exceptions import (
+    CourseDataScrapingException,
     ResourceNotFoundException,
     UserPermissionException,
 )
 from backend.services.permission import PermissionService
 from ....services.academics import SectionService, SectionMemberService
+from ....services.academics import course_site as course_site_module
+from ....services.academics.course_site import CourseSiteService
+from ....services.academics.enrollment import (
+    ENROLLMENT_TERMS,
+    DirectoryEnrollmentSource,
+)
+from ....entities.academics import SectionEntity
 from ....models.academics import SectionDetails, CatalogSection
 
 # Imported fixtures provide dependencies injected for the tests as parameters.
-from .fixtures import permission_svc, section_svc, section_member_svc
+from .fixtures import permission_svc, section_svc, section_member_svc, course_site_svc
 
 # Import the setup_teardown fixture explicitly to load entities in database
 from ..core_data import setup_insert_data_fixture as insert_order_0
@@ -177,6 +186,37 @@ def test_delete_as_root(section_svc: SectionService):
     )
 
 
+def test_update_invalidates_course_sites(
+    section_svc: SectionService, course_site_svc: CourseSiteService
+):
+    """The cached courses of a section's members are discarded when the section is updated."""
+    student = section_data.user__comp110_student_0
+    course_site_svc.get_user_course_sites(student)
+    assert course_site_module._user_course_sites.get(student.id) is not None
+
+    section_svc.update(
+        user_data.root,
+        section_data.edited_comp_110.model_copy(
+            update={"id": section_data.comp_110_001_current_term.id}
+        ),
+    )
+
+    assert course_site_module._user_course_sites.get(student.id) is None
+
+
+def test_delete_invalidates_course_sites(
+    section_svc: SectionService, course_site_svc: CourseSiteService
+):
+    """Cached courses are discarded when a section is deleted."""
+    student = section_data.user__comp110_student_0
+    course_site_svc.get_user_course_sites(student)
+    assert course_site_module._user_course_sites.get(student.id) is not None
+
+    section_svc.delete(user_data.root, section_data.comp_110_001_current_term.id)
+
+    assert course_site_module._user_course_sites.get(student.id) is None
+
+
 def test_delete_as_root_not_found(section_svc: SectionService):
     permission_svc = create_autospec(PermissionService)
     section_svc._permission_svc = permission_svc
@@ -221,5 +261,73 @@ def test_user_add_section_member(section_member_svc: SectionMemberService):
         pytest.fail()
 
 
-def test_update_enrollments(section_svc: SectionService):
-    section_svc.update_enrollment_totals(user_data.root)
+def test_update_enrollments(
+    session: Session,
+    permission_svc: PermissionService,
+    section_member_svc: SectionMemberService,
+    tmp_path,
+):
+    """Enrollment totals are synced for every term with enrollment data by default."""
+    for term in ENROLLMENT_TERMS:
+        (tmp_path / f"{term}.html").write_text(section_data.enrollment_html)
+    section_svc = SectionService(
+        session,
+        permission_svc,
+        section_member_svc,
+        DirectoryEnrollmentSource(str(tmp_path)),
+    )
+
+    report = section_svc.update_enrollment_totals(user_data.root)
+
+    assert [term.term for term in report.terms] == list(ENROLLMENT_TERMS)
+    assert all(term.error is None for term in report.terms)
+
+
+def test_update_enrollments_from_directory(
+    session: Session,
+    permission_svc: PermissionService,
+    section_member_svc: SectionMemberService,
+    tmp_path,
+):
+    """Enrollment totals are synced per term, so one failing term does not fail the others."""
+    (tmp_path / "fixture.html").write_text(section_data.enrollment_html)
+    section_svc = SectionService(
+        session,
+        permission_svc,
+        section_member_svc,
+        DirectoryEnrollmentSource(str(tmp_path)),
+    )
+
+    report = section_svc.update_enrollment_totals(
+        user_data.root,
+        {"fixture": term_data.current_term.id, "missing": term_data.current_term.id},
+    )
+
+    fixture, missing = report.terms
+    assert (fixture.sections, fixture.updated, fixture.error) == (3, 2, None)
+    assert missing.error is not None
+    section = session.get(SectionEntity, section_data.comp_110_001_current_term.id)
+    session.refresh(section)
+    assert (section.enrolled, section.total_seats) == (275, 300)
+    section = session.get(SectionEntity, section_data.comp_110_002_current_term.id)
+    session.refresh(section)
+    assert (section.enrolled, section.total_seats) == (150, 150)
+
+
+def test_update_enrollments_all_terms_fail(
+    session: Session,
+    permission_svc: PermissionService,
+    section_member_svc: SectionMemberService,
+    tmp_path,
+):
+    """Enrollment syncing fails when no term can be synced."""
+    section_svc = SectionService(
+        session,
+        permission_svc,
+        section_member_svc,
+        DirectoryEnrollmentSource(str(tmp_path)),
+    )
+    with pytest.raises(CourseDataScrapingException):
+        section_svc.update_enrollment_totals(
+            user_data.root, {"missing": term_data.current_term.id}
+        )
@@ -1,12 +1,15 @@
 """Tests for the Article Service."""
 
+import asyncio
 from unittest.mock import create_autospec
 import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 from backend.services.exceptions import (
     ResourceNotFoundException,
     UserPermissionException,
 )
-from ....services import ArticleService
+from ....services import ArticleService, AsyncArticleService
+from ....services.coworking import AsyncOperatingHoursService, PolicyService
 from ....models.articles import WelcomeOverview
 from ....models.pagination import PaginationParams
 
@@ -48,6 +51,36 @@ def test_get_welcome_unauthenticated(article_svc: ArticleService):
     )
 
 
+def _get_welcome_overview_async(engine: AsyncEngine, subject) -> WelcomeOverview:
+    """Gets the welcome overview from an AsyncArticleService on its own session."""
+
+    async def get_welcome_overview():
+        async with AsyncSession(engine) as session:
+            article_svc = AsyncArticleService(
+                session, PolicyService(), AsyncOperatingHoursService(session)
+            )
+            return await article_svc.get_welcome_overview(subject)
+
+    return asyncio.run(get_welcome_overview())
+
+
+def test_get_welcome_overview_async(
+    article_svc: ArticleService, test_async_engine: AsyncEngine
+):
+    """Ensures that the async variant gets the same welcome overview for users."""
+    welcome_overview = _get_welcome_overview_async(test_async_engine, user_data.student)
+    assert welcome_overview == article_svc.get_welcome_overview(user_data.student)
+
+
+def test_get_welcome_unauthenticated_async(
+    article_svc: ArticleService, test_async_engine: AsyncEngine
+):
+    """Ensures that the async variant gets the same welcome overview for logged out users."""
+    welcome_overview = _get_welcome_overview_async(test_async_engine, None)
+    assert welcome_overview.announcement is not None
+    assert welcome_overview == article_svc.get_welcome_overview(None)
+
+
 def test_get_by_slug(article_svc: ArticleService):
     """Ensures that users can get articles."""
     article = article_svc.get_article(article_data.article_one.slug)
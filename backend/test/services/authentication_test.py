@@ -0,0 +1,181 @@
+"""Tests for the authentication of bearer and principal snapshot tokens."""
+
+import asyncio
+import jwt
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import create_autospec
+from fastapi import HTTPException
+from fastapi.security.http import HTTPAuthorizationCredentials
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+# Tested Dependencies
+from ...api import authentication
+from ...api.authentication import (
+    async_registered_user,
+    async_snapshot_user,
+    principal_snapshot_token,
+    registered_user,
+    snapshot_user,
+)
+from ...api.profile import read_principal_snapshot
+from ...models import User
+from ...services import AsyncPermissionService, AsyncUserService, UserService
+
+# Data Setup and Injected Service Fixtures
+from .core_data import setup_insert_data_fixture
+from .fixtures import user_svc_integration
+
+# Data Models for Fake Data Inserted in Setup
+from .user_data import ambassador
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+
+def _bearer(token: str) -> HTTPAuthorizationCredentials:
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+def _encode(claims: dict, secret: str = authentication._JWT_SECRET) -> str:
+    return jwt.encode(claims, secret, algorithm=authentication._JST_ALGORITHM)
+
+
+def test_snapshot_user_without_database():
+    """A principal snapshot token resolves to the user it embeds without querying the database."""
+    user_svc = create_autospec(UserService)
+    token = principal_snapshot_token(ambassador)
+
+    assert snapshot_user(user_svc, _bearer(token)) == ambassador
+    user_svc.get.assert_not_called()
+
+
+def test_read_principal_snapshot():
+    """The profile route issues a snapshot token that embeds the subject."""
+    token = read_principal_snapshot(ambassador)
+    claims = jwt.decode(
+        token,
+        authentication._JWT_SECRET,
+        algorithms=[authentication._JST_ALGORITHM],
+    )
+    assert User.model_validate(claims[authentication._PRINCIPAL_CLAIM]) == ambassador
+
+
+def test_snapshot_user_expired():
+    """An expired principal snapshot token is unauthorized."""
+    user_svc = create_autospec(UserService)
+    token = _encode(
+        {
+            "uid": ambassador.onyen,
+            "pid": ambassador.pid,
+            authentication._PRINCIPAL_CLAIM: ambassador.model_dump(mode="json"),
+            "exp": datetime.now() - timedelta(minutes=1),
+        }
+    )
+
+    with pytest.raises(HTTPException) as error:
+        snapshot_user(user_svc, _bearer(token))
+    assert error.value.status_code == 401
+    user_svc.get.assert_not_called()
+
+
+def test_snapshot_user_tampered():
+    """A principal snapshot token not signed with the secret is unauthorized."""
+    user_svc = create_autospec(UserService)
+    token = _encode(
+        {
+            "uid": ambassador.onyen,
+            "pid": ambassador.pid,
+            authentication._PRINCIPAL_CLAIM: ambassador.model_dump(mode="json"),
+            "exp": datetime.now() + timedelta(minutes=1),
+        },
+        secret="not the secret",
+    )
+
+    with pytest.raises(HTTPException) as error:
+        snapshot_user(user_svc, _bearer(token))
+    assert error.value.status_code == 401
+    user_svc.get.assert_not_called()
+
+
+def test_snapshot_user_malformed_principal():
+    """A principal snapshot token embedding an invalid user is unauthorized."""
+    user_svc = create_autospec(UserService)
+    token = _encode(
+        {
+            "uid": ambassador.onyen,
+            "pid": ambassador.pid,
+            authentication._PRINCIPAL_CLAIM: {"pid": "not a pid"},
+            "exp": datetime.now() + timedelta(minutes=1),
+        }
+    )
+
+    with pytest.raises(HTTPException) as error:
+        snapshot_user(user_svc, _bearer(token))
+    assert error.value.status_code == 401
+
+
+def test_snapshot_user_falls_back_to_registered_user(
+    user_svc_integration: UserService,
+):
+    """An ordinary bearer token is authenticated as by `registered_user`."""
+    token = authentication._generate_token(ambassador.onyen, ambassador.pid)
+
+    subject = snapshot_user(user_svc_integration, _bearer(token))
+    assert subject == registered_user(user_svc_integration, _bearer(token))
+    assert subject.id == ambassador.id
+    assert subject.permissions == user_svc_integration.get(ambassador.pid).permissions
+
+
+def test_async_snapshot_user_without_database():
+    """The async variant resolves a principal snapshot token without querying the database."""
+    user_svc = create_autospec(AsyncUserService)
+    token = principal_snapshot_token(ambassador)
+
+    assert asyncio.run(async_snapshot_user(user_svc, _bearer(token))) == ambassador
+    user_svc.get.assert_not_called()
+
+
+def test_async_registered_user(
+    user_svc_integration: UserService, test_async_engine: AsyncEngine
+):
+    """The async variant loads the user a bearer token authenticates, as `registered_user` does."""
+    token = authentication._generate_token(ambassador.onyen, ambassador.pid)
+
+    async def authenticate():
+        async with AsyncSession(test_async_engine) as session:
+            user_svc = AsyncUserService(session, AsyncPermissionService(session))
+            return await async_registered_user(user_svc, _bearer(token))
+
+    subject = asyncio.run(authenticate())
+    assert subject.id == ambassador.id
+    assert subject == user_svc_integration.get(ambassador.pid)
+
+
+def test_async_registered_user_cached(user_svc_integration: UserService):
+    """Users authenticated by `registered_user` are shared with the async variant."""
+    token = authentication._generate_token(ambassador.onyen, ambassador.pid)
+    subject = registered_user(user_svc_integration, _bearer(token))
+    user_svc = create_autospec(AsyncUserService)
+
+    assert asyncio.run(async_registered_user(user_svc, _bearer(token))) == subject
+    user_svc.get.assert_not_called()
+
+
+def test_async_registered_user_invalid_token():
+    """The async variant rejects a token not signed with the secret."""
+    user_svc = create_autospec(AsyncUserService)
+    token = _encode(
+        {
+            "uid": ambassador.onyen,
+            "pid": ambassador.pid,
+            "exp": datetime.now() + timedelta(minutes=1),
+        },
+        secret="not the secret",
+    )
+
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(async_registered_user(user_svc, _bearer(token)))
+    assert error.value.status_code == 401
+    user_svc.get.assert_not_called()
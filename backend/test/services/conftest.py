@@ -3,12 +3,15 @@
 import pytest
 
 from sqlalchemy import create_engine, text, Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import NullPool
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import OperationalError, ProgrammingError
 
 from ...database import _engine_str
 from ...env import getenv
 from ... import entities
+from ...services.cache import clear_caches
 
 POSTGRES_DATABASE = f"{getenv('POSTGRES_DATABASE')}_test"
 POSTGRES_USER = getenv("POSTGRES_USER")
@@ -47,10 +50,19 @@ def test_engine() -> Engine:
     return create_engine(_engine_str(POSTGRES_DATABASE))
 
 
+@pytest.fixture(scope="session")
+def test_async_engine(test_engine: Engine) -> AsyncEngine:
+    # Tests run each coroutine in its own event loop, and asyncpg connections cannot outlive theirs.
+    return create_async_engine(
+        _engine_str(POSTGRES_DATABASE, "postgresql+asyncpg"), poolclass=NullPool
+    )
+
+
 @pytest.fixture(scope="function")
 def session(test_engine: Engine):
     entities.EntityBase.metadata.drop_all(test_engine)
     entities.EntityBase.metadata.create_all(test_engine)
+    clear_caches()
     session = Session(test_engine)
     try:
         yield session
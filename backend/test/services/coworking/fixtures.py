@@ -13,7 +13,9 @@ from ....services.coworking import (
     ReservationService,
     PolicyService,
     StatusService,
+    ReservationLifecycleService,
 )
+from ....services.coworking.checkin_leaderboard import CheckinLeaderboardService
 
 __authors__ = [
     "Kris Jordan",
@@ -70,6 +72,18 @@ def reservation_svc(
     )
 
 
+@pytest.fixture()
+def reservation_lifecycle_svc(session: Session, policy_svc: PolicyService):
+    """ReservationLifecycleService fixture."""
+    return ReservationLifecycleService(session, policy_svc)
+
+
+@pytest.fixture()
+def checkin_leaderboard_svc(session: Session):
+    """CheckinLeaderboardService fixture."""
+    return CheckinLeaderboardService(session)
+
+
 @pytest.fixture()
 def status_svc():
     policies_mock = create_autospec(PolicyService)
@@ -1,8 +1,11 @@
 """Tests for Coworking Operating Hours Service."""
 
 from unittest.mock import create_autospec, call
+from sqlalchemy import event
+from sqlalchemy.orm import Session
 
 from ....services.coworking import OperatingHoursService
+from ....services.coworking.operating_hours_calendar import OperatingHoursCalendar
 from ....models.coworking import OperatingHours, TimeRange
 from ....services.coworking.exceptions import OperatingHoursCannotOverlapException
 from ....services import PermissionService
@@ -55,14 +58,68 @@ def test_schedule_multiple_match(
     assert result[1].id == operating_hours_data.future.id
 
 
+def test_schedule_cached(
+    session: Session,
+    operating_hours_svc: OperatingHoursService,
+    time: dict[str, datetime],
+):
+    """Repeated schedule lookups are answered without querying the database."""
+    operating_hours_svc.schedule(TimeRange(start=time[NOW], end=time[IN_ONE_HOUR]))
+    statements: list[str] = []
+
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(session.get_bind(), "before_cursor_execute", count_statement)
+    try:
+        result = operating_hours_svc.schedule(
+            TimeRange(start=time[TOMORROW], end=time[TOMORROW] + ONE_DAY)
+        )
+    finally:
+        event.remove(session.get_bind(), "before_cursor_execute", count_statement)
+
+    assert [operating_hours.id for operating_hours in result] == [
+        operating_hours_data.tomorrow.id,
+        operating_hours_data.future.id,
+    ]
+    assert len(statements) == 0
+
+
+def test_calendar_overlapping_entries(time: dict[str, datetime]):
+    """Entries that overlap one another are each found by lookups within them."""
+    calendar = OperatingHoursCalendar(
+        [
+            OperatingHours(
+                id=3, start=time[NOW] + 5 * ONE_HOUR, end=time[NOW] + 6 * ONE_HOUR
+            ),
+            OperatingHours(id=1, start=time[NOW], end=time[NOW] + 10 * ONE_HOUR),
+            OperatingHours(
+                id=2, start=time[NOW] + ONE_HOUR, end=time[NOW] + 2 * ONE_HOUR
+            ),
+        ]
+    )
+
+    def ids(start: datetime, end: datetime) -> list[int | None]:
+        return [
+            entry.id for entry in calendar.schedule(TimeRange(start=start, end=end))
+        ]
+
+    assert ids(time[NOW] + 3 * ONE_HOUR, time[NOW] + 4 * ONE_HOUR) == [1]
+    assert ids(time[NOW] + 2 * ONE_HOUR, time[NOW] + 5 * ONE_HOUR) == [1, 2, 3]
+    assert ids(time[NOW] + 10 * ONE_HOUR, time[NOW] + 11 * ONE_HOUR) == [1]
+    assert ids(time[NOW] - ONE_HOUR, time[NOW] - ONE_HOUR / 2) == []
+
+
 def test_create(operating_hours_svc: OperatingHoursService, time: dict[str, datetime]):
     """Creating an Operating Hours entity expected case."""
     time_range = TimeRange(
         start=time[TOMORROW] + timedelta(days=5),
         end=time[TOMORROW] + timedelta(days=5, hours=2),
     )
+    assert operating_hours_svc.schedule(time_range) == []
     result: OperatingHours = operating_hours_svc.create(user_data.root, time_range)
     assert result.id is not None
+    assert operating_hours_svc.schedule(time_range) == [result]
 
 
 def test_create_overlap(operating_hours_svc: OperatingHoursService):
@@ -99,9 +156,11 @@ def test_delete(operating_hours_svc: OperatingHoursService):
     """Delete an Operating Hours entity expected case."""
     future = operating_hours_svc.get_by_id(operating_hours_data.future.id)  # type: ignore
     assert future.id is not None
+    assert future in operating_hours_svc.schedule(future)
     operating_hours_svc.delete(user_data.root, future)
     with pytest.raises(ResourceNotFoundException):
         future = operating_hours_svc.get_by_id(operating_hours_data.future.id)  # type: ignore
+    assert future not in operating_hours_svc.schedule(future)
 
 
 def test_delete_permissions(operating_hours_svc: OperatingHoursService):
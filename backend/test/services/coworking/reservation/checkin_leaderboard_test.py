@@ -0,0 +1,157 @@
+"""CheckinLeaderboardService tests"""
+
+import pytest
+from datetime import date
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from .....entities.coworking import CheckinMonthlyTotalEntity
+from .....models.coworking import ReservationState
+from .....models.coworking.reservation import ReservationPartial
+from .....services.coworking import ReservationService, ReservationLifecycleService
+from .....services.coworking.checkin_leaderboard import (
+    CheckinLeaderboardService,
+    month_of,
+)
+
+# Imported fixtures provide dependencies injected for the tests as parameters.
+from ..fixtures import (
+    checkin_leaderboard_svc,
+    reservation_svc,
+    reservation_lifecycle_svc,
+    permission_svc,
+    seat_svc,
+    policy_svc,
+    operating_hours_svc,
+)
+from ..time import *
+
+# Import the setup_teardown fixture explicitly to load entities in database.
+# The order in which these fixtures run is dependent on their imported alias.
+# Since there are relationship dependencies between the entities, order matters.
+from ...core_data import setup_insert_data_fixture as insert_order_0
+from ..operating_hours_data import fake_data_fixture as insert_order_1
+from ...room_data import fake_data_fixture as insert_order_2
+from ..seat_data import fake_data_fixture as insert_order_3
+from .reservation_data import fake_data_fixture as insert_order_4
+
+# Import the fake model data in a namespace for test assertions
+from ...core_data import user_data
+from . import reservation_data
+
+__authors__ = ["Will Zahrt", "Andrew Lockard"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+
+def _totals(session: Session) -> dict[tuple[int, date], float]:
+    return {
+        (total.user_id, total.month): total.seconds
+        for total in session.scalars(
+            select(CheckinMonthlyTotalEntity).execution_options(populate_existing=True)
+        )
+    }
+
+
+def _length(reservation) -> float:
+    return (reservation.end - reservation.start).total_seconds()
+
+
+def test_rebuild(session: Session):
+    """The test data is totaled from its checked out reservations."""
+    checked_out = reservation_data.reservation_2
+    assert _totals(session) == {
+        (user_data.ambassador.id, month_of(checked_out.end)): _length(checked_out)
+    }
+
+
+def test_rebuild_since(
+    session: Session, checkin_leaderboard_svc: CheckinLeaderboardService
+):
+    """Only the months since the given month are recomputed."""
+    checked_out = reservation_data.reservation_2
+    month = month_of(checked_out.end)
+    session.add(
+        CheckinMonthlyTotalEntity(
+            user_id=user_data.user.id, month=date(2020, 1, 1), seconds=60
+        )
+    )
+    session.execute(
+        delete(CheckinMonthlyTotalEntity).where(
+            CheckinMonthlyTotalEntity.month == month
+        )
+    )
+
+    checkin_leaderboard_svc.rebuild(since=month)
+
+    assert _totals(session) == {
+        (user_data.user.id, date(2020, 1, 1)): 60,
+        (user_data.ambassador.id, month): _length(checked_out),
+    }
+
+
+def test_change_reservation_checkout_records_total(
+    session: Session, reservation_svc: ReservationService
+):
+    """Checking out a reservation adds its length to the total of its user."""
+    reservation = reservation_svc.change_reservation(
+        user_data.user, ReservationPartial(id=1, state=ReservationState.CHECKED_OUT)
+    )
+    assert _totals(session)[
+        (user_data.user.id, month_of(reservation.end))
+    ] == pytest.approx(_length(reservation))
+
+
+def test_sweep_records_total(
+    session: Session, reservation_lifecycle_svc: ReservationLifecycleService
+):
+    """Reservations checked out by the sweep are added to the totals of their users."""
+    reservation = reservation_data.reservation_1
+    reservation_lifecycle_svc.sweep(reservation.end)
+    assert _totals(session)[
+        (user_data.user.id, month_of(reservation.end))
+    ] == pytest.approx(_length(reservation))
+
+    # A reservation is only totaled once, when it transitions
+    reservation_lifecycle_svc.sweep(reservation.end)
+    assert _totals(session)[
+        (user_data.user.id, month_of(reservation.end))
+    ] == pytest.approx(_length(reservation))
+
+
+def test_record_checked_out_accumulates(
+    session: Session, checkin_leaderboard_svc: CheckinLeaderboardService
+):
+    """Recording another reservation of a user in the same month adds to their total."""
+    checked_out = reservation_data.reservation_2
+    checkin_leaderboard_svc.record_checked_out([checked_out.id])
+    assert _totals(session)[
+        (user_data.ambassador.id, month_of(checked_out.end))
+    ] == pytest.approx(2 * _length(checked_out))
+
+
+def test_top_users(
+    session: Session, checkin_leaderboard_svc: CheckinLeaderboardService
+):
+    """Users are ranked by their totals in the month, up to the limit."""
+    month = date(2020, 1, 1)
+    for user, seconds in [
+        (user_data.user, 60),
+        (user_data.root, 180),
+        (user_data.ambassador, 120),
+    ]:
+        session.add(
+            CheckinMonthlyTotalEntity(user_id=user.id, month=month, seconds=seconds)
+        )
+    session.add(
+        CheckinMonthlyTotalEntity(
+            user_id=user_data.user.id, month=date(2020, 2, 1), seconds=600
+        )
+    )
+    session.flush()
+
+    top_users = checkin_leaderboard_svc.top_users(month, 2)
+    assert [user.id for user in top_users] == [
+        user_data.root.id,
+        user_data.ambassador.id,
+    ]
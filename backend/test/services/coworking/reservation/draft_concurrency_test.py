@@ -0,0 +1,208 @@
+"""ReservationService#draft_reservation tests under concurrent requests"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import Engine, create_engine, func, select
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy.pool import NullPool
+
+from .....entities import UserEntity
+from .....entities.coworking import ReservationEntity, reservation_seat_table
+from .....models.coworking import ReservationRequest, ReservationState
+from .....models.coworking.seat import SeatIdentity
+from .....models.user import User, UserIdentity
+from .....services import PermissionService
+from .....services.coworking import (
+    OperatingHoursService,
+    PolicyService,
+    ReservationService,
+    SeatService,
+)
+from .....services.coworking.reservation import ReservationException
+
+from ..time import *
+
+# Import the setup_teardown fixture explicitly to load entities in database.
+# The order in which these fixtures run is dependent on their imported alias.
+# Since there are relationship dependencies between the entities, order matters.
+from ...core_data import setup_insert_data_fixture as insert_order_0
+from ..operating_hours_data import fake_data_fixture as insert_order_1
+from ...room_data import fake_data_fixture as insert_order_2
+from ..seat_data import fake_data_fixture as insert_order_3
+from .reservation_data import fake_data_fixture as insert_order_4
+
+# Import the fake model data in a namespace for test assertions
+from .. import seat_data
+from ... import room_data
+from . import reservation_data
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2023-24"
+__license__ = "MIT"
+
+DRAFTS = 200
+CONCURRENCY = 50
+
+
+def _insert_users(session: Session, count: int) -> list[User]:
+    """Inserts users that may each make a reservation."""
+    users = [
+        User(
+            id=1000 + i,
+            pid=700000000 + i,
+            onyen=f"walkin{i}",
+            email=f"walkin{i}@unc.edu",
+            first_name="Walk",
+            last_name=f"In {i}",
+            accepted_community_agreement=True,
+        )
+        for i in range(count)
+    ]
+    for user in users:
+        session.add(UserEntity.from_model(user))
+    session.commit()
+    return users
+
+
+def _draft_concurrently(
+    test_engine: Engine, requests: list[tuple[User, ReservationRequest]]
+) -> list[int | None]:
+    """Drafts each request in its own session and thread, returning the drafted IDs."""
+    engine = create_engine(test_engine.url, poolclass=NullPool)
+
+    def draft(user: User, request: ReservationRequest) -> int | None:
+        with Session(engine) as session:
+            permission_svc = PermissionService(session)
+            reservation_svc = ReservationService(
+                session,
+                permission_svc,
+                PolicyService(),
+                OperatingHoursService(session, permission_svc),
+                SeatService(session),
+            )
+            try:
+                return reservation_svc.draft_reservation(user, request).id
+            except ReservationException:
+                return None
+
+    try:
+        with ThreadPoolExecutor(max_workers=CONCURRENCY) as pool:
+            futures = [pool.submit(draft, user, request) for user, request in requests]
+            return [future.result() for future in futures]
+    finally:
+        engine.dispose()
+
+
+def _overlapping_seat_reservations(session: Session) -> int:
+    """Counts pairs of active reservations that overlap on a seat."""
+    first, second = aliased(ReservationEntity), aliased(ReservationEntity)
+    first_seat, second_seat = (
+        reservation_seat_table.alias(),
+        reservation_seat_table.alias(),
+    )
+    active = [ReservationState.CANCELLED, ReservationState.CHECKED_OUT]
+    return session.scalar(
+        select(func.count())
+        .select_from(first)
+        .join(first_seat, first_seat.c.reservation_id == first.id)
+        .join(second_seat, second_seat.c.seat_id == first_seat.c.seat_id)
+        .join(second, second.id == second_seat.c.reservation_id)
+        .where(
+            first.id < second.id,
+            first.start < second.end,
+            second.start < first.end,
+            first.state.not_in(active),
+            second.state.not_in(active),
+        )
+    )
+
+
+def test_concurrent_walkin_drafts_never_double_book(
+    session: Session, test_engine: Engine, time: dict[str, datetime]
+):
+    """Simultaneous walk-in drafts for the same seats are each given a distinct seat or refused."""
+    users = _insert_users(session, DRAFTS)
+    seats = [SeatIdentity(id=seat.id) for seat in seat_data.seats]
+    requests = [
+        (
+            user,
+            ReservationRequest(
+                start=time[NOW],
+                end=time[IN_TWO_HOURS],
+                users=[UserIdentity(id=user.id)],
+                seats=seats,
+            ),
+        )
+        for user in users
+    ]
+
+    drafted = [id for id in _draft_concurrently(test_engine, requests) if id]
+
+    assert 0 < len(drafted) <= len(seats)
+    assert _overlapping_seat_reservations(session) == 0
+
+    # Each seat's copy of its reservation's time and state is kept by the database
+    rows = session.execute(
+        select(reservation_seat_table, ReservationEntity).join(
+            ReservationEntity,
+            ReservationEntity.id == reservation_seat_table.c.reservation_id,
+        )
+    ).all()
+    for row in rows:
+        reservation: ReservationEntity = row.ReservationEntity
+        assert (row.start, row.end, row.state) == (
+            reservation.start,
+            reservation.end,
+            reservation.state,
+        )
+
+
+def test_concurrent_room_drafts_book_room_once(
+    session: Session, test_engine: Engine, time: dict[str, datetime]
+):
+    """Of simultaneous drafts for the same room and time, exactly one succeeds."""
+    users = _insert_users(session, DRAFTS // 2)
+    start = reservation_data.reservation_6.end + ONE_HOUR
+    requests = [
+        (
+            user,
+            ReservationRequest(
+                start=start,
+                end=start + ONE_HOUR,
+                users=[UserIdentity(id=user.id)],
+                seats=[],
+                room=room_data.group_a,
+            ),
+        )
+        for user in users
+    ]
+
+    drafted = [id for id in _draft_concurrently(test_engine, requests) if id]
+
+    assert len(drafted) == 1
+
+
+def test_cancelled_seat_reservation_frees_seat(session: Session):
+    """State changes to a reservation are copied to its seats, releasing them when cancelled."""
+    reservation = session.get(ReservationEntity, reservation_data.reservation_4.id)
+    reservation.state = ReservationState.CANCELLED
+    session.commit()
+
+    states = session.scalars(
+        select(reservation_seat_table.c.state).where(
+            reservation_seat_table.c.reservation_id == reservation.id
+        )
+    ).all()
+    assert states == [ReservationState.CANCELLED] * len(reservation.seats)
+
+    # The same seats may be reserved again at the same time
+    rebooked = ReservationEntity(
+        state=ReservationState.DRAFT,
+        start=reservation.start,
+        end=reservation.end,
+        walkin=False,
+        users=[],
+        seats=list(reservation.seats),
+    )
+    session.add(rebooked)
+    session.commit()
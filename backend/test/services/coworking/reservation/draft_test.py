@@ -2,7 +2,9 @@
 
 import pytest
 from unittest.mock import create_autospec
+from sqlalchemy.orm import Session
 
+from .....entities.coworking import ReservationEntity, SeatEntity
 from .....services import PermissionService
 from .....services.coworking import ReservationService
 from .....services.coworking.reservation import ReservationException
@@ -416,6 +418,81 @@ def test_draft_reservation_different_room_time_conflict(
     assert reservation.id is not None
 
 
+def test_draft_reservation_room_expired_draft_not_swept(
+    session: Session, reservation_svc: ReservationService, time: dict[str, datetime]
+):
+    """Drafts that have timed out, but have yet to be swept, do not keep a room from being
+    reserved despite its exclusion constraint."""
+    start = reservation_data.reservation_6.end + ONE_HOUR
+    stale = ReservationEntity(
+        state=ReservationState.DRAFT,
+        start=start,
+        end=start + ONE_HOUR,
+        walkin=False,
+        room_id=room_data.group_a.id,
+        users=[],
+        seats=[],
+        created_at=time[AN_HOUR_AGO],
+    )
+    session.add(stale)
+    session.commit()
+
+    reservation = reservation_svc.draft_reservation(
+        user_data.ambassador,
+        ReservationRequest(
+            seats=[],
+            room=room_data.group_a,
+            start=start,
+            end=start + ONE_HOUR,
+            users=[user_data.ambassador],
+        ),
+    )
+    assert reservation.id is not None
+    session.refresh(stale)
+    assert stale.state == ReservationState.CANCELLED
+
+
+def test_draft_reservation_seat_expired_draft_not_swept(
+    session: Session, reservation_svc: ReservationService, time: dict[str, datetime]
+):
+    """Drafts that have timed out, but have yet to be swept, do not keep a seat from being
+    reserved despite its exclusion constraint."""
+    start = operating_hours_data.future.start
+    end = start + ONE_HOUR
+    stale = [
+        ReservationEntity(
+            state=ReservationState.DRAFT,
+            start=start,
+            end=end,
+            walkin=False,
+            users=[],
+            seats=[session.get(SeatEntity, seat.id)],
+            created_at=time[AN_HOUR_AGO],
+        )
+        for seat in seat_data.reservable_seats
+    ]
+    session.add_all(stale)
+    session.commit()
+
+    reservation = reservation_svc.draft_reservation(
+        user_data.ambassador,
+        reservation_data.test_request(
+            {
+                "seats": [
+                    SeatIdentity(**seat.model_dump())
+                    for seat in seat_data.reservable_seats
+                ],
+                "start": start,
+                "end": end,
+            }
+        ),
+    )
+    assert reservation.id is not None
+    for entity in stale:
+        session.refresh(entity)
+    assert ReservationState.CANCELLED in [entity.state for entity in stale]
+
+
 def test_draft_reservation_crosses_weekly_limit(
     reservation_svc: ReservationService, time: dict[str, datetime]
 ):
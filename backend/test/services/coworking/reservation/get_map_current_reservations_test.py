@@ -5,6 +5,7 @@ from backend.models.coworking.reservation import ReservationState
 from datetime import date, time as Time
 
 from .....services.coworking import ReservationService, PolicyService
+from .....services.coworking.room_availability import RoomAvailabilityGrid
 
 # Imported fixtures provide dependencies injected for the tests as parameters.
 # Dependent fixtures (seat_svc) are required to be imported in the testing module.
@@ -43,7 +44,7 @@ __copyright__ = "Copyright 2023-24"
 __license__ = "MIT"
 
 
-def test_transform_date_map_for_unavailable_simple(reservation_svc: ReservationService):
+def test_grid_unavailable_simple():
     """
     Validates the transformation of the date map to indicate unavailable time slots.
 
@@ -54,76 +55,63 @@ def test_transform_date_map_for_unavailable_simple(reservation_svc: ReservationS
     accurately reflects these unavailable slots, enhancing the user experience by
     preventing double bookings.
     """
+    grid = RoomAvailabilityGrid(["SN135", "SN137", "SN139"], 4)
+    grid.reserve("SN137", 2, 4, by_subject=True)
 
-    sample_date_map_1 = {
-        "SN135": [0, 0, 0, 0],
-        "SN137": [0, 0, 4, 4],
-        "SN139": [0, 0, 0, 0],
-    }
-
-    expected_transformed_date_map_1 = {
+    expected_date_map_1 = {
         "SN135": [0, 0, 3, 3],
         "SN137": [0, 0, 4, 4],
         "SN139": [0, 0, 3, 3],
     }
 
-    reservation_svc._transform_date_map_for_unavailable(sample_date_map_1)
-    assert sample_date_map_1 == expected_transformed_date_map_1
+    assert grid.to_date_map() == expected_date_map_1
 
 
-def test_transform_date_map_for_unavailable_complex(
-    reservation_svc: ReservationService,
-):
-    sample_date_map_2 = {
-        "SN135": [0, 0, 0, 0, 0, 0, 1, 1, 1, 1],
-        "SN137": [0, 0, 1, 1, 4, 4, 4, 4, 0, 0],
-        "SN139": [0, 4, 4, 1, 1, 0, 0, 0, 0, 0],
-    }
+def test_grid_unavailable_complex():
+    grid = RoomAvailabilityGrid(["SN135", "SN137", "SN139"], 10)
+    grid.reserve("SN135", 6, 10, by_subject=False)
+    grid.reserve("SN137", 2, 4, by_subject=False)
+    grid.reserve("SN137", 4, 8, by_subject=True)
+    grid.reserve("SN139", 1, 3, by_subject=True)
+    grid.reserve("SN139", 3, 5, by_subject=False)
 
-    expected_transformed_date_map_2 = {
+    expected_date_map_2 = {
         "SN135": [0, 3, 3, 0, 3, 3, 1, 1, 1, 1],
         "SN137": [0, 3, 1, 1, 4, 4, 4, 4, 0, 0],
         "SN139": [0, 4, 4, 1, 1, 3, 3, 3, 0, 0],
     }
 
-    reservation_svc._transform_date_map_for_unavailable(sample_date_map_2)
-    assert expected_transformed_date_map_2 == sample_date_map_2
+    assert grid.to_date_map() == expected_date_map_2
 
 
-def test_transform_date_map_for_office_hours(
-    reservation_svc: ReservationService, policy_svc: PolicyService
-):
+def test_grid_clips_to_bounds():
+    """Tests that reservations extending beyond the grid only mark slots within it."""
+    grid = RoomAvailabilityGrid(["SN135", "SN137"], 4)
+    grid.reserve("SN135", -2, 1, by_subject=False)
+    grid.reserve("SN135", 3, 8, by_subject=False)
+    grid.reserve("SN137", 5, 6, by_subject=True)
+    grid.reserve("SN999", 0, 4, by_subject=True)
+
+    assert grid.to_date_map() == {"SN135": [1, 0, 0, 1], "SN137": [0, 0, 0, 0]}
+
+
+def test_grid_office_hours():
     """Tests to make sure that office hours events in rooms
     are marked unavailable (3)"""
-    policy_svc.office_hours = MagicMock(
-        return_value={
-            "SN135": [],
-            "SN137": [(Time(hour=15), Time(hour=16))],
-            "SN139": [],
-            "SN141": [(Time(hour=10), Time(hour=16))],
-            "SN144": [],
-            "SN146": [],
-            "SN147": [],
-        }
-    )
-    date = datetime(year=2024, month=5, day=1)
-    start = datetime(year=2024, month=5, day=1, hour=10, minute=0)
-    reserved_date_map = {
-        "SN135": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-        "SN137": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-        "SN141": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    }
+    grid = RoomAvailabilityGrid(["SN135", "SN137", "SN141"], 16)
+    grid.reserve("SN137", 9, 11, by_subject=False)
+    grid.reserve("SN141", 11, 13, by_subject=True)
+    grid.block_for_office_hours("SN137", 10, 12)
+    grid.block_for_office_hours("SN139", 0, 16)
+    grid.block_for_office_hours("SN141", 0, 12)
 
-    expected_transformed_date_map = {
-        "SN135": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-        "SN137": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 3, 0, 0, 0, 0],
-        "SN141": [3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 0, 0, 0, 0],
+    expected_date_map = {
+        "SN135": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 3, 0, 0, 0],
+        "SN137": [0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 3, 3, 3, 0, 0, 0],
+        "SN141": [3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 4, 0, 0, 0],
     }
 
-    reservation_svc._transform_date_map_for_officehours(
-        date, reserved_date_map, start, 16
-    )
-    assert reserved_date_map == expected_transformed_date_map
+    assert grid.to_date_map() == expected_date_map
 
 
 def test_idx_calculation(reservation_svc: ReservationService):
@@ -163,16 +151,26 @@ def test_round_idx_calculation_2(reservation_svc: ReservationService):
     assert rounded_down.hour == 10 and rounded_down.minute == 30
 
 
-def test_query_confirmed_reservations_by_date_and_room(
+def test_query_reserved_times_by_date(
     reservation_svc: ReservationService, time: dict[str, datetime]
 ):
-    """Test getting all reservations for a particular date."""
-    reservations = reservation_svc._query_confirmed_reservations_by_date_and_room(
-        time[NOW] + timedelta(days=2), "SN135"
+    """Test getting all room reservations for a particular date."""
+    reserved_times = reservation_svc._query_reserved_times_by_date(
+        time[NOW] + timedelta(days=2), user_data.user, ["SN135", "SN137"]
+    )
+    assert reserved_times == [
+        (
+            "SN135",
+            reservation_data.reservation_6.start,
+            reservation_data.reservation_6.end,
+            True,
+        )
+    ]
+
+    reserved_times = reservation_svc._query_reserved_times_by_date(
+        time[NOW] + timedelta(days=2), user_data.root, ["SN135", "SN137"]
     )
-    assert len(reservations) == 1
-    assert reservations[0].id == 6
-    assert reservations[0].room.id == "SN135"
+    assert [by_subject for *_, by_subject in reserved_times] == [False]
 
 
 def test_get_reservable_rooms(reservation_svc: ReservationService):
@@ -183,14 +181,18 @@ def test_get_reservable_rooms(reservation_svc: ReservationService):
     assert rooms[3].id == "SN141" and rooms[3].reservable is True
 
 
-def test_query_xl_reservations_by_date_for_user(
+def test_query_reserved_times_by_date_xl(
     reservation_svc: ReservationService, time: dict[str, datetime]
 ):
-    reservations = reservation_svc._query_xl_reservations_by_date_for_user(
-        time[NOW], user_data.user
+    """Test that only the subject's own XL reservations are included."""
+    reserved_times = reservation_svc._query_reserved_times_by_date(
+        time[NOW], user_data.user, []
     )
-    assert reservations[0].room is None
-    assert reservations[0].users[0].first_name == "Sally"
+    assert len(reserved_times) == 1
+    room_id, start, _, by_subject = reserved_times[0]
+    assert room_id is None
+    assert start == reservation_data.reservation_1.start
+    assert by_subject
 
 
 def test_get_map_reserved_times_by_date(
@@ -4,6 +4,7 @@ import pytest
 from sqlalchemy import text, select
 from sqlalchemy.orm import Session
 from .....entities.coworking import ReservationEntity
+from .....services.coworking.checkin_leaderboard import CheckinLeaderboardService
 from .....models.coworking import Reservation, ReservationState, ReservationRequest
 from .....models.user import UserIdentity
 from .....models.coworking.seat import SeatIdentity
@@ -203,6 +204,10 @@ def insert_fake_data(session: Session, time: dict[str, datetime]):
         session, ReservationEntity, ReservationEntity.id, len(reservations) + 1
     )
 
+    # Total checked out reservations for the leaderboard
+    session.flush()
+    CheckinLeaderboardService(session).rebuild()
+
 
 def delete_future_data(session: Session, time: dict[str, datetime]):
     reservations = session.scalars(
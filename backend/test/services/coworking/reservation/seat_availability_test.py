@@ -1,6 +1,7 @@
 """ReservationService#seat_availability tests"""
 
 from .....services.coworking import ReservationService, PolicyService
+from .....services.coworking.seat_availability_index import SeatAvailabilityIndex
 from .....models.coworking import (
     TimeRange,
 )
@@ -145,3 +146,50 @@ def test_seat_availability_xl_closing_soon(
     )
     available_seats = reservation_svc.seat_availability(seat_data.seats, near_closing)
     assert len(available_seats) == 0
+
+
+def test_seat_availability_for_bounds(
+    reservation_svc: ReservationService, time: dict[str, datetime]
+):
+    """Availability for several bounds at once matches availability for each bounds alone."""
+    bounds_list = [
+        TimeRange(start=time[NOW], end=time[IN_TEN_MINUTES]),
+        TimeRange(start=time[THIRTY_MINUTES_AGO], end=time[NOW]),
+        TimeRange(
+            start=operating_hours_data.today.end - THIRTY_MINUTES - FIVE_MINUTES,
+            end=operating_hours_data.today.end + FIVE_MINUTES,
+        ),
+    ]
+    results = reservation_svc.seat_availability_for_bounds(
+        seat_data.reservable_seats, bounds_list
+    )
+    assert len(results) == 3
+    assert len(results[0]) == len(seat_data.reservable_seats) - 1
+    assert len(results[1]) == 0
+    assert len(results[2]) == len(seat_data.reservable_seats)
+    for seat in results[2]:
+        assert seat.availability[0].start == reservation_data.reservation_4.end
+
+
+def test_seat_availability_index():
+    """Busy intervals are merged and subtracted from each open range."""
+    t = datetime(2024, 1, 1, 10)
+    index = SeatAvailabilityIndex(
+        [
+            (1, t + ONE_HOUR, t + 2 * ONE_HOUR),
+            (1, t + ONE_HOUR + THIRTY_MINUTES, t + 3 * ONE_HOUR),
+            (1, t + 5 * ONE_HOUR, t + 7 * ONE_HOUR),
+            (2, t - ONE_HOUR, t + ONE_HOUR),
+        ]
+    )
+    open_ranges = [(t, t + 4 * ONE_HOUR), (t + 6 * ONE_HOUR, t + 8 * ONE_HOUR)]
+    assert index.available(1, open_ranges) == [
+        (t, t + ONE_HOUR),
+        (t + 3 * ONE_HOUR, t + 4 * ONE_HOUR),
+        (t + 7 * ONE_HOUR, t + 8 * ONE_HOUR),
+    ]
+    assert index.available(2, open_ranges) == [
+        (t + ONE_HOUR, t + 4 * ONE_HOUR),
+        (t + 6 * ONE_HOUR, t + 8 * ONE_HOUR),
+    ]
+    assert index.available(3, open_ranges) == open_ranges
@@ -1,33 +1,20 @@
-"""ReservationService#_state_transition tests"""
+"""ReservationLifecycleService tests"""
 
+import asyncio
 import pytest
-from unittest.mock import create_autospec
-
-from .....services import PermissionService, UserPermissionException
-from .....services.coworking import ReservationService, PolicyService
-from .....services.coworking.reservation import ReservationException
-from .....models.coworking import (
-    Reservation,
-    TimeRange,
-    ReservationState,
-    ReservationPartial,
-)
-from .....models.user import UserIdentity
-from .....models.coworking.seat import SeatIdentity
+from unittest.mock import create_autospec, patch
+
+from .....services.coworking import PolicyService, ReservationLifecycleService
+from .....services.coworking import reservation_lifecycle
+from .....models.coworking import ReservationState
 
 # Some internal methods use SQLAlchemy layer and are tested here
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from .....entities.coworking import ReservationEntity
 
 # Imported fixtures provide dependencies injected for the tests as parameters.
-# Dependent fixtures (seat_svc) are required to be imported in the testing module.
-from ..fixtures import (
-    reservation_svc,
-    permission_svc,
-    seat_svc,
-    policy_svc,
-    operating_hours_svc,
-)
+from ..fixtures import reservation_lifecycle_svc, policy_svc
 from ..time import *
 
 # Import the setup_teardown fixture explicitly to load entities in database.
@@ -40,9 +27,6 @@ from ..seat_data import fake_data_fixture as insert_order_3
 from .reservation_data import fake_data_fixture as insert_order_4
 
 # Import the fake model data in a namespace for test assertions
-from ...core_data import user_data
-from .. import operating_hours_data
-from .. import seat_data
 from . import reservation_data
 
 __authors__ = ["Kris Jordan"]
@@ -50,105 +34,144 @@ __copyright__ = "Copyright 2023"
 __license__ = "MIT"
 
 
-def test_state_transition_reservation_entities_by_time_noop(
-    session: Session, reservation_svc: ReservationService, time: dict[str, datetime]
-):
-    entities: list[ReservationEntity] = [
-        session.get(ReservationEntity, reservation.id)
-        for reservation in reservation_data.active_reservations
-    ]
-    collected = reservation_svc._state_transition_reservation_entities_by_time(
-        time[NOW], entities
-    )
-    assert collected is not entities
-    assert collected == entities
+def _state(session: Session, id: int) -> ReservationState:
+    return session.get(ReservationEntity, id, populate_existing=True).state
 
 
-def test_state_transition_reservation_entities_by_time_expired_active(
-    session: Session, reservation_svc: ReservationService
-):
-    entities: list[ReservationEntity] = [
-        session.get(ReservationEntity, reservation.id)
-        for reservation in reservation_data.active_reservations
-    ]
-    cutoff = entities[0].end
-    collected = reservation_svc._state_transition_reservation_entities_by_time(
-        cutoff, entities
+def _unexpired_ids(
+    session: Session, lifecycle_svc: ReservationLifecycleService, cutoff: datetime
+) -> set[int]:
+    return set(
+        session.scalars(
+            select(ReservationEntity.id).where(lifecycle_svc.unexpired(cutoff))
+        )
     )
 
-    assert len(collected) == len(entities) - 1
-    reservation = session.get(ReservationEntity, entities[0].id, populate_existing=True)
-    assert reservation.state == ReservationState.CHECKED_OUT
+
+def test_sweep_noop(
+    session: Session,
+    reservation_lifecycle_svc: ReservationLifecycleService,
+    time: dict[str, datetime],
+):
+    reservation_lifecycle_svc.sweep(time[NOW])
+    for reservation in reservation_data.active_reservations:
+        assert _state(session, reservation.id) == reservation.state
 
 
-def test_state_transition_reservation_entities_by_time_active_draft(
-    session: Session, reservation_svc: ReservationService, policy_svc: PolicyService
+def test_sweep_expired_active(
+    session: Session, reservation_lifecycle_svc: ReservationLifecycleService
 ):
-    entities: list[ReservationEntity] = [
-        session.get(ReservationEntity, reservation.id)
-        for reservation in reservation_data.draft_reservations
-    ]
-    cutoff = entities[0].created_at + policy_svc.reservation_draft_timeout()
-    collected = reservation_svc._state_transition_reservation_entities_by_time(
-        cutoff, entities
+    reservation = reservation_data.active_reservations[0]
+    assert reservation.state == ReservationState.CHECKED_IN
+    cutoff = reservation.end
+
+    assert reservation.id not in _unexpired_ids(
+        session, reservation_lifecycle_svc, cutoff
     )
-    assert len(collected) == len(entities)
-    assert collected[0].state == ReservationState.DRAFT
+    assert _state(session, reservation.id) == ReservationState.CHECKED_IN
 
+    assert reservation_lifecycle_svc.sweep(cutoff) >= 1
+    assert _state(session, reservation.id) == ReservationState.CHECKED_OUT
 
-def test_state_transition_reservation_entities_by_time_expired_draft(
-    session: Session, reservation_svc: ReservationService, policy_svc: PolicyService
+
+def test_sweep_active_draft(
+    session: Session,
+    reservation_lifecycle_svc: ReservationLifecycleService,
+    policy_svc: PolicyService,
 ):
+    entity = session.get(ReservationEntity, reservation_data.draft_reservations[0].id)
+    cutoff = entity.created_at + policy_svc.reservation_draft_timeout()
+
+    assert entity.id in _unexpired_ids(session, reservation_lifecycle_svc, cutoff)
+    reservation_lifecycle_svc.sweep(cutoff)
+    assert _state(session, entity.id) == ReservationState.DRAFT
+
+
+def test_sweep_expired_draft(session: Session, policy_svc: PolicyService):
     policy_mock = create_autospec(PolicyService)
     policy_mock.reservation_draft_timeout.return_value = (
         policy_svc.reservation_draft_timeout()
     )
-    reservation_svc._policy_svc = policy_mock
+    policy_mock.reservation_checkin_timeout.return_value = (
+        policy_svc.reservation_checkin_timeout()
+    )
+    lifecycle_svc = ReservationLifecycleService(session, policy_mock)
 
-    entities: list[ReservationEntity] = [
-        session.get(ReservationEntity, reservation.id)
-        for reservation in reservation_data.draft_reservations
-    ]
+    entity = session.get(ReservationEntity, reservation_data.draft_reservations[0].id)
     cutoff = (
-        entities[0].created_at
+        entity.created_at
         + policy_svc.reservation_draft_timeout()
         + timedelta(seconds=1)
     )
-    collected = reservation_svc._state_transition_reservation_entities_by_time(
-        cutoff, entities
-    )
-    assert len(collected) == len(entities) - 1
 
-    reservation = session.get(ReservationEntity, entities[0].id, populate_existing=True)
-    assert reservation.state == ReservationState.CANCELLED
+    assert entity.id not in _unexpired_ids(session, lifecycle_svc, cutoff)
+    lifecycle_svc.sweep(cutoff)
+    assert _state(session, entity.id) == ReservationState.CANCELLED
 
-    policy_mock.reservation_draft_timeout.assert_called_once()
+    # Once for the read criteria and once for the sweep
+    assert policy_mock.reservation_draft_timeout.call_count == 2
 
 
-def test_state_transition_reservation_entities_by_time_checkin_timeout(
-    session: Session, reservation_svc: ReservationService, policy_svc: PolicyService
+def test_sweep_checkin_timeout(
+    session: Session,
+    reservation_lifecycle_svc: ReservationLifecycleService,
+    policy_svc: PolicyService,
 ):
-    policy_mock = create_autospec(PolicyService)
-    policy_mock.reservation_checkin_timeout.return_value = (
-        policy_svc.reservation_checkin_timeout()
-    )
-    reservation_svc._policy_svc = policy_mock
-
-    entities: list[ReservationEntity] = [
+    # The room reservation is confirmed and starts later
+    entities = [
         session.get(ReservationEntity, reservation.id)
         for reservation in reservation_data.confirmed_reservations
+        + reservation_data.room_reservations
     ]
     cutoff = (
         entities[0].start
         + policy_svc.reservation_checkin_timeout()
         + timedelta(seconds=1)
     )
-    collected = reservation_svc._state_transition_reservation_entities_by_time(
-        cutoff, entities
+
+    unexpired = _unexpired_ids(session, reservation_lifecycle_svc, cutoff)
+    assert entities[0].id not in unexpired
+    assert entities[1].id in unexpired
+
+    reservation_lifecycle_svc.sweep(cutoff)
+    assert _state(session, entities[0].id) == ReservationState.CANCELLED
+    assert _state(session, entities[1].id) == ReservationState.CONFIRMED
+
+
+def test_unexpired_does_not_write(
+    session: Session, reservation_lifecycle_svc: ReservationLifecycleService
+):
+    cutoff = reservation_data.active_reservations[0].end + ONE_DAY
+    _unexpired_ids(session, reservation_lifecycle_svc, cutoff)
+    session.rollback()
+    assert (
+        _state(session, reservation_data.active_reservations[0].id)
+        == ReservationState.CHECKED_IN
     )
-    assert len(collected) == len(entities) - 1
 
-    reservation = session.get(ReservationEntity, entities[0].id, populate_existing=True)
-    assert reservation.state == ReservationState.CANCELLED
 
-    policy_mock.reservation_checkin_timeout.assert_called_once()
+def test_sweep_periodically_uses_clock():
+    times = [datetime(2024, 1, 1, 12), datetime(2024, 1, 1, 12, 1)]
+    clock = iter(times)
+    swept: list[datetime] = []
+
+    async def scenario():
+        sweeper = asyncio.create_task(
+            reservation_lifecycle.sweep_periodically(
+                timedelta(seconds=0), lambda: next(clock)
+            )
+        )
+        while len(swept) < len(times):
+            await asyncio.sleep(0.01)
+        sweeper.cancel()
+
+    def sweep(now: datetime) -> int:
+        swept.append(now)
+        if len(swept) == 1:
+            raise RuntimeError("Sweeps continue after a failure")
+        return 0
+
+    with patch.object(reservation_lifecycle, "sweep_reservations", sweep):
+        asyncio.run(scenario())
+
+    assert swept == times
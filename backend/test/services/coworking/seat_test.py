@@ -1,7 +1,11 @@
 """Tests for Coworking Rooms Service."""
 
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
 from ....services.coworking import SeatService
 from ....models.coworking import SeatDetails
+from ....models.coworking.seat import SeatIdentity
 
 # Imported fixtures provide dependencies injected for the tests as parameters.
 from .fixtures import seat_svc
@@ -12,6 +16,7 @@ from .seat_data import fake_data_fixture as insert_seat_fake_data
 
 # Import the fake model data in a namespace for test assertions
 from . import seat_data
+from .. import room_data
 
 __authors__ = ["Kris Jordan"]
 __copyright__ = "Copyright 2023"
@@ -22,3 +27,40 @@ def test_list(seat_svc: SeatService):
     seats = seat_svc.list()
     assert len(seats) == len(seat_data.seats)
     assert isinstance(seats[0], SeatDetails)
+
+
+def test_list_cached(session: Session, seat_svc: SeatService):
+    """Seats are listed from the floorplan without querying the database again."""
+    seat_svc.list()
+    statements: list[str] = []
+
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(session.get_bind(), "before_cursor_execute", count_statement)
+    try:
+        seats = seat_svc.list()
+    finally:
+        event.remove(session.get_bind(), "before_cursor_execute", count_statement)
+
+    assert [seat.id for seat in seats] == sorted(seat.id for seat in seat_data.seats)
+    assert len(statements) == 0
+
+
+def test_floorplan_get_seats(seat_svc: SeatService):
+    """Seats are looked up by id in the order they are identified, skipping unknown ids."""
+    seats = seat_svc.floorplan().get_seats(
+        [
+            SeatIdentity(id=seat_data.monitor_seat_01.id),
+            SeatIdentity(id=404),
+            SeatIdentity(id=seat_data.monitor_seat_00.id),
+        ]
+    )
+    assert seats == [seat_data.monitor_seat_01, seat_data.monitor_seat_00]
+
+
+def test_floorplan_rooms(seat_svc: SeatService):
+    """Rooms of the floorplan include their seats."""
+    rooms = {room.id: room for room in seat_svc.floorplan().rooms}
+    assert len(rooms) == len(room_data.rooms)
+    assert len(rooms[room_data.the_xl.id].seats) == len(seat_data.seats)
@@ -1,7 +1,25 @@
 """Test coworking StatusService"""
 
-from .fixtures import status_svc
-from ....services.coworking.status import StatusService
+import asyncio
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from .fixtures import (
+    status_svc,
+    reservation_svc,
+    permission_svc,
+    seat_svc,
+    policy_svc,
+    operating_hours_svc,
+)
+from ....services.coworking import (
+    AsyncOperatingHoursService,
+    AsyncReservationService,
+    AsyncSeatService,
+    PolicyService,
+    ReservationService,
+    SeatService,
+)
+from ....services.coworking.status import StatusService, AsyncStatusService
 from ....models.coworking.availability import SeatAvailability
 from datetime import timedelta
 
@@ -59,3 +77,32 @@ def test_status_dispatch(status_svc: StatusService):
     assert status.my_reservations == [reservation_data.reservation_1]
     assert status.seat_availability == seat_availability
     assert status.operating_hours == [operating_hours_data.today]
+
+
+def test_async_status(
+    reservation_svc: ReservationService,
+    seat_svc: SeatService,
+    test_async_engine: AsyncEngine,
+):
+    """The async variant computes the status from the database on an async connection."""
+
+    async def get_status():
+        async with AsyncSession(test_async_engine) as session:
+            operating_hours_svc = AsyncOperatingHoursService(session)
+            return await AsyncStatusService(
+                PolicyService(),
+                operating_hours_svc,
+                AsyncSeatService(session),
+                AsyncReservationService(session, PolicyService(), operating_hours_svc),
+            ).get_coworking_status(user_data.user)
+
+    status = asyncio.run(get_status())
+    assert len(status.my_reservations) > 0
+    assert status.my_reservations == reservation_svc.get_current_reservations_for_user(
+        user_data.user, user_data.user
+    )
+    assert len(status.seat_availability) > 0
+    assert {seat.id for seat in status.seat_availability} <= {
+        seat.id for seat in seat_svc.list()
+    }
+    assert status.operating_hours[0] == operating_hours_data.today
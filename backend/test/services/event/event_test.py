@@ -1,7 +1,9 @@
 """Tests for the EventService class."""
 
 # PyTest
+import asyncio
 import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 from unittest.mock import create_autospec
 from backend.models.pagination import PaginationParams
 
@@ -18,7 +20,7 @@ from ..coworking.time import *
 
 # Tested Dependencies
 from ....models import EventDraft, EventOverview, EventPaginationParams
-from ....services import EventService
+from ....services import EventService, AsyncEventService
 
 # Injected Service Fixtures
 from ..fixtures import (
@@ -90,6 +92,94 @@ def test_list_filter(event_svc_integration: EventService):
     assert len(fetched_events.items) == 1
 
 
+def test_list_async(
+    event_svc_integration: EventService, test_async_engine: AsyncEngine
+):
+    """Test that the async variant produces the same paginated list of events."""
+    pagination_params = EventPaginationParams(order_by="id", filter="Workshop")
+
+    async def list_events():
+        async with AsyncSession(test_async_engine) as session:
+            return await AsyncEventService(session).get_paginated_events(
+                pagination_params, ambassador
+            )
+
+    assert asyncio.run(list_events()) == event_svc_integration.get_paginated_events(
+        pagination_params, ambassador
+    )
+
+
+def test_list_filter_by_organization(event_svc_integration: EventService):
+    """Test that events can be filtered by the name or slug of their organization."""
+    for filter in ("social good", "CSSG"):
+        pagination_params = EventPaginationParams(filter=filter)
+        fetched_events = event_svc_integration.get_paginated_events(
+            pagination_params, ambassador
+        )
+        assert fetched_events.length == len(events)
+
+
+def test_list_by_cursor(event_svc_integration: EventService):
+    """Test that paging through events by cursor visits each event once, by start time."""
+    pagination_params = EventPaginationParams(page_size=2, cursor="")
+    visited = []
+    while pagination_params.cursor is not None:
+        fetched_events = event_svc_integration.get_paginated_events(
+            pagination_params, ambassador
+        )
+        assert fetched_events.length == len(events)
+        visited.extend(event.id for event in fetched_events.items)
+        pagination_params = pagination_params.model_copy(
+            update={"cursor": fetched_events.next_cursor}
+        )
+
+    # Events two and three start at the same time, so are ordered by id
+    assert visited == [event_one.id, event_two.id, event_three.id]
+
+
+def test_list_by_cursor_descending(event_svc_integration: EventService):
+    """Test that events can be paged through by cursor in descending order of start time."""
+    pagination_params = EventPaginationParams(page_size=2, cursor="", ascending="false")
+    first_page = event_svc_integration.get_paginated_events(
+        pagination_params, ambassador
+    )
+    assert [event.id for event in first_page.items] == [event_three.id, event_two.id]
+
+    pagination_params.cursor = first_page.next_cursor
+    second_page = event_svc_integration.get_paginated_events(
+        pagination_params, ambassador
+    )
+    assert [event.id for event in second_page.items] == [event_one.id]
+    assert second_page.next_cursor is None
+
+
+def test_list_by_malformed_cursor(event_svc_integration: EventService):
+    """Test that a malformed cursor is rejected."""
+    pagination_params = EventPaginationParams(cursor="not a cursor")
+    with pytest.raises(ValueError):
+        event_svc_integration.get_paginated_events(pagination_params, ambassador)
+
+
+def test_list_estimated_count(
+    event_svc_integration: EventService, test_async_engine: AsyncEngine
+):
+    """Test that the length of a list of events can be estimated rather than counted."""
+    pagination_params = EventPaginationParams(filter="Workshop", cursor="", count=False)
+    fetched_events = event_svc_integration.get_paginated_events(
+        pagination_params, ambassador
+    )
+    assert len(fetched_events.items) == 1
+    assert fetched_events.length >= 0
+
+    async def list_events():
+        async with AsyncSession(test_async_engine) as session:
+            return await AsyncEventService(session).get_paginated_events(
+                pagination_params, ambassador
+            )
+
+    assert asyncio.run(list_events()).length == fetched_events.length
+
+
 def test_create_enforces_permission(event_svc_integration: EventService):
     """Test that the service enforces permissions when attempting to create an event."""
 
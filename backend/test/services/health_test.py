@@ -2,11 +2,23 @@
 
 # Tested Dependencies
 from ...services.health import HealthService
+from ...services.permission import PermissionService
+from ...services.exceptions import UserPermissionException
+from ...database import MeteredQueuePool, PoolMetrics
+from ...env import getenv
 
 # Library Requirements
+import pytest
+import threading
+import time
 from datetime import datetime, timezone
+from sqlalchemy import Engine, create_engine
 from sqlalchemy.orm import Session
 
+# Data Setup and Injected Service Fixtures
+from .core_data import setup_insert_data_fixture
+from . import user_data
+
 __authors__ = ["Kris Jordan"]
 __copyright__ = "Copyright 2023"
 __license__ = "MIT"
@@ -17,3 +29,53 @@ def test_health_check(session: Session):
     now = str(datetime.now(tz=timezone.utc))[:16]
     result = health_service.check()
     assert f"OK @ {now}" in health_service.check()
+
+
+def test_get_pool_status(session: Session):
+    health_service = HealthService(session, PermissionService(session))
+    pools = health_service.get_pool_status(user_data.root)
+    assert pools.database_pool.size == int(getenv("POSTGRES_POOL_SIZE", "5"))
+    assert pools.database_pool.overflow >= 0
+
+
+def test_get_pool_status_not_permitted(session: Session):
+    health_service = HealthService(session, PermissionService(session))
+    with pytest.raises(UserPermissionException):
+        health_service.get_pool_status(user_data.user)
+
+
+def test_pool_status_counts_checkouts(session: Session, test_engine: Engine):
+    metered_engine = create_engine(test_engine.url, poolclass=MeteredQueuePool)
+    metrics = PoolMetrics(metered_engine)
+    with metered_engine.connect():
+        with metered_engine.connect():
+            ...
+    with metered_engine.connect():
+        ...
+    status = HealthService(session).pool_status(metered_engine.pool, metrics)
+    metered_engine.dispose()
+    assert status.checkouts == 3
+    assert status.checkins == 3
+    assert status.connections_opened == 2
+    assert status.checked_in == 2
+    assert status.checked_out == 0
+    assert status.checkout_seconds_max <= status.checkout_seconds_total
+
+
+def test_pool_status_times_checkout_waits(session: Session, test_engine: Engine):
+    metered_engine = create_engine(
+        test_engine.url, poolclass=MeteredQueuePool, pool_size=1, max_overflow=0
+    )
+    metrics = PoolMetrics(metered_engine)
+    # A second checkout waits until the only connection of the pool is returned
+    held = metered_engine.connect()
+    waiter = threading.Thread(target=lambda: metered_engine.connect().close())
+    waiter.start()
+    time.sleep(0.2)
+    held.close()
+    waiter.join()
+    status = HealthService(session).pool_status(metered_engine.pool, metrics)
+    metered_engine.dispose()
+    assert status.checkouts == 2
+    assert status.checkout_wait_seconds_max >= 0.2
+    assert status.checkout_wait_seconds_max <= status.checkout_wait_seconds_total
@@ -8,6 +8,8 @@ from ....services.office_hours.office_hours_recurrence import (
     OfficeHoursRecurrenceService,
 )
 from ....services import PermissionService
+from ....services.office_hours.queue_hub import OfficeHoursQueueHub
+from ....services.office_hours.site_access import CourseSiteAccessService
 from ....services.office_hours import (
     OfficeHourTicketService,
     OfficeHoursService,
@@ -31,6 +33,12 @@ def oh_svc(session: Session):
     return OfficeHoursService(session)
 
 
+@pytest.fixture()
+def site_access_svc(session: Session):
+    """CourseSiteAccessService fixture."""
+    return CourseSiteAccessService(session)
+
+
 @pytest.fixture()
 def oh_svc_mock():
     """This mocks the OfficeHoursEventService class to avoid testing its implementation here."""
@@ -38,9 +46,15 @@ def oh_svc_mock():
 
 
 @pytest.fixture()
-def oh_ticket_svc(session: Session):
+def oh_queue_hub_mock():
+    """This mocks the OfficeHoursQueueHub class to observe published queue updates."""
+    return create_autospec(OfficeHoursQueueHub)
+
+
+@pytest.fixture()
+def oh_ticket_svc(session: Session, oh_queue_hub_mock: OfficeHoursQueueHub):
     """OfficeHoursEventService fixture."""
-    return OfficeHourTicketService(session)
+    return OfficeHourTicketService(session, oh_queue_hub_mock)
 
 
 @pytest.fixture()
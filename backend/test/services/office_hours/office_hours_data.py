@@ -4,6 +4,7 @@ import pytest
 from datetime import datetime, date, timedelta
 from sqlalchemy.orm import Session
 from ...services.reset_table_id_seq import reset_table_id_seq
+from ....services.office_hours.ticket_rollup import OfficeHoursTicketRollupService
 
 from ....test.services import user_data, room_data
 from ..academics import section_data
@@ -438,6 +439,11 @@ def insert_fake_data(session: Session):
 
     session.commit()
 
+    # Step 6: Roll up closed tickets for statistics
+    OfficeHoursTicketRollupService(session).rebuild()
+
+    session.commit()
+
 
 @pytest.fixture(autouse=True)
 def fake_data_fixture(session: Session):
@@ -1,7 +1,13 @@
 """Tests for the OfficeHoursRecurrenceService."""
 
 import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session
 
+from ....entities.office_hours import (
+    OfficeHoursTicketDailyRollupEntity,
+    OfficeHoursTicketEntity,
+)
 from ....services.exceptions import (
     CoursePermissionException,
     RecurringOfficeHourEventException,
@@ -9,6 +15,7 @@ from ....services.exceptions import (
 )
 
 from ....services.office_hours import OfficeHoursRecurrenceService
+from ....services.office_hours.ticket_rollup import OfficeHoursTicketRollupService
 
 # Imported fixtures provide dependencies injected for the tests as parameters.
 from .fixtures import oh_svc_mock, oh_recurrence_svc
@@ -30,6 +37,22 @@ __copyright__ = "Copyright 2024"
 __license__ = "MIT"
 
 
+def _rollups(session: Session) -> list[tuple]:
+    """The ticket counts of the rollup table, in a comparable form."""
+    rollup = OfficeHoursTicketDailyRollupEntity
+    return [
+        tuple(row)
+        for row in session.execute(
+            select(
+                rollup.course_site_id,
+                rollup.day,
+                rollup.caller_id,
+                rollup.ticket_count,
+            ).order_by(rollup.course_site_id, rollup.day, rollup.caller_id)
+        )
+    ]
+
+
 def test_create_recurring_oh_event_instructor(
     oh_recurrence_svc: OfficeHoursRecurrenceService,
 ):
@@ -151,6 +174,32 @@ def test_delete_recurring_oh_event_instructor(
     )
 
 
+def test_delete_recurring_oh_event_updates_rollups(
+    session: Session, oh_recurrence_svc: OfficeHoursRecurrenceService
+):
+    """Ensures that deleting recurring events removes their tickets from the rollups."""
+    closed_ticket = office_hours_data.comp_110_closed_ticket.model_copy(
+        update={
+            "id": None,
+            "office_hours_id": office_hours_data.third_recurring_event.id,
+        }
+    )
+    session.add(OfficeHoursTicketEntity.from_model(closed_ticket))
+    OfficeHoursTicketRollupService(session).rebuild()
+    before = _rollups(session)
+
+    oh_recurrence_svc.delete_recurring(
+        user_data.instructor,
+        office_hours_data.comp_110_site.id,
+        office_hours_data.second_recurring_event.id,
+    )
+
+    incremental = _rollups(session)
+    assert incremental != before
+    OfficeHoursTicketRollupService(session).rebuild()
+    assert _rollups(session) == incremental
+
+
 def test_delete_recurring_oh_event_not_found(
     oh_recurrence_svc: OfficeHoursRecurrenceService,
 ):
@@ -1,7 +1,10 @@
 """Tests for the OfficeHoursStatisticsService."""
 
 import pytest
+from datetime import datetime, timedelta
 from pytest import approx
+from sqlalchemy import select
+from sqlalchemy.orm import Session
 
 from ....services.exceptions import (
     CoursePermissionException,
@@ -9,11 +12,21 @@ from ....services.exceptions import (
     ResourceNotFoundException,
 )
 
-from ....services.office_hours import OfficeHoursStatisticsService
+from ....entities.office_hours import (
+    OfficeHoursTicketDailyRollupEntity,
+    OfficeHoursTicketEntity,
+)
+from ....services.office_hours import (
+    OfficeHoursService,
+    OfficeHoursStatisticsService,
+    OfficeHourTicketService,
+)
+from ....services.office_hours import office_hours_statistics
+from ....services.office_hours.ticket_rollup import OfficeHoursTicketRollupService
 from ....models.pagination import TicketPaginationParams
 
 # Imported fixtures provide dependencies injected for the tests as parameters.
-from .fixtures import oh_statistics_svc
+from .fixtures import oh_statistics_svc, oh_svc, oh_ticket_svc, oh_queue_hub_mock
 
 # Import the setup_teardown fixture explicitly to load entities in database
 from ..core_data import setup_insert_data_fixture as insert_order_0
@@ -338,7 +351,7 @@ def test_get_ticket_csv(
         ticket_params,
     )
 
-    assert len(ticket_csv) == 3
+    assert len(list(ticket_csv)) == 3
 
 
 def test_get_ticket_csv_unauthenticated(
@@ -377,4 +390,135 @@ def test_get_ticket_csv_with_filters(
         ticket_params,
     )
 
-    assert len(ticket_csv) == 3
+    assert len(list(ticket_csv)) == 3
+
+
+def test_get_ticket_csv_streams_in_batches(
+    oh_statistics_svc: OfficeHoursStatisticsService,
+    session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Ensures that the CSV rows are the same when tickets are fetched one at a time."""
+    ticket_params = TicketPaginationParams(
+        range_start="",
+        range_end="",
+        student_ids=[],
+        staff_ids=[],
+    )
+    expected = list(
+        oh_statistics_svc.get_ticket_csv(
+            user_data.instructor, office_hours_data.comp_110_site.id, ticket_params
+        )
+    )
+
+    monkeypatch.setattr(office_hours_statistics, "CSV_BATCH_SIZE", 1)
+    ticket_csv = oh_statistics_svc.get_ticket_csv(
+        user_data.instructor, office_hours_data.comp_110_site.id, ticket_params
+    )
+
+    rows = []
+    for row in ticket_csv:
+        rows.append(row)
+        # Only the ticket being converted is held by the session
+        tickets = [
+            entity
+            for entity in session.identity_map.values()
+            if isinstance(entity, OfficeHoursTicketEntity)
+        ]
+        assert len(tickets) <= 1
+    assert rows == expected
+
+
+def _rollups(session: Session) -> list[tuple]:
+    """The contents of the rollup table, in a comparable form."""
+    rollup = OfficeHoursTicketDailyRollupEntity
+    return [
+        tuple(row)
+        for row in session.execute(
+            select(
+                rollup.course_site_id,
+                rollup.day,
+                rollup.caller_id,
+                rollup.ticket_count,
+                rollup.conceptual_count,
+                rollup.assignment_count,
+                rollup.wait_count,
+                rollup.duration_count,
+            ).order_by(rollup.course_site_id, rollup.day, rollup.caller_id)
+        )
+    ]
+
+
+def test_get_statistics_after_close(
+    session: Session,
+    oh_statistics_svc: OfficeHoursStatisticsService,
+    oh_ticket_svc: OfficeHourTicketService,
+):
+    """Ensures that closing a ticket updates the rollups statistics are served from."""
+    oh_ticket_svc.close_ticket(
+        user_data.instructor,
+        office_hours_data.comp_110_called_ticket.id,
+        office_hours_data.sample_delete_payload,
+    )
+    ticket_params = TicketPaginationParams(
+        range_start="", range_end="", student_ids=[], staff_ids=[]
+    )
+
+    statistics = oh_statistics_svc.get_statistics(
+        user_data.instructor, office_hours_data.comp_110_site.id, ticket_params
+    )
+
+    assert statistics.total_tickets == 4
+    assert statistics.total_assignment == 1
+    incremental = _rollups(session)
+    OfficeHoursTicketRollupService(session).rebuild()
+    assert _rollups(session) == incremental
+
+
+def test_delete_office_hours_updates_rollups(
+    session: Session, oh_svc: OfficeHoursService
+):
+    """Ensures that deleting an office hours event removes its tickets from the rollups."""
+    oh_svc.delete(
+        user_data.instructor,
+        office_hours_data.comp_110_site.id,
+        office_hours_data.comp_110_current_office_hours.id,
+    )
+    incremental = _rollups(session)
+    OfficeHoursTicketRollupService(session).rebuild()
+    assert _rollups(session) == incremental
+
+
+def test_get_statistics_partial_day_range(
+    oh_statistics_svc: OfficeHoursStatisticsService,
+):
+    """Ensures that ranges starting or ending within a day count that day's tickets exactly."""
+    now = datetime.now()
+    before_tickets = TicketPaginationParams(
+        range_start=(now - timedelta(days=1)).isoformat(),
+        range_end=(now - timedelta(minutes=5)).isoformat(),
+        student_ids=[],
+        staff_ids=[],
+    )
+    after_tickets = TicketPaginationParams(
+        range_start=(now + timedelta(seconds=1)).isoformat(),
+        range_end=(now + timedelta(days=1)).isoformat(),
+        student_ids=[],
+        staff_ids=[],
+    )
+    around_tickets = TicketPaginationParams(
+        range_start=(now - timedelta(minutes=5)).isoformat(),
+        range_end=(now + timedelta(seconds=1)).isoformat(),
+        student_ids=[],
+        staff_ids=[],
+    )
+
+    for ticket_params, expected in [
+        (before_tickets, 0),
+        (after_tickets, 0),
+        (around_tickets, 3),
+    ]:
+        statistics = oh_statistics_svc.get_statistics(
+            user_data.instructor, office_hours_data.comp_110_site.id, ticket_params
+        )
+        assert statistics.total_tickets == expected
@@ -1,13 +1,22 @@
 """Tests for the OfficeHoursService."""
 
 import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import event, insert
+from sqlalchemy.orm import Session
 
+from ....entities.office_hours import OfficeHoursTicketEntity
+from ....entities.office_hours.user_created_tickets_table import (
+    user_created_tickets_table,
+)
 from ....models.academics.my_courses import (
     OfficeHourQueueOverview,
     OfficeHourGetHelpOverview,
     OfficeHourEventRoleOverview,
 )
 from ....models.office_hours.office_hours import NewOfficeHours, OfficeHours
+from ....models.office_hours.ticket_state import TicketState
+from ....models.office_hours.ticket_type import TicketType
 from ....services.office_hours import OfficeHoursService
 from ....services.exceptions import CoursePermissionException, ResourceNotFoundException
 
@@ -73,6 +82,89 @@ def test_get_help_overview(oh_svc: OfficeHoursService):
     assert overview.queue_position == 1
 
 
+def _create_ticket(
+    session: Session, member_id: int, state: TicketState, created_at: datetime
+) -> OfficeHoursTicketEntity:
+    ticket = OfficeHoursTicketEntity(
+        description="Ticket",
+        type=TicketType.ASSIGNMENT_HELP,
+        state=state,
+        created_at=created_at,
+        office_hours_id=office_hours_data.comp_110_current_office_hours.id,
+    )
+    session.add(ticket)
+    session.flush()
+    session.execute(
+        insert(user_created_tickets_table).values(
+            ticket_id=ticket.id, member_id=member_id
+        )
+    )
+    return ticket
+
+
+def test_get_help_overview_queue_position(session: Session, oh_svc: OfficeHoursService):
+    """Ensures the queue position counts only the queued tickets created before a ticket."""
+    queued_ticket_created_at = office_hours_data.comp_110_queued_ticket.created_at
+    earlier_ticket = _create_ticket(
+        session,
+        section_data.comp110_student_0.id,
+        TicketState.QUEUED,
+        queued_ticket_created_at - timedelta(minutes=5),
+    )
+    _create_ticket(
+        session,
+        section_data.comp110_student_0.id,
+        TicketState.CLOSED,
+        queued_ticket_created_at - timedelta(minutes=10),
+    )
+    session.commit()
+
+    student_overview = oh_svc.get_office_hour_get_help_overview(
+        user_data.student, office_hours_data.comp_110_current_office_hours.id
+    )
+    user_overview = oh_svc.get_office_hour_get_help_overview(
+        user_data.user, office_hours_data.comp_110_current_office_hours.id
+    )
+
+    assert student_overview.queue_position == 2
+    assert user_overview.ticket is not None
+    assert user_overview.ticket.id == earlier_ticket.id
+    assert user_overview.queue_position == 1
+
+
+def test_get_help_overview_query_count(session: Session, oh_svc: OfficeHoursService):
+    """Ensures the get help overview does not load the ticket history of the event."""
+
+    def count_queries() -> int:
+        session.expunge_all()
+        statements: list[str] = []
+
+        def count_statement(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(session.get_bind(), "before_cursor_execute", count_statement)
+        try:
+            oh_svc.get_office_hour_get_help_overview(
+                user_data.student, office_hours_data.comp_110_current_office_hours.id
+            )
+        finally:
+            event.remove(session.get_bind(), "before_cursor_execute", count_statement)
+        return len(statements)
+
+    count_queries()  # Warm the course site access cache
+    queries = count_queries()
+    for minutes in range(1, 21):
+        _create_ticket(
+            session,
+            section_data.comp110_student_0.id,
+            TicketState.CLOSED,
+            datetime.now() - timedelta(minutes=minutes),
+        )
+    session.commit()
+
+    assert count_queries() == queries
+
+
 def test_get_help_overview_not_member(oh_svc: OfficeHoursService):
     """Ensures non-members cannot access the get help overview information."""
     with pytest.raises(CoursePermissionException):
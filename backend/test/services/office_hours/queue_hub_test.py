@@ -0,0 +1,66 @@
+"""Tests for the OfficeHoursQueueHub."""
+
+import asyncio
+import threading
+from datetime import datetime
+
+from ....models.office_hours.queue_update import OfficeHoursQueueUpdate
+from ....services.office_hours.queue_hub import OfficeHoursQueueHub
+
+__authors__ = ["Ajay Gandecha"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+
+def _update(office_hours_id: int, ticket_id: int) -> OfficeHoursQueueUpdate:
+    return OfficeHoursQueueUpdate(
+        office_hours_id=office_hours_id,
+        ticket_id=ticket_id,
+        state="Queued",
+        created_at=datetime.now(),
+    )
+
+
+def test_publish_to_subscribers():
+    """Ensures updates reach subscribers of the same queue only."""
+    hub = OfficeHoursQueueHub()
+
+    async def scenario():
+        async with hub.subscribe(1) as first, hub.subscribe(1) as second:
+            async with hub.subscribe(2) as other:
+                hub.publish(_update(1, 10))
+                assert (await first.get()).ticket_id == 10
+                assert (await second.get()).ticket_id == 10
+                hub.publish(_update(2, 20))
+                assert (await other.get()).ticket_id == 20
+                assert first._queue.empty()
+
+    asyncio.run(scenario())
+
+
+def test_publish_from_worker_thread():
+    """Ensures updates published from a request handler's thread reach the event loop."""
+    hub = OfficeHoursQueueHub()
+
+    async def scenario():
+        async with hub.subscribe(1) as subscription:
+            thread = threading.Thread(target=hub.publish, args=(_update(1, 10),))
+            thread.start()
+            update = await asyncio.wait_for(subscription.get(), timeout=5)
+            thread.join()
+            assert update.ticket_id == 10
+
+    asyncio.run(scenario())
+
+
+def test_unsubscribe_on_exit():
+    """Ensures subscriptions are removed once their context exits."""
+    hub = OfficeHoursQueueHub()
+
+    async def scenario():
+        async with hub.subscribe(1):
+            assert len(hub._subscriptions[1]) == 1
+        assert 1 not in hub._subscriptions
+        hub.publish(_update(1, 10))
+
+    asyncio.run(scenario())
@@ -0,0 +1,118 @@
+"""Tests for the CourseSiteAccessService."""
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from ....models.roster_role import RosterRole
+from ....services.academics import SectionMemberService
+from ....services.office_hours.site_access import CourseSiteAccessService
+from ....services.exceptions import ResourceNotFoundException
+
+# Imported fixtures provide dependencies injected for the tests as parameters.
+from .fixtures import site_access_svc
+from ..academics.fixtures import (
+    permission_svc,
+    course_site_svc,
+    section_member_svc,
+)
+
+# Import the setup_teardown fixture explicitly to load entities in database
+from ..core_data import setup_insert_data_fixture as insert_order_0
+from ..academics.term_data import fake_data_fixture as insert_order_1
+from ..academics.course_data import fake_data_fixture as insert_order_2
+from ..academics.section_data import fake_data_fixture as insert_order_3
+from ..room_data import fake_data_fixture as insert_order_4
+from ..office_hours.office_hours_data import fake_data_fixture as insert_order_5
+
+# Import the fake model data in a namespace for test assertions
+from .. import user_data
+from ..academics import section_data
+from ..office_hours import office_hours_data
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+
+def test_get_roles(site_access_svc: CourseSiteAccessService):
+    """Ensures the roles of a user in a course site are resolved."""
+    instructor_access = site_access_svc.get(
+        user_data.instructor, office_hours_data.comp_110_site.id
+    )
+    student_access = site_access_svc.get(
+        user_data.student, office_hours_data.comp_110_site.id
+    )
+
+    assert instructor_access.roles == {RosterRole.INSTRUCTOR}
+    assert not instructor_access.is_student()
+    assert student_access.roles == {RosterRole.STUDENT}
+    assert student_access.is_student()
+    assert not student_access.is_staff_of_every_section()
+
+
+def test_get_not_member(site_access_svc: CourseSiteAccessService):
+    """Ensures users outside of a course site have no roles in it."""
+    access = site_access_svc.get(
+        user_data.ambassador, office_hours_data.comp_110_site.id
+    )
+    assert access.roles == set()
+    assert access.role is None
+    assert access.member_ids == []
+
+
+def test_get_not_found(site_access_svc: CourseSiteAccessService):
+    """Ensures resolving access to a course site that does not exist fails."""
+    with pytest.raises(ResourceNotFoundException):
+        site_access_svc.get(user_data.instructor, 404)
+        pytest.fail()
+
+
+def test_get_for_office_hours(site_access_svc: CourseSiteAccessService):
+    """Ensures access is resolved through the course site of an office hours event."""
+    access = site_access_svc.get_for_office_hours(
+        user_data.student, office_hours_data.comp_110_current_office_hours.id
+    )
+    assert access.role == RosterRole.STUDENT
+    assert access.member_ids == [section_data.comp110_student_1.id]
+
+
+def test_get_cached(session: Session, site_access_svc: CourseSiteAccessService):
+    """Ensures repeated checks of the same user and course site do not query the database."""
+    site_access_svc.get(user_data.instructor, office_hours_data.comp_110_site.id)
+    statements: list[str] = []
+
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(session.get_bind(), "before_cursor_execute", count_statement)
+    try:
+        access = site_access_svc.get(
+            user_data.instructor, office_hours_data.comp_110_site.id
+        )
+    finally:
+        event.remove(session.get_bind(), "before_cursor_execute", count_statement)
+
+    assert access.roles == {RosterRole.INSTRUCTOR}
+    assert len(statements) == 0
+
+
+def test_add_section_member_invalidates_access(
+    site_access_svc: CourseSiteAccessService,
+    section_member_svc: SectionMemberService,
+):
+    """Ensures a roster change is reflected in the cached access of the member."""
+    assert not site_access_svc.get(
+        user_data.root, office_hours_data.comp_110_site.id
+    ).is_student()
+
+    section_member_svc.add_section_member(
+        user_data.root,
+        section_data.comp_110_001_current_term.id,
+        user_data.root.id,
+        RosterRole.STUDENT,
+    )
+
+    assert site_access_svc.get(
+        user_data.root, office_hours_data.comp_110_site.id
+    ).is_student()
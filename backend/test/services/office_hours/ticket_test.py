@@ -5,12 +5,13 @@ import pytest
 from ....models.academics.my_courses import OfficeHourTicketOverview
 
 from ....models.office_hours.ticket import TicketState
+from ....models.office_hours.queue_update import OfficeHoursQueueUpdate
 
 from ....services.office_hours import OfficeHourTicketService
 from ....services.exceptions import CoursePermissionException, ResourceNotFoundException
 
 # Imported fixtures provide dependencies injected for the tests as parameters.
-from .fixtures import oh_ticket_svc
+from .fixtures import oh_ticket_svc, oh_queue_hub_mock
 
 # Import the setup_teardown fixture explicitly to load entities in database
 from ..core_data import setup_insert_data_fixture as insert_order_0
@@ -39,6 +40,11 @@ def test_call_ticket(oh_ticket_svc: OfficeHourTicketService):
     )
     assert called.state == TicketState.CALLED.to_string()
     assert called.caller.id == user_data.instructor.id
+    oh_ticket_svc._queue_hub.publish.assert_called_once_with(
+        OfficeHoursQueueUpdate.from_ticket(
+            office_hours_data.comp_110_current_office_hours.id, called
+        )
+    )
 
 
 def test_call_ticket_already_called(oh_ticket_svc: OfficeHourTicketService):
@@ -98,6 +104,17 @@ def test_cancel_ticket(oh_ticket_svc: OfficeHourTicketService):
     assert called.state == TicketState.CANCELED.to_string()
 
 
+def test_cancel_ticket_not_member_is_not_published(
+    oh_ticket_svc: OfficeHourTicketService,
+):
+    """Ensures that rejected changes are not published to the queue."""
+    with pytest.raises(CoursePermissionException):
+        oh_ticket_svc.cancel_ticket(
+            user_data.ambassador, office_hours_data.comp_110_queued_ticket.id
+        )
+    oh_ticket_svc._queue_hub.publish.assert_not_called()
+
+
 def test_cancel_ticket_not_found(oh_ticket_svc: OfficeHourTicketService):
     """Ensures that an error is thrown if attempting to cancel a ticket that does not exist."""
     with pytest.raises(ResourceNotFoundException):
@@ -193,6 +210,9 @@ def test_create_ticket(oh_ticket_svc: OfficeHourTicketService):
     assert created is not None
     assert isinstance(created, OfficeHourTicketOverview)
     assert created.state == TicketState.QUEUED.to_string()
+    update = oh_ticket_svc._queue_hub.publish.call_args.args[0]
+    assert update.office_hours_id == office_hours_data.new_ticket.office_hours_id
+    assert update.ticket == created
 
 
 def test_create_ticket_with_one_in_queue(oh_ticket_svc: OfficeHourTicketService):
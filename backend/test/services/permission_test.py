@@ -1,10 +1,13 @@
 """Tests for the PermissionService class."""
 
 import pytest
+from unittest.mock import patch
+from sqlalchemy.orm import Session
 
 # Tested Dependencies
 from ...models import Permission, User
 from ...services import PermissionService
+from ...services.permission import CompiledPermissions
 
 # Data Setup and Injected Service Fixtures
 from .core_data import setup_insert_data_fixture
@@ -127,3 +130,47 @@ def test_check_specific_permission(permission_svc: PermissionService):
 def test_get_user_roles_permissions(permission_svc: PermissionService):
     """Test covers an edge case of _get_user_roles_permissions when user does not exist"""
     assert permission_svc._get_user_roles_permissions(User(id=423)) == []
+
+
+def test_check_is_cached(permission_svc: PermissionService, session: Session):
+    """Tests that compiled permissions are reused without querying the database"""
+    assert permission_svc.check(ambassador, "checkin.create", "checkin")
+    with (
+        patch.object(session, "execute", side_effect=AssertionError),
+        patch.object(session, "get", side_effect=AssertionError),
+    ):
+        assert permission_svc.check(ambassador, "checkin.create", "checkin")
+        assert permission_svc.check(ambassador, "checkin.delete", "checkin") is False
+
+
+def test_grant_invalidates_cached_permissions(permission_svc: PermissionService):
+    """Tests that a grant to a user is visible to checks after it is cached"""
+    assert permission_svc.check(user, "checkin.delete", "checkin/1") is False
+    permission_svc.grant(
+        root, user, Permission(action="checkin.*", resource="checkin/*")
+    )
+    assert permission_svc.check(user, "checkin.delete", "checkin/1")
+    assert permission_svc.check(user, "checkin.delete", "room/1") is False
+
+
+def test_compiled_permissions():
+    """Tests matching of exact, prefix wildcard, and catch-all action patterns"""
+    compiled = CompiledPermissions(
+        [
+            ("user.get", "user/*"),
+            ("checkin.*", "checkin"),
+            ("organization*", "organization/cads"),
+        ]
+    )
+    assert compiled.check("user.get", "user/1")
+    assert compiled.check("user.get", "role/1") is False
+    assert compiled.check("user.ge", "user/1") is False
+    assert compiled.check("user.get.all", "user/1") is False
+    assert compiled.check("checkin.delete", "checkin")
+    assert compiled.check("checkin.", "checkin")
+    assert compiled.check("checkin", "checkin") is False
+    assert compiled.check("organization", "organization/cads")
+    assert compiled.check("organization.update", "organization/cads")
+    assert compiled.check("organization.update", "organization/acm") is False
+    assert CompiledPermissions([("*", "*")]).check("anything", "at/all")
+    assert CompiledPermissions([]).check("user.get", "user/1") is False
@@ -106,9 +106,11 @@ def test_add_member(role_svc: RoleService):
     assert not role_svc.is_member(root, ambassador_role.id, user.id)
     role_svc.add_member(root, ambassador_role.id, user)
     assert role_svc.is_member(root, ambassador_role.id, user.id)
+    role_svc._permission.invalidate.assert_called_with(user.id)
 
 
 def test_remove_member(role_svc: RoleService):
     assert role_svc.is_member(root, ambassador_role.id, ambassador.id)
     role_svc.remove_member(root, ambassador_role.id, ambassador.id)
     assert not role_svc.is_member(root, ambassador_role.id, ambassador.id)
+    role_svc._permission.invalidate.assert_called_with(ambassador.id)
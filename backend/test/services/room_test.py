@@ -7,7 +7,9 @@ from backend.services.exceptions import (
     UserPermissionException,
 )
 from backend.services.permission import PermissionService
+from sqlalchemy.orm import Session
 from ...services import RoomService
+from ...services.coworking import SeatService
 from ...models import RoomDetails
 
 # Imported fixtures provide dependencies injected for the tests as parameters.
@@ -82,6 +84,19 @@ def test_update_as_root(room_svc: RoomService):
     assert room.id == room_data.edited_xl.id
 
 
+def test_update_invalidates_floorplan(session: Session, room_svc: RoomService):
+    room_svc._permission_svc = create_autospec(PermissionService)
+    seat_svc = SeatService(session)
+    rooms = {room.id: room for room in seat_svc.floorplan().rooms}
+    assert rooms[room_data.edited_xl.id].nickname == room_data.the_xl.nickname
+
+    room_svc.update(user_data.root, room_data.edited_xl)
+
+    rooms = {room.id: room for room in seat_svc.floorplan().rooms}
+    assert rooms[room_data.edited_xl.id].nickname == room_data.edited_xl.nickname
+    assert rooms[room_data.edited_xl.id].capacity == room_data.edited_xl.capacity
+
+
 def test_update_as_root_not_found(room_svc: RoomService):
     permission_svc = create_autospec(PermissionService)
     room_svc._permission_svc = permission_svc
@@ -5,6 +5,7 @@ from datetime import datetime, timedelta
 from sqlalchemy import text, select
 from sqlalchemy.orm import Session
 from ...entities.coworking import ReservationEntity
+from ...services.coworking.checkin_leaderboard import CheckinLeaderboardService
 from ...models.coworking import Reservation, ReservationState, ReservationRequest
 from time import *
 
@@ -110,6 +111,10 @@ def insert_fake_data(session: Session):
         entity = ReservationEntity.from_model(model, session)
         session.add(entity)
 
+    # Total checked out reservations for the leaderboard
+    session.flush()
+    CheckinLeaderboardService(session).rebuild()
+
 
 @pytest.fixture(autouse=True)
 def fake_data_fixture(session: Session):
@@ -1,14 +1,23 @@
 """Tests for the RoleService class."""
 
 # Tested Dependencies
+import asyncio
 import pytest
+from unittest.mock import patch
 
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 from sqlalchemy.orm import Session
 
 from backend.models.public_user import PublicUser
 
 from ...models import SignageOverviewFast, SignageOverviewSlow
-from ...services import SignageService
+from ...services import SignageService, AsyncSignageService
+from ...services.coworking import (
+    AsyncOperatingHoursService,
+    AsyncReservationService,
+    AsyncSeatService,
+    PolicyService,
+)
 
 # Imported fixtures provide dependencies injected for the tests as parameters.
 
@@ -86,3 +95,100 @@ def test_get_slow_data(signage_svc: SignageService):
 
     assert len(slow_data.announcements) == 1
     assert slow_data.announcements[0].title == "Sample Announcement"
+
+
+def test_get_fast_data_json_is_shared(signage_svc: SignageService):
+    """Ensures the serialized fast data is built once and shared between polls."""
+    with patch.object(
+        signage_svc, "get_fast_data", wraps=signage_svc.get_fast_data
+    ) as get_fast_data:
+        first = signage_svc.get_fast_data_json()
+        second = signage_svc.get_fast_data_json()
+    assert first is second
+    assert get_fast_data.call_count == 1
+    fast_data = SignageOverviewFast.model_validate_json(first)
+    assert room_data.pair_a.id not in fast_data.available_rooms
+    assert len(fast_data.active_office_hours) == 2
+
+
+def test_get_slow_data_json_is_shared(signage_svc: SignageService):
+    """Ensures the serialized slow data is built once and shared between polls."""
+    with patch.object(
+        signage_svc, "get_slow_data", wraps=signage_svc.get_slow_data
+    ) as get_slow_data:
+        first = signage_svc.get_slow_data_json()
+        second = signage_svc.get_slow_data_json()
+    assert first is second
+    assert get_slow_data.call_count == 1
+    assert SignageOverviewSlow.model_validate_json(first) == signage_svc.get_slow_data()
+
+
+def _async_signage_svc(session: AsyncSession) -> AsyncSignageService:
+    """Constructs an AsyncSignageService whose reads use the given session."""
+    return AsyncSignageService(
+        session,
+        AsyncReservationService(
+            session, PolicyService(), AsyncOperatingHoursService(session)
+        ),
+        AsyncSeatService(session),
+    )
+
+
+def test_get_fast_data_async(
+    signage_svc: SignageService, test_async_engine: AsyncEngine
+):
+    """Ensures that the async variant loads the same fast data."""
+
+    async def get_fast_data():
+        async with AsyncSession(test_async_engine) as session:
+            return await _async_signage_svc(session).get_fast_data()
+
+    fast_data = asyncio.run(get_fast_data())
+    expected = signage_svc.get_fast_data()
+    assert fast_data.active_office_hours == expected.active_office_hours
+    assert fast_data.available_rooms == expected.available_rooms
+    assert {seat.id for seat in fast_data.seat_availability} == {
+        seat.id for seat in expected.seat_availability
+    }
+
+
+def test_get_slow_data_async(
+    signage_svc: SignageService, test_async_engine: AsyncEngine
+):
+    """Ensures that the async variant loads the same slow data."""
+
+    async def get_slow_data():
+        async with AsyncSession(test_async_engine) as session:
+            return await _async_signage_svc(session).get_slow_data()
+
+    assert asyncio.run(get_slow_data()) == signage_svc.get_slow_data()
+
+
+def test_get_fast_data_json_is_shared_async(test_async_engine: AsyncEngine):
+    """Ensures concurrent polls await a single build, made with a session of its own."""
+    sessions: list[AsyncSession] = []
+
+    async def poll_concurrently():
+        async with (
+            AsyncSession(test_async_engine) as first_session,
+            AsyncSession(test_async_engine) as second_session,
+        ):
+            sessions.extend([first_session, second_session])
+            return await asyncio.gather(
+                _async_signage_svc(first_session).get_fast_data_json(),
+                _async_signage_svc(second_session).get_fast_data_json(),
+            )
+
+    with patch.object(
+        AsyncSignageService,
+        "get_fast_data",
+        autospec=True,
+        side_effect=AsyncSignageService.get_fast_data,
+    ) as get_fast_data:
+        first, second = asyncio.run(poll_concurrently())
+    assert first is second
+    assert get_fast_data.call_count == 1
+    assert get_fast_data.call_args.args[0]._session not in sessions
+    fast_data = SignageOverviewFast.model_validate_json(first)
+    assert room_data.pair_a.id not in fast_data.available_rooms
+    assert len(fast_data.active_office_hours) == 2
@@ -1,16 +1,25 @@
 """Tests for the UserService class."""
 
 import pytest
+import time
 
 # Tested Dependencies
 from ...models.user import User, NewUser
 from ...models.pagination import PaginationParams
-from ...services import UserService, PermissionService
+from ...services import UserService, PermissionService, GitHubService
+from ...services import user as user_module
+from ...services.principal import cache_principal, get_principal
+from ...services.user_prefix_index import UserPrefixIndex
 from ...services.exceptions import ResourceNotFoundException
 
 # Data Setup and Injected Service Fixtures
 from .core_data import setup_insert_data_fixture
-from .fixtures import user_svc, user_svc_integration, permission_svc_mock
+from .fixtures import (
+    user_svc,
+    user_svc_integration,
+    permission_svc,
+    permission_svc_mock,
+)
 
 # Data Models for Fake Data Inserted in Setup
 from .user_data import root, ambassador, user
@@ -132,6 +141,62 @@ def test_search_by_pid_rhonda(user_svc: UserService):
     assert users[0] == root
 
 
+def test_search_ranks_prefix_matches_first(user_svc: UserService):
+    """Test that users matching by prefix rank ahead of users matching elsewhere, each by name."""
+    users = user_svc.search(ambassador, "st")
+    assert [user.id for user in users] == [
+        user_data.user.id,  # Sally Student
+        user_data.student.id,  # Stewie Student
+        ambassador.id,  # Onyen xlstan
+        user_data.instructor.id,  # Ina Instructor
+    ]
+
+
+def test_search_escapes_wildcards(user_svc: UserService):
+    """Test that wildcard characters in a query are matched literally."""
+    assert user_svc.search(ambassador, "%") == []
+    assert user_svc.search(ambassador, "s_") == []
+
+
+def test_search_prefix_index(user_svc: UserService, monkeypatch):
+    """Test that short searches answered by the prefix index match the ranked search."""
+    monkeypatch.setattr(user_module, "_SEARCH_LIMIT", 2)
+    indexed = user_svc.search(ambassador, "s")
+    monkeypatch.setattr(user_module, "_PREFIX_INDEX_ENABLED", False)
+    assert indexed == user_svc.search(ambassador, "s")
+    assert [user.id for user in indexed] == [user_data.user.id, user_data.student.id]
+
+
+def test_search_prefix_index_updated(user_svc: UserService, monkeypatch):
+    """Test that renaming a user is reflected by the prefix index."""
+    monkeypatch.setattr(user_module, "_SEARCH_LIMIT", 1)
+    assert user_svc.search(ambassador, "s") == [user]
+
+    renamed = user_svc.get_by_id(root.id)
+    renamed.first_name = "Sal"
+    user_svc.update(root, renamed)
+
+    assert [user.id for user in user_svc.search(ambassador, "s")] == [root.id]
+
+
+def test_user_prefix_index():
+    """Test that the prefix index answers only prefixes matched by at least its limit of users."""
+    index = UserPrefixIndex(
+        [
+            (1, "Ada", "Lovelace", "ada", 100),
+            (2, "Alan", "Turing", "turing", 200),
+            (3, "Grace", "Hopper", "grace", 300),
+        ],
+        depth=2,
+        limit=2,
+    )
+    assert index.search("a") == [1, 2]
+    assert index.search("A") == [1, 2]
+    assert index.search("t") is None
+    assert index.search("tu") is None
+    assert index.search("ada") is None
+
+
 def test_list(user_svc: UserService):
     """Test that a paginated list of users can be produced."""
     pagination_params = PaginationParams(page=0, page_size=2, order_by="id", filter="")
@@ -303,3 +368,68 @@ def test_update_profile_then_accept_community_agreement(user_svc: UserService):
     assert updated_user.accepted_community_agreement == False
     updated_user.accepted_community_agreement = True
     assert updated_user.accepted_community_agreement == True
+
+
+def test_cached_principal_is_copied(user_svc_integration: UserService):
+    """Cached principals are returned as copies, so modifying a subject leaves the cache intact."""
+    principal = user_svc_integration.get(user.pid)
+    assert principal is not None
+    cache_principal("token", time.time() + 60, principal)
+
+    subject = get_principal("token")
+    assert subject == principal
+    subject.github = "modified"
+    assert get_principal("token") == principal
+
+
+def test_cached_principal_expires_with_token(user_svc_integration: UserService):
+    """A principal is not returned once the token that authenticated it expires."""
+    principal = user_svc_integration.get(user.pid)
+    assert principal is not None
+    cache_principal("token", time.time() - 1, principal)
+    assert get_principal("token") is None
+
+
+def test_update_invalidates_cached_principal(user_svc_integration: UserService):
+    """Updating a user, e.g. to accept the community agreement, invalidates only their principals."""
+    principal = user_svc_integration.get(user.pid)
+    other = user_svc_integration.get(ambassador.pid)
+    assert principal is not None and other is not None
+    cache_principal("token", time.time() + 60, principal)
+    cache_principal("other token", time.time() + 60, other)
+
+    principal.accepted_community_agreement = True
+    user_svc_integration.update(principal, principal)
+
+    assert get_principal("token") is None
+    assert get_principal("other token") == other
+
+
+def test_github_unlink_invalidates_cached_principal(user_svc_integration: UserService):
+    """Unlinking a GitHub account invalidates the user's principals."""
+    principal = user_svc_integration.get(user.pid)
+    assert principal is not None
+    cache_principal("token", time.time() + 60, principal)
+
+    GitHubService(user_svc_integration).remove_association(principal)
+
+    assert get_principal("token") is None
+
+
+def test_permission_change_invalidates_cached_principals(
+    user_svc_integration: UserService, permission_svc: PermissionService
+):
+    """Principals carry permissions, so changes to permissions invalidate them."""
+    principal = user_svc_integration.get(user.pid)
+    other = user_svc_integration.get(ambassador.pid)
+    assert principal is not None and other is not None
+    cache_principal("token", time.time() + 60, principal)
+    cache_principal("other token", time.time() + 60, other)
+
+    permission_svc.invalidate(ambassador.id)
+    assert get_principal("token") == principal
+    assert get_principal("other token") is None
+
+    # E.g. a grant to a role
+    permission_svc.invalidate()
+    assert get_principal("token") is None